@@ -0,0 +1,84 @@
+"""Measure the plugin's hook overhead on a module that never touches numpy.
+
+    $ python benchmarks/bench_hook_dispatch.py --calls 20000
+
+Reports the cost of ``get_function_hook`` / ``get_method_hook`` lookups for
+non-numpy callees, and the end-to-end mypy time on a generated numpy-free
+module with and without the plugin enabled.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import timeit
+
+BASE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, BASE_DIR)
+
+from mypy import api  # noqa: E402
+from mypy.options import Options  # noqa: E402
+
+from numpy_plugin.plugin import NumpyPlugin  # noqa: E402
+
+NON_NUMPY_CALLEES = [
+    'builtins.len', 'builtins.print', 'builtins.str.join', 'builtins.list.append',
+    'typing.Mapping.get', 'os.path.join', 'collections.OrderedDict',
+]
+
+
+def generate_module(n_calls: int) -> str:
+    lines = ['from typing import List', '', 'def f(xs: List[int]) -> int:', '    total = 0']
+    for i in range(n_calls):
+        lines.append('    total += len(xs) + abs(%d) + max(xs)' % i)
+    lines += ['    return total', '']
+    return '\n'.join(lines)
+
+
+def write_config(directory: str, with_plugin: bool) -> str:
+    path = os.path.join(directory, 'mypy.ini')
+    with open(path, 'w') as f:
+        f.write('[mypy]\nmypy_path = {0}/numpy_plugin/stubs\n'.format(BASE_DIR))
+        if with_plugin:
+            f.write('plugins = {0}/numpy_plugin_entry.py\n'.format(BASE_DIR))
+    return path
+
+
+def time_mypy(directory: str, with_plugin: bool, repeat: int) -> float:
+    config = write_config(directory, with_plugin)
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        api.run(['--config-file', config, os.path.join(directory, 'input.py')])
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    plugin = NumpyPlugin(Options())
+    n_lookups = 100000
+    lookup = timeit.timeit(
+        lambda: [plugin.get_function_hook(n) or plugin.get_method_hook(n)
+                 for n in NON_NUMPY_CALLEES],
+        number=n_lookups // len(NON_NUMPY_CALLEES))
+    print('hook lookup, non-numpy callee: %.1f ns/lookup' % (1e9 * lookup / n_lookups))
+
+    with tempfile.TemporaryDirectory() as td:
+        with open(os.path.join(td, 'input.py'), 'w') as f:
+            f.write(generate_module(args.calls))
+        time_mypy(td, True, 1)  # warm up imports and the OS file cache
+        without = time_mypy(td, False, args.repeat)
+        with_ = time_mypy(td, True, args.repeat)
+
+    print('mypy, %d calls, without plugin: %.3f s' % (args.calls, without))
+    print('mypy, %d calls, with plugin:    %.3f s (%+.1f%%)' % (
+        args.calls, with_, 100 * (with_ - without) / without))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""Generate synthetic numpy code for type-check benchmarks.
+
+    $ python benchmarks/generate.py --calls 10000 OUTDIR
+
+Writes a package of modules that together make about ``--calls`` numpy
+calls, mixing constructors, ufuncs, reductions and fancy indexing against the
+bundled stub. The output is deterministic for a given ``--seed``.
+"""
+import argparse
+import os
+import random
+from typing import Dict
+
+# Each template is one statement binding a fresh name; it may refer to the
+# arrays every generated function starts with:
+#   x: ndarray[float, TwoD], idx: ndarray[int, OneD], mask: ndarray[bool, OneD],
+#   rows: List[List[float]]
+PROLOGUE = [
+    'x = np.zeros((n, n))',
+    'idx = np.arange(n, dtype=int)',
+    'mask = np.ones(n, dtype=bool)',
+    'rows = [[1.0, 2.0], [3.0, 4.0]]',
+]
+
+TEMPLATES = {
+    'constructor': [
+        '{v} = np.zeros((n, {k}))',
+        '{v} = np.ones({k}, dtype=int)',
+        "{v} = np.empty(({k}, {k}, {k}), dtype='float32')",
+        '{v} = np.full(({k}, n), {f})',
+        '{v} = np.zeros_like(x)',
+        '{v} = np.array(rows)',
+        '{v} = np.asarray(x)',
+    ],
+    'ufunc': [
+        '{v} = np.add(x, {f})',
+        '{v} = np.multiply(x, x)',
+        '{v} = np.exp(x)',
+        '{v} = np.less(x, {f})',
+        '{v} = np.sqrt(idx)',
+        '{v} = np.maximum(x, idx)',
+    ],
+    'reduction': [
+        '{v} = np.sum(x, axis=0)',
+        '{v} = np.amax(x, axis=1, keepdims=True)',
+        '{v} = np.mean(x)',
+        '{v} = np.cumsum(x, axis=1)',
+        '{v} = np.all(mask)',
+    ],
+    'indexing': [
+        '{v} = x[idx]',
+        '{v} = x[mask]',
+        '{v} = x[:, {k}]',
+        '{v} = x[idx, idx]',
+        '{v} = x[1:, None]',
+        '{v} = x[{k}, {k}]',
+    ],
+}
+
+CALLS_PER_FUNCTION = 50
+
+
+def generate_module(n_calls: int, rng: random.Random, mix: Dict[str, float]=None) -> str:
+    kinds = sorted(TEMPLATES)
+    weights = [(mix or {}).get(kind, 1.0) for kind in kinds]
+    lines = ['import numpy as np', '']
+    made = 0
+    f = 0
+    while made < n_calls:
+        lines += ['', 'def f%d(n: int) -> None:' % f]
+        lines += ['    ' + s for s in PROLOGUE]
+        made += sum('np.' in s for s in PROLOGUE)
+        for i in range(min(CALLS_PER_FUNCTION, n_calls - made)):
+            kind = rng.choices(kinds, weights)[0]
+            template = rng.choice(TEMPLATES[kind])
+            lines.append('    ' + template.format(
+                v='v%d' % i, k=rng.randint(1, 8), f=round(rng.random(), 2)))
+            made += 1
+        f += 1
+    return '\n'.join(lines) + '\n'
+
+
+def generate_package(outdir: str, n_calls: int, calls_per_module: int=1000,
+                     seed: int=0) -> str:
+    """Write the package into outdir and return its path."""
+    rng = random.Random(seed)
+    package = os.path.join(outdir, 'synthetic')
+    os.makedirs(package, exist_ok=True)
+    with open(os.path.join(package, '__init__.py'), 'w') as f:
+        f.write('')
+    for m, start in enumerate(range(0, n_calls, calls_per_module)):
+        with open(os.path.join(package, 'm%d.py' % m), 'w') as f:
+            f.write(generate_module(min(calls_per_module, n_calls - start), rng))
+    return package
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('outdir')
+    parser.add_argument('--calls', type=int, default=1000)
+    parser.add_argument('--calls-per-module', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    print(generate_package(args.outdir, args.calls, args.calls_per_module, args.seed))
+
+
+if __name__ == '__main__':
+    main()
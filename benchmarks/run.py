@@ -0,0 +1,134 @@
+"""Type-check throughput benchmarks.
+
+    $ python benchmarks/run.py --sizes 1000 10000 --save results.json
+    $ python benchmarks/run.py --sizes 1000 10000 --compare results.json
+
+For every size, generates a synthetic package (see generate.py) and measures
+mypy's wall time and peak RSS with and without the plugin, for a cold run
+(empty incremental cache) and a warm one (the cache the cold run left
+behind). Each measurement runs mypy in a fresh interpreter. ``--save``
+stores the numbers as a baseline; ``--compare`` prints the change against a
+stored baseline and exits non-zero if anything got slower than
+``--tolerance``.
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BASE_DIR = os.path.normpath(os.path.join(BENCH_DIR, '..'))
+sys.path.insert(0, BENCH_DIR)
+
+from generate import generate_package  # noqa: E402
+
+
+def write_config(directory: str, with_plugin: bool) -> str:
+    path = os.path.join(directory, 'mypy-%s.ini' % ('plugin' if with_plugin else 'plain'))
+    with open(path, 'w') as f:
+        f.write('[mypy]\nmypy_path = {0}/numpy_plugin/stubs\n'.format(BASE_DIR))
+        if with_plugin:
+            f.write('plugins = {0}/numpy_plugin_entry.py\n'.format(BASE_DIR))
+    return path
+
+
+def measure(args: List[str]) -> Dict[str, float]:
+    """Run mypy in a fresh interpreter; return its wall time and peak RSS."""
+    out = subprocess.check_output(
+        [sys.executable, os.path.abspath(__file__), '--measure', '--'] + args,
+        universal_newlines=True)
+    return json.loads(out.splitlines()[-1])
+
+
+def _measure_in_process(args: List[str]) -> None:
+    from mypy import api
+    start = time.perf_counter()
+    api.run(args)
+    wall = time.perf_counter() - start
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        maxrss //= 1024
+    print(json.dumps({'wall_s': wall, 'maxrss_mb': maxrss / 1024}))
+
+
+def run_size(n_calls: int, repeat: int) -> Dict[str, Any]:
+    results = {}
+    with tempfile.TemporaryDirectory() as td:
+        package = generate_package(td, n_calls)
+        for with_plugin in (False, True):
+            config = write_config(td, with_plugin)
+            label = 'plugin' if with_plugin else 'plain'
+            cold, warm = [], []
+            for r in range(repeat):
+                cache_dir = os.path.join(td, 'cache-%s-%d' % (label, r))
+                args = ['--config-file', config, '--incremental',
+                        '--cache-dir', cache_dir, package]
+                cold.append(measure(args))
+                warm.append(measure(args))
+            results[label + '/cold'] = _best(cold)
+            results[label + '/warm'] = _best(warm)
+    return results
+
+
+def _best(samples: List[Dict[str, float]]) -> Dict[str, float]:
+    return {key: min(s[key] for s in samples) for key in samples[0]}
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> bool:
+    ok = True
+    for size, modes in sorted(results.items(), key=lambda kv: int(kv[0])):
+        for mode, metrics in sorted(modes.items()):
+            base = baseline.get(size, {}).get(mode)
+            if base is None:
+                continue
+            for key, value in sorted(metrics.items()):
+                change = (value - base[key]) / base[key]
+                flag = ''
+                if key == 'wall_s' and change > tolerance:
+                    flag = '  <-- regression'
+                    ok = False
+                print('%7s %-13s %-10s %9.3f -> %9.3f (%+.1f%%)%s' % (
+                    size, mode, key, base[key], value, 100 * change, flag))
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--save', metavar='PATH', help='store results as a baseline')
+    parser.add_argument('--compare', metavar='PATH', help='compare against a baseline')
+    parser.add_argument('--tolerance', type=float, default=0.10,
+                        help='allowed wall-time slowdown when comparing (default 0.10)')
+    parser.add_argument('--measure', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('mypy_args', nargs='*', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        _measure_in_process(args.mypy_args)
+        return
+
+    results = {}
+    for size in args.sizes:
+        results[str(size)] = run_size(size, args.repeat)
+        for mode, metrics in sorted(results[str(size)].items()):
+            print('%7d %-13s %7.3f s %8.1f MB' % (size, mode, metrics['wall_s'],
+                                                  metrics['maxrss_mb']))
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if not compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+"""Restrict inference to calls made from some modules.
+
+The ``modules`` option takes comma-separated module patterns::
+
+    [numpy-plugin]
+    modules = ourpkg.science.*, ourpkg.ml.*
+
+``pkg.*`` matches ``pkg`` and everything below it; other patterns are
+fnmatch globs on the module's full name. A call made from any other module
+gets the stub's return type, with unevaluated typefunctions erased to Any,
+and no hook work. Whether a module matches is decided the first time one of
+its calls is hooked.
+"""
+import fnmatch
+import re
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+_RULE_SEPARATOR = re.compile(r'[;\n]')
+
+
+def parse_patterns(value: Optional[str]) -> List[str]:
+    if not value:
+        return []
+    return [p.strip() for p in value.split(',') if p.strip()]
+
+
+def parse_code_rules(value: Optional[str],
+                     codes: Sequence[str]) -> List[Tuple[str, FrozenSet[str]]]:
+    """``(module pattern, enabled codes)`` for each line of an option like::
+
+        copy_checks =
+            ourpkg.hot.*
+            ourpkg.io: redundant-astype, redundant-asarray
+
+    A pattern without codes enables all of ``codes``. In environment
+    variables the lines are separated by semicolons.
+    """
+    rules = []  # type: List[Tuple[str, FrozenSet[str]]]
+    for line in _RULE_SEPARATOR.split(value or ''):
+        pattern, _, names = line.partition(':')
+        if not pattern.strip():
+            continue
+        enabled = frozenset(c.strip() for c in names.split(',') if c.strip()) or \
+            frozenset(codes)
+        unknown = enabled.difference(codes)
+        if unknown:
+            raise ValueError('unknown codes: %s' % ', '.join(sorted(unknown)))
+        rules.append((pattern.strip(), enabled))
+    return rules
+
+
+def compile_patterns(patterns: Sequence[str]):
+    regexes = []
+    for pattern in patterns:
+        if pattern.endswith('.*'):
+            # the package itself as well as its submodules
+            regexes.append(re.escape(pattern[:-2]) + r'(\..*)?\Z')
+        else:
+            regexes.append(fnmatch.translate(pattern))
+    return re.compile('|'.join('(?:%s)' % r for r in regexes))
+
+
+class ModuleFilter:
+    def __init__(self, patterns: Sequence[str]) -> None:
+        self.regex = compile_patterns(patterns)
+        self.active = {}  # type: Dict[str, bool]
+        # the checker of the module being checked, and whether it is active
+        self.last_api = None  # type: object
+        self.last_active = False
+
+    def matches(self, module: str) -> bool:
+        active = self.active.get(module)
+        if active is None:
+            active = self.active[module] = self.regex.match(module) is not None
+        return active
+
+    def wrap_hook(self, func: Callable, fallback: Callable) -> Callable:
+        """Run ``func`` for calls from matching modules, ``fallback`` elsewhere."""
+        def scoped(fullname, calltype, ctx):
+            api = ctx.api
+            if api is not self.last_api:
+                self.last_api = api
+                self.last_active = self.matches(api.tree.fullname())
+            if self.last_active:
+                return func(fullname, calltype, ctx)
+            return fallback(ctx)
+
+        return scoped
+
+
+class CodeFilter:
+    """The diagnostic codes that ``parse_code_rules`` rules enable per module."""
+
+    def __init__(self, rules: Sequence[Tuple[str, FrozenSet[str]]]) -> None:
+        self.rules = [(compile_patterns([pattern]), codes) for pattern, codes in rules]
+        self.codes = {}  # type: Dict[str, FrozenSet[str]]
+
+    def enabled(self, module: str) -> FrozenSet[str]:
+        codes = self.codes.get(module)
+        if codes is None:
+            codes = frozenset().union(*[c for regex, c in self.rules if regex.match(module)])
+            self.codes[module] = codes
+        return codes
@@ -1,23 +1,110 @@
-from typing import Dict
-from collections import namedtuple
+"""Bind the arguments of a hooked call to the formals of its stub signature.
 
-BoundArgument = namedtuple('BoundArgument', ('name', 'formal_typ', 'arg_typ', 'arg',))
+mypy has already matched actuals to formals (``map_actuals_to_formals``) by
+the time a hook runs: ``ctx.arg_types[i]`` and ``ctx.args[i]`` hold every
+actual bound to the i-th formal, several for ``*args`` and ``**kwargs``. So
+binding is a matter of naming those groups. The names and positions of each
+callee's formals are computed once per build, and a BoundArgument is only
+created when a typefunction asks for it.
+"""
+from typing import Iterable, Iterator, List, Optional, Tuple
 
+from mypy.types import CallableType, Type
+from mypy.nodes import Expression
 
-def bind_arguments(callee, ctx, calltype: str='function') -> Dict[str, BoundArgument]:
-    name2arg = {}
-    if calltype == 'method':
-        arg_types = callee.arg_types[1:]
-        arg_names = callee.arg_names[1:]
-    else:
-        arg_types = callee.arg_types
-        arg_names = callee.arg_names
+from . import context
 
-    for name, formal_typ, arg_typ, arg in zip(arg_names, arg_types, ctx.arg_types, ctx.args):
-        if len(arg) > 0 and len(arg_typ) > 0:
-            ba = BoundArgument(name, formal_typ, arg_typ[0], arg[0])
-        else:
-            ba = None
-        name2arg[name] = ba
 
-    return name2arg
+class BoundArgument:
+    __slots__ = ('name', 'formal_typ', 'arg_typ', 'arg', 'arg_types', 'args')
+
+    def __init__(self, name: str, formal_typ: Type,
+                 arg_types: List[Type], args: List[Expression]) -> None:
+        self.name = name
+        self.formal_typ = formal_typ
+        # the first actual; the only one unless the formal is *args or **kwargs
+        self.arg_typ = arg_types[0]
+        self.arg = args[0]
+        self.arg_types = arg_types
+        self.args = args
+
+    def __repr__(self) -> str:
+        return 'BoundArgument(%s, %s, %s)' % (self.name, self.formal_typ, self.arg_typ)
+
+
+class Layout:
+    """The formals of a callee, without ``self`` for methods."""
+    __slots__ = ('callee', 'names', 'formal_types', 'index')
+
+    def __init__(self, callee: CallableType, skip: int) -> None:
+        self.callee = callee
+        self.names = callee.arg_names[skip:]
+        self.formal_types = callee.arg_types[skip:]
+        self.index = {name: i for i, name in enumerate(self.names)}
+
+
+class BoundArguments:
+    """Formal name -> BoundArgument, or None for formals given no actual.
+
+    Read-only and dict-like; BoundArguments are created lazily.
+    """
+    __slots__ = ('layout', 'arg_types', 'args', 'bound')
+
+    def __init__(self, layout: Layout, arg_types: List[List[Type]],
+                 args: List[List[Expression]]) -> None:
+        self.layout = layout
+        self.arg_types = arg_types
+        self.args = args
+        self.bound = None  # type: Optional[List[Optional[BoundArgument]]]
+
+    def __getitem__(self, name: str) -> Optional[BoundArgument]:
+        return self.at(self.layout.index[name])
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.layout.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.layout.names)
+
+    def __len__(self) -> int:
+        return len(self.layout.names)
+
+    def get(self, name: str, default: Optional[BoundArgument]=None) -> Optional[BoundArgument]:
+        i = self.layout.index.get(name)
+        return default if i is None else self.at(i)
+
+    def keys(self) -> List[str]:
+        return self.layout.names
+
+    def values(self) -> List[Optional[BoundArgument]]:
+        bound = self.bound
+        if bound is None:
+            bound = self.bound = [None] * len(self.layout.names)
+        layout = self.layout
+        for i, (types, args) in enumerate(zip(self.arg_types, self.args)):
+            if bound[i] is None and types and args:
+                bound[i] = BoundArgument(layout.names[i], layout.formal_types[i], types, args)
+        return bound
+
+    def items(self) -> Iterable[Tuple[str, Optional[BoundArgument]]]:
+        return zip(self.layout.names, self.values())
+
+    def at(self, i: int) -> Optional[BoundArgument]:
+        if not self.arg_types[i] or not self.args[i]:
+            return None
+        if self.bound is None:
+            self.bound = [None] * len(self.layout.names)
+        ba = self.bound[i]
+        if ba is None:
+            ba = self.bound[i] = BoundArgument(
+                self.layout.names[i], self.layout.formal_types[i],
+                self.arg_types[i], self.args[i])
+        return ba
+
+
+def bind_arguments(callee: CallableType, ctx, calltype: str='function') -> BoundArguments:
+    layouts = context.current().layouts
+    layout = layouts.get(id(callee))
+    if layout is None or layout.callee is not callee:
+        layout = layouts[id(callee)] = Layout(callee, 1 if calltype == 'method' else 0)
+    return BoundArguments(layout, ctx.arg_types, ctx.args)
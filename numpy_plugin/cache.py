@@ -0,0 +1,218 @@
+"""Bounded caches for the type helpers, keyed on the structure of their arguments.
+
+mypy Types hash by identity, so an lru_cache keyed on them both misses on
+equal types built at different call sites and keeps every type it has seen
+alive. These caches key on a cheap structural description instead (the
+fullname plus the keys of the type arguments), evict the least recently used
+entry past a size bound, and count hits, misses and evictions.
+
+The entries belong to the current PluginContext, since the Instances they
+hold are only valid for the build that created them; the counts are kept
+per helper for the whole process.
+"""
+import atexit
+import functools
+import json
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from mypy.nodes import Expression, NameExpr, MemberExpr, StrExpr, TupleExpr, ListExpr
+from mypy.types import (Type, Instance, TupleType, AnyType, NoneTyp,
+                        UninhabitedType, TypeVarType, UnionType, FunctionLike)
+
+from . import context
+from .context import DEFAULT_MAXSIZE, PluginContext
+
+_counts = OrderedDict()  # type: OrderedDict[str, CacheCounts]
+MISSING = object()
+_stats_path = None  # type: Optional[str]
+
+
+class CacheCounts:
+    __slots__ = ('hits', 'misses', 'evictions')
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+class TypeCache:
+    __slots__ = ('name', 'maxsize', 'counts', 'data')
+
+    def __init__(self, name: str, maxsize: int=DEFAULT_MAXSIZE,
+                 counts: CacheCounts=None) -> None:
+        self.name = name
+        self.maxsize = maxsize
+        self.counts = CacheCounts() if counts is None else counts
+        self.data = OrderedDict()  # type: OrderedDict
+
+    @property
+    def hits(self) -> int:
+        return self.counts.hits
+
+    @property
+    def misses(self) -> int:
+        return self.counts.misses
+
+    @property
+    def evictions(self) -> int:
+        return self.counts.evictions
+
+    def get(self, key: Hashable) -> Any:
+        value = self.data.get(key, MISSING)
+        if value is MISSING:
+            self.counts.misses += 1
+        else:
+            self.counts.hits += 1
+            self.data.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        self.data[key] = value
+        if len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+            self.counts.evictions += 1
+
+    def clear(self) -> None:
+        self.data.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'size': len(self.data),
+            'maxsize': self.maxsize,
+        }
+
+
+def type_key(typ: Any) -> Optional[Hashable]:
+    """Structural key of a type, or None if it can't be keyed cheaply."""
+    if isinstance(typ, Instance):
+        if not typ.args:
+            return (typ.type.fullname(), typ.erased, ())
+        args = tuple(type_key(a) for a in typ.args)
+        if None in args:
+            return None
+        return (typ.type.fullname(), typ.erased, args)
+    if isinstance(typ, AnyType):
+        return ('Any', typ.type_of_any)
+    if isinstance(typ, NoneTyp):
+        return ('None',)
+    if isinstance(typ, TupleType):
+        items = tuple(type_key(i) for i in typ.items)
+        if None in items:
+            return None
+        return ('Tuple', items, type_key(typ.fallback))
+    if isinstance(typ, UninhabitedType):
+        return ('Uninhabited',)
+    if isinstance(typ, TypeVarType):
+        return ('TypeVar', typ.fullname, typ.id.raw_id, typ.id.meta_level)
+    if isinstance(typ, UnionType):
+        items = tuple(type_key(i) for i in typ.items)
+        if None in items:
+            return None
+        return ('Union', items)
+    if isinstance(typ, FunctionLike) and typ.is_type_obj():
+        # a class passed as a value, like the float of dtype=float
+        return ('TypeObj', typ.type_object().fullname())
+    if isinstance(typ, Type):
+        return None
+    # plain arguments such as ufunc names or flags
+    return typ
+
+
+def expr_key(expr: Expression) -> Hashable:
+    """What typefunctions read from an argument expression.
+
+    The dtype names in ``np.zeros(n, np.int32)`` or ``dtype='f'``, the
+    ``True`` of ``keepdims=True`` and the length of a literal shape; for
+    anything else only the kind of expression.
+    """
+    if isinstance(expr, NameExpr):
+        return ('NameExpr', expr.name, expr.fullname)
+    if isinstance(expr, MemberExpr):
+        return ('MemberExpr', expr.name)
+    if isinstance(expr, StrExpr):
+        return ('StrExpr', expr.value)
+    if isinstance(expr, (TupleExpr, ListExpr)):
+        return (type(expr).__name__, len(expr.items))
+    return type(expr).__name__
+
+
+def call_key(fullname: str, ctx) -> Optional[Hashable]:
+    """Key of a hooked call for the result memo, or None if it has none.
+
+    Two calls with equal keys are given the same type by the typefunctions:
+    the callee, its return type with type variables substituted, and the
+    types and ``expr_key`` of the actuals of every formal.
+    """
+    ret = type_key(ctx.default_return_type)
+    if ret is None:
+        return None
+    formals = []
+    for types, args in zip(ctx.arg_types, ctx.args):
+        keys = tuple(type_key(t) for t in types)
+        if None in keys:
+            return None
+        formals.append((keys, tuple(expr_key(a) for a in args)))
+    return (fullname, ret, tuple(formals))
+
+
+def register(name: str) -> str:
+    """Count a cache that is used through ``context_cache`` directly."""
+    if name not in _counts:
+        _counts[name] = CacheCounts()
+    return name
+
+
+def build_cache(f: Callable) -> Callable:
+    """Cache f on the structural keys of its arguments, per plugin context."""
+    name = '%s.%s' % (f.__module__, f.__name__)
+    counts = _counts[name] = CacheCounts()
+
+    @functools.wraps(f)
+    def wrapper(*args, **kwargs):
+        key = tuple(type_key(a) for a in args)
+        keywords = tuple((k, type_key(v)) for k, v in sorted(kwargs.items()))
+        if None in key or any(v is None for _, v in keywords):
+            return f(*args, **kwargs)
+        key += keywords
+        cache = context_cache(context.current(), name)
+        value = cache.get(key)
+        if value is MISSING:
+            value = f(*args, **kwargs)
+            cache.put(key, value)
+        return value
+
+    # the cache used outside of any build
+    wrapper.cache = context_cache(context.DEFAULT, name)
+    return wrapper
+
+
+def context_cache(ctx: PluginContext, name: str) -> TypeCache:
+    cache = ctx.caches.get(name)
+    if cache is None:
+        cache = ctx.caches[name] = TypeCache(name, ctx.maxsize, _counts[name])
+    return cache
+
+
+def cache_stats() -> Dict[str, Dict[str, int]]:
+    """Counts over the whole process; sizes for the current context."""
+    ctx = context.current()
+    return {name: context_cache(ctx, name).stats() for name in _counts}
+
+
+def write_cache_stats(path: str) -> None:
+    with open(path, 'w') as f:
+        json.dump(cache_stats(), f, indent=2, sort_keys=True)
+
+
+def write_cache_stats_at_exit(path: str) -> None:
+    global _stats_path
+    if _stats_path is None:
+        atexit.register(lambda: write_cache_stats(_stats_path))
+    _stats_path = path
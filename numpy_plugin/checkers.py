@@ -0,0 +1,103 @@
+"""What the checkers of calls (costs, copies, layout, shapes, loops and out
+buffers) share: finding the arguments of a call, and what they derive from
+the module being checked.
+"""
+from typing import Callable, Dict, Generic, Optional, Set, TypeVar
+
+from mypy.nodes import (ARG_STAR, CallExpr, Expression, MypyFile, Var, NameExpr, TupleExpr,
+                        ListExpr, AssignmentStmt, OperatorAssignmentStmt, ForStmt, FuncItem)
+from mypy.traverser import TraverserVisitor
+from mypy.types import Type, Instance
+
+T = TypeVar('T')
+
+# callee -> its call type, 'function' or 'method', for the callees a checker
+# looks at that aren't hooked for type inference
+Hooks = Dict[str, str]
+
+# the parameters taking buffers that results are written to
+OUT_PARAMETERS = ('out', 'out1', 'out2')
+
+
+def argument(call: CallExpr, name: str, position: Optional[int]) -> Optional[Expression]:
+    """The argument a call passes as ``name``, the parameter at ``position``
+    (None if keyword-only), or None if it doesn't or can't be told."""
+    for i, (arg, arg_name, kind) in enumerate(zip(call.args, call.arg_names, call.arg_kinds)):
+        if kind == ARG_STAR:
+            return None
+        if arg_name == name or arg_name is None and i == position:
+            return arg
+    return None
+
+
+class PerModule(Generic[T]):
+    """What ``derive(api)`` derives from the module a checker api checks.
+
+    mypy checks a module's calls together, so only the last module's is
+    kept.
+    """
+
+    def __init__(self, derive: Callable[..., T]) -> None:
+        self.derive = derive
+        self.tree = None  # type: Optional[MypyFile]
+        self.value = None  # type: Optional[T]
+
+    def get(self, api) -> T:
+        if api.tree is not self.tree:
+            self.tree = api.tree
+            self.value = self.derive(api)
+        return self.value
+
+
+class Assignments(TraverserVisitor):
+    """The value of every variable of a module that is assigned once.
+
+    Parameters are bound by every call: they have no value, and one that is
+    assigned in the body counts as assigned twice.
+    """
+
+    def __init__(self, tree: MypyFile) -> None:
+        self.values = {}  # type: Dict[Var, Optional[Expression]]
+        self.parameters = set()  # type: Set[Var]
+        tree.accept(self)
+
+    def visit_func(self, o: FuncItem) -> None:
+        self.parameters.update(arg.variable for arg in o.arguments)
+        super().visit_func(o)
+
+    def visit_assignment_stmt(self, s: AssignmentStmt) -> None:
+        for lvalue in s.lvalues:
+            self.assign(lvalue, s.rvalue if len(s.lvalues) == 1 else None)
+        super().visit_assignment_stmt(s)
+
+    def visit_operator_assignment_stmt(self, s: OperatorAssignmentStmt) -> None:
+        self.assign(s.lvalue, None)
+        super().visit_operator_assignment_stmt(s)
+
+    def visit_for_stmt(self, s: ForStmt) -> None:
+        self.assign(s.index, None)
+        super().visit_for_stmt(s)
+
+    def assign(self, lvalue: Expression, value: Optional[Expression]) -> None:
+        if isinstance(lvalue, (TupleExpr, ListExpr)):
+            for item in lvalue.items:
+                self.assign(item, None)
+        elif isinstance(lvalue, NameExpr) and isinstance(lvalue.node, Var):
+            var = lvalue.node
+            assigned = var in self.values or var in self.parameters
+            self.values[var] = None if assigned else value
+
+
+def is_array(typ: Type) -> bool:
+    return isinstance(typ, Instance) and typ.type.fullname() == 'numpy.ndarray'
+
+
+def enclosing_function(api) -> str:
+    func = api.scope.top_function()
+    module = api.tree.fullname()
+    if func is None:
+        return module
+    cls = api.scope.enclosing_class()
+    if cls is not None:
+        return '%s.%s' % (cls.fullname(), func.name())
+    return '%s.%s' % (module, func.name())
@@ -0,0 +1,94 @@
+"""Plugin options.
+
+Options are read from the ``[numpy-plugin]`` section of the mypy config file
+(``mypy.ini`` or ``setup.cfg``)::
+
+    [numpy-plugin]
+    cache_size = 4096
+
+and each can be overridden by an environment variable named after it, e.g.
+``NUMPY_PLUGIN_CACHE_SIZE=512``.
+"""
+import configparser
+import os
+from typing import Optional
+
+from mypy.options import Options
+
+from .activation import parse_patterns
+from .copies import parse_copy_checks
+from .costs import parse_size
+from .layout import parse_layout_checks
+from .loops import parse_loop_checks
+from .shapes import parse_shape_checks
+
+SECTION = 'numpy-plugin'
+ENV_PREFIX = 'NUMPY_PLUGIN_'
+
+
+class PluginConfig:
+    def __init__(self, parser: Optional[configparser.RawConfigParser]=None) -> None:
+        self.parser = parser if parser is not None else configparser.RawConfigParser()
+
+        # entries held by each type cache before the least recently used
+        # one is evicted; 0 disables caching
+        self.cache_size = self.get_int('cache_size', 4096)
+        # path to write cache hit/miss/eviction counters to at exit
+        self.cache_stats = self.get('cache_stats')
+        # path of the hook timing report written at exit, .json or .csv
+        self.profile = self.get('profile')
+        # include the tracemalloc peak of each function hook in the report
+        self.profile_memory = self.get_bool('profile_memory')
+        # SQLite database to record the type inferred at every hooked call in
+        self.export = self.get('export')
+        # module patterns to restrict inference to, e.g. ['ourpkg.science.*'];
+        # empty means every module
+        self.modules = parse_patterns(self.get('modules'))
+        # directory of prebuilt stub caches shared between projects; None
+        # or off means none is read or written
+        self.stub_cache = self.get('stub_cache')
+        # turn on mypy's incremental mode, so that the cache every run writes,
+        # seeded stubs included, is read back by the next one
+        self.incremental = self.get_bool('incremental')
+        # path of the per-function allocation and FLOP report written at
+        # exit (.json or .csv)
+        self.cost_report = self.get('cost_report')
+        # warn about single allocations above this many bytes, e.g. 512M
+        self.memory_budget = parse_size(self.get('memory_budget'))
+        # (module pattern, diagnostic codes) to report redundant copies for
+        self.copy_checks = parse_copy_checks(self.get('copy_checks'))
+        # (module pattern, diagnostic codes) to report copies forced by
+        # non-contiguous layouts for
+        self.layout_checks = parse_layout_checks(self.get('layout_checks'))
+        # (module pattern, diagnostic codes) to report mismatched and outer
+        # broadcasts for
+        self.shape_checks = parse_shape_checks(self.get('shape_checks'))
+        # (module pattern, diagnostic codes) to report element-by-element
+        # array access in loops for
+        self.loop_checks = parse_loop_checks(self.get('loop_checks'))
+        # path of the report of such accesses per loop written at exit
+        # (.json or .csv)
+        self.loop_report = self.get('loop_report')
+
+    @classmethod
+    def from_options(cls, options: Options) -> 'PluginConfig':
+        parser = configparser.RawConfigParser()
+        if options.config_file is not None:
+            parser.read(options.config_file)
+        return cls(parser)
+
+    def get(self, name: str, default: Optional[str]=None) -> Optional[str]:
+        env = os.environ.get(ENV_PREFIX + name.upper())
+        if env is not None:
+            return env
+        return self.parser.get(SECTION, name, fallback=default)
+
+    def get_int(self, name: str, default: int) -> int:
+        value = self.get(name)
+        return default if value is None else int(value)
+
+    def get_bool(self, name: str, default: bool=False) -> bool:
+        value = self.get(name)
+        if value is None:
+            return default
+        return value.strip().lower() in ('1', 'true', 'yes', 'on')
@@ -0,0 +1,47 @@
+"""Per-plugin state: the checker API, the type caches and callee layouts.
+
+Every NumpyPlugin owns a PluginContext and makes it the current one for the
+duration of each hook call, so several builds can share a process, back to
+back or in threads, without seeing each other's API or cached Instances.
+The current context is thread-local; outside of a hook it is ``DEFAULT``.
+"""
+import threading
+from typing import Any, Dict
+
+DEFAULT_MAXSIZE = 4096
+
+
+class PluginContext:
+    __slots__ = ('api', 'maxsize', 'caches', 'layouts', 'checks')
+
+    def __init__(self, maxsize: int=DEFAULT_MAXSIZE) -> None:
+        self.api = None  # type: Any
+        self.maxsize = maxsize
+        # cache name -> TypeCache, filled by cache.build_cache on first use
+        self.caches = {}  # type: Dict[str, Any]
+        # id(callee) -> bind_arguments.Layout
+        self.layouts = {}  # type: Dict[int, Any]
+        # activation.CodeFilter of the copy_checks diagnostics typefunctions
+        # report, or None
+        self.checks = None  # type: Any
+
+
+DEFAULT = PluginContext()
+
+class _Local(threading.local):
+    # the class attribute is the default in every thread
+    context = DEFAULT
+
+
+_local = _Local()
+
+
+def current() -> PluginContext:
+    return _local.context
+
+
+def swap(context: PluginContext) -> PluginContext:
+    """Make ``context`` current in this thread; return the one it replaces."""
+    previous = _local.context
+    _local.context = context
+    return previous
@@ -0,0 +1,381 @@
+"""Diagnostics for copies that can be dropped.
+
+Each diagnostic has a code, appended to its message, and is only reported in
+the modules the ``copy_checks`` option enables it for. Every line of the
+option is a module pattern, as in ``modules``, optionally followed by the
+codes to enable there (all of them by default)::
+
+    [numpy-plugin]
+    copy_checks =
+        ourpkg.hot.*
+        ourpkg.io: redundant-astype, redundant-asarray
+
+In ``NUMPY_PLUGIN_COPY_CHECKS`` the lines are separated by semicolons.
+
+The codes are:
+
+``redundant-array-copy``
+    ``np.array(x)`` copies the array ``x`` (``copy=True`` is the default),
+    but neither the copy nor ``x`` is ever written to or passed anywhere
+    that could write to it; ``np.asarray(x)`` would do.
+``redundant-astype``
+    ``a.astype(dtype)`` converts ``a`` to the dtype it already has. Only
+    reported when the dtype of ``a`` is known from the call that created it.
+``redundant-copy-chain``
+    ``a.copy()`` is passed straight to an operation that copies again:
+    ``np.array``, ``astype`` or ``copy``.
+``redundant-asarray``
+    ``np.asarray`` of ``np.array``, ``np.asarray`` or ``np.ascontiguousarray``
+    returns its argument unchanged.
+``chained-advanced-index``
+    ``a[mask][idx]``: advanced indexing of the copy made by advanced
+    indexing, which copies again. Reported by the ``__getitem__``
+    typefunction, from how it classifies both indices.
+
+Whether an array is only read is decided per module from how every variable
+holding it is used: as an operand, an index, a condition, the array of an
+index or view that is itself only read, or an argument of a numpy function
+or of a method that doesn't write to its array. An ``out`` buffer, passed
+by keyword or by position, is written to; the array a numpy function may
+return a view of, like ``np.reshape(a, -1)``, is only read if the view is.
+"""
+from typing import Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from mypy.nodes import (Expression, Var, NameExpr, MemberExpr, StrExpr, RefExpr,
+                        IndexExpr, CallExpr, OpExpr, ComparisonExpr, UnaryExpr, FuncDef,
+                        AssignmentStmt, IfStmt, WhileStmt, AssertStmt, MypyFile,
+                        ARG_POS, ARG_OPT)
+from mypy.types import Type
+
+from .activation import CodeFilter, parse_code_rules
+from .bind_arguments import BoundArguments
+from .checkers import Hooks, OUT_PARAMETERS, PerModule, Assignments, argument, is_array
+from .tables import DTYPE_ALIASES
+
+CODES = ('redundant-array-copy', 'redundant-astype', 'redundant-copy-chain',
+         'redundant-asarray', 'chained-advanced-index')
+COPY_HOOKS = {'numpy.ndarray.copy': 'method'}  # type: Hooks
+
+# type character -> dtype name, for messages
+CHAR_NAMES = {
+    '?': 'bool', 'b': 'int8', 'h': 'int16', 'i': 'int32', 'l': 'int64', 'B': 'uint8',
+    'H': 'uint16', 'I': 'uint32', 'L': 'uint64', 'e': 'float16', 'f': 'float32',
+    'd': 'float64',
+}
+# numpy functions that return their argument, or a view of it, when they can
+ASARRAY = ('numpy.asarray', 'numpy.asanyarray', 'numpy.ascontiguousarray')
+# constructor -> (position of dtype, default type character)
+CONSTRUCTOR_DTYPES = {
+    'numpy.zeros': (1, 'd'), 'numpy.ones': (1, 'd'), 'numpy.empty': (1, 'd'),
+    'numpy.full': (2, None), 'numpy.eye': (3, 'd'), 'numpy.identity': (1, 'd'),
+    'numpy.random.rand': (None, 'd'), 'numpy.random.randn': (None, 'd'),
+    'numpy.random.random': (None, 'd'),
+}
+# numpy functions that write to their first argument
+MUTATING_FUNCTIONS = ('numpy.copyto', 'numpy.put', 'numpy.place', 'numpy.putmask',
+                      'numpy.fill_diagonal', 'numpy.random.shuffle')
+READONLY_BUILTINS = ('builtins.len', 'builtins.print', 'builtins.str', 'builtins.repr',
+                     'builtins.float', 'builtins.int', 'builtins.bool', 'builtins.isinstance')
+# methods that don't write to their array or return a view of it
+READONLY_METHODS = frozenset((
+    'all', 'any', 'argmax', 'argmin', 'argsort', 'astype', 'copy', 'cumprod', 'cumsum',
+    'dot', 'flatten', 'item', 'max', 'mean', 'min', 'nonzero', 'prod', 'ptp', 'round',
+    'std', 'sum', 'tobytes', 'tofile', 'tolist', 'trace', 'var',
+))
+VIEW_METHODS = frozenset(('reshape', 'ravel', 'squeeze', 'swapaxes', 'transpose', 'view'))
+# numpy functions that may return their first argument or a view of it
+VIEW_FUNCTIONS = frozenset((
+    'numpy.asarray', 'numpy.asanyarray', 'numpy.ascontiguousarray', 'numpy.asfortranarray',
+    'numpy.reshape', 'numpy.ravel', 'numpy.transpose', 'numpy.swapaxes', 'numpy.squeeze',
+    'numpy.diagonal', 'numpy.moveaxis', 'numpy.rollaxis', 'numpy.expand_dims',
+    'numpy.atleast_1d', 'numpy.atleast_2d', 'numpy.atleast_3d', 'numpy.broadcast_to',
+    'numpy.real', 'numpy.imag',
+))
+VIEW_ATTRIBUTES = frozenset(('T', 'real', 'imag'))
+
+def parse_copy_checks(value: Optional[str]) -> List[Tuple[str, FrozenSet[str]]]:
+    return parse_code_rules(value, CODES)
+
+
+class Uses(Assignments):
+    """How the variables of a module are used.
+
+    Counts every load of a variable, and the loads in positions that only
+    read the array it holds.
+    """
+
+    def __init__(self, tree: MypyFile) -> None:
+        self.loads = {}  # type: Dict[Var, int]
+        self.readonly_loads = {}  # type: Dict[Var, int]
+        self.readonly = set()  # type: Set[Expression]
+        # assignment targets, and the member expressions that are called
+        self.stores = set()  # type: Set[Expression]
+        self.callees = set()  # type: Set[Expression]
+        # call expression -> the variable it is assigned to
+        self.bound = {}  # type: Dict[Expression, Var]
+        super().__init__(tree)
+
+    def only_read(self, expr: Expression) -> bool:
+        """Whether the array ``expr`` evaluates to is never written to."""
+        if isinstance(expr, NameExpr) and isinstance(expr.node, Var):
+            var = expr.node
+        elif expr in self.readonly:
+            return True
+        else:
+            var = self.bound.get(expr)
+        if var is None or self.values.get(var) is None and var in self.values:
+            # assigned more than once
+            return False
+        return self.loads.get(var, 0) == self.readonly_loads.get(var, 0)
+
+    def mark(self, expr: Expression) -> None:
+        # through indexing and views, to the array they are taken from
+        while True:
+            if isinstance(expr, IndexExpr):
+                expr = expr.base
+            elif isinstance(expr, MemberExpr) and expr.name in VIEW_ATTRIBUTES:
+                expr = expr.expr
+            elif (isinstance(expr, CallExpr) and isinstance(expr.callee, MemberExpr)
+                    and not expr.callee.fullname and expr.callee.name in VIEW_METHODS):
+                expr = expr.callee.expr
+            elif callee_fullname(expr) in VIEW_FUNCTIONS and expr.args:
+                expr = expr.args[source_index(expr)]
+            else:
+                break
+        if expr in self.readonly:
+            return
+        self.readonly.add(expr)
+        if isinstance(expr, NameExpr) and isinstance(expr.node, Var):
+            self.readonly_loads[expr.node] = self.readonly_loads.get(expr.node, 0) + 1
+
+    def visit_assignment_stmt(self, s: AssignmentStmt) -> None:
+        self.stores.update(s.lvalues)
+        if len(s.lvalues) == 1 and isinstance(s.lvalues[0], NameExpr) and \
+                isinstance(s.lvalues[0].node, Var):
+            self.bound[s.rvalue] = s.lvalues[0].node
+        super().visit_assignment_stmt(s)
+
+    def visit_name_expr(self, e: NameExpr) -> None:
+        if isinstance(e.node, Var) and e not in self.stores:
+            self.loads[e.node] = self.loads.get(e.node, 0) + 1
+
+    def visit_op_expr(self, e: OpExpr) -> None:
+        self.mark(e.left)
+        self.mark(e.right)
+        super().visit_op_expr(e)
+
+    def visit_comparison_expr(self, e: ComparisonExpr) -> None:
+        for operand in e.operands:
+            self.mark(operand)
+        super().visit_comparison_expr(e)
+
+    def visit_unary_expr(self, e: UnaryExpr) -> None:
+        self.mark(e.expr)
+        super().visit_unary_expr(e)
+
+    def visit_index_expr(self, e: IndexExpr) -> None:
+        self.mark(e.index)
+        super().visit_index_expr(e)
+
+    def visit_member_expr(self, e: MemberExpr) -> None:
+        if (not e.fullname and e.name not in VIEW_ATTRIBUTES
+                and e not in self.callees and e not in self.stores):
+            # a.shape, a.dtype, ...
+            self.mark(e.expr)
+        super().visit_member_expr(e)
+
+    def visit_call_expr(self, e: CallExpr) -> None:
+        callee = e.callee
+        fullname = callee.fullname if isinstance(callee, RefExpr) else None
+        args = list(zip(e.args, e.arg_names))
+        if isinstance(callee, MemberExpr) and not fullname:
+            self.callees.add(callee)
+            if callee.name in READONLY_METHODS:
+                self.mark(callee.expr)
+                for arg, _ in args:
+                    self.mark(arg)
+        elif fullname and (fullname.startswith('numpy.') or fullname in READONLY_BUILTINS):
+            names = formals(e)
+            if fullname in MUTATING_FUNCTIONS or fullname in VIEW_FUNCTIONS:
+                # written to, or only read if the view is
+                skipped = source_index(e)
+                args = [a for i, a in enumerate(args) if i != skipped]
+                names = [n for i, n in enumerate(names) if i != skipped]
+            for (arg, _), name in zip(args, names):
+                if name not in OUT_PARAMETERS:
+                    self.mark(arg)
+        super().visit_call_expr(e)
+
+    def visit_if_stmt(self, s: IfStmt) -> None:
+        for expr in s.expr:
+            self.mark(expr)
+        super().visit_if_stmt(s)
+
+    def visit_while_stmt(self, s: WhileStmt) -> None:
+        self.mark(s.expr)
+        super().visit_while_stmt(s)
+
+    def visit_assert_stmt(self, s: AssertStmt) -> None:
+        self.mark(s.expr)
+        super().visit_assert_stmt(s)
+
+
+class CopyChecker:
+    def __init__(self, rules: List[Tuple[str, FrozenSet[str]]]) -> None:
+        self.filter = CodeFilter(rules)
+        # how the variables of the module being checked are used
+        self.uses = PerModule(lambda api: Uses(api.tree))
+
+    def wrap_hook(self, func: Callable, bind: Callable) -> Callable:
+        """Check the calls of a ``function_hook(fullname, calltype, ctx)``.
+
+        ``bind(fullname, calltype, ctx)`` returns the call's BoundArguments,
+        or None before the plugin is set up.
+        """
+        def checked(fullname, calltype, ctx):
+            result = func(fullname, calltype, ctx)
+            if isinstance(ctx.context, CallExpr):
+                codes = self.filter.enabled(ctx.api.tree.fullname())
+                if codes:
+                    bound_args = bind(fullname, calltype, ctx)
+                    if bound_args is not None:
+                        self.check(fullname, bound_args, ctx, codes)
+            return result
+
+        return checked
+
+    def check(self, fullname: str, bound_args: BoundArguments, ctx,
+              codes: FrozenSet[str]) -> None:
+        api = ctx.api
+        uses = self.uses.get(api)
+        call = ctx.context
+        type_map = api.type_map
+
+        if fullname == 'numpy.array':
+            obj = bound_args['object']
+            if not is_true(bound_args['copy']):
+                return
+            if is_copy_call(obj.arg, type_map):
+                self.report('np.array() copies the result of copy() again; drop the copy()',
+                            'redundant-copy-chain', codes, ctx)
+            elif (is_array(obj.arg_typ) and uses.only_read(call)
+                    and source_only_read(obj.arg, uses)):
+                self.report('np.array() copies an array, but neither the array nor the copy is '
+                            'written to; use np.asarray()', 'redundant-array-copy', codes, ctx)
+        elif fullname in ASARRAY:
+            obj = bound_args['object']
+            inner = callee_fullname(obj.arg)
+            if bound_args['dtype'] is None and inner in ('numpy.array',) + ASARRAY:
+                self.report('%s() of %s() returns its argument unchanged'
+                            % (short(fullname), short(inner)), 'redundant-asarray', codes, ctx)
+        elif fullname in ('numpy.ndarray.astype', 'numpy.ndarray.copy'):
+            receiver = call.callee.expr
+            if fullname == 'numpy.ndarray.astype' and not is_true(bound_args['copy']):
+                return
+            name = fullname.rsplit('.', 1)[-1]
+            if is_copy_call(receiver, type_map):
+                self.report('%s() copies the result of copy() again; drop the copy()' % name,
+                            'redundant-copy-chain', codes, ctx)
+            elif name == 'astype':
+                char = dtype_char(bound_args['dtype'].arg)
+                if char is not None and array_char(receiver, uses) == char:
+                    self.report('astype() converts an array of dtype %s to the dtype it '
+                                'already has' % CHAR_NAMES[char], 'redundant-astype', codes,
+                                ctx)
+
+    def report(self, message: str, code: str, codes: FrozenSet[str], ctx) -> None:
+        # mypy drops repeated messages
+        if code in codes:
+            ctx.api.msg.fail('%s  [%s]' % (message, code), ctx.context)
+
+
+def is_true(arg) -> bool:
+    """Whether a bool argument is absent (and True by default) or ``True``."""
+    return arg is None or isinstance(arg.arg, NameExpr) and arg.arg.fullname == 'builtins.True'
+
+
+def is_copy_call(expr: Expression, type_map: Dict[Expression, Type]) -> bool:
+    """Whether ``expr`` is ``a.copy()`` of an array ``a``."""
+    if not isinstance(expr, CallExpr) or expr.args:
+        return False
+    callee = expr.callee
+    return (isinstance(callee, MemberExpr) and callee.name == 'copy' and not callee.fullname
+            and is_array(type_map.get(callee.expr)))
+
+
+def source_only_read(expr: Expression, uses: Uses) -> bool:
+    if isinstance(expr, NameExpr):
+        return isinstance(expr.node, Var) and uses.only_read(expr)
+    fullname = callee_fullname(expr)
+    # a temporary, unless it may be the argument of an asarray
+    return fullname is not None and fullname.startswith('numpy.') and \
+        fullname not in ASARRAY
+
+
+def callee_fullname(expr: Expression) -> Optional[str]:
+    if isinstance(expr, CallExpr) and isinstance(expr.callee, RefExpr):
+        return expr.callee.fullname or None
+    return None
+
+
+def formals(call: CallExpr) -> List[Optional[str]]:
+    """The name of the parameter each argument of a call is bound to, or
+    None where the callee's signature isn't known."""
+    node = call.callee.node if isinstance(call.callee, RefExpr) else None
+    positional = []  # type: List[str]
+    if isinstance(node, FuncDef):
+        for name, kind in zip(node.arg_names, node.arg_kinds):
+            if kind not in (ARG_POS, ARG_OPT):
+                break
+            positional.append(name)
+    return [name if name is not None else
+            positional[i] if kind == ARG_POS and i < len(positional) else None
+            for i, (name, kind) in enumerate(zip(call.arg_names, call.arg_kinds))]
+
+
+def source_index(call: CallExpr) -> int:
+    """The position of the argument bound to the callee's first parameter."""
+    node = call.callee.node if isinstance(call.callee, RefExpr) else None
+    if isinstance(node, FuncDef) and node.arg_names:
+        names = formals(call)
+        if node.arg_names[0] in names:
+            return names.index(node.arg_names[0])
+    return 0
+
+
+def short(fullname: str) -> str:
+    return 'np.' + fullname[len('numpy.'):]
+
+
+def dtype_char(expr: Optional[Expression]) -> Optional[str]:
+    if isinstance(expr, (NameExpr, MemberExpr)):
+        return DTYPE_ALIASES.get(expr.name)
+    if isinstance(expr, StrExpr):
+        return DTYPE_ALIASES.get(expr.value)
+    return None
+
+
+def array_char(expr: Expression, uses: Uses, depth: int=0) -> Optional[str]:
+    """The type character of the array ``expr``, from the call creating it."""
+    if depth > 8:
+        return None
+    if isinstance(expr, NameExpr) and isinstance(expr.node, Var):
+        value = uses.values.get(expr.node)
+        return None if value is None else array_char(value, uses, depth + 1)
+    if not isinstance(expr, CallExpr):
+        return None
+    callee = expr.callee
+    if isinstance(callee, MemberExpr) and not callee.fullname:
+        if callee.name == 'astype':
+            return dtype_char(argument(expr, 'dtype', 0))
+        if callee.name == 'copy' or callee.name in VIEW_METHODS:
+            return array_char(callee.expr, uses, depth + 1)
+        return None
+    fullname = callee_fullname(expr)
+    if fullname not in CONSTRUCTOR_DTYPES:
+        return None
+    position, default = CONSTRUCTOR_DTYPES[fullname]
+    if position is None:
+        return default
+    dtype = argument(expr, 'dtype', position)
+    return default if dtype is None else dtype_char(dtype)
@@ -0,0 +1,293 @@
+"""Static estimates of the memory allocated and the FLOPs done per function.
+
+Enabled by the ``cost_report`` option (or ``NUMPY_PLUGIN_COST_REPORT``),
+which names the report written at exit: JSON if the path ends in ``.json``,
+CSV otherwise. For every function (and module body) it lists the bytes
+allocated and the floating-point operations done by the numpy calls whose
+extents are known, the largest single allocation, and how many costed calls
+had unknown extents.
+
+Shapes are those the shape checker (``numpy_plugin.shapes``) infers, and a
+call is costed when all its extents are ints: literal, ``np.zeros((1000,
+1000))``, or derived from names assigned exactly once, ``N = 1000;
+np.eye(N)``, and from the arrays such calls return. Constructors, ufuncs, reductions,
+``einsum`` and ``linalg`` are costed; operators like ``a + b`` are not. An
+``einsum`` is costed in its best contraction order when ``optimize=`` is
+passed, looping over all its indices at once otherwise.
+
+With ``memory_budget`` set (bytes, or with a K/M/G suffix), every single
+allocation above it is reported as a warning at its call site, whether or
+not a report is written.
+"""
+import atexit
+import csv
+import json
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+from mypy.nodes import Expression, NameExpr, MemberExpr, StrExpr, CallExpr
+from mypy.types import Type, Instance
+
+from .bind_arguments import BoundArguments
+from .checkers import PerModule, enclosing_function, is_array
+from .einsum import naive_flops, optimal_path
+from .shapes import (Shapes, format_shape, is_ufunc, multiply, SHAPE_CONSTRUCTORS,
+                     LIKE_CONSTRUCTORS, REDUCTIONS, CUMULATIVE, Shape as SymbolicShape)
+from .shortcuts import ELEMENT_CHARS
+from .tables import DTYPE_ALIASES, ITEMSIZES
+
+Shape = Tuple[int, ...]
+
+# floating-point operations per input element, where it isn't one
+FLOPS_PER_ELEMENT = {'std': 3, 'var': 3, 'average': 2}
+# callees costed here but not hooked for type inference; the plugin hooks
+# them when costs are on
+EXTRA_HOOKS = ('numpy.eye', 'numpy.einsum', 'numpy.random.rand', 'numpy.random.randn',
+               'numpy.linalg.cholesky')
+
+_SIZE = re.compile(r'^\s*(\d+(?:\.\d*)?)\s*([kmgt]?)i?b?\s*$', re.IGNORECASE)
+
+_model = None  # type: Optional[CostModel]
+
+
+def parse_size(value: Optional[str]) -> Optional[int]:
+    """Bytes in ``'512M'``, ``'2GiB'`` or ``'1000000'``; powers of 1024."""
+    if value is None or not value.strip():
+        return None
+    m = _SIZE.match(value)
+    if m is None:
+        raise ValueError('invalid size: %r' % value)
+    number, unit = m.groups()
+    return int(float(number) * 1024 ** ' kmgt'.index(unit.lower() or ' '))
+
+
+def format_bytes(n: int) -> str:
+    for unit in ('B', 'KiB', 'MiB', 'GiB'):
+        if n < 1024:
+            break
+        n /= 1024
+    else:
+        unit = 'TiB'
+    return ('%d %s' if unit == 'B' else '%.1f %s') % (n, unit)
+
+
+class Cost:
+    __slots__ = ('shape', 'itemsize', 'allocated', 'flops', 'extra')
+
+    def __init__(self, shape: Optional[Shape], itemsize: int=0,
+                 allocated: bool=True, flops: int=0, extra: int=0) -> None:
+        # of the result; None when unknown
+        self.shape = shape
+        self.itemsize = itemsize
+        # False for views, scalars and results written to out=
+        self.allocated = allocated
+        self.flops = flops
+        # elements allocated besides the result, like eigh's eigenvalues
+        self.extra = extra
+
+    @property
+    def bytes(self) -> int:
+        if not self.allocated or self.shape is None:
+            return 0
+        return (multiply(self.shape) + self.extra) * self.itemsize
+
+
+class CallRecord:
+    __slots__ = ('file', 'function', 'line', 'callee', 'bytes', 'flops', 'known')
+
+    def __init__(self, file: str, function: str, line: int, callee: str,
+                 bytes: int, flops: int, known: bool) -> None:
+        self.file = file
+        self.function = function
+        self.line = line
+        self.callee = callee
+        self.bytes = bytes
+        self.flops = flops
+        self.known = known
+
+
+class CostModel:
+    def __init__(self, output: Optional[str], budget: Optional[int]) -> None:
+        self.output = output
+        self.budget = budget
+        # (file, line, column, callee) of a call -> its cost; a call checked
+        # twice, or rechecked by the daemon, is counted once
+        self.calls = {}  # type: Dict[Tuple[str, int, int, str], Tuple[CallRecord, Cost]]
+        # the shapes of the module being checked
+        self.shapes = PerModule(lambda api: Shapes(api.tree, api.type_map))
+
+    def wrap_hook(self, func: Callable, bind: Callable) -> Callable:
+        """Cost the calls of a ``function_hook(fullname, calltype, ctx)``.
+
+        ``bind(fullname, calltype, ctx)`` returns the call's BoundArguments,
+        or None before the plugin is set up.
+        """
+        def costed(fullname, calltype, ctx):
+            result = func(fullname, calltype, ctx)
+            if isinstance(ctx.context, CallExpr):
+                bound_args = bind(fullname, calltype, ctx)
+                if bound_args is not None:
+                    self.record(fullname, bound_args, ctx, result)
+            return result
+
+        return costed
+
+    def record(self, fullname: str, bound_args: BoundArguments, ctx, result: Type) -> None:
+        api = ctx.api
+        shapes = self.shapes.get(api)
+        shapes.type_map = api.type_map
+        cost = estimate(shapes, fullname, bound_args, ctx, result)
+        if cost is None:
+            return
+        call = ctx.context
+        record = CallRecord(api.path, enclosing_function(api), call.line, fullname,
+                            cost.bytes, cost.flops, cost.shape is not None)
+        self.calls[(api.path, call.line, call.column, fullname)] = (record, cost)
+        if self.budget is not None and record.bytes > self.budget:
+            api.msg.warn('%s allocates %s for an array of shape %s, over the memory budget '
+                         'of %s' % (fullname, format_bytes(record.bytes),
+                                    format_shape(cost.shape), format_bytes(self.budget)),
+                         call)
+
+    def report(self) -> Dict[str, List[Dict]]:
+        functions = {}  # type: Dict[Tuple[str, str], Dict]
+        for record, cost in self.calls.values():
+            row = functions.get((record.file, record.function))
+            if row is None:
+                row = functions[record.file, record.function] = {
+                    'file': record.file, 'function': record.function,
+                    'bytes_allocated': 0, 'flops': 0, 'largest_allocation_bytes': 0,
+                    'largest_allocation_site': '', 'costed_calls': 0, 'unknown_calls': 0,
+                }
+            row['costed_calls'] += 1
+            if not record.known:
+                row['unknown_calls'] += 1
+                continue
+            row['bytes_allocated'] += record.bytes
+            row['flops'] += record.flops
+            if record.bytes > row['largest_allocation_bytes']:
+                row['largest_allocation_bytes'] = record.bytes
+                row['largest_allocation_site'] = '%s:%d %s' % (record.file, record.line,
+                                                               record.callee)
+        rows = sorted(functions.values(),
+                      key=lambda r: (-r['bytes_allocated'], -r['flops'], r['file'], r['function']))
+        return {'functions': rows}
+
+    def write(self) -> None:
+        report = self.report()
+        with open(self.output, 'w') as f:
+            if self.output.endswith('.json'):
+                json.dump(report, f, indent=2)
+            elif report['functions']:
+                writer = csv.DictWriter(f, fieldnames=list(report['functions'][0]))
+                writer.writeheader()
+                writer.writerows(report['functions'])
+
+
+def get_cost_model(output: Optional[str], budget: Optional[int]) -> CostModel:
+    """The process-wide cost model; a dmypy server accumulates across builds."""
+    global _model
+    if _model is None:
+        _model = CostModel(output, budget)
+        atexit.register(_write_at_exit)
+    _model.output = output
+    _model.budget = budget
+    return _model
+
+
+def _write_at_exit() -> None:
+    if _model is not None and _model.output:
+        _model.write()
+
+
+###############################################################################
+
+
+def estimate(shapes: Shapes, fullname: str, bound_args: BoundArguments, ctx,
+             result: Type) -> Optional[Cost]:
+    """The cost of a call, None if the callee isn't costed."""
+    args = {name: ba.arg for name, ba in bound_args.items()
+            if ba is not None and len(ba.args) == 1}
+    name = fullname.rsplit('.', 1)[-1]
+    itemsize = result_itemsize(args.get('dtype'), result)
+    # inferred from the call itself: its type isn't recorded until the hook
+    # returns
+    shape = known(shapes.infer(ctx.context, 0))
+
+    if fullname in SHAPE_CONSTRUCTORS:
+        if SHAPE_CONSTRUCTORS[fullname][0] not in args:
+            # numpy.random draws a scalar when size is left out
+            return Cost((), itemsize, allocated=False)
+        return Cost(shape, itemsize)
+    if fullname in ('numpy.random.rand', 'numpy.random.randn'):
+        return Cost(shape, itemsize, allocated=shape != ())
+    if fullname in ('numpy.eye', 'numpy.arange', 'numpy.ndarray.astype') or \
+            fullname in LIKE_CONSTRUCTORS:
+        return Cost(shape, itemsize)
+    if fullname in ('numpy.reshape', 'numpy.ndarray.reshape'):
+        return Cost(shape, itemsize, allocated=False)
+    if is_ufunc(fullname):
+        return Cost(shape, itemsize, allocated='out' not in args and is_array(result),
+                    flops=0 if shape is None else multiply(shape))
+    if fullname.count('.') == 1 and name in REDUCTIONS + CUMULATIVE and 'a' in args:
+        a = known(shapes.shape(args['a']))
+        if a is None:
+            return Cost(None, itemsize)
+        return Cost(shape, itemsize, allocated='out' not in args and is_array(result),
+                    flops=multiply(a) * FLOPS_PER_ELEMENT.get(name, 1))
+    if fullname == 'numpy.einsum':
+        return einsum_cost(shapes, ctx.context, args, itemsize)
+    if fullname == 'numpy.linalg.cholesky':
+        a = known(shapes.shape(args['a'])) if 'a' in args else None
+        n = a[0] if a is not None and len(a) == 2 else None
+        return Cost(None if n is None else (n, n), itemsize, flops=0 if n is None else n ** 3 // 3)
+    if fullname == 'numpy.linalg.eigh':
+        a = known(shapes.shape(args['a'])) if 'a' in args else None
+        n = a[-1] if a else None
+        # eigenvalues and eigenvectors by symmetric QR, about 9n^3 (Golub & Van Loan)
+        return Cost(None if n is None else (n, n), 8, flops=0 if n is None else 9 * n ** 3,
+                    extra=0 if n is None else n)
+    return None
+
+
+def known(shape: Optional[SymbolicShape]) -> Optional[Shape]:
+    """A shape whose extents are all ints, else None."""
+    if shape is None or not all(isinstance(e, int) for e in shape):
+        return None
+    return shape
+
+
+def result_itemsize(dtype: Optional[Expression], result: Type) -> int:
+    char = None
+    if isinstance(dtype, (NameExpr, MemberExpr)):
+        char = DTYPE_ALIASES.get(dtype.name)
+    elif isinstance(dtype, StrExpr):
+        char = DTYPE_ALIASES.get(dtype.value)
+    if char is None:
+        element = result
+        if isinstance(result, Instance) and result.type.fullname() == 'numpy.ndarray':
+            element = result.args[0]
+        if isinstance(element, Instance):
+            char = ELEMENT_CHARS.get(element.type.fullname())
+    return ITEMSIZES.get(char, 8)
+
+
+def einsum_cost(shapes: Shapes, call: CallExpr, args: Dict[str, Expression],
+                itemsize: int) -> Cost:
+    found = shapes.einsum(call)
+    if found is None or not all(isinstance(e, int) for e in found[1].values()):
+        return Cost(None, itemsize)
+    terms, extents = found
+    flops = naive_flops(terms, extents)
+    if is_optimized(args.get('optimize')):
+        path = optimal_path(terms, extents)
+        flops = flops if path is None else min(flops, path[0])
+    return Cost(tuple(extents[i] for i in terms[1]), itemsize,
+                allocated='out' not in args, flops=flops)
+
+
+def is_optimized(optimize: Optional[Expression]) -> bool:
+    """Whether an ``optimize=`` argument asks ``np.einsum`` for a contraction
+    order: anything but ``False``."""
+    return optimize is not None and not (isinstance(optimize, NameExpr) and
+                                         optimize.fullname == 'builtins.False')
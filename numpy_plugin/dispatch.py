@@ -0,0 +1,94 @@
+"""Hook dispatch index, built once from the bundled numpy stub package.
+
+mypy asks the plugin for a hook on every call expression in the program, so
+deciding whether a callee is ours has to be a single dict lookup. The index is
+computed from the stub sources with a single walk over each signature,
+collecting every name that appears in its annotations and intersecting that
+with the registered typefunction names. Every module of the stub package is
+indexed, whether or not a build ends up importing it.
+"""
+import ast
+import os
+from typing import Dict, Iterable, Iterator, Set, Tuple
+
+STUBS_DIR = os.path.join(os.path.dirname(__file__), 'stubs')
+
+# Classes whose methods are dispatched through ``get_method_hook``.
+METHOD_CLASSES = ('numpy.ndarray',)
+
+
+def build_dispatch_index(typefunction_names: Iterable[str],
+                         stubs_dir: str=STUBS_DIR) -> Dict[str, str]:
+    """Map the fullname of every stub signature that mentions a typefunction
+    to its call type, ``'function'`` or ``'method'``.
+    """
+    wanted = {name.rsplit('.', 1)[-1] for name in typefunction_names}
+    index = {}
+    for module, path in stub_modules(stubs_dir):
+        with open(path) as f:
+            tree = ast.parse(f.read(), filename=path)
+
+        for node in tree.body:
+            if isinstance(node, ast.FunctionDef):
+                if _mentions(node, wanted):
+                    index['%s.%s' % (module, node.name)] = 'function'
+            elif (isinstance(node, ast.ClassDef) and
+                    '%s.%s' % (module, node.name) in METHOD_CLASSES):
+                for item in node.body:
+                    if isinstance(item, ast.FunctionDef) and _mentions(item, wanted):
+                        index['%s.%s.%s' % (module, node.name, item.name)] = 'method'
+    return index
+
+
+def stub_modules(stubs_dir: str=STUBS_DIR) -> Iterator[Tuple[str, str]]:
+    """Yield ``(module name, path)`` for every module of the numpy stubs."""
+    for dirpath, dirnames, filenames in os.walk(os.path.join(stubs_dir, 'numpy')):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if not filename.endswith('.pyi'):
+                continue
+            path = os.path.join(dirpath, filename)
+            parts = os.path.relpath(path, stubs_dir)[:-len('.pyi')].split(os.sep)
+            if parts[-1] == '__init__':
+                parts.pop()
+            yield '.'.join(parts), path
+
+
+def _mentions(func: ast.FunctionDef, wanted: Set[str]) -> bool:
+    if any(_decorator_name(d) == 'overload' for d in func.decorator_list):
+        # overloaded signatures are not CallableTypes, and aren't hooked
+        return False
+    return not wanted.isdisjoint(_annotation_names(func))
+
+
+def _decorator_name(node: ast.expr) -> str:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return ''
+
+
+def _annotation_names(func: ast.FunctionDef) -> Iterator[str]:
+    args = func.args
+    annotations = [a.annotation for a in args.args + args.kwonlyargs]
+    annotations += [a.annotation for a in (args.vararg, args.kwarg) if a is not None]
+    annotations.append(func.returns)
+    for annotation in annotations:
+        if annotation is not None:
+            yield from _names(annotation)
+
+
+def _names(node: ast.AST) -> Iterator[str]:
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name):
+            yield child.id
+        elif isinstance(child, ast.Attribute):
+            yield child.attr
+        elif isinstance(child, ast.Str):
+            # forward references such as 'ndarray[bool, _InferNdimsReduction]'
+            try:
+                parsed = ast.parse(child.s, mode='eval')
+            except SyntaxError:
+                continue
+            yield from _names(parsed)
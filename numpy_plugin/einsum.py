@@ -0,0 +1,141 @@
+"""``einsum`` subscripts, and the cost of evaluating them.
+
+``parse_subscripts`` reads a literal subscripts string, explicit
+(``'ij,jk->ik'``) or implicit (``'ij,jk'``), with ``...`` standing for the
+axes an operand's letters don't name. Costs are counted as
+``numpy.einsum_path`` counts them: a contraction loops over every
+combination of its indices, doing a multiplication per operand beyond the
+first, plus an addition if an index is summed over.
+
+Without ``optimize=``, ``np.einsum`` loops over the indices of all its
+operands at once. Contracting two operands at a time is usually far
+cheaper: ``'ij,jk,kl->il'`` is ``n^4`` at once, ``n^3`` a pair at a time.
+``optimal_path`` finds the cheapest order of pairwise contractions.
+"""
+from functools import reduce
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+Terms = Tuple[List[str], str]
+Path = List[Tuple[int, int]]
+
+# letters standing for the axes of an ellipsis; einsum's own are [a-zA-Z]
+ELLIPSIS_LETTERS = '0123456789'
+# operands beyond which the optimal path isn't searched; the search is 3^n
+MAX_OPTIMIZED_OPERANDS = 8
+
+
+def parse_subscripts(subscripts: str, ndims: Sequence[Optional[int]]) -> Optional[Terms]:
+    """The index letters of each operand and of the output, or None for
+    subscripts that don't fit operands of ``ndims`` dimensions (None if
+    unknown)."""
+    spec = subscripts.replace(' ', '')
+    inputs, arrow, output = spec.partition('->')
+    terms = inputs.split(',')
+    if len(terms) != len(ndims):
+        return None
+    n_ellipsis = 0
+    for term, ndim in zip(terms, ndims):
+        if '...' in term:
+            if ndim is None:
+                return None
+            n_ellipsis = max(n_ellipsis, ndim - len(term) + 3)
+    if n_ellipsis > len(ELLIPSIS_LETTERS):
+        return None
+    expanded = []
+    for term, ndim in zip(terms, ndims):
+        if not term.replace('...', '', 1).isalpha() and term.replace('...', '', 1):
+            return None
+        if '...' in term:
+            # the ellipsis axes of the operands are aligned on the right
+            term = term.replace('...', ELLIPSIS_LETTERS[n_ellipsis - ndim + len(term) - 3:
+                                                        n_ellipsis])
+        if ndim is not None and len(term) != ndim:
+            return None
+        expanded.append(term)
+    letters = ''.join(expanded)
+    if not arrow:
+        # the letters appearing once, in order, after the ellipsis axes
+        output = ELLIPSIS_LETTERS[:n_ellipsis] + ''.join(
+            sorted(c for c in set(letters) if c.isalpha() and letters.count(c) == 1))
+    else:
+        output = output.replace('...', ELLIPSIS_LETTERS[:n_ellipsis])
+        if not all(c in letters for c in output) or len(set(output)) != len(output):
+            return None
+    return expanded, output
+
+
+def contraction_flops(indices: FrozenSet[str], n_terms: int, summed: bool,
+                      extents: Dict[str, int]) -> int:
+    size = reduce(lambda a, b: a * b, (extents[i] for i in indices), 1)
+    return size * (max(1, n_terms - 1) + summed)
+
+
+def naive_flops(terms: Terms, extents: Dict[str, int]) -> int:
+    """The FLOPs of evaluating all operands at once."""
+    inputs, output = terms
+    indices = frozenset(''.join(inputs))
+    return contraction_flops(indices, len(inputs), bool(indices - set(output)), extents)
+
+
+def optimal_path(terms: Terms, extents: Dict[str, int]) -> Optional[Tuple[int, Path]]:
+    """The FLOPs of the cheapest order of pairwise contractions, and the
+    order as ``numpy.einsum_path`` writes it: the positions of the pair
+    contracted at each step, in a list of operands to which each result is
+    appended."""
+    inputs, output = terms
+    n = len(inputs)
+    if n < 2 or n > MAX_OPTIMIZED_OPERANDS:
+        return None
+    indices = [frozenset(term) for term in inputs]
+
+    def kept(subset: int) -> FrozenSet[str]:
+        # the indices a contraction of the operands in subset keeps: those
+        # of the output or of an operand outside it
+        inside = frozenset().union(*(indices[i] for i in range(n) if subset >> i & 1))
+        outside = frozenset(output).union(*(indices[i] for i in range(n)
+                                            if not subset >> i & 1))
+        return inside & outside
+
+    # subset of operands -> the FLOPs of contracting them into one, and the
+    # two subsets contracted last
+    best = {1 << i: (0, None)
+            for i in range(n)}  # type: Dict[int, Tuple[int, Optional[Tuple[int, int]]]]
+    for subset in range(1, 1 << n):
+        if subset in best:
+            continue
+        result = kept(subset)
+        choice = None  # type: Optional[Tuple[int, Tuple[int, int]]]
+        left = (subset - 1) & subset
+        while left:
+            right = subset ^ left
+            if left < right:
+                pair = kept(left) | kept(right)
+                flops = best[left][0] + best[right][0] + contraction_flops(
+                    pair, 2, bool(pair - result), extents)
+                if choice is None or flops < choice[0]:
+                    choice = (flops, (left, right))
+            left = (left - 1) & subset
+        best[subset] = choice
+
+    full = (1 << n) - 1
+    path = []  # type: Path
+    operands = [1 << i for i in range(n)]  # type: List[int]
+
+    def contract(subset: int) -> None:
+        split = best[subset][1]
+        if split is None:
+            return
+        contract(split[0])
+        contract(split[1])
+        positions = sorted((operands.index(split[0]), operands.index(split[1])))
+        path.append((positions[0], positions[1]))
+        for position in reversed(positions):
+            del operands[position]
+        operands.append(subset)
+
+    contract(full)
+    return best[full][0], path
+
+
+def format_path(path: Path) -> str:
+    return '[%s]' % ', '.join('(%d, %d)' % pair for pair in path)
@@ -0,0 +1,170 @@
+"""Opt-in export of the array type inferred at every hooked call site.
+
+Enabled by the ``export`` option (or ``NUMPY_PLUGIN_EXPORT``), which names a
+SQLite database. Each row holds the file, line and column of a call, the
+callee's fullname, the inferred dtype and ndim, and whether the result
+decayed to Any; the primary key is the call site, so a lookup is a single
+index probe::
+
+    $ python -m numpy_plugin.export numpy-types.sqlite src/model.py:42
+
+Rows are written when mypy moves on to the next module and at exit. The
+first row a build writes for a file replaces everything stored for it, so
+files that an incremental build doesn't recheck keep their rows; run with
+an empty cache to export a whole program.
+"""
+import argparse
+import atexit
+import os
+import sqlite3
+import sys
+from typing import Callable, List, Optional, Sequence, Set, Tuple
+
+from mypy.types import Type, Instance, AnyType
+
+from .shortcuts import dimtype_to_int
+
+SCHEMA_VERSION = 1
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS call_sites (
+    file TEXT NOT NULL,
+    line INTEGER NOT NULL,
+    "column" INTEGER NOT NULL,
+    callee TEXT NOT NULL,
+    dtype TEXT,
+    ndim INTEGER,
+    is_any INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    PRIMARY KEY (file, line, "column", callee)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+'''
+
+# (file, line, column, callee, dtype, ndim, is_any, type)
+Row = Tuple[str, int, int, str, Optional[str], Optional[int], int, str]
+
+_exporters = []  # type: List[CallSiteExporter]
+
+
+class CallSiteExporter:
+    def __init__(self, path: str, fingerprint: str='') -> None:
+        self.path = path
+        self.fingerprint = fingerprint
+        self.rows = []  # type: List[Row]
+        self.module = None  # type: Optional[str]
+        # files whose stored rows this build has already replaced
+        self.replaced = set()  # type: Set[str]
+
+    def record(self, fullname: str, ctx, result: Type) -> None:
+        module = getattr(ctx.api, 'path', None)
+        if module is None:
+            return
+        if module != self.module:
+            self.flush()
+            self.module = module
+        dtype, ndim, is_any = describe(result)
+        self.rows.append((os.path.abspath(module), ctx.context.line, ctx.context.column,
+                          fullname, dtype, ndim, is_any, str(result)))
+
+    def wrap_hook(self, func: Callable) -> Callable:
+        """Record the result of a ``function_hook(fullname, calltype, ctx)``."""
+        def exported(fullname, calltype, ctx):
+            result = func(fullname, calltype, ctx)
+            self.record(fullname, ctx, result)
+            return result
+
+        return exported
+
+    def flush(self) -> None:
+        if not self.rows:
+            return
+        rows, self.rows = self.rows, []
+        with connect(self.path) as db:
+            db.execute('INSERT OR REPLACE INTO meta VALUES (?, ?)',
+                       ('fingerprint', self.fingerprint))
+            for file in {row[0] for row in rows} - self.replaced:
+                db.execute('DELETE FROM call_sites WHERE file = ?', (file,))
+                self.replaced.add(file)
+            db.executemany('INSERT OR REPLACE INTO call_sites VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                           rows)
+        db.close()
+
+
+def get_exporter(path: str, fingerprint: str='') -> CallSiteExporter:
+    """An exporter for one build; earlier builds' rows are flushed first."""
+    if not _exporters:
+        atexit.register(flush_all)
+    flush_all()
+    # keep any exporter that a build in another thread is still filling
+    _exporters[:] = [e for e in _exporters if e.rows]
+    exporter = CallSiteExporter(path, fingerprint)
+    _exporters.append(exporter)
+    return exporter
+
+
+def flush_all() -> None:
+    for exporter in _exporters:
+        exporter.flush()
+
+
+def describe(typ: Type) -> Tuple[Optional[str], Optional[int], int]:
+    """The ``(dtype, ndim, is_any)`` columns for an inferred type."""
+    if isinstance(typ, AnyType):
+        return None, None, 1
+    if isinstance(typ, Instance) and typ.type.fullname() == 'numpy.ndarray':
+        dtype, dim = typ.args
+        ndim = dimtype_to_int(dim)
+        is_any = isinstance(dtype, AnyType) or not isinstance(ndim, int)
+        return (None if isinstance(dtype, AnyType) else str(dtype),
+                ndim if isinstance(ndim, int) else None,
+                int(is_any))
+    if isinstance(typ, Instance):
+        # zero-dimensional results are returned as scalars
+        return str(typ), 0, 0
+    return None, None, 0
+
+
+def connect(path: str) -> sqlite3.Connection:
+    db = sqlite3.connect(path, timeout=30)
+    db.executescript(SCHEMA)
+    db.execute('INSERT OR IGNORE INTO meta VALUES (?, ?)',
+               ('schema_version', str(SCHEMA_VERSION)))
+    return db
+
+
+def lookup(path: str, file: str, line: int, column: Optional[int]=None) -> List[sqlite3.Row]:
+    db = connect(path)
+    db.row_factory = sqlite3.Row
+    query = 'SELECT * FROM call_sites WHERE file = ? AND line = ?'
+    params = [os.path.abspath(file), line]  # type: List
+    if column is not None:
+        query += ' AND "column" = ?'
+        params.append(column)
+    try:
+        return db.execute(query + ' ORDER BY "column"', params).fetchall()
+    finally:
+        db.close()
+
+
+def main(argv: Optional[Sequence[str]]=None) -> int:
+    parser = argparse.ArgumentParser(description='Look up exported array types.')
+    parser.add_argument('database')
+    parser.add_argument('site', help='FILE:LINE or FILE:LINE:COLUMN')
+    args = parser.parse_args(argv)
+
+    file, *position = args.site.rsplit(':', 2)
+    if len(position) == 2 and not position[0].isdigit():
+        file, position = '%s:%s' % (file, position[0]), position[1:]
+    rows = lookup(args.database, file, *map(int, position))
+    for row in rows:
+        print('%s:%d:%d: %s -> %s' % (row['file'], row['line'], row['column'],
+                                      row['callee'], row['type']))
+    return 0 if rows else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,37 @@
+"""Fingerprint of the plugin, its stubs and its tables, for cache invalidation.
+
+Types inferred by the plugin end up in mypy's incremental cache, so a cache
+written by one version of the plugin must not be trusted by another. Newer
+mypy versions ask plugins for this through ``report_config_data``; for older
+ones the fingerprint names the cache directory instead.
+"""
+import hashlib
+import os
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR_PREFIX = 'numpy-plugin-'
+
+
+def plugin_fingerprint() -> str:
+    digest = hashlib.sha1()
+    for root, dirs, files in os.walk(PACKAGE_DIR):
+        dirs.sort()
+        for name in sorted(files):
+            if not name.endswith(('.py', '.pyi')):
+                continue
+            path = os.path.join(root, name)
+            digest.update(os.path.relpath(path, PACKAGE_DIR).encode())
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def versioned_cache_dir(cache_dir: str, fingerprint: str) -> str:
+    if cache_dir == os.devnull:
+        return cache_dir
+    head, tail = os.path.split(os.path.normpath(cache_dir))
+    if tail.startswith(CACHE_DIR_PREFIX):
+        # the options of a dmypy server outlive the builds, and with them
+        # the directory chosen for the previous build
+        cache_dir = head
+    return os.path.join(cache_dir, CACHE_DIR_PREFIX + fingerprint[:16])
@@ -0,0 +1,319 @@
+"""Memory layout of arrays, and the copies it forces.
+
+The layout of an array is C (row-major contiguous), F (column-major
+contiguous, like a transpose of a C array) or strided, and unknown for
+arrays whose origin isn't seen, like function arguments. It is inferred
+from the expression creating the array: the ``order=`` of the
+constructors, ``copy`` and ``astype``; ``transpose``, ``swapaxes`` and
+``.T``, which turn C into F and back; and basic indexing, which keeps an
+array contiguous only if it selects a block of consecutive elements. A
+variable assigned once has the layout of its value. One-dimensional
+contiguous arrays are C.
+
+Operations that need a contiguous array copy one that isn't, without a
+word. The ``layout_checks`` option takes module patterns, as
+``copy_checks`` does, and reports them there under the codes
+
+``layout-reshape-copy``
+    ``reshape`` and ``ravel`` (in C order, the default) of an F or strided
+    array, which can't be done as a view.
+``layout-contiguous-copy``
+    ``np.ascontiguousarray`` of an F or strided array, as when a transpose
+    is passed to a kernel that needs a C array.
+
+Only arrays whose layout is known are reported.
+"""
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from mypy.nodes import (Expression, Var, NameExpr, MemberExpr, StrExpr, IntExpr,
+                        UnaryExpr, TupleExpr, IndexExpr, SliceExpr, CallExpr, RefExpr,
+                        MypyFile)
+from mypy.types import Type, Instance
+
+from .activation import CodeFilter, parse_code_rules
+from .bind_arguments import BoundArguments
+from .checkers import Hooks, PerModule, Assignments, argument, is_array
+from .loops import ndim_of
+
+C, F, STRIDED = 'C', 'F', 'strided'
+Layout = Optional[str]
+
+CODES = ('layout-reshape-copy', 'layout-contiguous-copy')
+LAYOUT_HOOKS = {'numpy.ravel': 'function', 'numpy.ndarray.ravel': 'method'}  # type: Hooks
+
+# constructor -> position of its order argument, and its default
+CONSTRUCTOR_ORDERS = {
+    'numpy.zeros': (2, 'C'), 'numpy.ones': (2, 'C'), 'numpy.empty': (2, 'C'),
+    'numpy.full': (3, 'C'), 'numpy.array': (3, 'K'), 'numpy.zeros_like': (2, 'K'),
+    'numpy.ones_like': (2, 'K'), 'numpy.empty_like': (2, 'K'), 'numpy.full_like': (3, 'K'),
+}
+# numpy functions returning new C arrays
+C_CONSTRUCTORS = ('numpy.eye', 'numpy.identity', 'numpy.arange', 'numpy.linspace',
+                  'numpy.ascontiguousarray', 'numpy.ravel', 'numpy.random.rand',
+                  'numpy.random.randn', 'numpy.random.random', 'numpy.random.normal',
+                  'numpy.random.uniform', 'numpy.random.randint')
+# functions of an array that return a view of it, or it unchanged
+VIEW_FUNCTIONS = ('numpy.asarray', 'numpy.asanyarray')
+# callee -> (parameter holding the array, or None for the receiver, name in
+# messages, code)
+CHECKED = {
+    'numpy.reshape': ('a', 'np.reshape', 'layout-reshape-copy'),
+    'numpy.ndarray.reshape': (None, 'reshape', 'layout-reshape-copy'),
+    'numpy.ravel': ('a', 'np.ravel', 'layout-reshape-copy'),
+    'numpy.ndarray.ravel': (None, 'ravel', 'layout-reshape-copy'),
+    'numpy.ascontiguousarray': ('object', 'np.ascontiguousarray', 'layout-contiguous-copy'),
+}
+DESCRIPTIONS = {F: 'Fortran-ordered (transposed)', STRIDED: 'non-contiguous'}
+
+
+def parse_layout_checks(value: Optional[str]) -> List[Tuple[str, FrozenSet[str]]]:
+    return parse_code_rules(value, CODES)
+
+
+class Layouts:
+    """The layout of the arrays of a module's expressions."""
+
+    def __init__(self, tree: MypyFile, type_map: Dict[Expression, Type]) -> None:
+        self.values = Assignments(tree).values
+        self.type_map = type_map
+
+    def of(self, expr: Expression, depth: int=0) -> Layout:
+        if depth > 16:
+            return None
+        layout = self.infer(expr, depth + 1)
+        if layout in (C, F) and self.ndim(expr) in (0, 1):
+            return C
+        return layout
+
+    def ndim(self, expr: Expression) -> Optional[int]:
+        typ = self.type_map.get(expr)
+        return ndim_of(typ) if is_array(typ) else None
+
+    def infer(self, expr: Expression, depth: int) -> Layout:
+        if isinstance(expr, NameExpr) and isinstance(expr.node, Var):
+            value = self.values.get(expr.node)
+            return None if value is None else self.of(value, depth)
+        if isinstance(expr, MemberExpr) and expr.name == 'T' and not expr.fullname:
+            return self.transposed(expr.expr, depth)
+        if isinstance(expr, IndexExpr):
+            return self.indexed(expr, depth)
+        if not isinstance(expr, CallExpr):
+            return None
+        callee = expr.callee
+        if isinstance(callee, MemberExpr) and not callee.fullname:
+            return self.method(expr, callee.name, callee.expr, depth)
+        fullname = callee.fullname if isinstance(callee, RefExpr) else None
+        if fullname in C_CONSTRUCTORS:
+            return C
+        if fullname in CONSTRUCTOR_ORDERS:
+            position, default = CONSTRUCTOR_ORDERS[fullname]
+            source = argument(expr, 'object', 0) if fullname == 'numpy.array' else \
+                argument(expr, 'a', 0)
+            order = argument(expr, 'order', position)
+            if fullname == 'numpy.array' and not is_array(self.type_map.get(source)):
+                return self.ordered(order, C, None, depth)
+            return self.ordered(order, default, source, depth)
+        if fullname in VIEW_FUNCTIONS:
+            source = argument(expr, 'object', 0)
+            if is_array(self.type_map.get(source)):
+                return self.of(source, depth)
+            return self.ordered(argument(expr, 'order', 2), C, None, depth)
+        if fullname == 'numpy.asfortranarray':
+            return F
+        if fullname == 'numpy.transpose':
+            axes = argument(expr, 'axes', 1)
+            return self.permuted(argument(expr, 'a', 0), axes, depth)
+        if fullname == 'numpy.swapaxes':
+            return self.swapped(argument(expr, 'a', 0), argument(expr, 'axis1', 1),
+                                argument(expr, 'axis2', 2), depth)
+        if fullname == 'numpy.reshape':
+            return order_of(argument(expr, 'order', 2), C)
+        return None
+
+    def method(self, call: CallExpr, name: str, receiver: Expression, depth: int) -> Layout:
+        if not is_array(self.type_map.get(receiver)):
+            return None
+        if name == 'copy':
+            return self.ordered(argument(call, 'order', 0), C, receiver, depth)
+        if name == 'astype':
+            copy = argument(call, 'copy', 4)
+            if isinstance(copy, NameExpr) and copy.fullname == 'builtins.False':
+                return None
+            return self.ordered(argument(call, 'order', 1), 'K', receiver, depth)
+        if name == 'transpose':
+            axes = call.args[0] if len(call.args) == 1 else \
+                TupleExpr(call.args) if call.args else None
+            return self.permuted(receiver, axes, depth)
+        if name == 'swapaxes':
+            return self.swapped(receiver, argument(call, 'axis1', 0),
+                                argument(call, 'axis2', 1), depth)
+        if name == 'view':
+            return self.of(receiver, depth)
+        if name in ('ravel', 'flatten'):
+            return C
+        if name == 'reshape':
+            return order_of(argument(call, 'order', 1), C)
+        return None
+
+    def ordered(self, order: Optional[Expression], default: str, source: Optional[Expression],
+                depth: int) -> Layout:
+        """The layout of a new array with ``order`` C, F, A or K, copied from
+        ``source``, or from data that isn't an array if None."""
+        value = order.value if isinstance(order, StrExpr) else default if order is None else None
+        if value in (C, F):
+            return value
+        if value not in ('A', 'K'):
+            return None
+        layout = C if source is None else self.of(source, depth)
+        if layout is None:
+            return None
+        return F if layout == F else C
+
+    def transposed(self, array: Expression, depth: int) -> Layout:
+        layout = self.of(array, depth)
+        return {C: F, F: C}.get(layout, layout)
+
+    def permuted(self, array: Expression, axes: Optional[Expression], depth: int) -> Layout:
+        if axes is None:
+            return self.transposed(array, depth)
+        ndim = self.ndim(array)
+        order = int_values(axes.items if isinstance(axes, TupleExpr) else [axes])
+        if ndim is None or order is None:
+            return None
+        order = [i % ndim for i in order]
+        if order == list(range(ndim)):
+            return self.of(array, depth)
+        if order == list(reversed(range(ndim))):
+            return self.transposed(array, depth)
+        return STRIDED if self.of(array, depth) is not None else None
+
+    def swapped(self, array: Expression, axis1: Optional[Expression],
+                axis2: Optional[Expression], depth: int) -> Layout:
+        ndim = self.ndim(array)
+        axes = int_values([axis1, axis2])
+        if ndim is None or axes is None:
+            return None
+        order = list(range(ndim))
+        i, j = (a % ndim for a in axes)
+        order[i], order[j] = order[j], order[i]
+        return self.permuted(array, TupleExpr([IntExpr(a) for a in order]), depth)
+
+    def indexed(self, expr: IndexExpr, depth: int) -> Layout:
+        if not is_array(self.type_map.get(expr.base)):
+            return None
+        layout = self.of(expr.base, depth)
+        ndim = self.ndim(expr.base)
+        if layout is None or ndim is None:
+            return None
+        index = expr.index.items if isinstance(expr.index, TupleExpr) else [expr.index]
+        kinds = [self.index_kind(item) for item in index]
+        if None in kinds or len(kinds) > ndim:
+            return None
+        if layout == STRIDED:
+            return STRIDED
+        kinds += ['full'] * (ndim - len(kinds))
+        if layout == F:
+            kinds.reverse()
+        return layout if is_block(kinds) else STRIDED
+
+    def index_kind(self, item: Expression) -> Optional[str]:
+        """``int``, a ``full`` slice, a ``range`` of consecutive elements, or a
+        ``step``ped slice; None for other indices."""
+        if isinstance(item, SliceExpr):
+            if item.stride is not None and int_values([item.stride]) != [1]:
+                return 'step'
+            if item.begin_index is None and item.end_index is None:
+                return 'full'
+            return 'range'
+        typ = self.type_map.get(item)
+        if isinstance(typ, Instance) and typ.type.has_base('builtins.int') and \
+                typ.type.fullname() != 'builtins.bool':
+            return 'int'
+        return None
+
+
+def is_block(kinds: Sequence[str]) -> bool:
+    """Whether an index selects a C-contiguous block of a C array: integers,
+    then at most one range, then full slices."""
+    i = 0
+    while i < len(kinds) and kinds[i] == 'int':
+        i += 1
+    if i < len(kinds) and kinds[i] == 'range':
+        i += 1
+    return all(kind == 'full' for kind in kinds[i:])
+
+
+def order_of(order: Optional[Expression], default: str) -> Layout:
+    if order is None:
+        return default
+    if isinstance(order, StrExpr) and order.value in (C, F):
+        return order.value
+    return None
+
+
+def int_values(exprs: Sequence[Optional[Expression]]) -> Optional[List[int]]:
+    values = []
+    for expr in exprs:
+        if isinstance(expr, IntExpr):
+            values.append(expr.value)
+        elif isinstance(expr, UnaryExpr) and expr.op == '-' and isinstance(expr.expr, IntExpr):
+            values.append(-expr.expr.value)
+        else:
+            return None
+    return values
+
+
+class LayoutChecker:
+    def __init__(self, rules: List[Tuple[str, FrozenSet[str]]]) -> None:
+        self.filter = CodeFilter(rules)
+        # the layouts of the module being checked
+        self.layouts = PerModule(lambda api: Layouts(api.tree, api.type_map))
+
+    def wrap_hook(self, func: Callable, bind: Callable) -> Callable:
+        """Check the calls of a ``function_hook(fullname, calltype, ctx)``.
+
+        ``bind(fullname, calltype, ctx)`` returns the call's BoundArguments,
+        or None before the plugin is set up.
+        """
+        def checked(fullname, calltype, ctx):
+            result = func(fullname, calltype, ctx)
+            if fullname in CHECKED and isinstance(ctx.context, CallExpr):
+                codes = self.filter.enabled(ctx.api.tree.fullname())
+                if codes:
+                    bound_args = bind(fullname, calltype, ctx)
+                    if bound_args is not None:
+                        self.check(fullname, bound_args, ctx, codes)
+            return result
+
+        return checked
+
+    def check(self, fullname: str, bound_args: BoundArguments, ctx,
+              codes: FrozenSet[str]) -> None:
+        api = ctx.api
+        layouts = self.layouts.get(api)
+        layouts.type_map = api.type_map
+        parameter, name, code = CHECKED[fullname]
+        if parameter is None:
+            array = ctx.context.callee.expr
+        else:
+            arg = bound_args[parameter]
+            if arg is None:
+                return
+            array = arg.arg
+        layout = layouts.of(array)
+        if layout not in (F, STRIDED) or code not in codes:
+            return
+        order = bound_args.get('order')
+        wanted = C if order is None else order_of(order.arg, C)
+        if wanted == layout or wanted is None:
+            return
+        if code == 'layout-contiguous-copy':
+            message = '%s() copies a %s array; create it in C order, or use it as it is'
+        elif name == 'ravel':
+            message = '%s() copies a %s array; keep it contiguous, or pass the order it has'
+        else:
+            message = '%s() of a %s array copies it; keep it contiguous, or reshape it ' \
+                'in the order it has'
+        # mypy drops repeated messages
+        api.msg.fail('%s  [%s]' % (message % (name, DESCRIPTIONS[layout]), code), ctx.context)
+
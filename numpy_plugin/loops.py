@@ -0,0 +1,236 @@
+"""Per-element Python access to arrays in loops.
+
+Indexing an array down to a scalar, ``a[i, j]``, inside a ``for`` or
+``while`` body or a comprehension, and iterating over an array or its
+``flat`` iterator, run the interpreter once per element. The ``loop_checks``
+option takes module patterns, as ``copy_checks`` does, and reports every
+such access there with a hint on how to vectorize it, under the codes
+
+``loop-element-access``
+    ``a[i, j]`` in a loop, with integer indices only.
+``loop-element-iteration``
+    ``for x in a``, ``for x in a.flat`` and the comprehensions doing the
+    same.
+
+The ``loop_report`` option names a report written at exit, JSON if the
+path ends in ``.json``, CSV otherwise. It has a row for every loop of every
+checked module with such accesses, ranked by the total of the function the
+loop is in.
+
+Element writes, ``a[i] = x``, are not seen: mypy 0.550 doesn't call
+plugins for ``__setitem__``.
+"""
+import atexit
+import csv
+import json
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from mypy.nodes import (Node, Expression, IndexExpr, ForStmt, WhileStmt,
+                        FuncItem, GeneratorExpr, DictionaryComprehension, MypyFile)
+from mypy.traverser import TraverserVisitor
+from mypy.types import Type, Instance
+
+from .activation import CodeFilter, parse_code_rules
+from .checkers import PerModule, enclosing_function, is_array
+from .shortcuts import DIMTYPE_TO_INT
+
+CODES = ('loop-element-access', 'loop-element-iteration')
+# attributes whose hooks see every iteration over an array
+ATTRIBUTE_HOOKS = ('numpy.ndarray.__iter__', 'numpy.ndarray.flat')
+
+Loop = Node
+
+
+def parse_loop_checks(value: Optional[str]) -> List[Tuple[str, FrozenSet[str]]]:
+    return parse_code_rules(value, CODES)
+
+
+class Loops(TraverserVisitor):
+    """The innermost loop around every index expression of a module, and
+    the expressions loops iterate over.
+
+    Loops don't extend into the functions and lambdas defined in them.
+    """
+
+    def __init__(self, tree: MypyFile) -> None:
+        self.loop = None  # type: Optional[Loop]
+        self.indexed = {}  # type: Dict[Expression, Loop]
+        self.iterated = {}  # type: Dict[Expression, Loop]
+        tree.accept(self)
+
+    def in_loop(self, loop: Optional[Loop], *nodes: Optional[Node]) -> None:
+        outer, self.loop = self.loop, loop
+        for node in nodes:
+            if node is not None:
+                node.accept(self)
+        self.loop = outer
+
+    def visit_func(self, o: FuncItem) -> None:
+        outer, self.loop = self.loop, None
+        super().visit_func(o)
+        self.loop = outer
+
+    def visit_for_stmt(self, s: ForStmt) -> None:
+        self.iterated[s.expr] = s
+        # the iterable is evaluated once, by the enclosing loop if any
+        s.expr.accept(self)
+        s.index.accept(self)
+        self.in_loop(s, s.body)
+        if s.else_body is not None:
+            s.else_body.accept(self)
+
+    def visit_while_stmt(self, s: WhileStmt) -> None:
+        self.in_loop(s, s.expr, s.body)
+        if s.else_body is not None:
+            s.else_body.accept(self)
+
+    def visit_generator_expr(self, e: GeneratorExpr) -> None:
+        self.comprehension(e, e.sequences, e.condlists, [e.left_expr])
+
+    def visit_dictionary_comprehension(self, e: DictionaryComprehension) -> None:
+        self.comprehension(e, e.sequences, e.condlists, [e.key, e.value])
+
+    def comprehension(self, e: Expression, sequences: Sequence[Expression],
+                      condlists: Sequence[Sequence[Expression]],
+                      results: Sequence[Expression]) -> None:
+        for i, sequence in enumerate(sequences):
+            self.iterated[sequence] = e
+            if i == 0:
+                sequence.accept(self)
+            else:
+                self.in_loop(e, sequence)
+        self.in_loop(e, *[c for conditions in condlists for c in conditions])
+        self.in_loop(e, *results)
+
+    def visit_index_expr(self, e: IndexExpr) -> None:
+        if self.loop is not None:
+            self.indexed[e] = self.loop
+        super().visit_index_expr(e)
+
+
+class Site:
+    __slots__ = ('file', 'function', 'loop_line', 'code')
+
+    def __init__(self, file: str, function: str, loop_line: int, code: str) -> None:
+        self.file = file
+        self.function = function
+        self.loop_line = loop_line
+        self.code = code
+
+
+class LoopChecker:
+    def __init__(self, rules: Sequence[Tuple[str, FrozenSet[str]]],
+                 output: Optional[str]) -> None:
+        self.filter = CodeFilter(rules)
+        self.output = output
+        # (file, line, column, code) of an access -> where it is; an access
+        # checked twice, or rechecked by the daemon, is counted once
+        self.sites = {}  # type: Dict[Tuple[str, int, int, str], Site]
+        # the loops of the module being checked
+        self.loops = PerModule(lambda api: Loops(api.tree))
+
+    def wrap_hook(self, func):
+        """Check the ``__getitem__`` calls of a ``function_hook``."""
+        def checked(fullname, calltype, ctx):
+            result = func(fullname, calltype, ctx)
+            if fullname == 'numpy.ndarray.__getitem__' and is_scalar(result):
+                loop = self.loops.get(ctx.api).indexed.get(ctx.context)
+                if loop is not None:
+                    self.record(ctx.api, ctx.context, loop, 'loop-element-access',
+                                '%s indexed element by element in a loop; index it with '
+                                'arrays or slices, or use a ufunc or reduction over whole '
+                                'axes' % describe(ctx.type))
+            return result
+
+        return checked
+
+    def attribute_hook(self, fullname: str):
+        def iterated(ctx):
+            loop = self.loops.get(ctx.api).iterated.get(ctx.context)
+            if loop is not None and is_array(ctx.type):
+                ndim = ndim_of(ctx.type)
+                rows = not fullname.endswith('.flat') and ndim is not None and ndim > 1
+                what = '%s of %s' % ('the rows' if rows else 'the elements', describe(ctx.type))
+                self.record(ctx.api, ctx.context, loop, 'loop-element-iteration',
+                            'loop over %s one at a time; operate on the whole array '
+                            'instead' % what)
+            return ctx.default_attr_type
+
+        return iterated
+
+    def record(self, api, expr: Expression, loop: Loop, code: str, message: str) -> None:
+        key = (api.path, expr.line, expr.column, code)
+        self.sites[key] = Site(api.path, enclosing_function(api), loop.line, code)
+        # mypy drops repeated messages; and those reported while it tries
+        # out argument types, with errors disabled
+        if code in self.filter.enabled(api.tree.fullname()):
+            api.msg.fail('%s  [%s]' % (message, code), expr)
+
+    def report(self) -> Dict[str, List[Dict]]:
+        loops = {}  # type: Dict[Tuple[str, str, int], Dict]
+        totals = {}  # type: Dict[Tuple[str, str], int]
+        for site in self.sites.values():
+            row = loops.get((site.file, site.function, site.loop_line))
+            if row is None:
+                row = loops[site.file, site.function, site.loop_line] = {
+                    'file': site.file, 'function': site.function, 'loop_line': site.loop_line,
+                    'element_accesses': 0, 'element_iterations': 0, 'function_total': 0,
+                }
+            if site.code == 'loop-element-access':
+                row['element_accesses'] += 1
+            else:
+                row['element_iterations'] += 1
+            totals[site.file, site.function] = totals.get((site.file, site.function), 0) + 1
+        for row in loops.values():
+            row['function_total'] = totals[row['file'], row['function']]
+        rows = sorted(loops.values(), key=lambda r: (
+            -r['function_total'], -r['element_accesses'] - r['element_iterations'],
+            r['file'], r['loop_line']))
+        return {'loops': rows}
+
+    def write(self) -> None:
+        report = self.report()
+        with open(self.output, 'w') as f:
+            if self.output.endswith('.json'):
+                json.dump(report, f, indent=2)
+            elif report['loops']:
+                writer = csv.DictWriter(f, fieldnames=list(report['loops'][0]))
+                writer.writeheader()
+                writer.writerows(report['loops'])
+
+
+_checker = None  # type: Optional[LoopChecker]
+
+
+def get_loop_checker(rules: Sequence[Tuple[str, FrozenSet[str]]],
+                     output: Optional[str]) -> LoopChecker:
+    """The process-wide loop checker; a dmypy server accumulates across builds."""
+    global _checker
+    if _checker is None:
+        _checker = LoopChecker(rules, output)
+        atexit.register(_write_at_exit)
+    _checker.filter = CodeFilter(rules)
+    _checker.output = output
+    return _checker
+
+
+def _write_at_exit() -> None:
+    if _checker is not None and _checker.output:
+        _checker.write()
+
+
+def is_scalar(typ: Type) -> bool:
+    """Whether ``__getitem__`` returned an element, rather than an array."""
+    return isinstance(typ, Instance) and not is_array(typ) and \
+        typ.type.fullname().startswith(('builtins.', 'numpy.'))
+
+
+def ndim_of(array: Type) -> Optional[int]:
+    if isinstance(array, Instance) and isinstance(array.args[1], Instance):
+        return DIMTYPE_TO_INT.get(array.args[1].type.name())
+    return None
+
+
+def describe(array: Type) -> str:
+    ndim = ndim_of(array)
+    return 'an array' if ndim is None else 'a %d-D array' % ndim
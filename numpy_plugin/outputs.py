@@ -0,0 +1,80 @@
+"""Checking of ``out=`` buffers.
+
+A function writing its result to an ``out=`` buffer returns the buffer, so
+the call has the buffer's type. The buffer has to hold the result:
+
+- its dtype has to be one the result casts to safely. A ufunc refuses, at
+  runtime, a buffer its result doesn't cast to under ``same_kind`` casting;
+  the other casts are made silently. Reductions with a ``dtype`` parameter
+  compute in the buffer's dtype when none is given, so their input is
+  what is cast.
+- its number of dimensions has to be the result's. The inputs of a ufunc
+  are broadcast against the buffer, which may have more.
+
+``frexp`` and ``modf`` have a buffer per output, ``out1`` and ``out2``.
+"""
+from typing import Optional
+
+from mypy.plugin import FunctionContext
+from mypy.types import Type, Instance, TupleType
+
+from .bind_arguments import BoundArguments
+from .checkers import OUT_PARAMETERS
+from .copies import CHAR_NAMES
+from .shortcuts import element_char, dimtype_to_int, is_ndarray
+from .tables import CAN_CAST_SAFE, CAN_CAST_SAME_KIND, UFUNC_ALIASES, UFUNC_OUTPUTS
+
+# functions with out parameters that aren't hooked for type inference
+OUT_HOOKS = ('numpy.around', 'numpy.round', 'numpy.clip')
+
+
+def passes_out(bound_args: BoundArguments) -> bool:
+    """Whether a call passes a buffer to an out parameter of its callee."""
+    return any(bound_args.get(name) is not None for name in OUT_PARAMETERS)
+
+
+def check_out(fullname: str, bound_args: BoundArguments, result: Type,
+              ctx: FunctionContext) -> Type:
+    """The type of a call with a result type, checking its out buffers."""
+    name = fullname.rsplit('.', 1)[-1]
+    if isinstance(result, TupleType):
+        items = list(result.items)
+        for i, parameter in enumerate(('out1', 'out2')[:len(items)]):
+            items[i] = check_buffer(name, parameter, bound_args, items[i], ctx)
+        return result.copy_modified(items=items)
+    return check_buffer(name, 'out', bound_args, result, ctx)
+
+
+def check_buffer(name: str, parameter: str, bound_args: BoundArguments, result: Type,
+                 ctx: FunctionContext) -> Type:
+    arg = bound_args.get(parameter)
+    if arg is None or not is_ndarray(arg.arg_typ) or not is_ndarray(result):
+        return result
+    buffer = arg.arg_typ
+    ufunc = UFUNC_ALIASES.get(name, name) in UFUNC_OUTPUTS
+
+    source = result.args[0]
+    if 'dtype' in bound_args and bound_args['dtype'] is None and 'a' in bound_args:
+        array = bound_args['a'].arg_typ if bound_args['a'] is not None else None
+        source = array.args[0] if is_ndarray(array) else None
+    check_dtype(name, parameter, element_char(source), element_char(buffer.args[0]), ufunc,
+                ctx)
+
+    ndim, buffer_ndim = dimtype_to_int(result.args[1]), dimtype_to_int(buffer.args[1])
+    if isinstance(ndim, int) and isinstance(buffer_ndim, int) and \
+            (buffer_ndim < ndim or buffer_ndim > ndim and not ufunc):
+        ctx.api.fail('Argument "%s" to "%s" has %d dimensions, but the result has %d'
+                     % (parameter, name, buffer_ndim, ndim), ctx.context)
+    return buffer
+
+
+def check_dtype(name: str, parameter: str, char: Optional[str], buffer_char: Optional[str],
+                ufunc: bool, ctx: FunctionContext) -> None:
+    if char is None or buffer_char is None or buffer_char in CAN_CAST_SAFE[char]:
+        return
+    if ufunc and buffer_char not in CAN_CAST_SAME_KIND[char]:
+        message = "Argument \"%s\" to \"%s\" has dtype %s, which the %s result can't be cast to"
+    else:
+        message = 'Argument "%s" to "%s" has dtype %s; the %s result is cast to it silently'
+    ctx.api.fail(message % (parameter, name, CHAR_NAMES[buffer_char], CHAR_NAMES[char]),
+                 ctx.context)
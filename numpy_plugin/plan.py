@@ -0,0 +1,132 @@
+"""Return types of hooked signatures, compiled into evaluation plans.
+
+The return type mypy hands a hook is the stub's, with the type variables
+substituted, so its typefunctions always sit at the same positions. A plan
+records those positions once per signature: evaluating it calls every
+typefunction bottom-up, so nested ones like ``_InferNdimsIfAxisSpecified[
+ZeroD, _LowerDim[_D]]`` see evaluated arguments, and rebuilds only the
+Instances that contain one or a type variable. Other subtrees are returned
+as they are.
+"""
+from typing import Callable, Dict, List, Optional, Sequence
+
+from mypy.nodes import TypeInfo
+from mypy.types import Type, Instance, TupleType, TypeVarType
+
+from .bind_arguments import BoundArguments
+
+
+class PlanMismatch(Exception):
+    """The return type doesn't have the structure the plan was compiled from."""
+
+
+class Step:
+    __slots__ = ()
+
+    def evaluate(self, typ: Type, funcname: str, bound_args: BoundArguments) -> Type:
+        raise NotImplementedError
+
+
+class Rebuild(Step):
+    """An Instance some of whose arguments contain typefunctions."""
+    __slots__ = ('info', 'children')
+
+    def __init__(self, info: TypeInfo, children: Sequence[Optional[Step]]) -> None:
+        self.info = info
+        self.children = children
+
+    def evaluate_args(self, typ: Type, funcname: str,
+                      bound_args: BoundArguments) -> Instance:
+        if not isinstance(typ, Instance) or typ.type is not self.info or \
+                len(typ.args) != len(self.children):
+            raise PlanMismatch(typ)
+        args = list(typ.args)
+        for i, child in enumerate(self.children):
+            if child is not None:
+                args[i] = child.evaluate(args[i], funcname, bound_args)
+        return Instance(self.info, args)
+
+    def evaluate(self, typ: Type, funcname: str, bound_args: BoundArguments) -> Type:
+        return self.evaluate_args(typ, funcname, bound_args)
+
+
+class Call(Rebuild):
+    """A typefunction, called once its arguments are evaluated."""
+    __slots__ = ('func',)
+
+    def __init__(self, info: TypeInfo, children: Sequence[Optional[Step]],
+                 func: Callable) -> None:
+        super().__init__(info, children)
+        self.func = func
+
+    def evaluate(self, typ: Type, funcname: str, bound_args: BoundArguments) -> Type:
+        if any(self.children):
+            typ = self.evaluate_args(typ, funcname, bound_args)
+        elif not isinstance(typ, Instance) or typ.type is not self.info:
+            raise PlanMismatch(typ)
+        return self.func(typ, funcname, bound_args)
+
+
+class Items(Step):
+    """A tuple some of whose items contain typefunctions."""
+    __slots__ = ('children',)
+
+    def __init__(self, children: Sequence[Optional[Step]]) -> None:
+        self.children = children
+
+    def evaluate(self, typ: Type, funcname: str, bound_args: BoundArguments) -> Type:
+        if not isinstance(typ, TupleType) or len(typ.items) != len(self.children):
+            raise PlanMismatch(typ)
+        items = list(typ.items)
+        for i, child in enumerate(self.children):
+            if child is not None:
+                items[i] = child.evaluate(items[i], funcname, bound_args)
+        return TupleType(items, typ.fallback)
+
+
+class Substituted(Step):
+    """A type variable's value, marked erased (``*``) by the substitution.
+
+    The marks are dropped, as they were when every Instance of the result
+    was rebuilt.
+    """
+    __slots__ = ()
+
+    def evaluate(self, typ: Type, funcname: str, bound_args: BoundArguments) -> Type:
+        return unerase(typ)
+
+
+SUBSTITUTED = Substituted()
+
+
+def unerase(typ: Type) -> Type:
+    if not isinstance(typ, Instance):
+        return typ
+    if not typ.args:
+        return Instance(typ.type, []) if typ.erased else typ
+    args = [unerase(a) for a in typ.args]
+    if not typ.erased and all(a is b for a, b in zip(args, typ.args)):
+        return typ
+    return Instance(typ.type, args)
+
+
+def compile_plan(typ: Type, registry: Dict[str, Callable]) -> Optional[Step]:
+    """The plan for a stub return type; None if it is returned as is."""
+    if isinstance(typ, TypeVarType):
+        return SUBSTITUTED
+    if isinstance(typ, Instance):
+        children = _compile_all(typ.args, registry)
+        func = registry.get(typ.type.fullname())
+        if func is not None:
+            return Call(typ.type, children, func)
+        if any(children):
+            return Rebuild(typ.type, children)
+    elif isinstance(typ, TupleType):
+        children = _compile_all(typ.items, registry)
+        if any(children):
+            return Items(children)
+    return None
+
+
+def _compile_all(types: Sequence[Type], registry: Dict[str, Callable]) -> List[Optional[Step]]:
+    return [compile_plan(t, registry) for t in types]
@@ -1,20 +1,37 @@
-from typing import Optional, Callable
-import itertools
+from typing import Optional, Callable, Dict
 import functools
 
 import mypy.types
 from mypy.options import Options
 from mypy.plugin import Plugin, FunctionContext, MethodContext
-from mypy.types import Type, TypeQuery, Instance, CallableType
-
-from . import shortcuts
-from .bind_arguments import bind_arguments
-from .visitor import TypefunctionRegistryTransformer, SimpleTransformer
+from mypy.types import Type
+
+from . import cache, context, shortcuts
+from .activation import CodeFilter, ModuleFilter
+from .config import PluginConfig
+from .context import PluginContext
+from .copies import CopyChecker, COPY_HOOKS
+from .costs import get_cost_model, EXTRA_HOOKS
+from .bind_arguments import bind_arguments, BoundArguments
+from .dispatch import build_dispatch_index, METHOD_CLASSES
+from .export import get_exporter
+from .layout import LayoutChecker, LAYOUT_HOOKS
+from .shapes import ShapeChecker, SHAPE_HOOKS
+from .loops import get_loop_checker, ATTRIBUTE_HOOKS
+from .outputs import check_out, passes_out, OUT_HOOKS
+from .plan import compile_plan, PlanMismatch
+from .fingerprint import plugin_fingerprint, versioned_cache_dir
+from .profiling import get_profiler
+from .stubcache import prepare, store_from_config
+from .visitor import TypefunctionRegistryTransformer, SimpleTransformer, TypefunctionEraser
 from .typefunctions import registry
 from .special_typefunctions.indexing import ndarray_getitem  #, ndarray_setitem
 from .special_typefunctions.ndarray_constructor import ndarray_constructor
 
 
+RESULT_MEMO = cache.register('numpy_plugin.plugin.call_results')
+
+
 class NumpyPlugin(Plugin):
     special_ndarray_hooks = {
         'numpy.ndarray.__getitem__': ndarray_getitem,
@@ -22,16 +39,100 @@ class NumpyPlugin(Plugin):
         'numpy.array': ndarray_constructor,
         'numpy.asarray': ndarray_constructor,
         'numpy.ascontiguousarray': ndarray_constructor,
+        'numpy.asfortranarray': ndarray_constructor,
     }
 
     def __init__(self, options: Options):
         super().__init__(options)
+        self.config = PluginConfig.from_options(options)
+        # mypy creates a plugin per build, but imports this package once per
+        # process; the API and the cached Instances are only valid for the
+        # build that produced them
+        self.context = PluginContext(self.config.cache_size)
+        if self.config.cache_stats:
+            cache.write_cache_stats_at_exit(self.config.cache_stats)
+
+        self.fingerprint = plugin_fingerprint()
+        if not hasattr(Plugin, 'report_config_data'):
+            options.cache_dir = versioned_cache_dir(options.cache_dir,
+                                                    self.fingerprint)
+        if self.config.incremental:
+            options.incremental = True
+        store = store_from_config(self.config.stub_cache)
+        if store is not None:
+            prepare(store, options, self.fingerprint)
 
         self.is_setup = False
         self.api = None
         self.npmodule = None
-        self.hooked_functions = set()
         self.fullname2sig = {}
+        self.fullname2plan = {}
+
+        self.registry = registry
+        self.special_hooks = self.special_ndarray_hooks
+        self.bind_arguments = bind_arguments
+        hook = self.function_hook
+        if self.config.profile:
+            profiler = get_profiler(self.config.profile, self.config.profile_memory)
+            self.registry = {name: profiler.wrap('typefunction', name, f)
+                             for name, f in registry.items()}
+            self.special_hooks = {
+                name: profiler.wrap('typefunction', f.__name__, f)
+                for name, f in self.special_ndarray_hooks.items()
+            }
+            self.bind_arguments = profiler.wrap('bind_arguments', 'bind_arguments',
+                                                bind_arguments)
+            hook = profiler.wrap_hook(hook)
+        if self.config.export:
+            hook = get_exporter(self.config.export, self.fingerprint).wrap_hook(hook)
+        costs = self.config.cost_report or self.config.memory_budget is not None
+        if costs:
+            hook = get_cost_model(self.config.cost_report, self.config.memory_budget).wrap_hook(
+                hook, self.bind_call)
+        if self.config.copy_checks:
+            hook = CopyChecker(self.config.copy_checks).wrap_hook(hook, self.bind_call)
+            self.context.checks = CodeFilter(self.config.copy_checks)
+        if self.config.layout_checks:
+            hook = LayoutChecker(self.config.layout_checks).wrap_hook(hook, self.bind_call)
+        if self.config.shape_checks:
+            hook = ShapeChecker(self.config.shape_checks).wrap_hook(hook)
+        self.attribute_hooks = {}  # type: Dict[str, Callable]
+        if self.config.loop_checks or self.config.loop_report:
+            loops = get_loop_checker(self.config.loop_checks, self.config.loop_report)
+            hook = loops.wrap_hook(hook)
+            self.attribute_hooks = {name: loops.attribute_hook(name) for name in ATTRIBUTE_HOOKS}
+        if self.config.modules:
+            eraser = TypefunctionEraser(registry)
+            hook = ModuleFilter(self.config.modules).wrap_hook(
+                hook, lambda ctx: ctx.default_return_type.accept(eraser))
+
+        index = build_dispatch_index(registry.keys())
+        for fullname in self.special_ndarray_hooks:
+            index[fullname] = ('method' if fullname.rsplit('.', 1)[0] in METHOD_CLASSES
+                               else 'function')
+        for fullname in OUT_HOOKS:
+            index.setdefault(fullname, 'function')
+        if costs:
+            for fullname in EXTRA_HOOKS:
+                index.setdefault(fullname, 'function')
+        if self.config.copy_checks:
+            for fullname, calltype in COPY_HOOKS.items():
+                index.setdefault(fullname, calltype)
+        if self.config.layout_checks:
+            for fullname, calltype in LAYOUT_HOOKS.items():
+                index.setdefault(fullname, calltype)
+        if self.config.shape_checks:
+            for fullname, calltype in SHAPE_HOOKS.items():
+                index.setdefault(fullname, calltype)
+        self.hooked_functions = set(index)
+        self.function_hooks = {
+            fullname: functools.partial(hook, fullname, calltype)
+            for fullname, calltype in index.items() if calltype == 'function'
+        }
+        self.method_hooks = {
+            fullname: functools.partial(hook, fullname, calltype)
+            for fullname, calltype in index.items() if calltype == 'method'
+        }
 
     def do_setup(self, ctx: FunctionContext):
         if 'numpy' not in ctx.api.modules or len(
@@ -40,83 +141,95 @@ class NumpyPlugin(Plugin):
 
         self.api = ctx.api
         self.npmodule = ctx.api.modules['numpy']
-        shortcuts.API = self.api
-
-        for node in itertools.chain(
-                self.npmodule.names.values(),
-                self.npmodule.names['ndarray'].node.names.values()):
-            if isinstance(node.type, CallableType):
-                for tfname, tffunc in registry.items():
-                    if node.type.accept(HasInstanceQuery(tfname)):
-                        self.hooked_functions.add(node.fullname)
-                        self.fullname2sig[node.fullname] = node.type
-
-        for fullname, func in self.special_ndarray_hooks.items():
-            self.hooked_functions.add(fullname)
-            split = fullname.split('.')
-            if len(split) == 2:
-                assert split[0] == 'numpy'
-                self.fullname2sig[fullname] = self.npmodule.names[split[
-                    1]].type
-            elif len(split) == 3:
-                assert split[0] == 'numpy'
-                self.fullname2sig[fullname] = self.npmodule.names[split[
-                    1]].node.names[split[2]].type
+        self.context.api = self.api
+        self.is_setup = True
+
+    def signature(self, fullname: str, calltype: str) -> Type:
+        # Submodules of the stub package are only analyzed once something
+        # imports them, so signatures are resolved on first use.
+        sig = self.fullname2sig.get(fullname)
+        if sig is None:
+            if calltype == 'method':
+                module, cls, name = fullname.rsplit('.', 2)
+                sig = self.api.modules[module].names[cls].node.names[name].type
             else:
-                assert False
+                module, name = fullname.rsplit('.', 1)
+                sig = self.api.modules[module].names[name].type
+            self.fullname2sig[fullname] = sig
+            self.fullname2plan[fullname] = compile_plan(sig.ret_type, self.registry)
+        return sig
 
-        self.is_setup = True
+    def bind_call(self, fullname: str, calltype: str, ctx) -> Optional[BoundArguments]:
+        if not self.is_setup:
+            return None
+        return self.bind_arguments(self.signature(fullname, calltype), ctx, calltype=calltype)
 
     def function_hook(self, fullname: str, calltype: str,
                       ctx: FunctionContext):
+        previous = context.swap(self.context)
+        try:
+            return self.infer_return_type(fullname, calltype, ctx)
+        finally:
+            context.swap(previous)
+
+    def infer_return_type(self, fullname: str, calltype: str,
+                          ctx: FunctionContext):
         if not self.is_setup:
             self.do_setup(ctx)
-            if fullname not in self.hooked_functions:
+            if not self.is_setup:
                 return ctx.default_return_type
 
-        assert fullname in self.hooked_functions
-        callee = self.fullname2sig[fullname]
-        bound_args = bind_arguments(callee, ctx, calltype=calltype)
+        callee = self.signature(fullname, calltype)
+
+        if fullname in self.special_hooks:
+            bound_args = self.bind_arguments(callee, ctx, calltype=calltype)
+            return self.special_hooks[fullname](bound_args, ctx)
 
-        if fullname in self.special_ndarray_hooks:
-            return self.special_ndarray_hooks[fullname](bound_args, ctx)
+        # identical calls, like np.zeros((n, m)) all over a codebase, are
+        # evaluated once per build; out= buffers are checked at every call
+        bound_args = self.bind_arguments(callee, ctx, calltype=calltype)
+        out = passes_out(bound_args)
+        key = None if out else cache.call_key(fullname, ctx)
+        if key is not None:
+            memo = cache.context_cache(self.context, RESULT_MEMO)
+            result = memo.get(key)
+            if result is not cache.MISSING:
+                return result
 
         result = ctx.default_return_type
-        result = result.accept(
-            TypefunctionRegistryTransformer(registry, fullname, bound_args))
-        result = result.accept(
-            TypefunctionRegistryTransformer(registry, fullname, bound_args))
-        return result.accept(SimpleTransformer(shortcuts.zerodim_to_scalar))
+        plan = self.fullname2plan[fullname]
+        if plan is not None:
+            try:
+                result = plan.evaluate(result, fullname, bound_args)
+            except PlanMismatch:
+                result = self.transform(result, fullname, bound_args)
+        if out:
+            result = check_out(fullname, bound_args, result, ctx)
+        result = result.accept(SimpleTransformer(shortcuts.zerodim_to_scalar))
+
+        if key is not None:
+            memo.put(key, result)
+        return result
+
+    def transform(self, typ: Type, fullname: str, bound_args) -> Type:
+        # a return type the plan doesn't fit, like Any after an argument
+        # error; typefunctions may return further typefunctions
+        typ = typ.accept(TypefunctionRegistryTransformer(self.registry, fullname, bound_args))
+        return typ.accept(TypefunctionRegistryTransformer(self.registry, fullname, bound_args))
+
+    def report_config_data(self, ctx) -> Dict[str, str]:
+        return {'numpy_plugin': self.fingerprint}
 
     def get_function_hook(self, fullname):
-        if (not self.is_setup) or fullname in self.hooked_functions:
-            return functools.partial(self.function_hook, fullname, 'function')
-        return False
+        return self.function_hooks.get(fullname)
 
     def get_method_hook(
             self, fullname: str) -> Optional[Callable[[MethodContext], Type]]:
-        if (not self.is_setup) or fullname in self.hooked_functions:
-            return functools.partial(self.function_hook, fullname, 'method')
-        return False
+        return self.method_hooks.get(fullname)
+
+    def get_attribute_hook(self, fullname: str):
+        return self.attribute_hooks.get(fullname)
 
 
 def plugin(version):
-    import os
-    paths = [
-        os.environ.get('MYPYPATH', ''),
-        os.path.join(os.path.dirname(__file__), 'stubs/')
-    ]
-    os.environ['MYPYPATH'] = ':'.join(paths)
     return NumpyPlugin
-
-
-class HasInstanceQuery(TypeQuery[bool]):
-    def __init__(self, fullname) -> None:
-        super().__init__(any)
-        self.fullname = fullname
-
-    def visit_instance(self, t: Instance) -> bool:
-        if t.type.fullname() == self.fullname:
-            return True
-        else:
-            return super().visit_instance(t)
@@ -0,0 +1,147 @@
+"""Opt-in timing of the plugin's hooks, typefunctions and argument binding.
+
+Enabled by the ``profile`` option (or ``NUMPY_PLUGIN_PROFILE``), which names
+the report written at exit: JSON if the path ends in ``.json``, CSV
+otherwise. When it is off nothing is wrapped, so the plugin pays nothing for
+it. ``profile_memory`` additionally records the tracemalloc peak allocated
+by each function hook.
+"""
+import atexit
+import csv
+import heapq
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from . import cache
+
+# How many of the slowest individual calls the JSON report lists.
+SLOWEST_CALLS = 25
+
+_profiler = None  # type: Optional[Profiler]
+
+
+class HookRecord:
+    __slots__ = ('kind', 'name', 'durations', 'peak_alloc', 'slowest', 'slowest_site')
+
+    def __init__(self, kind: str, name: str) -> None:
+        self.kind = kind
+        self.name = name
+        self.durations = []  # type: List[float]
+        self.peak_alloc = 0
+        self.slowest = 0.0
+        self.slowest_site = ''
+
+    def summary(self) -> Dict[str, Any]:
+        durations = sorted(self.durations)
+        n = len(durations)
+        return {
+            'kind': self.kind,
+            'name': self.name,
+            'count': n,
+            'total_ms': 1e3 * sum(durations),
+            'p50_ms': 1e3 * durations[(n - 1) // 2],
+            'p99_ms': 1e3 * durations[(99 * (n - 1)) // 100],
+            'max_ms': 1e3 * durations[-1],
+            'peak_alloc_bytes': self.peak_alloc,
+            'slowest_site': self.slowest_site,
+        }
+
+
+class Profiler:
+    def __init__(self, output: str, memory: bool=False) -> None:
+        self.output = output
+        self.memory = memory
+        self.records = {}  # type: Dict[Tuple[str, str], HookRecord]
+        self.slowest = []  # type: List[Tuple[float, str, str, str]]
+        self.site = ''
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def record(self, kind: str, name: str, duration: float) -> HookRecord:
+        rec = self.records.get((kind, name))
+        if rec is None:
+            rec = self.records[(kind, name)] = HookRecord(kind, name)
+        rec.durations.append(duration)
+        if duration > rec.slowest:
+            rec.slowest = duration
+            rec.slowest_site = self.site
+        entry = (duration, kind, name, self.site)
+        if len(self.slowest) < SLOWEST_CALLS:
+            heapq.heappush(self.slowest, entry)
+        elif duration > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, entry)
+        return rec
+
+    def wrap(self, kind: str, name: str, func: Callable) -> Callable:
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(kind, name, time.perf_counter() - start)
+
+        return timed
+
+    def wrap_hook(self, func: Callable) -> Callable:
+        """Time a ``function_hook(fullname, calltype, ctx)``, by callee."""
+        def timed(fullname, calltype, ctx):
+            outer_site = self.site
+            self.site = '%s:%d' % (getattr(ctx.api, 'path', '?'), ctx.context.line)
+            mem_start = _memory_start() if self.memory else 0
+            start = time.perf_counter()
+            try:
+                return func(fullname, calltype, ctx)
+            finally:
+                rec = self.record('function_hook', fullname, time.perf_counter() - start)
+                if self.memory:
+                    rec.peak_alloc = max(rec.peak_alloc, _memory_peak_since(mem_start))
+                self.site = outer_site
+
+        return timed
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            'hooks': sorted((r.summary() for r in self.records.values()),
+                            key=lambda s: -s['total_ms']),
+            'slowest_calls': [
+                {'kind': kind, 'name': name, 'site': site, 'ms': 1e3 * duration}
+                for duration, kind, name, site in sorted(self.slowest, reverse=True)
+            ],
+            'caches': cache.cache_stats(),
+        }
+
+    def write(self) -> None:
+        report = self.report()
+        with open(self.output, 'w') as f:
+            if self.output.endswith('.json'):
+                json.dump(report, f, indent=2)
+            elif report['hooks']:
+                writer = csv.DictWriter(f, fieldnames=list(report['hooks'][0]))
+                writer.writeheader()
+                writer.writerows(report['hooks'])
+
+
+def get_profiler(output: str, memory: bool=False) -> Profiler:
+    """The process-wide profiler; a dmypy server accumulates across builds."""
+    global _profiler
+    if _profiler is None:
+        _profiler = Profiler(output, memory)
+        atexit.register(lambda: _profiler.write())
+    _profiler.output = output
+    return _profiler
+
+
+def _memory_start() -> int:
+    if hasattr(tracemalloc, 'reset_peak'):
+        tracemalloc.reset_peak()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def _memory_peak_since(start: int) -> int:
+    current, peak = tracemalloc.get_traced_memory()
+    if not hasattr(tracemalloc, 'reset_peak'):
+        # before Python 3.9 the peak can't be reset; count the net allocation
+        peak = current
+    return max(peak - start, 0)
@@ -0,0 +1,754 @@
+"""Symbolic array shapes, and the broadcasts they make.
+
+An extent is an int, a name standing for one, or None when nothing is
+known about it. Names come from int variables that aren't constants,
+``np.zeros((n, m))`` in ``def f(n: int, m: int)``, and from arrays whose
+shape isn't seen, like a parameter ``x: np.ndarray[float, np.TwoD]``, whose
+extents are ``x.shape[0]`` and ``x.shape[1]``. Products and sums of names
+are names too, ``n*m`` or ``n + 1``; names equal as they are written.
+
+Shapes are inferred from constructors, the arrays variables assigned once
+hold, and ``x.shape[i]`` and ``len(x)``, and propagated through ufuncs and
+arithmetic operators, ``reshape`` (with ``-1``), ``ravel``, transposes,
+reductions, ``concatenate`` and the ``stack`` family, ``einsum``, and basic
+indexing.
+
+The ``shape_checks`` option takes module patterns, as ``copy_checks``
+does, and reports there, at ufunc calls, operators, ``reshape`` and
+concatenations, under the codes
+
+``shape-mismatch``
+    shapes that can't be broadcast or concatenated together, or a reshape
+    to a different size: an error at runtime.
+``broadcast-outer``
+    a broadcast whose result is larger than every operand, like ``(n, 1)``
+    against ``(1, m)``, which silently makes an ``(n, m)`` temporary.
+``einsum-unoptimized``
+    an ``np.einsum`` without ``optimize=`` doing at least ten times the
+    FLOPs of its best order of pairwise contractions. Extents that aren't
+    ints are taken to be 1000.
+"""
+from typing import Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
+
+from mypy.nodes import (Expression, Var, NameExpr, MemberExpr, IntExpr, UnaryExpr, OpExpr,
+                        ComparisonExpr, TupleExpr, ListExpr, IndexExpr, SliceExpr,
+                        EllipsisExpr, CallExpr, RefExpr, StrExpr, AssignmentStmt, MypyFile,
+                        ARG_POS, ARG_STAR)
+from mypy.types import Type, Instance, NoneTyp
+
+from .activation import CodeFilter, parse_code_rules
+from .checkers import Hooks, OUT_PARAMETERS, PerModule, Assignments, argument, is_array
+from .einsum import parse_subscripts, naive_flops, optimal_path, format_path, Terms
+from .loops import ndim_of
+from .shortcuts import element_char
+from .tables import UFUNC_ALIASES, UFUNC_OUTPUTS
+
+Extent = Union[int, str, None]
+Shape = Tuple[Extent, ...]
+
+CODES = ('shape-mismatch', 'broadcast-outer', 'einsum-unoptimized')
+SHAPE_HOOKS = dict([('numpy.concatenate', 'function')] + [
+    ('numpy.ndarray.%s' % name, 'method') for name in (
+        '__add__', '__radd__', '__sub__', '__rsub__', '__mul__', '__rmul__', '__div__',
+        '__rdiv__', '__floordiv__', '__rfloordiv__', '__truediv__', '__rtruediv__',
+        '__le__', '__lt__', '__ge__', '__gt__')])  # type: Hooks
+
+# constructor -> its shape parameter, and the parameter's position
+SHAPE_CONSTRUCTORS = {
+    'numpy.zeros': ('shape', 0), 'numpy.ones': ('shape', 0), 'numpy.empty': ('shape', 0),
+    'numpy.full': ('shape', 0), 'numpy.random.random': ('size', 0),
+    'numpy.random.random_sample': ('size', 0), 'numpy.random.randint': ('size', 2),
+    'numpy.random.normal': ('size', 2), 'numpy.random.uniform': ('size', 2),
+    'numpy.random.choice': ('size', 1),
+}
+LIKE_CONSTRUCTORS = ('numpy.zeros_like', 'numpy.ones_like', 'numpy.empty_like',
+                     'numpy.full_like')
+REDUCTIONS = ('all', 'alltrue', 'amin', 'amax', 'any', 'argmax', 'argmin', 'average',
+              'max', 'mean', 'prod', 'product', 'ptp', 'sometrue', 'std', 'sum', 'var')
+CUMULATIVE = ('cumsum', 'cumprod', 'cumproduct')
+BROADCASTING_OPERATORS = ('+', '-', '*', '/', '//', '%', '**', '<', '<=', '>', '>=', '==',
+                          '!=')
+CONVERSIONS = ('numpy.array', 'numpy.asarray', 'numpy.asanyarray', 'numpy.ascontiguousarray',
+               'numpy.asfortranarray')
+STACKS = ('numpy.concatenate', 'numpy.stack', 'numpy.vstack', 'numpy.hstack', 'numpy.dstack')
+# methods returning an array of the shape of theirs
+SAME_SHAPE_METHODS = ('copy', 'astype')
+# how many times the FLOPs of its best contraction order an einsum does
+# before it is reported, and the extent taken for those that aren't ints
+EINSUM_SPEEDUP = 10
+ASSUMED_EXTENT = 1000
+
+
+def parse_shape_checks(value: Optional[str]) -> List[Tuple[str, FrozenSet[str]]]:
+    return parse_code_rules(value, CODES)
+
+
+class ShapeAssignments(Assignments):
+    """Assignments, with ``n, m = x.shape`` read as ``n = x.shape[0]`` and
+    ``m = x.shape[1]``."""
+
+    def visit_assignment_stmt(self, s: AssignmentStmt) -> None:
+        lvalue = s.lvalues[0] if len(s.lvalues) == 1 else None
+        unpacked = isinstance(lvalue, (TupleExpr, ListExpr)) and \
+            isinstance(s.rvalue, MemberExpr) and s.rvalue.name == 'shape'
+        new = [item.node for item in lvalue.items
+               if isinstance(item, NameExpr) and isinstance(item.node, Var) and
+               item.node not in self.values and item.node not in self.parameters] \
+            if unpacked else []
+        super().visit_assignment_stmt(s)
+        for i, item in enumerate(lvalue.items if unpacked else []):
+            if isinstance(item, NameExpr) and item.node in new:
+                self.values[item.node] = IndexExpr(s.rvalue, IntExpr(i))
+
+
+class Shapes:
+    """The shapes of the arrays and the extents of the ints of a module's
+    expressions."""
+
+    def __init__(self, tree: MypyFile, type_map: Dict[Expression, Type]) -> None:
+        self.values = ShapeAssignments(tree).values
+        self.type_map = type_map
+        self.memo = {}  # type: Dict[Expression, Shape]
+
+    ###########################################################################
+    # extents
+
+    def extent(self, expr: Expression, depth: int=0) -> Extent:
+        if depth > 20:
+            return None
+        if isinstance(expr, IntExpr):
+            return expr.value
+        if isinstance(expr, UnaryExpr) and expr.op == '-':
+            value = self.extent(expr.expr, depth + 1)
+            return -value if isinstance(value, int) else None
+        if isinstance(expr, OpExpr) and expr.op in ('+', '-', '*', '//', '**'):
+            left = self.extent(expr.left, depth + 1)
+            right = self.extent(expr.right, depth + 1)
+            if left is None or right is None:
+                return None
+            if expr.op == '*':
+                return multiply([left, right])
+            if isinstance(left, int) and isinstance(right, int):
+                if expr.op == '//':
+                    return left // right if right else None
+                if expr.op == '**':
+                    return left ** right if 0 <= right <= 64 else None
+                return left + right if expr.op == '+' else left - right
+            if expr.op == '**':
+                return None
+            return '%s %s %s' % (left, expr.op, right)
+        if isinstance(expr, CallExpr) and isinstance(expr.callee, NameExpr) and \
+                expr.callee.fullname == 'builtins.len' and len(expr.args) == 1:
+            shape = self.shape(expr.args[0], depth + 1)
+            return shape[0] if shape else None
+        if isinstance(expr, IndexExpr) and isinstance(expr.base, MemberExpr) and \
+                expr.base.name == 'shape':
+            shape = self.shape(expr.base.expr, depth + 1)
+            i = self.extent(expr.index, depth + 1)
+            if shape is None or not isinstance(i, int) or not -len(shape) <= i < len(shape):
+                return None
+            return shape[i]
+        if isinstance(expr, NameExpr) and isinstance(expr.node, Var) and \
+                self.is_int(self.type_map.get(expr)):
+            var = expr.node
+            if var not in self.values:
+                # a parameter
+                return var.name()
+            value = self.values[var]
+            if value is None:
+                return None
+            extent = self.extent(value, depth + 1)
+            return var.name() if extent is None else extent
+        return None
+
+    def is_int(self, typ: Optional[Type]) -> bool:
+        return isinstance(typ, Instance) and typ.type.has_base('builtins.int') and \
+            typ.type.fullname() != 'builtins.bool'
+
+    def shape_argument(self, expr: Expression, depth: int=0) -> Optional[Shape]:
+        """The shape an argument like ``(n, m)``, ``n`` or ``x.shape``
+        describes."""
+        if isinstance(expr, NameExpr) and isinstance(expr.node, Var) and \
+                self.values.get(expr.node) is not None:
+            expr = self.values[expr.node]
+        if isinstance(expr, (TupleExpr, ListExpr)):
+            return tuple(self.extent(item, depth + 1) for item in expr.items)
+        if isinstance(expr, MemberExpr) and expr.name == 'shape' and \
+                is_array(self.type_map.get(expr.expr)):
+            return self.shape(expr.expr, depth + 1)
+        if self.is_int(self.type_map.get(expr)) or isinstance(expr, IntExpr):
+            return (self.extent(expr, depth + 1),)
+        return None
+
+    ###########################################################################
+    # shapes
+
+    def shape(self, expr: Expression, depth: int=0) -> Optional[Shape]:
+        """The shape of an array expression; () for a scalar."""
+        if depth > 20:
+            return None
+        shape = self.memo.get(expr)
+        if shape is not None:
+            return shape
+        typ = self.type_map.get(expr)
+        if not is_array(typ):
+            if isinstance(typ, Instance) and element_char(typ) is not None:
+                return ()
+            return None
+        shape = self.infer(expr, depth + 1)
+        ndim = ndim_of(typ)
+        if shape is None or ndim is not None and len(shape) != ndim:
+            shape = None if ndim is None else (None,) * ndim
+        if shape is not None:
+            self.memo[expr] = shape
+        return shape
+
+    def infer(self, expr: Expression, depth: int) -> Optional[Shape]:
+        if isinstance(expr, NameExpr) and isinstance(expr.node, Var):
+            var = expr.node
+            if var not in self.values:
+                ndim = ndim_of(self.type_map.get(expr))
+                return None if ndim is None else tuple(
+                    '%s.shape[%d]' % (var.name(), i) for i in range(ndim))
+            value = self.values[var]
+            return None if value is None else self.shape(value, depth)
+        if isinstance(expr, MemberExpr) and expr.name == 'T' and not expr.fullname:
+            shape = self.shape(expr.expr, depth)
+            return None if shape is None else shape[::-1]
+        if isinstance(expr, IndexExpr):
+            return self.indexed(expr, depth)
+        if isinstance(expr, UnaryExpr) and expr.op in ('-', '+', '~'):
+            return self.shape(expr.expr, depth)
+        if isinstance(expr, (OpExpr, ComparisonExpr)):
+            shapes = self.operand_shapes(expr, depth)
+            return None if shapes is None else broadcast(shapes)[0]
+        if isinstance(expr, CallExpr):
+            callee = expr.callee
+            if isinstance(callee, MemberExpr) and not callee.fullname:
+                return self.method(expr, callee.name, callee.expr, depth)
+            if isinstance(callee, RefExpr) and callee.fullname:
+                return self.function(expr, callee.fullname, depth)
+        return None
+
+    def operand_shapes(self, expr: Expression, depth: int=0) -> Optional[List[Shape]]:
+        """The shapes an operator or ufunc call broadcasts together."""
+        if isinstance(expr, OpExpr) and expr.op in BROADCASTING_OPERATORS:
+            operands = [expr.left, expr.right]
+        elif isinstance(expr, ComparisonExpr) and len(expr.operators) == 1 and \
+                expr.operators[0] in BROADCASTING_OPERATORS:
+            operands = expr.operands
+        elif isinstance(expr, CallExpr) and isinstance(expr.callee, RefExpr) and \
+                is_ufunc(expr.callee.fullname):
+            operands = [a for a, name in zip(expr.args, expr.arg_names)
+                        if name not in OUT_PARAMETERS]
+        else:
+            return None
+        shapes = [self.shape(operand, depth) for operand in operands]
+        if None in shapes:
+            return None
+        return shapes
+
+    def method(self, call: CallExpr, name: str, receiver: Expression,
+               depth: int) -> Optional[Shape]:
+        if not is_array(self.type_map.get(receiver)):
+            return None
+        shape = self.shape(receiver, depth)
+        if shape is None:
+            return None
+        if name in SAME_SHAPE_METHODS:
+            return shape
+        if name in ('ravel', 'flatten'):
+            return (multiply(shape),)
+        if name == 'reshape':
+            newshape = self.shape_argument(call.args[0], depth) if len(call.args) == 1 else \
+                self.shape_argument(TupleExpr(call.args), depth) if call.args else None
+            return reshaped(shape, newshape)[0]
+        if name == 'transpose':
+            axes = call.args[0] if len(call.args) == 1 else \
+                TupleExpr(call.args) if call.args else None
+            return self.permuted(shape, axes)
+        if name == 'swapaxes' and len(call.args) == 2:
+            return swapped(shape, self.extent(call.args[0]), self.extent(call.args[1]))
+        if name == 'all':
+            return self.reduced(shape, 'all', argument(call, 'axis', 0),
+                                argument(call, 'keepdims', 1))
+        return None
+
+    def function(self, call: CallExpr, fullname: str, depth: int) -> Optional[Shape]:
+        if fullname in SHAPE_CONSTRUCTORS:
+            arg = argument(call, *SHAPE_CONSTRUCTORS[fullname])
+            if arg is None:
+                return () if fullname.startswith('numpy.random.') else None
+            return self.shape_argument(arg, depth)
+        if fullname in ('numpy.random.rand', 'numpy.random.randn'):
+            return tuple(self.extent(a, depth) for a in call.args)
+        if fullname == 'numpy.eye':
+            n = argument(call, 'N', 0)
+            m = argument(call, 'M', 1)
+            if n is None:
+                return None
+            return (self.extent(n, depth), self.extent(m if m is not None else n, depth))
+        if fullname == 'numpy.identity' and call.args:
+            n = self.extent(call.args[0], depth)
+            return (n, n)
+        if fullname == 'numpy.arange':
+            return self.arange(call, depth)
+        if fullname in LIKE_CONSTRUCTORS:
+            a = argument(call, 'a', 0)
+            return None if a is None else self.shape(a, depth)
+        if fullname in CONVERSIONS:
+            a = argument(call, 'object', 0)
+            if a is None:
+                return None
+            return self.shape(a, depth) if is_array(self.type_map.get(a)) else literal_shape(a)
+        if is_ufunc(fullname):
+            shapes = self.operand_shapes(call, depth)
+            return None if shapes is None else broadcast(shapes)[0]
+        name = fullname.rsplit('.', 1)[-1]
+        if fullname.count('.') == 1 and name in REDUCTIONS + CUMULATIVE:
+            a = argument(call, 'a', 0)
+            shape = None if a is None else self.shape(a, depth)
+            if shape is None:
+                return None
+            return self.reduced(shape, name, argument(call, 'axis', 1),
+                                argument(call, 'keepdims', None))
+        if fullname in ('numpy.reshape', 'numpy.ravel', 'numpy.transpose', 'numpy.swapaxes'):
+            a = argument(call, 'a', 0)
+            shape = None if a is None else self.shape(a, depth)
+            if shape is None:
+                return None
+            if fullname == 'numpy.ravel':
+                return (multiply(shape),)
+            if fullname == 'numpy.transpose':
+                return self.permuted(shape, argument(call, 'axes', 1))
+            if fullname == 'numpy.swapaxes':
+                axis1, axis2 = argument(call, 'axis1', 1), argument(call, 'axis2', 2)
+                if axis1 is None or axis2 is None:
+                    return None
+                return swapped(shape, self.extent(axis1), self.extent(axis2))
+            newshape = argument(call, 'newshape', 1)
+            return None if newshape is None else \
+                reshaped(shape, self.shape_argument(newshape, depth))[0]
+        if fullname in STACKS:
+            return self.stacked(call, fullname, depth)[0]
+        if fullname == 'numpy.einsum':
+            found = self.einsum(call, depth)
+            return None if found is None else tuple(found[1][i] for i in found[0][1])
+        return None
+
+    def arange(self, call: CallExpr, depth: int) -> Optional[Shape]:
+        start, stop, step = (argument(call, name, i)
+                             for i, name in enumerate(('start', 'stop', 'step')))
+        if start is None:
+            return None
+        if stop is None and step is None:
+            return (self.extent(start, depth),)
+        if stop is None:
+            # np.arange(n, step=s) counts from 0 to n
+            start, stop = None, start
+        first, last, stride = (default if e is None else self.extent(e, depth)
+                               for e, default in ((start, 0), (stop, 0), (step, 1)))
+        if not all(isinstance(e, int) for e in (first, last, stride)) or not stride:
+            return (None,)
+        return (max(0, -((first - last) // stride)),)
+
+    def permuted(self, shape: Shape, axes: Optional[Expression]) -> Optional[Shape]:
+        if axes is None:
+            return shape[::-1]
+        order = [self.extent(a) for a in (axes.items if isinstance(axes, (TupleExpr, ListExpr))
+                                          else [axes])]
+        if len(order) != len(shape) or not all(isinstance(i, int) for i in order):
+            return None
+        return tuple(shape[i] for i in order)
+
+    def reduced(self, shape: Shape, name: str, axis: Optional[Expression],
+                keepdims: Optional[Expression]) -> Optional[Shape]:
+        if axis is None or isinstance(axis, NameExpr) and axis.fullname == 'builtins.None':
+            if name in CUMULATIVE:
+                return (multiply(shape),)
+            axes = list(range(len(shape)))
+        else:
+            axes = [self.extent(a) for a in (axis.items if isinstance(axis, TupleExpr)
+                                             else [axis])]
+            if not all(isinstance(a, int) and -len(shape) <= a < len(shape) for a in axes):
+                return None
+            axes = [a % len(shape) for a in axes]
+        if name in CUMULATIVE:
+            return shape
+        keep = isinstance(keepdims, NameExpr) and keepdims.fullname == 'builtins.True'
+        return tuple(1 if i in axes else e for i, e in enumerate(shape)
+                     if keep or i not in axes)
+
+    def indexed(self, expr: IndexExpr, depth: int) -> Optional[Shape]:
+        base = self.shape(expr.base, depth)
+        if base is None:
+            return None
+        items = expr.index.items if isinstance(expr.index, TupleExpr) else [expr.index]
+        types = [self.type_map.get(item) for item in items]
+        if len(items) == 1 and is_array(types[0]):
+            # a[idx], a[mask]
+            index = self.shape(items[0], depth)
+            if index is None or not base:
+                return None
+            if element_char(types[0].args[0]) == '?':
+                return (None,) + base[len(index):] if len(index) <= len(base) else None
+            return index + base[1:]
+        n_indexing = sum(not isinstance(t, NoneTyp) and not isinstance(i, EllipsisExpr)
+                         for i, t in zip(items, types))
+        shape = []  # type: List[Extent]
+        axis = 0
+        for item, typ in zip(items, types):
+            if isinstance(typ, NoneTyp):
+                shape.append(1)
+            elif isinstance(item, EllipsisExpr):
+                skipped = len(base) - n_indexing
+                shape.extend(base[axis:axis + skipped])
+                axis += skipped
+            elif axis >= len(base):
+                return None
+            elif isinstance(item, SliceExpr):
+                shape.append(self.sliced(base[axis], item))
+                axis += 1
+            elif self.is_int(typ):
+                axis += 1
+            else:
+                return None
+        return tuple(shape) + base[axis:]
+
+    def sliced(self, extent: Extent, s: SliceExpr) -> Extent:
+        start, stop, step = (None if e is None else self.extent(e)
+                             for e in (s.begin_index, s.end_index, s.stride))
+        if any(e is not None and not isinstance(e, int)
+               for e in (start, stop, step)) or step == 0:
+            return None
+        if s.begin_index is None and s.end_index is None and step in (None, 1):
+            return extent
+        if isinstance(extent, int):
+            return len(range(extent)[start:stop:step])
+        if stop is None and step in (None, 1) and isinstance(start, int) and start >= 0:
+            return '%s - %d' % (extent, start)
+        return None
+
+    def einsum(self, call: CallExpr,
+               depth: int=0) -> Optional[Tuple[Terms, Dict[str, Extent]]]:
+        """The terms of an ``np.einsum`` call with literal subscripts, and the
+        extent of each index."""
+        subscripts = argument(call, 'subscripts', 0)
+        if not isinstance(subscripts, StrExpr) or ARG_STAR in call.arg_kinds:
+            return None
+        operands = [a for a, kind in zip(call.args[1:], call.arg_kinds[1:]) if kind == ARG_POS]
+        shapes = [self.shape(operand, depth) for operand in operands]
+        if None in shapes:
+            return None
+        terms = parse_subscripts(subscripts.value, [len(s) for s in shapes])
+        if terms is None:
+            return None
+        extents = {}  # type: Dict[str, Extent]
+        for term, shape in zip(terms[0], shapes):
+            for index, extent in zip(term, shape):
+                extents[index] = broadcast_extent(extents.get(index, 1), extent)[0]
+        return terms, extents
+
+    def stacked(self, call: CallExpr, fullname: str,
+                depth: int=0) -> Tuple[Optional[Shape], Optional[str]]:
+        """The shape of a concatenation, and why it fails if it does."""
+        tup = argument(call, 'tup', 0)
+        if not isinstance(tup, (TupleExpr, ListExpr)) or not tup.items:
+            return None, None
+        shapes = [self.shape(item, depth) for item in tup.items]
+        if None in shapes:
+            return None, None
+        axis_arg = argument(call, 'axis', 1)
+        if fullname == 'numpy.vstack':
+            shapes = [s if len(s) >= 2 else (1,) * (2 - len(s)) + s for s in shapes]
+            axis = 0
+        elif fullname == 'numpy.hstack':
+            axis = 0 if all(len(s) == 1 for s in shapes) else 1
+        elif fullname == 'numpy.dstack':
+            # as np.atleast_3d makes them
+            shapes = [{0: (1, 1, 1), 1: (1,) + s + (1,), 2: s + (1,)}.get(len(s), s)
+                      for s in shapes]
+            axis = 2
+        elif axis_arg is None:
+            axis = 0
+        elif isinstance(axis_arg, NameExpr) and axis_arg.fullname == 'builtins.None' and \
+                fullname == 'numpy.concatenate':
+            return (add([multiply(s) for s in shapes]),), None
+        else:
+            axis = self.extent(axis_arg)
+            if not isinstance(axis, int):
+                return None, None
+
+        if fullname == 'numpy.stack':
+            first = shapes[0]
+            for i, s in enumerate(shapes[1:], 1):
+                if len(s) != len(first) or not all(compatible(a, b) for a, b in zip(first, s)):
+                    return None, 'all input arrays must have the same shape, but %s and %s ' \
+                        'are stacked' % (format_shape(first), format_shape(s))
+            if not -len(first) - 1 <= axis <= len(first):
+                return None, None
+            axis %= len(first) + 1
+            return first[:axis] + (len(shapes),) + first[axis:], None
+
+        ndim = len(shapes[0])
+        if any(len(s) != ndim for s in shapes) or not -ndim <= axis < ndim:
+            return None, None
+        axis %= ndim
+        for i, s in enumerate(shapes[1:], 1):
+            for j in range(ndim):
+                if j != axis and not compatible(shapes[0][j], s[j]):
+                    return None, 'along dimension %d, the array at index 0 has size %s and ' \
+                        'the array at index %d has size %s' % (j, shapes[0][j], i, s[j])
+        return shapes[0][:axis] + (add([s[axis] for s in shapes]),) + shapes[0][axis + 1:], None
+
+
+###############################################################################
+
+
+def is_ufunc(fullname: Optional[str]) -> bool:
+    if not fullname or not fullname.startswith('numpy.') or fullname.count('.') != 1:
+        return False
+    name = fullname[len('numpy.'):]
+    return UFUNC_ALIASES.get(name, name) in UFUNC_OUTPUTS
+
+
+def literal_shape(expr: Expression) -> Optional[Shape]:
+    """The shape of a nested list or tuple literal of numbers."""
+    if isinstance(expr, (ListExpr, TupleExpr)):
+        if not expr.items:
+            return (0,)
+        inner = [literal_shape(item) for item in expr.items]
+        if None in inner or any(s != inner[0] for s in inner):
+            return None
+        return (len(expr.items),) + inner[0]
+    if isinstance(expr, (ListExpr, TupleExpr, CallExpr, NameExpr, MemberExpr, IndexExpr)):
+        return None
+    return ()
+
+
+def broadcast(shapes: Sequence[Shape]) -> Tuple[Shape, bool]:
+    """The shape ``shapes`` broadcast to, and whether they mismatch."""
+    ndim = max((len(s) for s in shapes), default=0)
+    result = []  # type: List[Extent]
+    ok = True
+    for i in range(ndim):
+        extent = 1  # type: Extent
+        for s in shapes:
+            j = i - ndim + len(s)
+            if j >= 0:
+                extent, fits = broadcast_extent(extent, s[j])
+                ok = ok and fits
+        result.append(extent)
+    return tuple(result), not ok
+
+
+def broadcast_extent(a: Extent, b: Extent) -> Tuple[Extent, bool]:
+    if a == b or b == 1:
+        return a, True
+    if a == 1:
+        return b, True
+    if a is None or b is None:
+        return b if a is None else a, True
+    if isinstance(a, int) and isinstance(b, int):
+        return a, False
+    if isinstance(a, int) or isinstance(b, int):
+        # the name has to equal the int
+        return a if isinstance(a, int) else b, True
+    # one of two names may be 1
+    return None, True
+
+
+def is_outer(shapes: Sequence[Shape], result: Shape) -> bool:
+    """Whether a broadcast is larger than each of its operands: every array
+    is stretched along an axis whose extent is known not to be 1."""
+    arrays = [s for s in shapes if s]
+    if len(arrays) < 2:
+        return False
+    for s in arrays:
+        aligned = (1,) * (len(result) - len(s)) + s
+        # a name broadcast against an int has to equal it
+        if all(a == r or a is None or r is None or r == 1 or isinstance(a, str)
+               for a, r in zip(aligned, result)):
+            return False
+    return True
+
+
+def compatible(a: Extent, b: Extent) -> bool:
+    return a == b or not isinstance(a, int) or not isinstance(b, int)
+
+
+def factors(extent: Extent) -> Optional[Tuple[int, List[str]]]:
+    """An extent as an int coefficient times names."""
+    if isinstance(extent, int):
+        return extent, []
+    if extent is None:
+        return None
+    if ' ' in extent:
+        return 1, [extent]
+    coefficient, names = 1, []
+    for part in extent.split('*'):
+        if part.isdigit():
+            coefficient *= int(part)
+        else:
+            names.append(part)
+    return coefficient, names
+
+
+def from_factors(coefficient: int, names: List[str]) -> Extent:
+    if not names or coefficient == 0:
+        return coefficient
+    parts = ([str(coefficient)] if coefficient != 1 else []) + sorted(names)
+    return '*'.join(parts)
+
+
+def multiply(extents: Sequence[Extent]) -> Extent:
+    coefficient, names = 1, []  # type: Tuple[int, List[str]]
+    for extent in extents:
+        f = factors(extent)
+        if f is None:
+            return None
+        coefficient *= f[0]
+        names += f[1]
+    return from_factors(coefficient, names)
+
+
+def divide(total: Extent, divisor: Extent) -> Extent:
+    t, d = factors(total), factors(divisor)
+    if t is None or d is None or d[0] == 0 or t[0] % d[0]:
+        return None
+    names = list(t[1])
+    for name in d[1]:
+        if name not in names:
+            return None
+        names.remove(name)
+    return from_factors(t[0] // d[0], names)
+
+
+def add(extents: Sequence[Extent]) -> Extent:
+    if None in extents:
+        return None
+    if all(isinstance(e, int) for e in extents):
+        return sum(extents)
+    return ' + '.join(str(e) for e in extents)
+
+
+def reshaped(shape: Shape, newshape: Optional[Shape]) -> Tuple[Optional[Shape], bool]:
+    """The shape ``shape`` is reshaped to, and whether its size differs."""
+    if newshape is None or newshape.count(-1) > 1:
+        return None, False
+    size = multiply(shape)
+    if -1 in newshape:
+        known = multiply([e for e in newshape if e != -1])
+        missing = divide(size, known)
+        if missing is None:
+            return None, isinstance(size, int) and isinstance(known, int) and known > 0
+        return tuple(missing if e == -1 else e for e in newshape), False
+    new_size = multiply(newshape)
+    return newshape, isinstance(size, int) and isinstance(new_size, int) and size != new_size
+
+
+def swapped(shape: Shape, axis1: Extent, axis2: Extent) -> Optional[Shape]:
+    if not isinstance(axis1, int) or not isinstance(axis2, int) or \
+            not all(-len(shape) <= a < len(shape) for a in (axis1, axis2)):
+        return None
+    result = list(shape)
+    result[axis1], result[axis2] = result[axis2], result[axis1]
+    return tuple(result)
+
+
+def format_shape(shape: Shape) -> str:
+    extents = ['?' if e is None else str(e) for e in shape]
+    if len(extents) == 1:
+        return '(%s,)' % extents[0]
+    return '(%s)' % ', '.join(extents)
+
+
+###############################################################################
+
+
+class ShapeChecker:
+    def __init__(self, rules: List[Tuple[str, FrozenSet[str]]]) -> None:
+        self.filter = CodeFilter(rules)
+        # the shapes of the module being checked
+        self.shapes = PerModule(lambda api: Shapes(api.tree, api.type_map))
+
+    def wrap_hook(self, func: Callable) -> Callable:
+        """Check the calls and operators of a ``function_hook``."""
+        def checked(fullname, calltype, ctx):
+            result = func(fullname, calltype, ctx)
+            codes = self.filter.enabled(ctx.api.tree.fullname())
+            if codes:
+                self.check(fullname, ctx, codes)
+            return result
+
+        return checked
+
+    def check(self, fullname: str, ctx, codes: FrozenSet[str]) -> None:
+        api = ctx.api
+        shapes = self.shapes.get(api)
+        shapes.type_map = api.type_map
+        expr = ctx.context
+
+        operands = shapes.operand_shapes(expr)
+        if operands is not None:
+            result, mismatch = broadcast(operands)
+            if mismatch:
+                self.report('operands could not be broadcast together with shapes %s'
+                            % ' '.join(format_shape(s) for s in operands),
+                            'shape-mismatch', codes, ctx)
+            elif is_outer(operands, result):
+                self.report('broadcasting %s creates a temporary of shape %s, larger than '
+                            'any operand' % (' against '.join(format_shape(s) for s in operands),
+                                             format_shape(result)),
+                            'broadcast-outer', codes, ctx, warn=True)
+        elif fullname in STACKS and isinstance(expr, CallExpr):
+            _, error = shapes.stacked(expr, fullname)
+            if error is not None:
+                self.report('%s(): %s' % (fullname.replace('numpy.', 'np.'), error),
+                            'shape-mismatch', codes, ctx)
+        elif fullname == 'numpy.einsum' and isinstance(expr, CallExpr) and \
+                'optimize' not in expr.arg_names:
+            self.check_einsum(expr, codes, ctx)
+        elif fullname in ('numpy.reshape', 'numpy.ndarray.reshape') and \
+                isinstance(expr, CallExpr):
+            if fullname == 'numpy.reshape':
+                array, args = argument(expr, 'a', 0), [argument(expr, 'newshape', 1)]
+            else:
+                array, args = expr.callee.expr, expr.args
+            shape = None if array is None else shapes.shape(array)
+            if shape is None or not args or None in args:
+                return
+            newshape = shapes.shape_argument(args[0]) if len(args) == 1 else \
+                shapes.shape_argument(TupleExpr(args))
+            if reshaped(shape, newshape)[1]:
+                self.report('cannot reshape an array of shape %s into shape %s'
+                            % (format_shape(shape), format_shape(newshape)),
+                            'shape-mismatch', codes, ctx)
+
+    def check_einsum(self, call: CallExpr, codes: FrozenSet[str], ctx) -> None:
+        found = self.shapes.get(ctx.api).einsum(call)
+        if found is None:
+            return
+        terms, extents = found
+        assumed = {index: extent if isinstance(extent, int) else ASSUMED_EXTENT
+                   for index, extent in extents.items()}
+        best = optimal_path(terms, assumed)
+        if best is None:
+            return
+        flops, path = best
+        naive = naive_flops(terms, assumed)
+        if naive < EINSUM_SPEEDUP * max(flops, 1):
+            return
+        message = ("np.einsum('%s') without optimize= does %dx the FLOPs of contracting "
+                   "in the order %s; pass optimize=True"
+                   % (call.args[0].value, naive // max(flops, 1), format_path(path)))
+        if assumed != extents:
+            message += ' (taking %d for the extents that aren\'t known)' % ASSUMED_EXTENT
+        self.report(message, 'einsum-unoptimized', codes, ctx, warn=True)
+
+    def report(self, message: str, code: str, codes: FrozenSet[str], ctx,
+               warn: bool=False) -> None:
+        # mypy drops repeated messages
+        if code in codes:
+            (ctx.api.msg.warn if warn else ctx.api.msg.fail)('%s  [%s]' % (message, code),
+                                                             ctx.context)
@@ -1,83 +1,130 @@
-from typing import Union
-from functools import lru_cache
+from typing import Dict, Optional, Tuple, Union
 from mypy.types import NoneTyp, UnionType, AnyType, Type, TupleType, UninhabitedType, Instance, TypeOfAny
 from mypy.sametypes import is_same_type
 from mypy.subtypes import is_subtype
+from mypy.maptype import map_instance_to_supertype
+from mypy.nodes import Expression, ListExpr, TupleExpr
 
-API = None
+from . import context
+from .cache import build_cache
+from .tables import KINDS
 
+class _CurrentAPI:
+    """The checker API of the plugin context active in this thread."""
+    __slots__ = ()
 
-INT_TO_DIMTYPE = {
-        0: 'ZeroD',
-        1: 'OneD',
-        2: 'TwoD',
-        3: 'ThreeD',
-        4: 'FourD',
-}
-DIMTYPE_TO_INT = {v: k for k, v in INT_TO_DIMTYPE.items()}
+    def __getattr__(self, name):
+        return getattr(context.current().api, name)
+
+
+API = _CurrentAPI()
+
+
+# numpy's NPY_MAXDIMS
+MAXDIMS = 32
 
+# The stub declares one _Dimension subclass per rank; the rank is its index.
+INT_TO_DIMTYPE = (
+        'ZeroD', 'OneD', 'TwoD', 'ThreeD', 'FourD', 'FiveD', 'SixD', 'SevenD',
+        'EightD', 'NineD', 'TenD', 'ElevenD', 'TwelveD', 'ThirteenD',
+        'FourteenD', 'FifteenD', 'SixteenD', 'SeventeenD', 'EighteenD',
+        'NineteenD', 'TwentyD', 'TwentyOneD', 'TwentyTwoD', 'TwentyThreeD',
+        'TwentyFourD', 'TwentyFiveD', 'TwentySixD', 'TwentySevenD',
+        'TwentyEightD', 'TwentyNineD', 'ThirtyD', 'ThirtyOneD', 'ThirtyTwoD',
+)
+assert len(INT_TO_DIMTYPE) == MAXDIMS + 1
+DIMTYPE_TO_INT = {name: i for i, name in enumerate(INT_TO_DIMTYPE)}
 
-@lru_cache()
+
+@build_cache
 def int_type():
     return API.named_type('builtins.int')
 
 
-@lru_cache()
+@build_cache
 def float_type():
     return API.named_type('builtins.float')
 
 
-@lru_cache()
+@build_cache
 def bool_type():
     return API.named_type('builtins.bool')
 
 
-@lru_cache()
+# Type character -> element type. float, int and bool stand for float64,
+# int64 and bool_; the stub declares the other widths as their subclasses.
+ELEMENT_TYPES = {
+    '?': 'builtins.bool', 'b': 'numpy.int8', 'h': 'numpy.int16', 'i': 'numpy.int32',
+    'l': 'builtins.int', 'B': 'numpy.uint8', 'H': 'numpy.uint16', 'I': 'numpy.uint32',
+    'L': 'numpy.uint64', 'e': 'numpy.float16', 'f': 'numpy.float32', 'd': 'builtins.float',
+}
+ELEMENT_CHARS = {fullname: char for char, fullname in ELEMENT_TYPES.items()}
+# order of the dtype kinds in promotion
+KIND_ORDER = {'b': 0, 'u': 1, 'i': 1, 'f': 2}
+
+
+@build_cache
+def char_to_type(char: str) -> Type:
+    # Example: 'l' (int64) -> 'builtins.int'
+    #          'f' (float32) -> 'numpy.float32'
+    return API.named_type(ELEMENT_TYPES[char])
+
+
+def element_char(typ: Type) -> Optional[str]:
+    """The type character of an element type, or None."""
+    if isinstance(typ, Instance):
+        return ELEMENT_CHARS.get(typ.type.fullname())
+    return None
+
+
+@build_cache
 def is_int(typ: Type):
-    return is_same_type(typ, int_type())
+    # numpy's integer widths, but not bool
+    char = element_char(typ)
+    return char is not None and KINDS[char] in ('i', 'u')
 
 
-@lru_cache()
+@build_cache
 def is_bool(typ: Type):
     return is_same_type(typ, bool_type())
 
 
-@lru_cache()
+@build_cache
 def is_tuple(typ: Type) -> bool:
     return isinstance(typ, TupleType)
 
 
-@lru_cache()
+@build_cache
 def is_float(typ: Type):
     return is_same_type(typ, float_type())
 
 
-@lru_cache()
+@build_cache
 def is_none(typ: Type):
     return is_same_type(typ, NoneTyp())
 
 
-@lru_cache()
+@build_cache
 def is_object(typ: Type):
     return is_same_type(typ, API.named_type('builtins.object'))
 
 
-@lru_cache()
+@build_cache
 def is_ellipsis(type: Type):
     return is_same_type(type, API.named_type('builtins.ellipsis'))
 
 
-@lru_cache()
+@build_cache
 def is_slice(type: Type):
     return is_same_type(type, API.named_type('builtins.slice'))
 
 
-@lru_cache()
+@build_cache
 def is_list_of_int(type: Type):
     return is_same_type(type, API.named_generic_type('builtins.list', args=[int_type()]))
 
 
-@lru_cache()
+@build_cache
 def is_basic_index_sequence(type: Type):
     # From: https://docs.scipy.org/doc/numpy-1.13.0/reference/arrays.indexing.html
     # >> Basic slicing occurs when obj is a slice object
@@ -92,26 +139,26 @@ def is_basic_index_sequence(type: Type):
     return is_subtype(type, API.named_generic_type('typing.Sequence', args=[u]))
 
 
-@lru_cache()
+@build_cache
 def is_any(typ: Type):
     return isinstance(typ, AnyType)
 
-@lru_cache()
+@build_cache
 def is_shapetype(type: Type):
     return is_same_type(type, API.modules['numpy'].names['ShapeType'].type)
 
 
-@lru_cache()
+@build_cache
 def is_axestype(type: Type):
     return is_same_type(type, API.modules['numpy'].names['AxesType'].type)
 
 
-@lru_cache()
+@build_cache
 def is_dtypetype(type: Type):
     return is_same_type(type, API.modules['numpy'].names['DtypeType'].type)
 
 
-@lru_cache()
+@build_cache
 def is_ndarray(typ: Type):
     if not isinstance(typ, Instance):
         return False
@@ -119,7 +166,7 @@ def is_ndarray(typ: Type):
         args=[AnyType(TypeOfAny.unannotated), AnyType(TypeOfAny.unannotated)]))
 
 
-@lru_cache()
+@build_cache
 def is_ndarray_of_ints(typ: Type, no_bools: bool=True):
     if not isinstance(typ, Instance):
         return False
@@ -131,7 +178,7 @@ def is_ndarray_of_ints(typ: Type, no_bools: bool=True):
     return of_ints and not is_ndarray_of_bools(typ)
 
 
-@lru_cache()
+@build_cache
 def is_ndarray_of_bools(typ: Type):
     if not isinstance(typ, Instance):
         return False
@@ -139,7 +186,7 @@ def is_ndarray_of_bools(typ: Type):
         args=[bool_type(), API.named_type('numpy._Dimension')])) and (not is_same_type(typ.args[1], AnyType(TypeOfAny.unannotated)))
 
 
-@lru_cache()
+@build_cache
 def is_ndarray_of_floats(typ: Type):
     if not isinstance(typ, Instance):
         return False
@@ -147,68 +194,138 @@ def is_ndarray_of_floats(typ: Type):
         args=[float_type(), API.named_type('numpy._Dimension')])) and (not is_same_type(typ.args[1], AnyType(TypeOfAny.unannotated)))
 
 
-@lru_cache()
+@build_cache
 def ndarray_dim_as_int(type: Type) -> Union[int, str]:
     return dimtype_to_int(type.args[1]) 
 
 
-@lru_cache()
+# Sequences that numpy doesn't unpack into an axis.
+NOT_NDSEQUENCES = ('builtins.str', 'builtins.bytes', 'builtins.bytearray')
+
+
+@build_cache
+def sequence_info():
+    return API.named_generic_type('typing.Sequence', args=[AnyType(TypeOfAny.special_form)]).type
+
+
+@build_cache
+def ndsequence_of(type: Type) -> Optional[Tuple[Instance, int]]:
+    """The element type and the nesting depth of a nested sequence.
+
+    Example: List[List[float]] -> (builtins.float, 2)
+             List[Tuple[int, int]] -> (builtins.int, 2)
+    The element type is bool, int or float, found in a single walk down the
+    sequence's type arguments; None for anything else, such as List[Any].
+    """
+    sequence = sequence_info()
+    depth = 0
+    while depth <= MAXDIMS:
+        if isinstance(type, TupleType):
+            type = type.fallback
+        if (not isinstance(type, Instance) or type.type.fullname() in NOT_NDSEQUENCES
+                or not type.type.has_base('typing.Sequence')):
+            break
+        type = map_instance_to_supertype(type, sequence).args[0]
+        depth += 1
+    if depth == 0 or depth > MAXDIMS:
+        return None
+    element = element_type(type)
+    return None if element is None else (element, depth)
+
+
+@build_cache
+def element_type(type: Type) -> Optional[Instance]:
+    """bool, int or float, whichever is the narrowest to hold a ``type``."""
+    if isinstance(type, AnyType):
+        return None
+    for element in (bool_type(), int_type(), float_type()):
+        if is_subtype(type, element):
+            return element
+    return None
+
+
+def ndliteral_of(expr: Expression, type_map: Dict[Expression, Type]) -> Optional[Tuple[Instance, int]]:
+    """``ndsequence_of`` for a list or tuple display like [[1, 2.0], [3, 4]].
+
+    mypy types nested displays passed to an Iterable as List[Any], so the
+    display is walked instead, once, looking up the types mypy inferred for
+    its items. Ragged displays give None.
+    """
+    if not isinstance(expr, (ListExpr, TupleExpr)):
+        return None
+    if not expr.items:
+        # np.array([]) is float64
+        return float_type(), 1
+    widest = None  # type: Optional[Instance]
+    depth = None  # type: Optional[int]
+    for item in expr.items:
+        if isinstance(item, (ListExpr, TupleExpr)):
+            found = ndliteral_of(item, type_map)
+        elif item in type_map:
+            item_type = type_map[item]
+            found = ndsequence_of(item_type)
+            if found is None:
+                element = element_type(item_type)
+                found = None if element is None else (element, 0)
+        else:
+            found = None
+        if found is None or (depth is not None and found[1] != depth):
+            return None
+        depth = found[1]
+        if widest is None or is_subtype(widest, found[0]):
+            widest = found[0]
+    if depth + 1 > MAXDIMS:
+        return None
+    return widest, depth + 1
+
+
 def is_ndsequence_of(type: Type, base_type: Type):
-    si = API.named_generic_type('typing.Sequence', args=[base_type])
-    ssi = API.named_generic_type('typing.Sequence', args=[si])
-    sssi = API.named_generic_type('typing.Sequence', args=[ssi])
-    u = UnionType.make_union([si, ssi, sssi])
-    return is_subtype(type, u)
+    found = ndsequence_of(type)
+    return found is not None and is_subtype(found[0], base_type)
 
 
-@lru_cache()
 def is_ndsequence_of_bools(type: Type):
-    return is_ndsequence_of(type, bool_type()) and not isinstance(type.args[0], AnyType)
+    return is_ndsequence_of(type, bool_type())
 
 
-@lru_cache()
 def is_ndsequence_of_floats(type: Type):
-    return is_ndsequence_of(type, float_type()) and not isinstance(type.args[0], AnyType)
+    return is_ndsequence_of(type, float_type())
 
 
-@lru_cache()
 def is_ndsequence_of_ints(type: Type, no_bools: bool=True):
-    of_ints = is_ndsequence_of(type, int_type()) and not isinstance(type.args[0], AnyType)
+    of_ints = is_ndsequence_of(type, int_type())
     if not no_bools:
         return of_ints
     return of_ints and not is_ndsequence_of_bools(type)
 
 
-@lru_cache()
 def ndsequence_dim_as_int(type: Type) -> int:
-    i = AnyType(TypeOfAny.unannotated)
-    si = API.named_generic_type('typing.Sequence', args=[i])
-    ssi = API.named_generic_type('typing.Sequence', args=[si])
-    sssi = API.named_generic_type('typing.Sequence', args=[ssi])
-
-    if is_subtype(type, sssi):
-        return 3
-    elif is_subtype(type, ssi):
-        return 2
-    elif is_subtype(type, si):
-        return 1
-    raise KeyError()
+    found = ndsequence_of(type)
+    if found is None:
+        raise KeyError()
+    return found[1]
 
 
-@lru_cache()
+@build_cache
 def ndsequence_dim_as_type(type: Type):
     return dim_as_type(ndsequence_dim_as_int(type))
 
 
-@lru_cache()
+@build_cache
 def zerodim_to_scalar(typ: Type) -> Type:
     if is_subtype(typ,  API.named_generic_type('numpy.ndarray',
-        args=[AnyType(TypeOfAny.unannotated), API.named_type('numpy.ZeroD')])) and (not is_same_type(typ.args[1], AnyType(TypeOfAny.unannotated))):
+        args=[AnyType(TypeOfAny.unannotated), dim_types()[0]])) and (not is_same_type(typ.args[1], AnyType(TypeOfAny.unannotated))):
         return typ.args[0]
     return typ
 
 
-@lru_cache()
+@build_cache
+def dim_types() -> Tuple[Instance, ...]:
+    # Example: dim_types()[2] -> 'numpy.TwoD'
+    names = API.modules['numpy'].names
+    return tuple(Instance(names[name].node, []) for name in INT_TO_DIMTYPE)
+
+
 def dimtype_to_int(typ) -> Union[int, str]:
     if isinstance(typ, Instance):
         return DIMTYPE_TO_INT[typ.type.name()]
@@ -216,15 +333,13 @@ def dimtype_to_int(typ) -> Union[int, str]:
         return 0
     else:
         return 'Any'
-    raise ValueError()
 
 
-@lru_cache()
-def dim_as_type(i: Union[str, int, Type]):
+def dim_as_type(i: Union[str, int]):
     if isinstance(i, str):
         assert i == 'Any'
         return AnyType(TypeOfAny.unannotated)
-    if i in INT_TO_DIMTYPE:
-        return  API.named_type('numpy.%s' % INT_TO_DIMTYPE[i])
+    if 0 <= i <= MAXDIMS:
+        return dim_types()[i]
 
     raise ValueError(i, type(i))
@@ -1,17 +1,35 @@
-from typing import Union, Dict
-from mypy.types import Type, TupleType
+from typing import List, Tuple, Union
+from mypy.nodes import IndexExpr
+from mypy.types import Type, TupleType, Instance
 from mypy.plugin import FunctionContext
-from itertools import chain
-from ..bind_arguments import BoundArgument
+from .. import context
+from ..bind_arguments import BoundArguments
 from ..shortcuts import (is_int, is_ndarray_of_ints, ndarray_dim_as_int,
                          is_slice, is_ellipsis, is_ndarray_of_bools,
                          is_list_of_int, is_ndsequence_of_ints,
                          is_ndsequence_of_bools, ndsequence_dim_as_int,
-                         is_basic_index_sequence, is_none, dim_as_type,
-                         dimtype_to_int, is_any)
+                         is_none, dim_as_type, dimtype_to_int, is_any)
 
+CHAINED_CODE = 'chained-advanced-index'
 
-def ndarray_getitem(bound_args: Dict[str, BoundArgument],
+
+class IndexInfo:
+    """What indexing an array with an index gives.
+
+    ``ndim`` is the result's number of dimensions, or ``'Any'``; ``copy``
+    is whether it is a new array (advanced indexing) rather than a view;
+    ``n_arrays`` is the number of index arrays broadcast together, a
+    boolean array counting once per dimension.
+    """
+    __slots__ = ('ndim', 'copy', 'n_arrays')
+
+    def __init__(self, ndim: Union[int, str], copy: bool=False, n_arrays: int=0) -> None:
+        self.ndim = ndim
+        self.copy = copy
+        self.n_arrays = n_arrays
+
+
+def ndarray_getitem(bound_args: BoundArguments,
                     ctx: FunctionContext):
 
     self_type = ctx.type
@@ -21,11 +39,11 @@ def ndarray_getitem(bound_args: Dict[str, BoundArgument],
     if not isinstance(self_ndim_int, int):
         return dim_as_type('Any')
 
-    try:
-        result_ndim = basic_indexing_ndim(self_ndim_int, index_type)
-    except BasicIndexingError:
-        result_ndim = advanced_indexing_ndim(self_ndim_int, index_type)
+    info = classify_index(self_ndim_int, index_type)
+    if info.copy and isinstance(ctx.context, IndexExpr):
+        check_chained_index(ctx)
 
+    result_ndim = info.ndim
     if result_ndim == 0:
         return ctx.default_return_type.args[0]
 
@@ -39,72 +57,105 @@ def ndarray_getitem(bound_args: Dict[str, BoundArgument],
         args=[ctx.default_return_type.args[0], result_type])
 
 
-def basic_indexing_ndim(input_ndim: int, type: Type) -> Union[int, str]:
+def classify_index(input_ndim: int, type: Type) -> IndexInfo:
+    """Classify an index of an array of ``input_ndim`` dimensions, looking at
+    every item of a tuple index once."""
+    if not isinstance(type, TupleType):
+        kind, dim = index_item_kind(type)
+        if kind in BASIC_NDIM:
+            return IndexInfo(input_ndim + BASIC_NDIM[kind])
+        if not isinstance(dim, int):
+            return IndexInfo('Any')
+        if kind == 'int_array':
+            return IndexInfo(input_ndim + dim - 1, True, 1)
+        if kind == 'bool_array':
+            # like indexing with .nonzero()
+            return IndexInfo(1 + input_ndim - dim, True, dim)
+        if kind == 'int_seq' and is_list_of_int(type):
+            return IndexInfo(input_ndim, True, 1)
+        return IndexInfo('Any')
+
+    counts = dict.fromkeys(KINDS, 0)
+    # the broadcast dimensions of the integer index arrays, and the largest
+    # boolean array and sequence
+    int_dims = []  # type: List[int]
+    bool_dims = {'bool_array': 0, 'bool_seq': 0}
+    for item in type.items:
+        kind, dim = index_item_kind(item)
+        counts[kind] += 1
+        if kind in bool_dims or kind in ('int_array', 'int_seq'):
+            if not isinstance(dim, int):
+                return IndexInfo('Any', True)
+            if kind in bool_dims:
+                bool_dims[kind] = max(bool_dims[kind], dim)
+            else:
+                int_dims.append(dim)
+
+    n_ints, n_slices = counts['int'], counts['slice']
+    if counts['any'] or counts['other']:
+        return IndexInfo('Any', bool(int_dims) or any(bool_dims.values()))
+    if not int_dims and not counts['bool_array'] and not counts['bool_seq']:
+        return IndexInfo(input_ndim - n_ints + counts['none'])
+    n_arrays = len(int_dims) + bool_dims['bool_array'] + bool_dims['bool_seq']
+    if counts['none']:
+        return IndexInfo('Any', True, n_arrays)
+
+    # the axes not indexed by an integer or an array are sliced, explicitly
+    # or not
+    n_sliced = input_ndim - n_ints - n_arrays
+    if n_sliced < n_slices:
+        # too many indices
+        return IndexInfo(-1, True, n_arrays)
+    return IndexInfo(max(int_dims, default=1) + n_sliced, True, n_arrays)
+
+
+# result ndim minus input ndim, for a basic index item
+BASIC_NDIM = {'int': -1, 'slice': 0, 'ellipsis': 0, 'none': 1}
+KINDS = ('int', 'slice', 'ellipsis', 'none', 'int_array', 'bool_array', 'int_seq',
+         'bool_seq', 'any', 'other')
+
+
+def index_item_kind(type: Type) -> Tuple[str, Union[int, str]]:
+    """The kind of an index, or of an item of a tuple index, and the number
+    of dimensions of an index array or sequence."""
+    if is_any(type):
+        return 'any', 0
     if is_int(type):
-        return input_ndim - 1
+        return 'int', 0
     if is_slice(type):
-        return input_ndim
+        return 'slice', 0
     if is_ellipsis(type):
-        return input_ndim
+        return 'ellipsis', 0
     if is_none(type):
-        return input_ndim + 1
-    if isinstance(type, TupleType) and is_basic_index_sequence(type):
-        s = input_ndim
-        for i in type.items:
-            this_dim = basic_indexing_ndim(0, i)
-            if isinstance(this_dim, int):
-                s += this_dim
-            else:
-                s = this_dim
-        return s
-
-    raise BasicIndexingError()
-
-
-def advanced_indexing_ndim(input_ndim, type):
-    if is_ndarray_of_ints(type, no_bools=True):
-        return input_ndim + ndarray_dim_as_int(type) - 1
-
-    if is_ndarray_of_bools(type):
-        n_int_arrays = ndarray_dim_as_int(type)  # like .nonzero()
-        if isinstance(n_int_arrays, int):
-            n_slices = input_ndim - n_int_arrays
-            return 1 + n_slices
-        return 'Any'
-
-    if is_list_of_int(type):
-        return input_ndim
-
-    if isinstance(type, TupleType) and any(is_any(i) for i in type.items):
-        return 'Any'
-
-    if isinstance(type, TupleType) and all(
-            is_int(i) or is_slice(i) or is_ellipsis(i) or is_ndarray_of_ints(i)
-            or is_ndsequence_of_ints(i) or is_ndarray_of_bools(i)
-            or is_ndsequence_of_bools(i) for i in type.items):
-
-        n_int_arrays = sum(is_ndarray_of_ints(i, no_bools=True) or is_ndsequence_of_ints(i, no_bools=True) for i in type.items)
-        n_slices = sum(is_slice(i) for i in type.items)
-        n_ints = sum(is_int(i) for i in type.items)
-
-        n_effective_int_arrays = (n_int_arrays +
-            max((ndarray_dim_as_int(i) for i in type.items if is_ndarray_of_bools(i)), default=0) +
-            max((ndsequence_dim_as_int(i) for i in type.items if is_ndsequence_of_bools(i)), default=0))
-        int_array_broadcast_dim = max(chain(
-                (ndarray_dim_as_int(i) for i in type.items if is_ndarray_of_ints(i)),
-                (ndsequence_dim_as_int(i) for i in type.items if is_ndsequence_of_ints(i))),
-                default=1)
-
-        # print(type)
-
-        if n_effective_int_arrays + n_slices < (input_ndim - n_ints):
-            n_slices += (input_ndim - n_effective_int_arrays + n_slices - n_ints)
-        assert n_slices + n_effective_int_arrays == input_ndim - n_ints
-
-        return int_array_broadcast_dim + n_slices
-
-    return 'Any'
-
-
-class BasicIndexingError(Exception):
-    pass
+        return 'none', 0
+    if isinstance(type, Instance):
+        # an array of Any elements is taken for a mask
+        if is_ndarray_of_bools(type):
+            return 'bool_array', ndarray_dim_as_int(type)
+        if is_ndarray_of_ints(type, no_bools=False):
+            return 'int_array', ndarray_dim_as_int(type)
+    if is_ndsequence_of_bools(type):
+        return 'bool_seq', ndsequence_dim_as_int(type)
+    if is_ndsequence_of_ints(type, no_bools=False):
+        return 'int_seq', ndsequence_dim_as_int(type)
+    return 'other', 0
+
+
+def check_chained_index(ctx: FunctionContext) -> None:
+    """Report ``a[mask][idx]``: advanced indexing of the copy advanced
+    indexing made."""
+    checks = context.current().checks
+    base = ctx.context.base
+    if checks is None or not isinstance(base, IndexExpr) or \
+            CHAINED_CODE not in checks.enabled(ctx.api.tree.fullname()):
+        return
+    array, index = ctx.api.type_map.get(base.base), ctx.api.type_map.get(base.index)
+    if not isinstance(array, Instance) or array.type.fullname() != 'numpy.ndarray' or \
+            index is None:
+        return
+    ndim = dimtype_to_int(array.args[1])
+    if isinstance(ndim, int) and classify_index(ndim, index).copy:
+        # mypy drops repeated messages
+        ctx.api.msg.fail('advanced indexing of the copy made by advanced indexing copies '
+                         'twice; combine the indices, e.g. a[np.flatnonzero(mask)[idx]]  [%s]'
+                         % CHAINED_CODE, ctx.context)
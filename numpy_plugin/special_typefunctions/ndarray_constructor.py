@@ -1,35 +1,35 @@
-from typing import Dict
-from mypy.types import AnyType
+from mypy.nodes import NameExpr
+from mypy.types import AnyType, TypeOfAny
 from mypy.plugin import FunctionContext
 import logging
-from ..bind_arguments import BoundArgument
-from ..shortcuts import (is_ndarray, is_ndsequence_of_ints, is_ndsequence_of_bools, is_ndsequence_of_floats,
-                         ndsequence_dim_as_type)
+from ..bind_arguments import BoundArguments
+from ..shortcuts import is_ndarray, ndsequence_of, ndliteral_of, dim_as_type
+from ..typefunctions.dtype import infer_dtype
 
 log = logging.getLogger(__name__)
 
 
-def ndarray_constructor(bound_args: Dict[str, BoundArgument],
+def ndarray_constructor(bound_args: BoundArguments,
                         ctx: FunctionContext):
 
     assert 'object' in bound_args
     arg_typ = bound_args['object'].arg_typ
+    arg = bound_args['object'].arg
+    dtype = bound_args['dtype']
+    if dtype is not None and isinstance(dtype.arg, NameExpr) and dtype.arg.name == 'None':
+        dtype = None
 
     if is_ndarray(arg_typ):
-        # print('4', ctx.context.line)
-        return arg_typ
-    if is_ndsequence_of_ints(arg_typ):
-        # print('1', ctx.context.line)
-        return ctx.default_return_type.copy_modified(args=
-            [ctx.api.named_type('builtins.int'), ndsequence_dim_as_type(arg_typ)])
-    if is_ndsequence_of_bools(arg_typ):
-        # print('2', ctx.context.line, arg_typ)
-        return ctx.default_return_type.copy_modified(args=
-            [ctx.api.named_type('builtins.bool'), ndsequence_dim_as_type(arg_typ)])
-    if is_ndsequence_of_floats(arg_typ):
-        # print('3')
-        return ctx.default_return_type.copy_modified(args=
-            [ctx.api.named_type('builtins.float'), ndsequence_dim_as_type(arg_typ)])
+        if dtype is None:
+            return arg_typ
+        return arg_typ.copy_modified(args=[infer_dtype(dtype), arg_typ.args[1]])
+    found = ndliteral_of(arg, ctx.api.type_map) or ndsequence_of(arg_typ)
+    if found is not None:
+        element, ndim = found
+        if dtype is not None:
+            element = infer_dtype(dtype)
+        return ctx.default_return_type.copy_modified(args=[element, dim_as_type(ndim)])
 
     ctx.api.fail('Could not determine type', ctx.context)
-    return ctx.default_return_type.copy_modified(args=[AnyType(), AnyType()])
+    return ctx.default_return_type.copy_modified(
+        args=[AnyType(TypeOfAny.from_error), AnyType(TypeOfAny.from_error)])
@@ -0,0 +1,249 @@
+"""A prebuilt mypy cache for the numpy stubs, shared between projects.
+
+Analyzing the stubs, and the parts of typeshed they import, is most of the
+work of a cold run. Once a build has cached them, the cache files of every
+``numpy`` module and of everything they depend on are copied into a store
+shared by all of the user's projects. A later build whose cache lacks numpy
+gets them copied in before mypy looks, and mypy validates each entry against
+the files on disk as usual. Fragments in the store are keyed by mypy version,
+Python version, the options that affect the cache and the plugin fingerprint.
+
+There is no store unless the ``stub_cache`` option names one, e.g.
+``~/.cache/numpy-plugin``; mypy only reads the seeded cache in incremental
+mode. To prebuild the fragment for a config, e.g. while building a docker
+image::
+
+    $ python -m numpy_plugin.stubcache --config-file mypy.ini [--store DIR]
+"""
+import argparse
+import atexit
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from mypy.options import Options
+from mypy.version import __version__ as mypy_version
+
+from .fingerprint import plugin_fingerprint, versioned_cache_dir
+
+META_SUFFIX = '.meta.json'
+DATA_SUFFIX = '.data.json'
+DISABLED = ('', 'off', 'false', 'no', '0')
+
+# (fragment, cache_dir) -> StubCache to harvest at exit
+_pending = {}  # type: Dict[Tuple[str, str], StubCache]
+
+
+def store_from_config(value: Optional[str]) -> Optional[str]:
+    if value is None or value.strip().lower() in DISABLED:
+        return None
+    return os.path.expanduser(value)
+
+
+def fragment_key(options: Options, fingerprint: str) -> str:
+    key = {
+        'mypy': mypy_version,
+        'python_version': list(options.python_version),
+        'options': options.clone_for_module('numpy').select_options_affecting_cache(),
+        'plugin': fingerprint,
+    }
+    return hashlib.sha1(json.dumps(key, sort_keys=True).encode()).hexdigest()[:16]
+
+
+class StubCache:
+    """The fragment of ``store`` that fits a build with ``options``."""
+
+    def __init__(self, store: str, options: Options, fingerprint: str) -> None:
+        self.options = options
+        self.fragment = os.path.join(store, fragment_key(options, fingerprint))
+        self.version_dir = '%d.%d' % options.python_version
+
+    @property
+    def cache_root(self) -> str:
+        # read late: the plugin moves cache_dir into its versioned directory
+        return os.path.join(self.options.cache_dir, self.version_dir)
+
+    def has_fragment(self) -> bool:
+        return os.path.isdir(self.fragment)
+
+    def seed(self) -> int:
+        """Copy the fragment into the build's cache unless numpy is there.
+
+        Returns the number of modules copied.
+        """
+        if (self.options.cache_dir == os.devnull or not self.has_fragment()
+                or meta_path(self.cache_root, 'numpy') is not None):
+            return 0
+        copied = 0
+        for rel in fragment_files(self.fragment):
+            target = os.path.join(self.options.cache_dir, rel)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            # copy2 keeps the mtimes, which mypy checks against data_mtime
+            shutil.copy2(os.path.join(self.fragment, data_for(rel)), data_for(target))
+            shutil.copy2(os.path.join(self.fragment, rel), target)
+            copied += 1
+        return copied
+
+    def harvest(self) -> bool:
+        """Store numpy's cache files and their dependencies' as the fragment."""
+        if self.options.cache_dir == os.devnull or self.has_fragment():
+            return False
+        metas = self.closure()
+        if not metas:
+            return False
+        store = os.path.dirname(self.fragment)
+        try:
+            os.makedirs(store, exist_ok=True)
+            tmp = tempfile.mkdtemp(prefix='.tmp-', dir=store)
+        except OSError:
+            return False
+        try:
+            for path in metas:
+                rel = os.path.relpath(path, self.options.cache_dir)
+                os.makedirs(os.path.join(tmp, os.path.dirname(rel)), exist_ok=True)
+                shutil.copy2(data_for(path), data_for(os.path.join(tmp, rel)))
+                shutil.copy2(path, os.path.join(tmp, rel))
+            # another process may have stored the same fragment meanwhile
+            os.rename(tmp, self.fragment)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+            return False
+        return True
+
+    def closure(self) -> List[str]:
+        """Meta files of every cached numpy module and its dependencies.
+
+        Empty unless all of them are cached, by this mypy, with the options
+        of the fragment.
+        """
+        root = self.cache_root
+        snapshot = self.options.clone_for_module('numpy').select_options_affecting_cache()
+        pending = cached_modules(root, 'numpy')
+        seen = set()  # type: Set[str]
+        metas = []  # type: List[str]
+        while pending:
+            module = pending.pop()
+            if module in seen:
+                continue
+            seen.add(module)
+            path = meta_path(root, module)
+            if path is None or not os.path.exists(data_for(path)):
+                return []
+            meta = read_meta(path)
+            if (meta is None or meta.get('version_id') != mypy_version
+                    or meta.get('options') != snapshot):
+                return []
+            metas.append(path)
+            pending.extend(meta.get('dependencies', []))
+        return sorted(metas)
+
+
+def meta_path(root: str, module: str) -> Optional[str]:
+    prefix = os.path.join(root, *module.split('.'))
+    for path in (os.path.join(prefix, '__init__' + META_SUFFIX), prefix + META_SUFFIX):
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def data_for(meta: str) -> str:
+    return meta[:-len(META_SUFFIX)] + DATA_SUFFIX
+
+
+def read_meta(path: str) -> Optional[Dict]:
+    try:
+        with open(path) as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return meta if isinstance(meta, dict) else None
+
+
+def cached_modules(root: str, package: str) -> List[str]:
+    """``package`` and its submodules that have cache files under ``root``."""
+    modules = []
+    top = os.path.join(root, package)
+    for dirpath, dirnames, filenames in os.walk(top):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if not name.endswith(META_SUFFIX):
+                continue
+            parts = os.path.relpath(os.path.join(dirpath, name[:-len(META_SUFFIX)]),
+                                    root).split(os.sep)
+            if parts[-1] == '__init__':
+                parts.pop()
+            modules.append('.'.join(parts))
+    return modules
+
+
+def fragment_files(fragment: str) -> List[str]:
+    """Meta files of a fragment, relative to it."""
+    files = []
+    for dirpath, dirnames, filenames in os.walk(fragment):
+        for name in filenames:
+            if name.endswith(META_SUFFIX):
+                files.append(os.path.relpath(os.path.join(dirpath, name), fragment))
+    return sorted(files)
+
+
+def prepare(store: str, options: Options, fingerprint: str) -> StubCache:
+    """Seed the build's cache, or store its numpy modules at exit."""
+    stub_cache = StubCache(store, options, fingerprint)
+    if stub_cache.has_fragment():
+        stub_cache.seed()
+    elif options.cache_dir != os.devnull:
+        if not _pending:
+            atexit.register(harvest_all)
+        _pending[stub_cache.fragment, options.cache_dir] = stub_cache
+    return stub_cache
+
+
+def harvest_all() -> None:
+    while _pending:
+        _, stub_cache = _pending.popitem()
+        stub_cache.harvest()
+
+
+def main(argv: Optional[Sequence[str]]=None) -> int:
+    from mypy import build
+    from mypy.main import process_options
+    from .config import PluginConfig
+
+    parser = argparse.ArgumentParser(description='Prebuild the mypy cache of the numpy stubs.')
+    parser.add_argument('--config-file', default='mypy.ini')
+    parser.add_argument('--store', help='default: the stub_cache option')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as td:
+        path = os.path.join(td, 'prebuild_numpy.py')
+        with open(path, 'w') as f:
+            f.write('import numpy\nimport numpy.random\nimport numpy.testing\n'
+                    'import numpy.lib.stride_tricks\n')
+        sources, options = process_options(['--config-file', args.config_file,
+                                            '--cache-dir', os.path.join(td, 'cache'), path])
+        store = args.store or store_from_config(PluginConfig.from_options(options).get('stub_cache'))
+        if store is None:
+            print('stub_cache is off; pass --store', file=sys.stderr)
+            return 1
+        # without the plugin, so the cache can't depend on its results
+        options.plugins = []
+        fingerprint = plugin_fingerprint()
+        options.cache_dir = versioned_cache_dir(options.cache_dir, fingerprint)
+        build.build(sources, options)
+        stub_cache = StubCache(store, options, fingerprint)
+        if stub_cache.has_fragment():
+            print('%s is up to date' % stub_cache.fragment)
+        elif stub_cache.harvest():
+            print('wrote %s' % stub_cache.fragment)
+        else:
+            print('numpy was not cached', file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
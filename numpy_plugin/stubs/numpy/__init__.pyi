@@ -3,10 +3,30 @@
 from typing import (Any, Callable, Dict, Generic, Iterator, List, Optional, Sequence, Tuple, Type, Text,
                     TypeVar, Union, Sized, Iterable, SupportsInt, SupportsFloat, overload, SupportsAbs)
 
+# numpy.lib.stride_tricks is only analyzed when imported; linalg, random and
+# testing are imported here, as numpy itself does.
+from . import linalg
+from . import random
+from . import testing
+
 class dtype: ...
 _dtype = dtype
 
-int32 = Generic[int]
+# Element types. float, int and bool are float64, int64 and bool_; the
+# narrower widths subclass them, so that an ndarray[float32, ...] is accepted
+# where an ndarray[float, ...] is expected, but not the other way round.
+class float16(float): ...
+class float32(float): ...
+class int8(int): ...
+class int16(int): ...
+class int32(int): ...
+class uint8(int): ...
+class uint16(int): ...
+class uint32(int): ...
+class uint64(int): ...
+float64 = float
+int64 = int
+bool_ = bool
 
 
 class flagsobj:
@@ -34,11 +54,40 @@ _X = TypeVar('_X')
 _Y = TypeVar('_Y')
 
 class _Dimension: ...
+# One class per rank, up to NPY_MAXDIMS.
 class ZeroD(_Dimension): ...
 class OneD(_Dimension): ...
 class TwoD(_Dimension): ...
 class ThreeD(_Dimension): ...
 class FourD(_Dimension): ...
+class FiveD(_Dimension): ...
+class SixD(_Dimension): ...
+class SevenD(_Dimension): ...
+class EightD(_Dimension): ...
+class NineD(_Dimension): ...
+class TenD(_Dimension): ...
+class ElevenD(_Dimension): ...
+class TwelveD(_Dimension): ...
+class ThirteenD(_Dimension): ...
+class FourteenD(_Dimension): ...
+class FifteenD(_Dimension): ...
+class SixteenD(_Dimension): ...
+class SeventeenD(_Dimension): ...
+class EighteenD(_Dimension): ...
+class NineteenD(_Dimension): ...
+class TwentyD(_Dimension): ...
+class TwentyOneD(_Dimension): ...
+class TwentyTwoD(_Dimension): ...
+class TwentyThreeD(_Dimension): ...
+class TwentyFourD(_Dimension): ...
+class TwentyFiveD(_Dimension): ...
+class TwentySixD(_Dimension): ...
+class TwentySevenD(_Dimension): ...
+class TwentyEightD(_Dimension): ...
+class TwentyNineD(_Dimension): ...
+class ThirtyD(_Dimension): ...
+class ThirtyOneD(_Dimension): ...
+class ThirtyTwoD(_Dimension): ...
 class _InferNdimsReduction(Generic[_X]): ...
 class _InferNdimsFromShape: ...
 class _InferNdimsDiagonal(Generic[_X]): ...
@@ -50,7 +99,11 @@ class _RaiseDim(Generic[_X]): ...
 class _LowerDim(Generic[_X]): ...
 class _LowerDim2(Generic[_X]): ...
 class _UfuncCast(Generic[_X, _Y]): ...
+class _AccumulateDtype(Generic[_X]): ...
+class _MeanDtype(Generic[_X]): ...
 class _LargestDim(Generic[_X, _Y]): ...
+class _EinsumDtype: ...
+class _EinsumNdim: ...
 
 
 _S = TypeVar('_S', covariant=True)
@@ -102,6 +155,9 @@ class ndarray(Generic[_S, _D], SupportsAbs['ndarray[_S, _D]'], Sized, Iterable):
     shape = None     # type: Tuple[int, ...]
     strides = None   # type: Tuple[int, ...]
     base = None      # type: Optional[ndarray[_S, _D]]
+    # an attribute rather than a method, so that the plugin's attribute hook
+    # sees every iteration over an array
+    __iter__ = None  # type: Callable[[ndarray], Iterator[Any]]
 
     # "only integers, slices (`:`), ellipsis (`...`), numpy.newaxis (`None`)
     # and integer or boolean arrays are valid indices"
@@ -136,9 +192,15 @@ class ndarray(Generic[_S, _D], SupportsAbs['ndarray[_S, _D]'], Sized, Iterable):
     # Incomplete
     def all(self, axis: AxesType=None, keepdims: bool=False) -> 'ndarray[bool, _InferNdimsReduction]': ...
     def swapaxes(self, axis1: int, axis2: int) -> 'ndarray[_S, _D]': ...
-    def astype(self, dtype: DtypeType) -> 'ndarray[_InferDtype, _D]': ...
+    def astype(self, dtype: DtypeType, order: str='K', casting: str='unsafe', subok: bool=True, copy: bool=True) -> 'ndarray[_InferDtype, _D]': ...
     def fill(self, a: scalar) -> None: ...
     def reshape(self, shape: ShapeType, order: str='C') -> 'ndarray[_S, _InferNdimsFromShape]': ...
+    def ravel(self, order: str='C') -> 'ndarray[_S, OneD]': ...
+    def flatten(self, order: str='C') -> 'ndarray[_S, OneD]': ...
+    @overload
+    def transpose(self, axes: Sequence[int]) -> 'ndarray[_S, _D]': ...
+    @overload
+    def transpose(self, *axes: int) -> 'ndarray[_S, _D]': ...
 
 
 
@@ -149,19 +211,15 @@ array4d = ndarray[_S, FourD]
 array_float = ndarray[float, _D]
 array_like = TypeVar('array_like', ndarray, float, int)
 
-float32 = float
-float64 = float
-int32 = int
-int64 = int
-
 ###############################################################################
 # numpy.core.multiarray:
 #   count_nonzero,  datetime_as_string,  datetime_data,  digitize,  dot,  einsum,  empty,  empty_like,  fastCopyAndTranspose,  frombuffer,  fromfile,  fromiter,  fromstring,  inner,  int_asbuffer,  is_busday,  lexsort,  matmul,  may_share_memory,  min_scalar_type,  nested_iters,  packbits,  promote_types,  putmask,  ravel_multi_index,  result_type,  set_numeric_ops,  shares_memory,  unpackbits,  unravel_index,  vdot,  where,  zeros
 
 def arange(start: int, stop: int=0, step: int=0, dtype: DtypeType=float) -> array1d[_InferDtypeWithDefault[float]]: ...
 def array(object: Iterable, dtype: DtypeType=None, copy: bool=True, order: str='K', subok: bool=False, ndim: int=0) -> ndarray[_InferDtypeWithDefault[Any], Any]: ...
-def asarray(object: Iterable, dtype: DtypeType=None) -> ndarray[_InferDtypeWithDefault[Any], Any]: ...
+def asarray(object: Iterable, dtype: DtypeType=None, order: str=None) -> ndarray[_InferDtypeWithDefault[Any], Any]: ...
 def ascontiguousarray(object: Iterable, dtype: DtypeType=None) -> ndarray[_InferDtypeWithDefault[Any], Any]: ...
+def asfortranarray(object: Iterable, dtype: DtypeType=None) -> ndarray[_InferDtypeWithDefault[Any], Any]: ...
 def bincount(x: array1d[int], weights: array1d[_S]=None, minlength: int=None) -> array1d[int]: ...
 def can_cast(fromtype: Any, totype: Any, casting: str = 'safe') -> bool: ...
 def concatenate(tup: Iterable[ndarray[_S, _D]], axis: int=None) -> ndarray[_S, _D]: ...
@@ -177,7 +235,7 @@ def zeros_like(a: ndarray[_S, _D], dtype: DtypeType=None, order: str='K') -> nda
 def empty_like(a: ndarray[_S, _D], dtype: DtypeType=None, order: str='K') -> ndarray[_InferDtypeWithDefault[_S], _D]: ...
 # FIXME: dtype of fill value takes priority over dtype arg.
 def full_like(a: ndarray[_S, _D], fill_value: scalar, dtype: DtypeType=float, order: str='K') -> ndarray[_InferDtypeWithDefault[_S], _D]: ...
-def average(a: ndarray[_S, _D], axis: AxisType=None, weights: ndarray[_S1, _D1]=None, returned: bool=False) -> ndarray[float, _InferNdimsIfAxisSpecified[ZeroD, _LowerDim[_D]]]: ...
+def average(a: ndarray[_S, _D], axis: AxisType=None, weights: ndarray[_S1, _D1]=None, returned: bool=False) -> ndarray[_MeanDtype[_S], _InferNdimsIfAxisSpecified[ZeroD, _LowerDim[_D]]]: ...
 
 ###############################################################################
 
@@ -216,7 +274,7 @@ def floor_divide(x1: Union[scalar, ndarray[_S, _D]], x2: Union[scalar, ndarray[_
 def fmax(x1: Union[scalar, ndarray[_S, _D]], x2: Union[scalar, ndarray[_S1, _D1]], out: ndarray=None) -> ndarray[_UfuncCast[_S, _S1], _LargestDim[_D, _D1]]: ...
 def fmin(x1: Union[scalar, ndarray[_S, _D]], x2: Union[scalar, ndarray[_S1, _D1]], out: ndarray=None) -> ndarray[_UfuncCast[_S, _S1], _LargestDim[_D, _D1]]: ...
 def fmod(x1: Union[scalar, ndarray[_S, _D]], x2: Union[scalar, ndarray[_S1, _D1]], out: ndarray=None) -> ndarray[_UfuncCast[_S, _S1], _LargestDim[_D, _D1]]: ...
-def frexp(x: Union[scalar, ndarray[_S, _D]], out1: ndarray=None, out2: ndarray=None) -> Tuple[ndarray[float, _LargestDim[_D, ZeroD]], ndarray[int, _LargestDim[_D, ZeroD]]]: ...
+def frexp(x: Union[scalar, ndarray[_S, _D]], out1: ndarray=None, out2: ndarray=None) -> Tuple[ndarray[float, _LargestDim[_D, ZeroD]], ndarray[int32, _LargestDim[_D, ZeroD]]]: ...
 def greater(x1: Union[scalar, ndarray[_S, _D]], x2: Union[scalar, ndarray[_S1, _D1]], out: ndarray=None) -> ndarray[_UfuncCast[_S, _S1], _LargestDim[_D, _D1]]: ...
 def greater_equal(x1: Union[scalar, ndarray[_S, _D]], x2: Union[scalar, ndarray[_S1, _D1]], out: ndarray=None) -> ndarray[_UfuncCast[_S, _S1], _LargestDim[_D, _D1]]: ...
 def hypot(x1: Union[scalar, ndarray[_S, _D]], x2: Union[scalar, ndarray[_S1, _D1]], out: ndarray=None) -> ndarray[_UfuncCast[_S, _S1], _LargestDim[_D, _D1]]: ...
@@ -296,18 +354,18 @@ def around(a: ndarray[_S, _D], decimals: int=0, out: ndarray=None) -> ndarray[_S
 def choose(a: ndarray[int, Any], choices: Sequence[ndarray[Any, _D]], mode: str='raise') -> ndarray[Any, _D]: ...
 def clip(a: ndarray[_S, _D], a_min: array_like, a_max: array_like, out: ndarray=None) -> ndarray[_S, _D]: ...
 def compress(condition: array1d[bool], a: array_like, axis: int=None, out: ndarray=None) -> ndarray[Any, Any]: ...
-def cumprod(a: ndarray[_S, _D], axis: AxesType=None, dtype: DtypeType=None, out: ndarray=None) -> ndarray[_InferDtypeWithDefault[_S], _InferNdimsIfAxisSpecified[OneD, _D]]: ...
-def cumproduct(a: ndarray[_S, _D], axis: AxesType=None, dtype: DtypeType=None, out: ndarray=None) -> ndarray[_InferDtypeWithDefault[_S], _InferNdimsIfAxisSpecified[OneD, _D]]: ...
-def cumsum(a: ndarray[_S, _D], axis: AxesType=None, dtype: DtypeType=None, out: ndarray=None) -> ndarray[_InferDtypeWithDefault[_S], _InferNdimsIfAxisSpecified[OneD, _D]]: ...
+def cumprod(a: ndarray[_S, _D], axis: AxesType=None, dtype: DtypeType=None, out: ndarray=None) -> ndarray[_InferDtypeWithDefault[_AccumulateDtype[_S]], _InferNdimsIfAxisSpecified[OneD, _D]]: ...
+def cumproduct(a: ndarray[_S, _D], axis: AxesType=None, dtype: DtypeType=None, out: ndarray=None) -> ndarray[_InferDtypeWithDefault[_AccumulateDtype[_S]], _InferNdimsIfAxisSpecified[OneD, _D]]: ...
+def cumsum(a: ndarray[_S, _D], axis: AxesType=None, dtype: DtypeType=None, out: ndarray=None) -> ndarray[_InferDtypeWithDefault[_AccumulateDtype[_S]], _InferNdimsIfAxisSpecified[OneD, _D]]: ...
 def diagonal(a: ndarray[_S, _D], offset: int=0, axis1: int=0, axis2: int=1) -> ndarray[_S, _LowerDim[_D]]: ...
 def max(a: ndarray[_S, _D], axis: AxesType=None, out: ndarray=None, keepdims: bool=False) -> ndarray[_S, _InferNdimsReduction[_D]]: ...
-def mean(a: ndarray[_S, _D], axis: AxesType=None, out: ndarray=None, keepdims: bool=False) -> ndarray[_S, _InferNdimsReduction[_D]]: ...
+def mean(a: ndarray[_S, _D], axis: AxesType=None, dtype: DtypeType=None, out: ndarray=None, keepdims: bool=False) -> ndarray[_InferDtypeWithDefault[_MeanDtype[_S]], _InferNdimsReduction[_D]]: ...
 def ndim(a: ndarray[_S, _D]) -> int: ...
 # FIXME: nonzero: Incomplete: length of tuple is _D
 def nonzero(a: ndarray[_S, _D]) -> Tuple[ndarray[int, OneD], ...]: ...
 # def partition(a: ndarray[_S, _D], axis: AxisType=-1, kth=Union[int, Sequence[int]], kind: str='introselect', order: Union[str, Sequence[str]]=None) -> ndarray[_S, _D]: ...
-def prod(a: ndarray[_S, _D], axis: AxesType=None, dtype: DtypeType=None, out: ndarray=None, keepdims: bool=False) -> ndarray[_InferDtypeWithDefault[_S], _InferNdimsReduction[_D]]: ...
-def product(a: ndarray[_S, _D], axis: AxesType=None, dtype: DtypeType=None, out: ndarray=None, keepdims: bool=False) -> ndarray[_InferDtypeWithDefault[_S], _InferNdimsReduction[_D]]: ...
+def prod(a: ndarray[_S, _D], axis: AxesType=None, dtype: DtypeType=None, out: ndarray=None, keepdims: bool=False) -> ndarray[_InferDtypeWithDefault[_AccumulateDtype[_S]], _InferNdimsReduction[_D]]: ...
+def product(a: ndarray[_S, _D], axis: AxesType=None, dtype: DtypeType=None, out: ndarray=None, keepdims: bool=False) -> ndarray[_InferDtypeWithDefault[_AccumulateDtype[_S]], _InferNdimsReduction[_D]]: ...
 def ptp(a: ndarray[_S, _D], axis: AxesType=None, out: ndarray=None) -> ndarray[_S, _InferNdimsReduction[_D]]: ...
 def put(a: ndarray[_S, _D], ind: array_like, v: array_like, mode: str='raise') -> None: ...
 def rank(a: ndarray[_S, _D]) -> int: ...
@@ -321,12 +379,12 @@ def shape(a: ndarray[_S, _D]) -> Tuple[int, ...]: ...
 def size(a: ndarray[_S, _D], axis: AxisType=None) -> int: ...
 def sometrue(a: ndarray[_S, _D], axis: AxesType=None, out: ndarray=None, keepdims: bool=False) -> ndarray[bool, _InferNdimsReduction[_D]]: ...
 def squeeze(a: ndarray[_S, _D], axis: AxesType=None) -> ndarray[_S, Any]: ...
-def std(a: ndarray[_S, _D], axis: AxesType=None, dtype: DtypeType=None, out: ndarray=None, ddof: int=0, keepdims: bool=False) -> ndarray[_InferDtypeWithDefault[_S], _InferNdimsReduction[_D]]: ...
-def sum(a: ndarray[_S, _D], axis: AxesType=None, dtype: DtypeType=None, out: ndarray=None, keepdims: bool=False) -> ndarray[_InferDtypeWithDefault[_S], _InferNdimsReduction[_D]]: ...
+def std(a: ndarray[_S, _D], axis: AxesType=None, dtype: DtypeType=None, out: ndarray=None, ddof: int=0, keepdims: bool=False) -> ndarray[_InferDtypeWithDefault[_MeanDtype[_S]], _InferNdimsReduction[_D]]: ...
+def sum(a: ndarray[_S, _D], axis: AxesType=None, dtype: DtypeType=None, out: ndarray=None, keepdims: bool=False) -> ndarray[_InferDtypeWithDefault[_AccumulateDtype[_S]], _InferNdimsReduction[_D]]: ...
 def swapaxes(a: ndarray[_S, _D], axis1: int, axis2: int) -> ndarray[_S, _D]: ...
-def trace(a: ndarray[_S, _D], offset: int=0, axis1: int=0, axis2: int=1, dtype: DtypeType=None, out: ndarray=None) -> ndarray[_InferDtypeWithDefault[_S], _LowerDim2[_D]]: ...
+def trace(a: ndarray[_S, _D], offset: int=0, axis1: int=0, axis2: int=1, dtype: DtypeType=None, out: ndarray=None) -> ndarray[_InferDtypeWithDefault[_AccumulateDtype[_S]], _LowerDim2[_D]]: ...
 def transpose(a: ndarray[_S, _D], axes: Sequence[int]=None) -> ndarray[_S, _D]: ...
-def var(a: ndarray[_S, _D], axis: AxesType=None, dtype: DtypeType=None, out: ndarray=None, ddof: int=0, keepdims: bool=False) -> ndarray[_InferDtypeWithDefault[_S], _InferNdimsReduction[_D]]: ...
+def var(a: ndarray[_S, _D], axis: AxesType=None, dtype: DtypeType=None, out: ndarray=None, ddof: int=0, keepdims: bool=False) -> ndarray[_InferDtypeWithDefault[_MeanDtype[_S]], _InferNdimsReduction[_D]]: ...
 
 ###############################################################################
 
@@ -344,8 +402,7 @@ def diag(a: ndarray[_S, _D]) -> ndarray[_S, _ToggleDims_12_21[_D]]: ...
 # @overload
 # def diag(a: array2d[float]) -> array1d[float]: ...
 
-# Incomplete
-def einsum(subscripts: str, *operands: ndarray[_S, Any], out: ndarray[_S, Any]=None, dtype: DtypeType=None, order: str='K', casting: str='safe') -> ndarray[Any, Any]: ...
+def einsum(subscripts: str, *operands: ndarray, out: ndarray=None, dtype: DtypeType=None, order: str='K', casting: str='safe', optimize: Union[bool, str, list]=False) -> ndarray[_EinsumDtype, _EinsumNdim]: ...
 
 # Incomplete
 # def ix_(*args: ndarray[_S, OneD]) -> Tuple[ndarray[_S, Any], ...]: ...
@@ -355,7 +412,7 @@ def ix_(iter1: ndarray[_S, OneD]) -> Tuple[ndarray[_S, OneD]]: ...
 def ix_(iter1: ndarray[_S, OneD], iter2: ndarray[_S, OneD]) -> Tuple[ndarray[_S, OneD], ndarray[_S, OneD]]: ...
 
 
-def eye(N: int, M: int=None, k: int=0, dtype: DtypeType=float) -> ndarray[float, TwoD]: ...
+def eye(N: int, M: int=None, k: int=0, dtype: DtypeType=float) -> ndarray[_InferDtypeWithDefault[float], TwoD]: ...
 
 
 
@@ -377,26 +434,8 @@ pi = ... # type: float
 newaxis = ... # type: None
 
 
-class linalg:
-    @staticmethod
-    def cholesky(a: ndarray[Any, TwoD]) -> ndarray[float, TwoD]: ...
-
-    @staticmethod
-    def eigh(a: ndarray[Any, _D]) -> Tuple[ndarray[float, _LowerDim[_D]], ndarray[float, _D]]: ...
-
-
 class finfo:
     def __init__(self, dtype: DtypeType=None) -> None: ...
     eps = None  # type: float
     min = None  # type: float
     max = None  # type: float
-
-
-class testing:
-    @overload
-    @staticmethod
-    def assert_allclose(actual: ndarray[_S, _D], desired: ndarray[_S, _D], rtol: float=None, atol: float=None, equal_nan: bool=None, err_msg: str='', verbose: bool=False) -> None: ...
-
-    @overload
-    @staticmethod
-    def assert_allclose(actual: float, desired: float, rtol: float=None, atol: float=None, equal_nan: bool=None, err_msg: str='', verbose: bool=False) -> None: ...
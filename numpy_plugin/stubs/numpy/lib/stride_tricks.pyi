@@ -0,0 +1,7 @@
+from typing import Any, List, Sequence
+
+from numpy import ndarray, ShapeType, _S, _D, _InferNdimsFromShape
+
+def as_strided(x: ndarray[_S, _D], shape: ShapeType=None, strides: Sequence[int]=None, subok: bool=False, writeable: bool=True) -> ndarray[_S, Any]: ...
+def broadcast_to(array: ndarray[_S, _D], shape: ShapeType, subok: bool=False) -> ndarray[_S, _InferNdimsFromShape]: ...
+def broadcast_arrays(*args: ndarray[_S, Any], subok: bool=False) -> List[ndarray[_S, Any]]: ...
@@ -0,0 +1,6 @@
+from typing import Any, Tuple
+
+from numpy import ndarray, TwoD, _D, _LowerDim
+
+def cholesky(a: ndarray[Any, TwoD]) -> ndarray[float, TwoD]: ...
+def eigh(a: ndarray[Any, _D]) -> Tuple[ndarray[float, _LowerDim[_D]], ndarray[float, _D]]: ...
@@ -0,0 +1,16 @@
+from typing import Any
+
+from numpy import ndarray, ShapeType, DtypeType, _S, _InferNdimsFromShape, _InferDtypeWithDefault
+
+def seed(seed: int=None) -> None: ...
+def rand(*args: int) -> ndarray[float, Any]: ...
+def randn(*args: int) -> ndarray[float, Any]: ...
+# an omitted size draws a single scalar
+def random(size: ShapeType=None) -> ndarray[float, _InferNdimsFromShape]: ...
+def random_sample(size: ShapeType=None) -> ndarray[float, _InferNdimsFromShape]: ...
+def randint(low: int, high: int=None, size: ShapeType=None, dtype: DtypeType=int) -> ndarray[_InferDtypeWithDefault[int], _InferNdimsFromShape]: ...
+def normal(loc: float=0.0, scale: float=1.0, size: ShapeType=None) -> ndarray[float, _InferNdimsFromShape]: ...
+def uniform(low: float=0.0, high: float=1.0, size: ShapeType=None) -> ndarray[float, _InferNdimsFromShape]: ...
+def choice(a: ndarray[_S, Any], size: ShapeType=None, replace: bool=True, p: ndarray[float, Any]=None) -> ndarray[_S, _InferNdimsFromShape]: ...
+def shuffle(x: ndarray[_S, Any]) -> None: ...
+def permutation(x: ndarray[_S, Any]) -> ndarray[_S, Any]: ...
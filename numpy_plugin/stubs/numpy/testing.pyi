@@ -0,0 +1,9 @@
+from typing import overload
+
+from numpy import ndarray, _S, _D
+
+@overload
+def assert_allclose(actual: ndarray[_S, _D], desired: ndarray[_S, _D], rtol: float=None, atol: float=None, equal_nan: bool=None, err_msg: str='', verbose: bool=False) -> None: ...
+@overload
+def assert_allclose(actual: float, desired: float, rtol: float=None, atol: float=None, equal_nan: bool=None, err_msg: str='', verbose: bool=False) -> None: ...
+def assert_array_equal(x: ndarray[_S, _D], y: ndarray[_S, _D], err_msg: str='', verbose: bool=True) -> None: ...
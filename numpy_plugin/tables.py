@@ -0,0 +1,1172 @@
+"""Dtype, casting and ufunc resolution tables.
+
+Generated by tools/generate_tables.py from NumPy 1.19.5; do not edit.
+"""
+
+NUMPY_VERSION = '1.19.5'
+TABLES_VERSION = 1
+
+# Type characters covered by the tables, narrowest first.
+TYPECHARS = '?bhilBHILefd'
+
+# dtype name or character -> canonical type character
+DTYPE_ALIASES = {
+    '?': '?', 'B': 'B', 'H': 'H', 'I': 'I', 'L': 'L', 'P': 'L', 'Q': 'L',
+    'Uint64': 'L', 'b': 'b', 'b1': '?', 'bool': '?', 'bool8': '?',
+    'bool_': '?', 'byte': 'b', 'd': 'd', 'double': 'd', 'e': 'e', 'f': 'f',
+    'f2': 'e', 'f4': 'f', 'f8': 'd', 'float': 'd', 'float16': 'e',
+    'float32': 'f', 'float64': 'd', 'float_': 'd', 'h': 'h', 'half': 'e',
+    'i': 'i', 'i1': 'b', 'i2': 'h', 'i4': 'i', 'i8': 'l', 'int': 'l',
+    'int0': 'l', 'int16': 'h', 'int32': 'i', 'int64': 'l', 'int8': 'b',
+    'int_': 'l', 'intc': 'i', 'intp': 'l', 'l': 'l', 'long': 'l',
+    'longlong': 'l', 'p': 'l', 'q': 'l', 'short': 'h', 'single': 'f',
+    'u1': 'B', 'u2': 'H', 'u4': 'I', 'u8': 'L', 'ubyte': 'B', 'uint': 'L',
+    'uint0': 'L', 'uint16': 'H', 'uint32': 'I', 'uint64': 'L', 'uint8': 'B',
+    'uintc': 'I', 'uintp': 'L', 'ulonglong': 'L', 'ushort': 'H',
+}
+
+# type character -> dtype kind
+KINDS = {
+    '?': 'b', 'B': 'u', 'H': 'u', 'I': 'u', 'L': 'u', 'b': 'i', 'd': 'f',
+    'e': 'f', 'f': 'f', 'h': 'i', 'i': 'i', 'l': 'i',
+}
+
+# type character -> itemsize in bytes
+ITEMSIZES = {
+    '?': 1, 'B': 1, 'H': 2, 'I': 4, 'L': 8, 'b': 1, 'd': 8, 'e': 2, 'f': 4,
+    'h': 2, 'i': 4, 'l': 8,
+}
+
+# type character -> the characters it casts to under each casting rule
+CAN_CAST_SAFE = {
+    '?': '?bhilBHILefd', 'B': 'hilBHILefd', 'H': 'ilHILfd', 'I': 'lILd',
+    'L': 'Ld', 'b': 'bhilefd', 'd': 'd', 'e': 'efd', 'f': 'fd', 'h': 'hilfd',
+    'i': 'ild', 'l': 'ld',
+}
+CAN_CAST_SAME_KIND = {
+    '?': '?bhilBHILefd', 'B': 'bhilBHILefd', 'H': 'bhilBHILefd',
+    'I': 'bhilBHILefd', 'L': 'bhilBHILefd', 'b': 'bhilefd', 'd': 'efd',
+    'e': 'efd', 'f': 'efd', 'h': 'bhilefd', 'i': 'bhilefd', 'l': 'bhilefd',
+}
+
+# ufunc alias -> the name it is listed under in UFUNC_OUTPUTS
+UFUNC_ALIASES = {
+    'abs': 'absolute', 'bitwise_not': 'invert', 'conj': 'conjugate',
+    'divide': 'true_divide', 'mod': 'remainder',
+}
+
+# ufunc name -> {input characters: output characters}
+UFUNC_OUTPUTS = {
+    'absolute': {
+        '?': '?', 'B': 'B', 'H': 'H', 'I': 'I', 'L': 'L', 'b': 'b', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'h', 'i': 'i', 'l': 'l',
+    },
+    'add': {
+        '??': '?', '?B': 'B', '?H': 'H', '?I': 'I', '?L': 'L', '?b': 'b',
+        '?d': 'd', '?e': 'e', '?f': 'f', '?h': 'h', '?i': 'i', '?l': 'l',
+        'B?': 'B', 'BB': 'B', 'BH': 'H', 'BI': 'I', 'BL': 'L', 'Bb': 'h',
+        'Bd': 'd', 'Be': 'e', 'Bf': 'f', 'Bh': 'h', 'Bi': 'i', 'Bl': 'l',
+        'H?': 'H', 'HB': 'H', 'HH': 'H', 'HI': 'I', 'HL': 'L', 'Hb': 'i',
+        'Hd': 'd', 'He': 'f', 'Hf': 'f', 'Hh': 'i', 'Hi': 'i', 'Hl': 'l',
+        'I?': 'I', 'IB': 'I', 'IH': 'I', 'II': 'I', 'IL': 'L', 'Ib': 'l',
+        'Id': 'd', 'Ie': 'd', 'If': 'd', 'Ih': 'l', 'Ii': 'l', 'Il': 'l',
+        'L?': 'L', 'LB': 'L', 'LH': 'L', 'LI': 'L', 'LL': 'L', 'Lb': 'd',
+        'Ld': 'd', 'Le': 'd', 'Lf': 'd', 'Lh': 'd', 'Li': 'd', 'Ll': 'd',
+        'b?': 'b', 'bB': 'h', 'bH': 'i', 'bI': 'l', 'bL': 'd', 'bb': 'b',
+        'bd': 'd', 'be': 'e', 'bf': 'f', 'bh': 'h', 'bi': 'i', 'bl': 'l',
+        'd?': 'd', 'dB': 'd', 'dH': 'd', 'dI': 'd', 'dL': 'd', 'db': 'd',
+        'dd': 'd', 'de': 'd', 'df': 'd', 'dh': 'd', 'di': 'd', 'dl': 'd',
+        'e?': 'e', 'eB': 'e', 'eH': 'f', 'eI': 'd', 'eL': 'd', 'eb': 'e',
+        'ed': 'd', 'ee': 'e', 'ef': 'f', 'eh': 'f', 'ei': 'd', 'el': 'd',
+        'f?': 'f', 'fB': 'f', 'fH': 'f', 'fI': 'd', 'fL': 'd', 'fb': 'f',
+        'fd': 'd', 'fe': 'f', 'ff': 'f', 'fh': 'f', 'fi': 'd', 'fl': 'd',
+        'h?': 'h', 'hB': 'h', 'hH': 'i', 'hI': 'l', 'hL': 'd', 'hb': 'h',
+        'hd': 'd', 'he': 'f', 'hf': 'f', 'hh': 'h', 'hi': 'i', 'hl': 'l',
+        'i?': 'i', 'iB': 'i', 'iH': 'i', 'iI': 'l', 'iL': 'd', 'ib': 'i',
+        'id': 'd', 'ie': 'd', 'if': 'd', 'ih': 'i', 'ii': 'i', 'il': 'l',
+        'l?': 'l', 'lB': 'l', 'lH': 'l', 'lI': 'l', 'lL': 'd', 'lb': 'l',
+        'ld': 'd', 'le': 'd', 'lf': 'd', 'lh': 'l', 'li': 'l', 'll': 'l',
+    },
+    'arccos': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'arccosh': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'arcsin': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'arcsinh': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'arctan': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'arctan2': {
+        '??': 'e', '?B': 'e', '?H': 'f', '?I': 'd', '?L': 'd', '?b': 'e',
+        '?d': 'd', '?e': 'e', '?f': 'f', '?h': 'f', '?i': 'd', '?l': 'd',
+        'B?': 'e', 'BB': 'e', 'BH': 'f', 'BI': 'd', 'BL': 'd', 'Bb': 'e',
+        'Bd': 'd', 'Be': 'e', 'Bf': 'f', 'Bh': 'f', 'Bi': 'd', 'Bl': 'd',
+        'H?': 'f', 'HB': 'f', 'HH': 'f', 'HI': 'd', 'HL': 'd', 'Hb': 'f',
+        'Hd': 'd', 'He': 'f', 'Hf': 'f', 'Hh': 'f', 'Hi': 'd', 'Hl': 'd',
+        'I?': 'd', 'IB': 'd', 'IH': 'd', 'II': 'd', 'IL': 'd', 'Ib': 'd',
+        'Id': 'd', 'Ie': 'd', 'If': 'd', 'Ih': 'd', 'Ii': 'd', 'Il': 'd',
+        'L?': 'd', 'LB': 'd', 'LH': 'd', 'LI': 'd', 'LL': 'd', 'Lb': 'd',
+        'Ld': 'd', 'Le': 'd', 'Lf': 'd', 'Lh': 'd', 'Li': 'd', 'Ll': 'd',
+        'b?': 'e', 'bB': 'e', 'bH': 'f', 'bI': 'd', 'bL': 'd', 'bb': 'e',
+        'bd': 'd', 'be': 'e', 'bf': 'f', 'bh': 'f', 'bi': 'd', 'bl': 'd',
+        'd?': 'd', 'dB': 'd', 'dH': 'd', 'dI': 'd', 'dL': 'd', 'db': 'd',
+        'dd': 'd', 'de': 'd', 'df': 'd', 'dh': 'd', 'di': 'd', 'dl': 'd',
+        'e?': 'e', 'eB': 'e', 'eH': 'f', 'eI': 'd', 'eL': 'd', 'eb': 'e',
+        'ed': 'd', 'ee': 'e', 'ef': 'f', 'eh': 'f', 'ei': 'd', 'el': 'd',
+        'f?': 'f', 'fB': 'f', 'fH': 'f', 'fI': 'd', 'fL': 'd', 'fb': 'f',
+        'fd': 'd', 'fe': 'f', 'ff': 'f', 'fh': 'f', 'fi': 'd', 'fl': 'd',
+        'h?': 'f', 'hB': 'f', 'hH': 'f', 'hI': 'd', 'hL': 'd', 'hb': 'f',
+        'hd': 'd', 'he': 'f', 'hf': 'f', 'hh': 'f', 'hi': 'd', 'hl': 'd',
+        'i?': 'd', 'iB': 'd', 'iH': 'd', 'iI': 'd', 'iL': 'd', 'ib': 'd',
+        'id': 'd', 'ie': 'd', 'if': 'd', 'ih': 'd', 'ii': 'd', 'il': 'd',
+        'l?': 'd', 'lB': 'd', 'lH': 'd', 'lI': 'd', 'lL': 'd', 'lb': 'd',
+        'ld': 'd', 'le': 'd', 'lf': 'd', 'lh': 'd', 'li': 'd', 'll': 'd',
+    },
+    'arctanh': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'bitwise_and': {
+        '??': '?', '?B': 'B', '?H': 'H', '?I': 'I', '?L': 'L', '?b': 'b',
+        '?h': 'h', '?i': 'i', '?l': 'l', 'B?': 'B', 'BB': 'B', 'BH': 'H',
+        'BI': 'I', 'BL': 'L', 'Bb': 'h', 'Bh': 'h', 'Bi': 'i', 'Bl': 'l',
+        'H?': 'H', 'HB': 'H', 'HH': 'H', 'HI': 'I', 'HL': 'L', 'Hb': 'i',
+        'Hh': 'i', 'Hi': 'i', 'Hl': 'l', 'I?': 'I', 'IB': 'I', 'IH': 'I',
+        'II': 'I', 'IL': 'L', 'Ib': 'l', 'Ih': 'l', 'Ii': 'l', 'Il': 'l',
+        'L?': 'L', 'LB': 'L', 'LH': 'L', 'LI': 'L', 'LL': 'L', 'b?': 'b',
+        'bB': 'h', 'bH': 'i', 'bI': 'l', 'bb': 'b', 'bh': 'h', 'bi': 'i',
+        'bl': 'l', 'h?': 'h', 'hB': 'h', 'hH': 'i', 'hI': 'l', 'hb': 'h',
+        'hh': 'h', 'hi': 'i', 'hl': 'l', 'i?': 'i', 'iB': 'i', 'iH': 'i',
+        'iI': 'l', 'ib': 'i', 'ih': 'i', 'ii': 'i', 'il': 'l', 'l?': 'l',
+        'lB': 'l', 'lH': 'l', 'lI': 'l', 'lb': 'l', 'lh': 'l', 'li': 'l',
+        'll': 'l',
+    },
+    'bitwise_or': {
+        '??': '?', '?B': 'B', '?H': 'H', '?I': 'I', '?L': 'L', '?b': 'b',
+        '?h': 'h', '?i': 'i', '?l': 'l', 'B?': 'B', 'BB': 'B', 'BH': 'H',
+        'BI': 'I', 'BL': 'L', 'Bb': 'h', 'Bh': 'h', 'Bi': 'i', 'Bl': 'l',
+        'H?': 'H', 'HB': 'H', 'HH': 'H', 'HI': 'I', 'HL': 'L', 'Hb': 'i',
+        'Hh': 'i', 'Hi': 'i', 'Hl': 'l', 'I?': 'I', 'IB': 'I', 'IH': 'I',
+        'II': 'I', 'IL': 'L', 'Ib': 'l', 'Ih': 'l', 'Ii': 'l', 'Il': 'l',
+        'L?': 'L', 'LB': 'L', 'LH': 'L', 'LI': 'L', 'LL': 'L', 'b?': 'b',
+        'bB': 'h', 'bH': 'i', 'bI': 'l', 'bb': 'b', 'bh': 'h', 'bi': 'i',
+        'bl': 'l', 'h?': 'h', 'hB': 'h', 'hH': 'i', 'hI': 'l', 'hb': 'h',
+        'hh': 'h', 'hi': 'i', 'hl': 'l', 'i?': 'i', 'iB': 'i', 'iH': 'i',
+        'iI': 'l', 'ib': 'i', 'ih': 'i', 'ii': 'i', 'il': 'l', 'l?': 'l',
+        'lB': 'l', 'lH': 'l', 'lI': 'l', 'lb': 'l', 'lh': 'l', 'li': 'l',
+        'll': 'l',
+    },
+    'bitwise_xor': {
+        '??': '?', '?B': 'B', '?H': 'H', '?I': 'I', '?L': 'L', '?b': 'b',
+        '?h': 'h', '?i': 'i', '?l': 'l', 'B?': 'B', 'BB': 'B', 'BH': 'H',
+        'BI': 'I', 'BL': 'L', 'Bb': 'h', 'Bh': 'h', 'Bi': 'i', 'Bl': 'l',
+        'H?': 'H', 'HB': 'H', 'HH': 'H', 'HI': 'I', 'HL': 'L', 'Hb': 'i',
+        'Hh': 'i', 'Hi': 'i', 'Hl': 'l', 'I?': 'I', 'IB': 'I', 'IH': 'I',
+        'II': 'I', 'IL': 'L', 'Ib': 'l', 'Ih': 'l', 'Ii': 'l', 'Il': 'l',
+        'L?': 'L', 'LB': 'L', 'LH': 'L', 'LI': 'L', 'LL': 'L', 'b?': 'b',
+        'bB': 'h', 'bH': 'i', 'bI': 'l', 'bb': 'b', 'bh': 'h', 'bi': 'i',
+        'bl': 'l', 'h?': 'h', 'hB': 'h', 'hH': 'i', 'hI': 'l', 'hb': 'h',
+        'hh': 'h', 'hi': 'i', 'hl': 'l', 'i?': 'i', 'iB': 'i', 'iH': 'i',
+        'iI': 'l', 'ib': 'i', 'ih': 'i', 'ii': 'i', 'il': 'l', 'l?': 'l',
+        'lB': 'l', 'lH': 'l', 'lI': 'l', 'lb': 'l', 'lh': 'l', 'li': 'l',
+        'll': 'l',
+    },
+    'cbrt': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'ceil': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'conjugate': {
+        '?': 'b', 'B': 'B', 'H': 'H', 'I': 'I', 'L': 'L', 'b': 'b', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'h', 'i': 'i', 'l': 'l',
+    },
+    'copysign': {
+        '??': 'e', '?B': 'e', '?H': 'f', '?I': 'd', '?L': 'd', '?b': 'e',
+        '?d': 'd', '?e': 'e', '?f': 'f', '?h': 'f', '?i': 'd', '?l': 'd',
+        'B?': 'e', 'BB': 'e', 'BH': 'f', 'BI': 'd', 'BL': 'd', 'Bb': 'e',
+        'Bd': 'd', 'Be': 'e', 'Bf': 'f', 'Bh': 'f', 'Bi': 'd', 'Bl': 'd',
+        'H?': 'f', 'HB': 'f', 'HH': 'f', 'HI': 'd', 'HL': 'd', 'Hb': 'f',
+        'Hd': 'd', 'He': 'f', 'Hf': 'f', 'Hh': 'f', 'Hi': 'd', 'Hl': 'd',
+        'I?': 'd', 'IB': 'd', 'IH': 'd', 'II': 'd', 'IL': 'd', 'Ib': 'd',
+        'Id': 'd', 'Ie': 'd', 'If': 'd', 'Ih': 'd', 'Ii': 'd', 'Il': 'd',
+        'L?': 'd', 'LB': 'd', 'LH': 'd', 'LI': 'd', 'LL': 'd', 'Lb': 'd',
+        'Ld': 'd', 'Le': 'd', 'Lf': 'd', 'Lh': 'd', 'Li': 'd', 'Ll': 'd',
+        'b?': 'e', 'bB': 'e', 'bH': 'f', 'bI': 'd', 'bL': 'd', 'bb': 'e',
+        'bd': 'd', 'be': 'e', 'bf': 'f', 'bh': 'f', 'bi': 'd', 'bl': 'd',
+        'd?': 'd', 'dB': 'd', 'dH': 'd', 'dI': 'd', 'dL': 'd', 'db': 'd',
+        'dd': 'd', 'de': 'd', 'df': 'd', 'dh': 'd', 'di': 'd', 'dl': 'd',
+        'e?': 'e', 'eB': 'e', 'eH': 'f', 'eI': 'd', 'eL': 'd', 'eb': 'e',
+        'ed': 'd', 'ee': 'e', 'ef': 'f', 'eh': 'f', 'ei': 'd', 'el': 'd',
+        'f?': 'f', 'fB': 'f', 'fH': 'f', 'fI': 'd', 'fL': 'd', 'fb': 'f',
+        'fd': 'd', 'fe': 'f', 'ff': 'f', 'fh': 'f', 'fi': 'd', 'fl': 'd',
+        'h?': 'f', 'hB': 'f', 'hH': 'f', 'hI': 'd', 'hL': 'd', 'hb': 'f',
+        'hd': 'd', 'he': 'f', 'hf': 'f', 'hh': 'f', 'hi': 'd', 'hl': 'd',
+        'i?': 'd', 'iB': 'd', 'iH': 'd', 'iI': 'd', 'iL': 'd', 'ib': 'd',
+        'id': 'd', 'ie': 'd', 'if': 'd', 'ih': 'd', 'ii': 'd', 'il': 'd',
+        'l?': 'd', 'lB': 'd', 'lH': 'd', 'lI': 'd', 'lL': 'd', 'lb': 'd',
+        'ld': 'd', 'le': 'd', 'lf': 'd', 'lh': 'd', 'li': 'd', 'll': 'd',
+    },
+    'cos': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'cosh': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'deg2rad': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'degrees': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'divmod': {
+        '??': 'bb', '?B': 'BB', '?H': 'HH', '?I': 'II', '?L': 'LL', '?b': 'bb',
+        '?d': 'dd', '?e': 'ee', '?f': 'ff', '?h': 'hh', '?i': 'ii', '?l': 'll',
+        'B?': 'BB', 'BB': 'BB', 'BH': 'HH', 'BI': 'II', 'BL': 'LL', 'Bb': 'hh',
+        'Bd': 'dd', 'Be': 'ee', 'Bf': 'ff', 'Bh': 'hh', 'Bi': 'ii', 'Bl': 'll',
+        'H?': 'HH', 'HB': 'HH', 'HH': 'HH', 'HI': 'II', 'HL': 'LL', 'Hb': 'ii',
+        'Hd': 'dd', 'He': 'ff', 'Hf': 'ff', 'Hh': 'ii', 'Hi': 'ii', 'Hl': 'll',
+        'I?': 'II', 'IB': 'II', 'IH': 'II', 'II': 'II', 'IL': 'LL', 'Ib': 'll',
+        'Id': 'dd', 'Ie': 'dd', 'If': 'dd', 'Ih': 'll', 'Ii': 'll', 'Il': 'll',
+        'L?': 'LL', 'LB': 'LL', 'LH': 'LL', 'LI': 'LL', 'LL': 'LL', 'Lb': 'dd',
+        'Ld': 'dd', 'Le': 'dd', 'Lf': 'dd', 'Lh': 'dd', 'Li': 'dd', 'Ll': 'dd',
+        'b?': 'bb', 'bB': 'hh', 'bH': 'ii', 'bI': 'll', 'bL': 'dd', 'bb': 'bb',
+        'bd': 'dd', 'be': 'ee', 'bf': 'ff', 'bh': 'hh', 'bi': 'ii', 'bl': 'll',
+        'd?': 'dd', 'dB': 'dd', 'dH': 'dd', 'dI': 'dd', 'dL': 'dd', 'db': 'dd',
+        'dd': 'dd', 'de': 'dd', 'df': 'dd', 'dh': 'dd', 'di': 'dd', 'dl': 'dd',
+        'e?': 'ee', 'eB': 'ee', 'eH': 'ff', 'eI': 'dd', 'eL': 'dd', 'eb': 'ee',
+        'ed': 'dd', 'ee': 'ee', 'ef': 'ff', 'eh': 'ff', 'ei': 'dd', 'el': 'dd',
+        'f?': 'ff', 'fB': 'ff', 'fH': 'ff', 'fI': 'dd', 'fL': 'dd', 'fb': 'ff',
+        'fd': 'dd', 'fe': 'ff', 'ff': 'ff', 'fh': 'ff', 'fi': 'dd', 'fl': 'dd',
+        'h?': 'hh', 'hB': 'hh', 'hH': 'ii', 'hI': 'll', 'hL': 'dd', 'hb': 'hh',
+        'hd': 'dd', 'he': 'ff', 'hf': 'ff', 'hh': 'hh', 'hi': 'ii', 'hl': 'll',
+        'i?': 'ii', 'iB': 'ii', 'iH': 'ii', 'iI': 'll', 'iL': 'dd', 'ib': 'ii',
+        'id': 'dd', 'ie': 'dd', 'if': 'dd', 'ih': 'ii', 'ii': 'ii', 'il': 'll',
+        'l?': 'll', 'lB': 'll', 'lH': 'll', 'lI': 'll', 'lL': 'dd', 'lb': 'll',
+        'ld': 'dd', 'le': 'dd', 'lf': 'dd', 'lh': 'll', 'li': 'll', 'll': 'll',
+    },
+    'equal': {
+        '??': '?', '?B': '?', '?H': '?', '?I': '?', '?L': '?', '?b': '?',
+        '?d': '?', '?e': '?', '?f': '?', '?h': '?', '?i': '?', '?l': '?',
+        'B?': '?', 'BB': '?', 'BH': '?', 'BI': '?', 'BL': '?', 'Bb': '?',
+        'Bd': '?', 'Be': '?', 'Bf': '?', 'Bh': '?', 'Bi': '?', 'Bl': '?',
+        'H?': '?', 'HB': '?', 'HH': '?', 'HI': '?', 'HL': '?', 'Hb': '?',
+        'Hd': '?', 'He': '?', 'Hf': '?', 'Hh': '?', 'Hi': '?', 'Hl': '?',
+        'I?': '?', 'IB': '?', 'IH': '?', 'II': '?', 'IL': '?', 'Ib': '?',
+        'Id': '?', 'Ie': '?', 'If': '?', 'Ih': '?', 'Ii': '?', 'Il': '?',
+        'L?': '?', 'LB': '?', 'LH': '?', 'LI': '?', 'LL': '?', 'Lb': '?',
+        'Ld': '?', 'Le': '?', 'Lf': '?', 'Lh': '?', 'Li': '?', 'Ll': '?',
+        'b?': '?', 'bB': '?', 'bH': '?', 'bI': '?', 'bL': '?', 'bb': '?',
+        'bd': '?', 'be': '?', 'bf': '?', 'bh': '?', 'bi': '?', 'bl': '?',
+        'd?': '?', 'dB': '?', 'dH': '?', 'dI': '?', 'dL': '?', 'db': '?',
+        'dd': '?', 'de': '?', 'df': '?', 'dh': '?', 'di': '?', 'dl': '?',
+        'e?': '?', 'eB': '?', 'eH': '?', 'eI': '?', 'eL': '?', 'eb': '?',
+        'ed': '?', 'ee': '?', 'ef': '?', 'eh': '?', 'ei': '?', 'el': '?',
+        'f?': '?', 'fB': '?', 'fH': '?', 'fI': '?', 'fL': '?', 'fb': '?',
+        'fd': '?', 'fe': '?', 'ff': '?', 'fh': '?', 'fi': '?', 'fl': '?',
+        'h?': '?', 'hB': '?', 'hH': '?', 'hI': '?', 'hL': '?', 'hb': '?',
+        'hd': '?', 'he': '?', 'hf': '?', 'hh': '?', 'hi': '?', 'hl': '?',
+        'i?': '?', 'iB': '?', 'iH': '?', 'iI': '?', 'iL': '?', 'ib': '?',
+        'id': '?', 'ie': '?', 'if': '?', 'ih': '?', 'ii': '?', 'il': '?',
+        'l?': '?', 'lB': '?', 'lH': '?', 'lI': '?', 'lL': '?', 'lb': '?',
+        'ld': '?', 'le': '?', 'lf': '?', 'lh': '?', 'li': '?', 'll': '?',
+    },
+    'exp': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'exp2': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'expm1': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'fabs': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'float_power': {
+        '??': 'd', '?B': 'd', '?H': 'd', '?I': 'd', '?L': 'd', '?b': 'd',
+        '?d': 'd', '?e': 'd', '?f': 'd', '?h': 'd', '?i': 'd', '?l': 'd',
+        'B?': 'd', 'BB': 'd', 'BH': 'd', 'BI': 'd', 'BL': 'd', 'Bb': 'd',
+        'Bd': 'd', 'Be': 'd', 'Bf': 'd', 'Bh': 'd', 'Bi': 'd', 'Bl': 'd',
+        'H?': 'd', 'HB': 'd', 'HH': 'd', 'HI': 'd', 'HL': 'd', 'Hb': 'd',
+        'Hd': 'd', 'He': 'd', 'Hf': 'd', 'Hh': 'd', 'Hi': 'd', 'Hl': 'd',
+        'I?': 'd', 'IB': 'd', 'IH': 'd', 'II': 'd', 'IL': 'd', 'Ib': 'd',
+        'Id': 'd', 'Ie': 'd', 'If': 'd', 'Ih': 'd', 'Ii': 'd', 'Il': 'd',
+        'L?': 'd', 'LB': 'd', 'LH': 'd', 'LI': 'd', 'LL': 'd', 'Lb': 'd',
+        'Ld': 'd', 'Le': 'd', 'Lf': 'd', 'Lh': 'd', 'Li': 'd', 'Ll': 'd',
+        'b?': 'd', 'bB': 'd', 'bH': 'd', 'bI': 'd', 'bL': 'd', 'bb': 'd',
+        'bd': 'd', 'be': 'd', 'bf': 'd', 'bh': 'd', 'bi': 'd', 'bl': 'd',
+        'd?': 'd', 'dB': 'd', 'dH': 'd', 'dI': 'd', 'dL': 'd', 'db': 'd',
+        'dd': 'd', 'de': 'd', 'df': 'd', 'dh': 'd', 'di': 'd', 'dl': 'd',
+        'e?': 'd', 'eB': 'd', 'eH': 'd', 'eI': 'd', 'eL': 'd', 'eb': 'd',
+        'ed': 'd', 'ee': 'd', 'ef': 'd', 'eh': 'd', 'ei': 'd', 'el': 'd',
+        'f?': 'd', 'fB': 'd', 'fH': 'd', 'fI': 'd', 'fL': 'd', 'fb': 'd',
+        'fd': 'd', 'fe': 'd', 'ff': 'd', 'fh': 'd', 'fi': 'd', 'fl': 'd',
+        'h?': 'd', 'hB': 'd', 'hH': 'd', 'hI': 'd', 'hL': 'd', 'hb': 'd',
+        'hd': 'd', 'he': 'd', 'hf': 'd', 'hh': 'd', 'hi': 'd', 'hl': 'd',
+        'i?': 'd', 'iB': 'd', 'iH': 'd', 'iI': 'd', 'iL': 'd', 'ib': 'd',
+        'id': 'd', 'ie': 'd', 'if': 'd', 'ih': 'd', 'ii': 'd', 'il': 'd',
+        'l?': 'd', 'lB': 'd', 'lH': 'd', 'lI': 'd', 'lL': 'd', 'lb': 'd',
+        'ld': 'd', 'le': 'd', 'lf': 'd', 'lh': 'd', 'li': 'd', 'll': 'd',
+    },
+    'floor': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'floor_divide': {
+        '??': 'b', '?B': 'B', '?H': 'H', '?I': 'I', '?L': 'L', '?b': 'b',
+        '?d': 'd', '?e': 'e', '?f': 'f', '?h': 'h', '?i': 'i', '?l': 'l',
+        'B?': 'B', 'BB': 'B', 'BH': 'H', 'BI': 'I', 'BL': 'L', 'Bb': 'h',
+        'Bd': 'd', 'Be': 'e', 'Bf': 'f', 'Bh': 'h', 'Bi': 'i', 'Bl': 'l',
+        'H?': 'H', 'HB': 'H', 'HH': 'H', 'HI': 'I', 'HL': 'L', 'Hb': 'i',
+        'Hd': 'd', 'He': 'f', 'Hf': 'f', 'Hh': 'i', 'Hi': 'i', 'Hl': 'l',
+        'I?': 'I', 'IB': 'I', 'IH': 'I', 'II': 'I', 'IL': 'L', 'Ib': 'l',
+        'Id': 'd', 'Ie': 'd', 'If': 'd', 'Ih': 'l', 'Ii': 'l', 'Il': 'l',
+        'L?': 'L', 'LB': 'L', 'LH': 'L', 'LI': 'L', 'LL': 'L', 'Lb': 'd',
+        'Ld': 'd', 'Le': 'd', 'Lf': 'd', 'Lh': 'd', 'Li': 'd', 'Ll': 'd',
+        'b?': 'b', 'bB': 'h', 'bH': 'i', 'bI': 'l', 'bL': 'd', 'bb': 'b',
+        'bd': 'd', 'be': 'e', 'bf': 'f', 'bh': 'h', 'bi': 'i', 'bl': 'l',
+        'd?': 'd', 'dB': 'd', 'dH': 'd', 'dI': 'd', 'dL': 'd', 'db': 'd',
+        'dd': 'd', 'de': 'd', 'df': 'd', 'dh': 'd', 'di': 'd', 'dl': 'd',
+        'e?': 'e', 'eB': 'e', 'eH': 'f', 'eI': 'd', 'eL': 'd', 'eb': 'e',
+        'ed': 'd', 'ee': 'e', 'ef': 'f', 'eh': 'f', 'ei': 'd', 'el': 'd',
+        'f?': 'f', 'fB': 'f', 'fH': 'f', 'fI': 'd', 'fL': 'd', 'fb': 'f',
+        'fd': 'd', 'fe': 'f', 'ff': 'f', 'fh': 'f', 'fi': 'd', 'fl': 'd',
+        'h?': 'h', 'hB': 'h', 'hH': 'i', 'hI': 'l', 'hL': 'd', 'hb': 'h',
+        'hd': 'd', 'he': 'f', 'hf': 'f', 'hh': 'h', 'hi': 'i', 'hl': 'l',
+        'i?': 'i', 'iB': 'i', 'iH': 'i', 'iI': 'l', 'iL': 'd', 'ib': 'i',
+        'id': 'd', 'ie': 'd', 'if': 'd', 'ih': 'i', 'ii': 'i', 'il': 'l',
+        'l?': 'l', 'lB': 'l', 'lH': 'l', 'lI': 'l', 'lL': 'd', 'lb': 'l',
+        'ld': 'd', 'le': 'd', 'lf': 'd', 'lh': 'l', 'li': 'l', 'll': 'l',
+    },
+    'fmax': {
+        '??': '?', '?B': 'B', '?H': 'H', '?I': 'I', '?L': 'L', '?b': 'b',
+        '?d': 'd', '?e': 'e', '?f': 'f', '?h': 'h', '?i': 'i', '?l': 'l',
+        'B?': 'B', 'BB': 'B', 'BH': 'H', 'BI': 'I', 'BL': 'L', 'Bb': 'h',
+        'Bd': 'd', 'Be': 'e', 'Bf': 'f', 'Bh': 'h', 'Bi': 'i', 'Bl': 'l',
+        'H?': 'H', 'HB': 'H', 'HH': 'H', 'HI': 'I', 'HL': 'L', 'Hb': 'i',
+        'Hd': 'd', 'He': 'f', 'Hf': 'f', 'Hh': 'i', 'Hi': 'i', 'Hl': 'l',
+        'I?': 'I', 'IB': 'I', 'IH': 'I', 'II': 'I', 'IL': 'L', 'Ib': 'l',
+        'Id': 'd', 'Ie': 'd', 'If': 'd', 'Ih': 'l', 'Ii': 'l', 'Il': 'l',
+        'L?': 'L', 'LB': 'L', 'LH': 'L', 'LI': 'L', 'LL': 'L', 'Lb': 'd',
+        'Ld': 'd', 'Le': 'd', 'Lf': 'd', 'Lh': 'd', 'Li': 'd', 'Ll': 'd',
+        'b?': 'b', 'bB': 'h', 'bH': 'i', 'bI': 'l', 'bL': 'd', 'bb': 'b',
+        'bd': 'd', 'be': 'e', 'bf': 'f', 'bh': 'h', 'bi': 'i', 'bl': 'l',
+        'd?': 'd', 'dB': 'd', 'dH': 'd', 'dI': 'd', 'dL': 'd', 'db': 'd',
+        'dd': 'd', 'de': 'd', 'df': 'd', 'dh': 'd', 'di': 'd', 'dl': 'd',
+        'e?': 'e', 'eB': 'e', 'eH': 'f', 'eI': 'd', 'eL': 'd', 'eb': 'e',
+        'ed': 'd', 'ee': 'e', 'ef': 'f', 'eh': 'f', 'ei': 'd', 'el': 'd',
+        'f?': 'f', 'fB': 'f', 'fH': 'f', 'fI': 'd', 'fL': 'd', 'fb': 'f',
+        'fd': 'd', 'fe': 'f', 'ff': 'f', 'fh': 'f', 'fi': 'd', 'fl': 'd',
+        'h?': 'h', 'hB': 'h', 'hH': 'i', 'hI': 'l', 'hL': 'd', 'hb': 'h',
+        'hd': 'd', 'he': 'f', 'hf': 'f', 'hh': 'h', 'hi': 'i', 'hl': 'l',
+        'i?': 'i', 'iB': 'i', 'iH': 'i', 'iI': 'l', 'iL': 'd', 'ib': 'i',
+        'id': 'd', 'ie': 'd', 'if': 'd', 'ih': 'i', 'ii': 'i', 'il': 'l',
+        'l?': 'l', 'lB': 'l', 'lH': 'l', 'lI': 'l', 'lL': 'd', 'lb': 'l',
+        'ld': 'd', 'le': 'd', 'lf': 'd', 'lh': 'l', 'li': 'l', 'll': 'l',
+    },
+    'fmin': {
+        '??': '?', '?B': 'B', '?H': 'H', '?I': 'I', '?L': 'L', '?b': 'b',
+        '?d': 'd', '?e': 'e', '?f': 'f', '?h': 'h', '?i': 'i', '?l': 'l',
+        'B?': 'B', 'BB': 'B', 'BH': 'H', 'BI': 'I', 'BL': 'L', 'Bb': 'h',
+        'Bd': 'd', 'Be': 'e', 'Bf': 'f', 'Bh': 'h', 'Bi': 'i', 'Bl': 'l',
+        'H?': 'H', 'HB': 'H', 'HH': 'H', 'HI': 'I', 'HL': 'L', 'Hb': 'i',
+        'Hd': 'd', 'He': 'f', 'Hf': 'f', 'Hh': 'i', 'Hi': 'i', 'Hl': 'l',
+        'I?': 'I', 'IB': 'I', 'IH': 'I', 'II': 'I', 'IL': 'L', 'Ib': 'l',
+        'Id': 'd', 'Ie': 'd', 'If': 'd', 'Ih': 'l', 'Ii': 'l', 'Il': 'l',
+        'L?': 'L', 'LB': 'L', 'LH': 'L', 'LI': 'L', 'LL': 'L', 'Lb': 'd',
+        'Ld': 'd', 'Le': 'd', 'Lf': 'd', 'Lh': 'd', 'Li': 'd', 'Ll': 'd',
+        'b?': 'b', 'bB': 'h', 'bH': 'i', 'bI': 'l', 'bL': 'd', 'bb': 'b',
+        'bd': 'd', 'be': 'e', 'bf': 'f', 'bh': 'h', 'bi': 'i', 'bl': 'l',
+        'd?': 'd', 'dB': 'd', 'dH': 'd', 'dI': 'd', 'dL': 'd', 'db': 'd',
+        'dd': 'd', 'de': 'd', 'df': 'd', 'dh': 'd', 'di': 'd', 'dl': 'd',
+        'e?': 'e', 'eB': 'e', 'eH': 'f', 'eI': 'd', 'eL': 'd', 'eb': 'e',
+        'ed': 'd', 'ee': 'e', 'ef': 'f', 'eh': 'f', 'ei': 'd', 'el': 'd',
+        'f?': 'f', 'fB': 'f', 'fH': 'f', 'fI': 'd', 'fL': 'd', 'fb': 'f',
+        'fd': 'd', 'fe': 'f', 'ff': 'f', 'fh': 'f', 'fi': 'd', 'fl': 'd',
+        'h?': 'h', 'hB': 'h', 'hH': 'i', 'hI': 'l', 'hL': 'd', 'hb': 'h',
+        'hd': 'd', 'he': 'f', 'hf': 'f', 'hh': 'h', 'hi': 'i', 'hl': 'l',
+        'i?': 'i', 'iB': 'i', 'iH': 'i', 'iI': 'l', 'iL': 'd', 'ib': 'i',
+        'id': 'd', 'ie': 'd', 'if': 'd', 'ih': 'i', 'ii': 'i', 'il': 'l',
+        'l?': 'l', 'lB': 'l', 'lH': 'l', 'lI': 'l', 'lL': 'd', 'lb': 'l',
+        'ld': 'd', 'le': 'd', 'lf': 'd', 'lh': 'l', 'li': 'l', 'll': 'l',
+    },
+    'fmod': {
+        '??': 'b', '?B': 'B', '?H': 'H', '?I': 'I', '?L': 'L', '?b': 'b',
+        '?d': 'd', '?e': 'e', '?f': 'f', '?h': 'h', '?i': 'i', '?l': 'l',
+        'B?': 'B', 'BB': 'B', 'BH': 'H', 'BI': 'I', 'BL': 'L', 'Bb': 'h',
+        'Bd': 'd', 'Be': 'e', 'Bf': 'f', 'Bh': 'h', 'Bi': 'i', 'Bl': 'l',
+        'H?': 'H', 'HB': 'H', 'HH': 'H', 'HI': 'I', 'HL': 'L', 'Hb': 'i',
+        'Hd': 'd', 'He': 'f', 'Hf': 'f', 'Hh': 'i', 'Hi': 'i', 'Hl': 'l',
+        'I?': 'I', 'IB': 'I', 'IH': 'I', 'II': 'I', 'IL': 'L', 'Ib': 'l',
+        'Id': 'd', 'Ie': 'd', 'If': 'd', 'Ih': 'l', 'Ii': 'l', 'Il': 'l',
+        'L?': 'L', 'LB': 'L', 'LH': 'L', 'LI': 'L', 'LL': 'L', 'Lb': 'd',
+        'Ld': 'd', 'Le': 'd', 'Lf': 'd', 'Lh': 'd', 'Li': 'd', 'Ll': 'd',
+        'b?': 'b', 'bB': 'h', 'bH': 'i', 'bI': 'l', 'bL': 'd', 'bb': 'b',
+        'bd': 'd', 'be': 'e', 'bf': 'f', 'bh': 'h', 'bi': 'i', 'bl': 'l',
+        'd?': 'd', 'dB': 'd', 'dH': 'd', 'dI': 'd', 'dL': 'd', 'db': 'd',
+        'dd': 'd', 'de': 'd', 'df': 'd', 'dh': 'd', 'di': 'd', 'dl': 'd',
+        'e?': 'e', 'eB': 'e', 'eH': 'f', 'eI': 'd', 'eL': 'd', 'eb': 'e',
+        'ed': 'd', 'ee': 'e', 'ef': 'f', 'eh': 'f', 'ei': 'd', 'el': 'd',
+        'f?': 'f', 'fB': 'f', 'fH': 'f', 'fI': 'd', 'fL': 'd', 'fb': 'f',
+        'fd': 'd', 'fe': 'f', 'ff': 'f', 'fh': 'f', 'fi': 'd', 'fl': 'd',
+        'h?': 'h', 'hB': 'h', 'hH': 'i', 'hI': 'l', 'hL': 'd', 'hb': 'h',
+        'hd': 'd', 'he': 'f', 'hf': 'f', 'hh': 'h', 'hi': 'i', 'hl': 'l',
+        'i?': 'i', 'iB': 'i', 'iH': 'i', 'iI': 'l', 'iL': 'd', 'ib': 'i',
+        'id': 'd', 'ie': 'd', 'if': 'd', 'ih': 'i', 'ii': 'i', 'il': 'l',
+        'l?': 'l', 'lB': 'l', 'lH': 'l', 'lI': 'l', 'lL': 'd', 'lb': 'l',
+        'ld': 'd', 'le': 'd', 'lf': 'd', 'lh': 'l', 'li': 'l', 'll': 'l',
+    },
+    'frexp': {
+        '?': 'ei', 'B': 'ei', 'H': 'fi', 'I': 'di', 'L': 'di', 'b': 'ei',
+        'd': 'di', 'e': 'ei', 'f': 'fi', 'h': 'fi', 'i': 'di', 'l': 'di',
+    },
+    'gcd': {
+        '?B': 'B', '?H': 'H', '?I': 'I', '?L': 'L', '?b': 'b', '?h': 'h',
+        '?i': 'i', '?l': 'l', 'B?': 'B', 'BB': 'B', 'BH': 'H', 'BI': 'I',
+        'BL': 'L', 'Bb': 'h', 'Bh': 'h', 'Bi': 'i', 'Bl': 'l', 'H?': 'H',
+        'HB': 'H', 'HH': 'H', 'HI': 'I', 'HL': 'L', 'Hb': 'i', 'Hh': 'i',
+        'Hi': 'i', 'Hl': 'l', 'I?': 'I', 'IB': 'I', 'IH': 'I', 'II': 'I',
+        'IL': 'L', 'Ib': 'l', 'Ih': 'l', 'Ii': 'l', 'Il': 'l', 'L?': 'L',
+        'LB': 'L', 'LH': 'L', 'LI': 'L', 'LL': 'L', 'b?': 'b', 'bB': 'h',
+        'bH': 'i', 'bI': 'l', 'bb': 'b', 'bh': 'h', 'bi': 'i', 'bl': 'l',
+        'h?': 'h', 'hB': 'h', 'hH': 'i', 'hI': 'l', 'hb': 'h', 'hh': 'h',
+        'hi': 'i', 'hl': 'l', 'i?': 'i', 'iB': 'i', 'iH': 'i', 'iI': 'l',
+        'ib': 'i', 'ih': 'i', 'ii': 'i', 'il': 'l', 'l?': 'l', 'lB': 'l',
+        'lH': 'l', 'lI': 'l', 'lb': 'l', 'lh': 'l', 'li': 'l', 'll': 'l',
+    },
+    'greater': {
+        '??': '?', '?B': '?', '?H': '?', '?I': '?', '?L': '?', '?b': '?',
+        '?d': '?', '?e': '?', '?f': '?', '?h': '?', '?i': '?', '?l': '?',
+        'B?': '?', 'BB': '?', 'BH': '?', 'BI': '?', 'BL': '?', 'Bb': '?',
+        'Bd': '?', 'Be': '?', 'Bf': '?', 'Bh': '?', 'Bi': '?', 'Bl': '?',
+        'H?': '?', 'HB': '?', 'HH': '?', 'HI': '?', 'HL': '?', 'Hb': '?',
+        'Hd': '?', 'He': '?', 'Hf': '?', 'Hh': '?', 'Hi': '?', 'Hl': '?',
+        'I?': '?', 'IB': '?', 'IH': '?', 'II': '?', 'IL': '?', 'Ib': '?',
+        'Id': '?', 'Ie': '?', 'If': '?', 'Ih': '?', 'Ii': '?', 'Il': '?',
+        'L?': '?', 'LB': '?', 'LH': '?', 'LI': '?', 'LL': '?', 'Lb': '?',
+        'Ld': '?', 'Le': '?', 'Lf': '?', 'Lh': '?', 'Li': '?', 'Ll': '?',
+        'b?': '?', 'bB': '?', 'bH': '?', 'bI': '?', 'bL': '?', 'bb': '?',
+        'bd': '?', 'be': '?', 'bf': '?', 'bh': '?', 'bi': '?', 'bl': '?',
+        'd?': '?', 'dB': '?', 'dH': '?', 'dI': '?', 'dL': '?', 'db': '?',
+        'dd': '?', 'de': '?', 'df': '?', 'dh': '?', 'di': '?', 'dl': '?',
+        'e?': '?', 'eB': '?', 'eH': '?', 'eI': '?', 'eL': '?', 'eb': '?',
+        'ed': '?', 'ee': '?', 'ef': '?', 'eh': '?', 'ei': '?', 'el': '?',
+        'f?': '?', 'fB': '?', 'fH': '?', 'fI': '?', 'fL': '?', 'fb': '?',
+        'fd': '?', 'fe': '?', 'ff': '?', 'fh': '?', 'fi': '?', 'fl': '?',
+        'h?': '?', 'hB': '?', 'hH': '?', 'hI': '?', 'hL': '?', 'hb': '?',
+        'hd': '?', 'he': '?', 'hf': '?', 'hh': '?', 'hi': '?', 'hl': '?',
+        'i?': '?', 'iB': '?', 'iH': '?', 'iI': '?', 'iL': '?', 'ib': '?',
+        'id': '?', 'ie': '?', 'if': '?', 'ih': '?', 'ii': '?', 'il': '?',
+        'l?': '?', 'lB': '?', 'lH': '?', 'lI': '?', 'lL': '?', 'lb': '?',
+        'ld': '?', 'le': '?', 'lf': '?', 'lh': '?', 'li': '?', 'll': '?',
+    },
+    'greater_equal': {
+        '??': '?', '?B': '?', '?H': '?', '?I': '?', '?L': '?', '?b': '?',
+        '?d': '?', '?e': '?', '?f': '?', '?h': '?', '?i': '?', '?l': '?',
+        'B?': '?', 'BB': '?', 'BH': '?', 'BI': '?', 'BL': '?', 'Bb': '?',
+        'Bd': '?', 'Be': '?', 'Bf': '?', 'Bh': '?', 'Bi': '?', 'Bl': '?',
+        'H?': '?', 'HB': '?', 'HH': '?', 'HI': '?', 'HL': '?', 'Hb': '?',
+        'Hd': '?', 'He': '?', 'Hf': '?', 'Hh': '?', 'Hi': '?', 'Hl': '?',
+        'I?': '?', 'IB': '?', 'IH': '?', 'II': '?', 'IL': '?', 'Ib': '?',
+        'Id': '?', 'Ie': '?', 'If': '?', 'Ih': '?', 'Ii': '?', 'Il': '?',
+        'L?': '?', 'LB': '?', 'LH': '?', 'LI': '?', 'LL': '?', 'Lb': '?',
+        'Ld': '?', 'Le': '?', 'Lf': '?', 'Lh': '?', 'Li': '?', 'Ll': '?',
+        'b?': '?', 'bB': '?', 'bH': '?', 'bI': '?', 'bL': '?', 'bb': '?',
+        'bd': '?', 'be': '?', 'bf': '?', 'bh': '?', 'bi': '?', 'bl': '?',
+        'd?': '?', 'dB': '?', 'dH': '?', 'dI': '?', 'dL': '?', 'db': '?',
+        'dd': '?', 'de': '?', 'df': '?', 'dh': '?', 'di': '?', 'dl': '?',
+        'e?': '?', 'eB': '?', 'eH': '?', 'eI': '?', 'eL': '?', 'eb': '?',
+        'ed': '?', 'ee': '?', 'ef': '?', 'eh': '?', 'ei': '?', 'el': '?',
+        'f?': '?', 'fB': '?', 'fH': '?', 'fI': '?', 'fL': '?', 'fb': '?',
+        'fd': '?', 'fe': '?', 'ff': '?', 'fh': '?', 'fi': '?', 'fl': '?',
+        'h?': '?', 'hB': '?', 'hH': '?', 'hI': '?', 'hL': '?', 'hb': '?',
+        'hd': '?', 'he': '?', 'hf': '?', 'hh': '?', 'hi': '?', 'hl': '?',
+        'i?': '?', 'iB': '?', 'iH': '?', 'iI': '?', 'iL': '?', 'ib': '?',
+        'id': '?', 'ie': '?', 'if': '?', 'ih': '?', 'ii': '?', 'il': '?',
+        'l?': '?', 'lB': '?', 'lH': '?', 'lI': '?', 'lL': '?', 'lb': '?',
+        'ld': '?', 'le': '?', 'lf': '?', 'lh': '?', 'li': '?', 'll': '?',
+    },
+    'heaviside': {
+        '??': 'e', '?B': 'e', '?H': 'f', '?I': 'd', '?L': 'd', '?b': 'e',
+        '?d': 'd', '?e': 'e', '?f': 'f', '?h': 'f', '?i': 'd', '?l': 'd',
+        'B?': 'e', 'BB': 'e', 'BH': 'f', 'BI': 'd', 'BL': 'd', 'Bb': 'e',
+        'Bd': 'd', 'Be': 'e', 'Bf': 'f', 'Bh': 'f', 'Bi': 'd', 'Bl': 'd',
+        'H?': 'f', 'HB': 'f', 'HH': 'f', 'HI': 'd', 'HL': 'd', 'Hb': 'f',
+        'Hd': 'd', 'He': 'f', 'Hf': 'f', 'Hh': 'f', 'Hi': 'd', 'Hl': 'd',
+        'I?': 'd', 'IB': 'd', 'IH': 'd', 'II': 'd', 'IL': 'd', 'Ib': 'd',
+        'Id': 'd', 'Ie': 'd', 'If': 'd', 'Ih': 'd', 'Ii': 'd', 'Il': 'd',
+        'L?': 'd', 'LB': 'd', 'LH': 'd', 'LI': 'd', 'LL': 'd', 'Lb': 'd',
+        'Ld': 'd', 'Le': 'd', 'Lf': 'd', 'Lh': 'd', 'Li': 'd', 'Ll': 'd',
+        'b?': 'e', 'bB': 'e', 'bH': 'f', 'bI': 'd', 'bL': 'd', 'bb': 'e',
+        'bd': 'd', 'be': 'e', 'bf': 'f', 'bh': 'f', 'bi': 'd', 'bl': 'd',
+        'd?': 'd', 'dB': 'd', 'dH': 'd', 'dI': 'd', 'dL': 'd', 'db': 'd',
+        'dd': 'd', 'de': 'd', 'df': 'd', 'dh': 'd', 'di': 'd', 'dl': 'd',
+        'e?': 'e', 'eB': 'e', 'eH': 'f', 'eI': 'd', 'eL': 'd', 'eb': 'e',
+        'ed': 'd', 'ee': 'e', 'ef': 'f', 'eh': 'f', 'ei': 'd', 'el': 'd',
+        'f?': 'f', 'fB': 'f', 'fH': 'f', 'fI': 'd', 'fL': 'd', 'fb': 'f',
+        'fd': 'd', 'fe': 'f', 'ff': 'f', 'fh': 'f', 'fi': 'd', 'fl': 'd',
+        'h?': 'f', 'hB': 'f', 'hH': 'f', 'hI': 'd', 'hL': 'd', 'hb': 'f',
+        'hd': 'd', 'he': 'f', 'hf': 'f', 'hh': 'f', 'hi': 'd', 'hl': 'd',
+        'i?': 'd', 'iB': 'd', 'iH': 'd', 'iI': 'd', 'iL': 'd', 'ib': 'd',
+        'id': 'd', 'ie': 'd', 'if': 'd', 'ih': 'd', 'ii': 'd', 'il': 'd',
+        'l?': 'd', 'lB': 'd', 'lH': 'd', 'lI': 'd', 'lL': 'd', 'lb': 'd',
+        'ld': 'd', 'le': 'd', 'lf': 'd', 'lh': 'd', 'li': 'd', 'll': 'd',
+    },
+    'hypot': {
+        '??': 'e', '?B': 'e', '?H': 'f', '?I': 'd', '?L': 'd', '?b': 'e',
+        '?d': 'd', '?e': 'e', '?f': 'f', '?h': 'f', '?i': 'd', '?l': 'd',
+        'B?': 'e', 'BB': 'e', 'BH': 'f', 'BI': 'd', 'BL': 'd', 'Bb': 'e',
+        'Bd': 'd', 'Be': 'e', 'Bf': 'f', 'Bh': 'f', 'Bi': 'd', 'Bl': 'd',
+        'H?': 'f', 'HB': 'f', 'HH': 'f', 'HI': 'd', 'HL': 'd', 'Hb': 'f',
+        'Hd': 'd', 'He': 'f', 'Hf': 'f', 'Hh': 'f', 'Hi': 'd', 'Hl': 'd',
+        'I?': 'd', 'IB': 'd', 'IH': 'd', 'II': 'd', 'IL': 'd', 'Ib': 'd',
+        'Id': 'd', 'Ie': 'd', 'If': 'd', 'Ih': 'd', 'Ii': 'd', 'Il': 'd',
+        'L?': 'd', 'LB': 'd', 'LH': 'd', 'LI': 'd', 'LL': 'd', 'Lb': 'd',
+        'Ld': 'd', 'Le': 'd', 'Lf': 'd', 'Lh': 'd', 'Li': 'd', 'Ll': 'd',
+        'b?': 'e', 'bB': 'e', 'bH': 'f', 'bI': 'd', 'bL': 'd', 'bb': 'e',
+        'bd': 'd', 'be': 'e', 'bf': 'f', 'bh': 'f', 'bi': 'd', 'bl': 'd',
+        'd?': 'd', 'dB': 'd', 'dH': 'd', 'dI': 'd', 'dL': 'd', 'db': 'd',
+        'dd': 'd', 'de': 'd', 'df': 'd', 'dh': 'd', 'di': 'd', 'dl': 'd',
+        'e?': 'e', 'eB': 'e', 'eH': 'f', 'eI': 'd', 'eL': 'd', 'eb': 'e',
+        'ed': 'd', 'ee': 'e', 'ef': 'f', 'eh': 'f', 'ei': 'd', 'el': 'd',
+        'f?': 'f', 'fB': 'f', 'fH': 'f', 'fI': 'd', 'fL': 'd', 'fb': 'f',
+        'fd': 'd', 'fe': 'f', 'ff': 'f', 'fh': 'f', 'fi': 'd', 'fl': 'd',
+        'h?': 'f', 'hB': 'f', 'hH': 'f', 'hI': 'd', 'hL': 'd', 'hb': 'f',
+        'hd': 'd', 'he': 'f', 'hf': 'f', 'hh': 'f', 'hi': 'd', 'hl': 'd',
+        'i?': 'd', 'iB': 'd', 'iH': 'd', 'iI': 'd', 'iL': 'd', 'ib': 'd',
+        'id': 'd', 'ie': 'd', 'if': 'd', 'ih': 'd', 'ii': 'd', 'il': 'd',
+        'l?': 'd', 'lB': 'd', 'lH': 'd', 'lI': 'd', 'lL': 'd', 'lb': 'd',
+        'ld': 'd', 'le': 'd', 'lf': 'd', 'lh': 'd', 'li': 'd', 'll': 'd',
+    },
+    'invert': {
+        '?': '?', 'B': 'B', 'H': 'H', 'I': 'I', 'L': 'L', 'b': 'b', 'h': 'h',
+        'i': 'i', 'l': 'l',
+    },
+    'isfinite': {
+        '?': '?', 'B': '?', 'H': '?', 'I': '?', 'L': '?', 'b': '?', 'd': '?',
+        'e': '?', 'f': '?', 'h': '?', 'i': '?', 'l': '?',
+    },
+    'isinf': {
+        '?': '?', 'B': '?', 'H': '?', 'I': '?', 'L': '?', 'b': '?', 'd': '?',
+        'e': '?', 'f': '?', 'h': '?', 'i': '?', 'l': '?',
+    },
+    'isnan': {
+        '?': '?', 'B': '?', 'H': '?', 'I': '?', 'L': '?', 'b': '?', 'd': '?',
+        'e': '?', 'f': '?', 'h': '?', 'i': '?', 'l': '?',
+    },
+    'isnat': {},
+    'lcm': {
+        '?B': 'B', '?H': 'H', '?I': 'I', '?L': 'L', '?b': 'b', '?h': 'h',
+        '?i': 'i', '?l': 'l', 'B?': 'B', 'BB': 'B', 'BH': 'H', 'BI': 'I',
+        'BL': 'L', 'Bb': 'h', 'Bh': 'h', 'Bi': 'i', 'Bl': 'l', 'H?': 'H',
+        'HB': 'H', 'HH': 'H', 'HI': 'I', 'HL': 'L', 'Hb': 'i', 'Hh': 'i',
+        'Hi': 'i', 'Hl': 'l', 'I?': 'I', 'IB': 'I', 'IH': 'I', 'II': 'I',
+        'IL': 'L', 'Ib': 'l', 'Ih': 'l', 'Ii': 'l', 'Il': 'l', 'L?': 'L',
+        'LB': 'L', 'LH': 'L', 'LI': 'L', 'LL': 'L', 'b?': 'b', 'bB': 'h',
+        'bH': 'i', 'bI': 'l', 'bb': 'b', 'bh': 'h', 'bi': 'i', 'bl': 'l',
+        'h?': 'h', 'hB': 'h', 'hH': 'i', 'hI': 'l', 'hb': 'h', 'hh': 'h',
+        'hi': 'i', 'hl': 'l', 'i?': 'i', 'iB': 'i', 'iH': 'i', 'iI': 'l',
+        'ib': 'i', 'ih': 'i', 'ii': 'i', 'il': 'l', 'l?': 'l', 'lB': 'l',
+        'lH': 'l', 'lI': 'l', 'lb': 'l', 'lh': 'l', 'li': 'l', 'll': 'l',
+    },
+    'ldexp': {
+        '??': 'e', '?B': 'e', '?H': 'e', '?I': 'e', '?b': 'e', '?h': 'e',
+        '?i': 'e', '?l': 'e', 'B?': 'e', 'BB': 'e', 'BH': 'e', 'BI': 'e',
+        'Bb': 'e', 'Bh': 'e', 'Bi': 'e', 'Bl': 'e', 'H?': 'f', 'HB': 'f',
+        'HH': 'f', 'HI': 'f', 'Hb': 'f', 'Hh': 'f', 'Hi': 'f', 'Hl': 'f',
+        'I?': 'd', 'IB': 'd', 'IH': 'd', 'II': 'd', 'Ib': 'd', 'Ih': 'd',
+        'Ii': 'd', 'Il': 'd', 'L?': 'd', 'LB': 'd', 'LH': 'd', 'LI': 'd',
+        'Lb': 'd', 'Lh': 'd', 'Li': 'd', 'Ll': 'd', 'b?': 'e', 'bB': 'e',
+        'bH': 'e', 'bI': 'e', 'bb': 'e', 'bh': 'e', 'bi': 'e', 'bl': 'e',
+        'd?': 'd', 'dB': 'd', 'dH': 'd', 'dI': 'd', 'db': 'd', 'dh': 'd',
+        'di': 'd', 'dl': 'd', 'e?': 'e', 'eB': 'e', 'eH': 'e', 'eI': 'e',
+        'eb': 'e', 'eh': 'e', 'ei': 'e', 'el': 'e', 'f?': 'f', 'fB': 'f',
+        'fH': 'f', 'fI': 'f', 'fb': 'f', 'fh': 'f', 'fi': 'f', 'fl': 'f',
+        'h?': 'f', 'hB': 'f', 'hH': 'f', 'hI': 'f', 'hb': 'f', 'hh': 'f',
+        'hi': 'f', 'hl': 'f', 'i?': 'd', 'iB': 'd', 'iH': 'd', 'iI': 'd',
+        'ib': 'd', 'ih': 'd', 'ii': 'd', 'il': 'd', 'l?': 'd', 'lB': 'd',
+        'lH': 'd', 'lI': 'd', 'lb': 'd', 'lh': 'd', 'li': 'd', 'll': 'd',
+    },
+    'left_shift': {
+        '??': 'b', '?B': 'B', '?H': 'H', '?I': 'I', '?L': 'L', '?b': 'b',
+        '?h': 'h', '?i': 'i', '?l': 'l', 'B?': 'B', 'BB': 'B', 'BH': 'H',
+        'BI': 'I', 'BL': 'L', 'Bb': 'h', 'Bh': 'h', 'Bi': 'i', 'Bl': 'l',
+        'H?': 'H', 'HB': 'H', 'HH': 'H', 'HI': 'I', 'HL': 'L', 'Hb': 'i',
+        'Hh': 'i', 'Hi': 'i', 'Hl': 'l', 'I?': 'I', 'IB': 'I', 'IH': 'I',
+        'II': 'I', 'IL': 'L', 'Ib': 'l', 'Ih': 'l', 'Ii': 'l', 'Il': 'l',
+        'L?': 'L', 'LB': 'L', 'LH': 'L', 'LI': 'L', 'LL': 'L', 'b?': 'b',
+        'bB': 'h', 'bH': 'i', 'bI': 'l', 'bb': 'b', 'bh': 'h', 'bi': 'i',
+        'bl': 'l', 'h?': 'h', 'hB': 'h', 'hH': 'i', 'hI': 'l', 'hb': 'h',
+        'hh': 'h', 'hi': 'i', 'hl': 'l', 'i?': 'i', 'iB': 'i', 'iH': 'i',
+        'iI': 'l', 'ib': 'i', 'ih': 'i', 'ii': 'i', 'il': 'l', 'l?': 'l',
+        'lB': 'l', 'lH': 'l', 'lI': 'l', 'lb': 'l', 'lh': 'l', 'li': 'l',
+        'll': 'l',
+    },
+    'less': {
+        '??': '?', '?B': '?', '?H': '?', '?I': '?', '?L': '?', '?b': '?',
+        '?d': '?', '?e': '?', '?f': '?', '?h': '?', '?i': '?', '?l': '?',
+        'B?': '?', 'BB': '?', 'BH': '?', 'BI': '?', 'BL': '?', 'Bb': '?',
+        'Bd': '?', 'Be': '?', 'Bf': '?', 'Bh': '?', 'Bi': '?', 'Bl': '?',
+        'H?': '?', 'HB': '?', 'HH': '?', 'HI': '?', 'HL': '?', 'Hb': '?',
+        'Hd': '?', 'He': '?', 'Hf': '?', 'Hh': '?', 'Hi': '?', 'Hl': '?',
+        'I?': '?', 'IB': '?', 'IH': '?', 'II': '?', 'IL': '?', 'Ib': '?',
+        'Id': '?', 'Ie': '?', 'If': '?', 'Ih': '?', 'Ii': '?', 'Il': '?',
+        'L?': '?', 'LB': '?', 'LH': '?', 'LI': '?', 'LL': '?', 'Lb': '?',
+        'Ld': '?', 'Le': '?', 'Lf': '?', 'Lh': '?', 'Li': '?', 'Ll': '?',
+        'b?': '?', 'bB': '?', 'bH': '?', 'bI': '?', 'bL': '?', 'bb': '?',
+        'bd': '?', 'be': '?', 'bf': '?', 'bh': '?', 'bi': '?', 'bl': '?',
+        'd?': '?', 'dB': '?', 'dH': '?', 'dI': '?', 'dL': '?', 'db': '?',
+        'dd': '?', 'de': '?', 'df': '?', 'dh': '?', 'di': '?', 'dl': '?',
+        'e?': '?', 'eB': '?', 'eH': '?', 'eI': '?', 'eL': '?', 'eb': '?',
+        'ed': '?', 'ee': '?', 'ef': '?', 'eh': '?', 'ei': '?', 'el': '?',
+        'f?': '?', 'fB': '?', 'fH': '?', 'fI': '?', 'fL': '?', 'fb': '?',
+        'fd': '?', 'fe': '?', 'ff': '?', 'fh': '?', 'fi': '?', 'fl': '?',
+        'h?': '?', 'hB': '?', 'hH': '?', 'hI': '?', 'hL': '?', 'hb': '?',
+        'hd': '?', 'he': '?', 'hf': '?', 'hh': '?', 'hi': '?', 'hl': '?',
+        'i?': '?', 'iB': '?', 'iH': '?', 'iI': '?', 'iL': '?', 'ib': '?',
+        'id': '?', 'ie': '?', 'if': '?', 'ih': '?', 'ii': '?', 'il': '?',
+        'l?': '?', 'lB': '?', 'lH': '?', 'lI': '?', 'lL': '?', 'lb': '?',
+        'ld': '?', 'le': '?', 'lf': '?', 'lh': '?', 'li': '?', 'll': '?',
+    },
+    'less_equal': {
+        '??': '?', '?B': '?', '?H': '?', '?I': '?', '?L': '?', '?b': '?',
+        '?d': '?', '?e': '?', '?f': '?', '?h': '?', '?i': '?', '?l': '?',
+        'B?': '?', 'BB': '?', 'BH': '?', 'BI': '?', 'BL': '?', 'Bb': '?',
+        'Bd': '?', 'Be': '?', 'Bf': '?', 'Bh': '?', 'Bi': '?', 'Bl': '?',
+        'H?': '?', 'HB': '?', 'HH': '?', 'HI': '?', 'HL': '?', 'Hb': '?',
+        'Hd': '?', 'He': '?', 'Hf': '?', 'Hh': '?', 'Hi': '?', 'Hl': '?',
+        'I?': '?', 'IB': '?', 'IH': '?', 'II': '?', 'IL': '?', 'Ib': '?',
+        'Id': '?', 'Ie': '?', 'If': '?', 'Ih': '?', 'Ii': '?', 'Il': '?',
+        'L?': '?', 'LB': '?', 'LH': '?', 'LI': '?', 'LL': '?', 'Lb': '?',
+        'Ld': '?', 'Le': '?', 'Lf': '?', 'Lh': '?', 'Li': '?', 'Ll': '?',
+        'b?': '?', 'bB': '?', 'bH': '?', 'bI': '?', 'bL': '?', 'bb': '?',
+        'bd': '?', 'be': '?', 'bf': '?', 'bh': '?', 'bi': '?', 'bl': '?',
+        'd?': '?', 'dB': '?', 'dH': '?', 'dI': '?', 'dL': '?', 'db': '?',
+        'dd': '?', 'de': '?', 'df': '?', 'dh': '?', 'di': '?', 'dl': '?',
+        'e?': '?', 'eB': '?', 'eH': '?', 'eI': '?', 'eL': '?', 'eb': '?',
+        'ed': '?', 'ee': '?', 'ef': '?', 'eh': '?', 'ei': '?', 'el': '?',
+        'f?': '?', 'fB': '?', 'fH': '?', 'fI': '?', 'fL': '?', 'fb': '?',
+        'fd': '?', 'fe': '?', 'ff': '?', 'fh': '?', 'fi': '?', 'fl': '?',
+        'h?': '?', 'hB': '?', 'hH': '?', 'hI': '?', 'hL': '?', 'hb': '?',
+        'hd': '?', 'he': '?', 'hf': '?', 'hh': '?', 'hi': '?', 'hl': '?',
+        'i?': '?', 'iB': '?', 'iH': '?', 'iI': '?', 'iL': '?', 'ib': '?',
+        'id': '?', 'ie': '?', 'if': '?', 'ih': '?', 'ii': '?', 'il': '?',
+        'l?': '?', 'lB': '?', 'lH': '?', 'lI': '?', 'lL': '?', 'lb': '?',
+        'ld': '?', 'le': '?', 'lf': '?', 'lh': '?', 'li': '?', 'll': '?',
+    },
+    'log': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'log10': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'log1p': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'log2': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'logaddexp': {
+        '??': 'e', '?B': 'e', '?H': 'f', '?I': 'd', '?L': 'd', '?b': 'e',
+        '?d': 'd', '?e': 'e', '?f': 'f', '?h': 'f', '?i': 'd', '?l': 'd',
+        'B?': 'e', 'BB': 'e', 'BH': 'f', 'BI': 'd', 'BL': 'd', 'Bb': 'e',
+        'Bd': 'd', 'Be': 'e', 'Bf': 'f', 'Bh': 'f', 'Bi': 'd', 'Bl': 'd',
+        'H?': 'f', 'HB': 'f', 'HH': 'f', 'HI': 'd', 'HL': 'd', 'Hb': 'f',
+        'Hd': 'd', 'He': 'f', 'Hf': 'f', 'Hh': 'f', 'Hi': 'd', 'Hl': 'd',
+        'I?': 'd', 'IB': 'd', 'IH': 'd', 'II': 'd', 'IL': 'd', 'Ib': 'd',
+        'Id': 'd', 'Ie': 'd', 'If': 'd', 'Ih': 'd', 'Ii': 'd', 'Il': 'd',
+        'L?': 'd', 'LB': 'd', 'LH': 'd', 'LI': 'd', 'LL': 'd', 'Lb': 'd',
+        'Ld': 'd', 'Le': 'd', 'Lf': 'd', 'Lh': 'd', 'Li': 'd', 'Ll': 'd',
+        'b?': 'e', 'bB': 'e', 'bH': 'f', 'bI': 'd', 'bL': 'd', 'bb': 'e',
+        'bd': 'd', 'be': 'e', 'bf': 'f', 'bh': 'f', 'bi': 'd', 'bl': 'd',
+        'd?': 'd', 'dB': 'd', 'dH': 'd', 'dI': 'd', 'dL': 'd', 'db': 'd',
+        'dd': 'd', 'de': 'd', 'df': 'd', 'dh': 'd', 'di': 'd', 'dl': 'd',
+        'e?': 'e', 'eB': 'e', 'eH': 'f', 'eI': 'd', 'eL': 'd', 'eb': 'e',
+        'ed': 'd', 'ee': 'e', 'ef': 'f', 'eh': 'f', 'ei': 'd', 'el': 'd',
+        'f?': 'f', 'fB': 'f', 'fH': 'f', 'fI': 'd', 'fL': 'd', 'fb': 'f',
+        'fd': 'd', 'fe': 'f', 'ff': 'f', 'fh': 'f', 'fi': 'd', 'fl': 'd',
+        'h?': 'f', 'hB': 'f', 'hH': 'f', 'hI': 'd', 'hL': 'd', 'hb': 'f',
+        'hd': 'd', 'he': 'f', 'hf': 'f', 'hh': 'f', 'hi': 'd', 'hl': 'd',
+        'i?': 'd', 'iB': 'd', 'iH': 'd', 'iI': 'd', 'iL': 'd', 'ib': 'd',
+        'id': 'd', 'ie': 'd', 'if': 'd', 'ih': 'd', 'ii': 'd', 'il': 'd',
+        'l?': 'd', 'lB': 'd', 'lH': 'd', 'lI': 'd', 'lL': 'd', 'lb': 'd',
+        'ld': 'd', 'le': 'd', 'lf': 'd', 'lh': 'd', 'li': 'd', 'll': 'd',
+    },
+    'logaddexp2': {
+        '??': 'e', '?B': 'e', '?H': 'f', '?I': 'd', '?L': 'd', '?b': 'e',
+        '?d': 'd', '?e': 'e', '?f': 'f', '?h': 'f', '?i': 'd', '?l': 'd',
+        'B?': 'e', 'BB': 'e', 'BH': 'f', 'BI': 'd', 'BL': 'd', 'Bb': 'e',
+        'Bd': 'd', 'Be': 'e', 'Bf': 'f', 'Bh': 'f', 'Bi': 'd', 'Bl': 'd',
+        'H?': 'f', 'HB': 'f', 'HH': 'f', 'HI': 'd', 'HL': 'd', 'Hb': 'f',
+        'Hd': 'd', 'He': 'f', 'Hf': 'f', 'Hh': 'f', 'Hi': 'd', 'Hl': 'd',
+        'I?': 'd', 'IB': 'd', 'IH': 'd', 'II': 'd', 'IL': 'd', 'Ib': 'd',
+        'Id': 'd', 'Ie': 'd', 'If': 'd', 'Ih': 'd', 'Ii': 'd', 'Il': 'd',
+        'L?': 'd', 'LB': 'd', 'LH': 'd', 'LI': 'd', 'LL': 'd', 'Lb': 'd',
+        'Ld': 'd', 'Le': 'd', 'Lf': 'd', 'Lh': 'd', 'Li': 'd', 'Ll': 'd',
+        'b?': 'e', 'bB': 'e', 'bH': 'f', 'bI': 'd', 'bL': 'd', 'bb': 'e',
+        'bd': 'd', 'be': 'e', 'bf': 'f', 'bh': 'f', 'bi': 'd', 'bl': 'd',
+        'd?': 'd', 'dB': 'd', 'dH': 'd', 'dI': 'd', 'dL': 'd', 'db': 'd',
+        'dd': 'd', 'de': 'd', 'df': 'd', 'dh': 'd', 'di': 'd', 'dl': 'd',
+        'e?': 'e', 'eB': 'e', 'eH': 'f', 'eI': 'd', 'eL': 'd', 'eb': 'e',
+        'ed': 'd', 'ee': 'e', 'ef': 'f', 'eh': 'f', 'ei': 'd', 'el': 'd',
+        'f?': 'f', 'fB': 'f', 'fH': 'f', 'fI': 'd', 'fL': 'd', 'fb': 'f',
+        'fd': 'd', 'fe': 'f', 'ff': 'f', 'fh': 'f', 'fi': 'd', 'fl': 'd',
+        'h?': 'f', 'hB': 'f', 'hH': 'f', 'hI': 'd', 'hL': 'd', 'hb': 'f',
+        'hd': 'd', 'he': 'f', 'hf': 'f', 'hh': 'f', 'hi': 'd', 'hl': 'd',
+        'i?': 'd', 'iB': 'd', 'iH': 'd', 'iI': 'd', 'iL': 'd', 'ib': 'd',
+        'id': 'd', 'ie': 'd', 'if': 'd', 'ih': 'd', 'ii': 'd', 'il': 'd',
+        'l?': 'd', 'lB': 'd', 'lH': 'd', 'lI': 'd', 'lL': 'd', 'lb': 'd',
+        'ld': 'd', 'le': 'd', 'lf': 'd', 'lh': 'd', 'li': 'd', 'll': 'd',
+    },
+    'logical_and': {
+        '??': '?', '?B': '?', '?H': '?', '?I': '?', '?L': '?', '?b': '?',
+        '?d': '?', '?e': '?', '?f': '?', '?h': '?', '?i': '?', '?l': '?',
+        'B?': '?', 'BB': '?', 'BH': '?', 'BI': '?', 'BL': '?', 'Bb': '?',
+        'Bd': '?', 'Be': '?', 'Bf': '?', 'Bh': '?', 'Bi': '?', 'Bl': '?',
+        'H?': '?', 'HB': '?', 'HH': '?', 'HI': '?', 'HL': '?', 'Hb': '?',
+        'Hd': '?', 'He': '?', 'Hf': '?', 'Hh': '?', 'Hi': '?', 'Hl': '?',
+        'I?': '?', 'IB': '?', 'IH': '?', 'II': '?', 'IL': '?', 'Ib': '?',
+        'Id': '?', 'Ie': '?', 'If': '?', 'Ih': '?', 'Ii': '?', 'Il': '?',
+        'L?': '?', 'LB': '?', 'LH': '?', 'LI': '?', 'LL': '?', 'Lb': '?',
+        'Ld': '?', 'Le': '?', 'Lf': '?', 'Lh': '?', 'Li': '?', 'Ll': '?',
+        'b?': '?', 'bB': '?', 'bH': '?', 'bI': '?', 'bL': '?', 'bb': '?',
+        'bd': '?', 'be': '?', 'bf': '?', 'bh': '?', 'bi': '?', 'bl': '?',
+        'd?': '?', 'dB': '?', 'dH': '?', 'dI': '?', 'dL': '?', 'db': '?',
+        'dd': '?', 'de': '?', 'df': '?', 'dh': '?', 'di': '?', 'dl': '?',
+        'e?': '?', 'eB': '?', 'eH': '?', 'eI': '?', 'eL': '?', 'eb': '?',
+        'ed': '?', 'ee': '?', 'ef': '?', 'eh': '?', 'ei': '?', 'el': '?',
+        'f?': '?', 'fB': '?', 'fH': '?', 'fI': '?', 'fL': '?', 'fb': '?',
+        'fd': '?', 'fe': '?', 'ff': '?', 'fh': '?', 'fi': '?', 'fl': '?',
+        'h?': '?', 'hB': '?', 'hH': '?', 'hI': '?', 'hL': '?', 'hb': '?',
+        'hd': '?', 'he': '?', 'hf': '?', 'hh': '?', 'hi': '?', 'hl': '?',
+        'i?': '?', 'iB': '?', 'iH': '?', 'iI': '?', 'iL': '?', 'ib': '?',
+        'id': '?', 'ie': '?', 'if': '?', 'ih': '?', 'ii': '?', 'il': '?',
+        'l?': '?', 'lB': '?', 'lH': '?', 'lI': '?', 'lL': '?', 'lb': '?',
+        'ld': '?', 'le': '?', 'lf': '?', 'lh': '?', 'li': '?', 'll': '?',
+    },
+    'logical_not': {
+        '?': '?', 'B': '?', 'H': '?', 'I': '?', 'L': '?', 'b': '?', 'd': '?',
+        'e': '?', 'f': '?', 'h': '?', 'i': '?', 'l': '?',
+    },
+    'logical_or': {
+        '??': '?', '?B': '?', '?H': '?', '?I': '?', '?L': '?', '?b': '?',
+        '?d': '?', '?e': '?', '?f': '?', '?h': '?', '?i': '?', '?l': '?',
+        'B?': '?', 'BB': '?', 'BH': '?', 'BI': '?', 'BL': '?', 'Bb': '?',
+        'Bd': '?', 'Be': '?', 'Bf': '?', 'Bh': '?', 'Bi': '?', 'Bl': '?',
+        'H?': '?', 'HB': '?', 'HH': '?', 'HI': '?', 'HL': '?', 'Hb': '?',
+        'Hd': '?', 'He': '?', 'Hf': '?', 'Hh': '?', 'Hi': '?', 'Hl': '?',
+        'I?': '?', 'IB': '?', 'IH': '?', 'II': '?', 'IL': '?', 'Ib': '?',
+        'Id': '?', 'Ie': '?', 'If': '?', 'Ih': '?', 'Ii': '?', 'Il': '?',
+        'L?': '?', 'LB': '?', 'LH': '?', 'LI': '?', 'LL': '?', 'Lb': '?',
+        'Ld': '?', 'Le': '?', 'Lf': '?', 'Lh': '?', 'Li': '?', 'Ll': '?',
+        'b?': '?', 'bB': '?', 'bH': '?', 'bI': '?', 'bL': '?', 'bb': '?',
+        'bd': '?', 'be': '?', 'bf': '?', 'bh': '?', 'bi': '?', 'bl': '?',
+        'd?': '?', 'dB': '?', 'dH': '?', 'dI': '?', 'dL': '?', 'db': '?',
+        'dd': '?', 'de': '?', 'df': '?', 'dh': '?', 'di': '?', 'dl': '?',
+        'e?': '?', 'eB': '?', 'eH': '?', 'eI': '?', 'eL': '?', 'eb': '?',
+        'ed': '?', 'ee': '?', 'ef': '?', 'eh': '?', 'ei': '?', 'el': '?',
+        'f?': '?', 'fB': '?', 'fH': '?', 'fI': '?', 'fL': '?', 'fb': '?',
+        'fd': '?', 'fe': '?', 'ff': '?', 'fh': '?', 'fi': '?', 'fl': '?',
+        'h?': '?', 'hB': '?', 'hH': '?', 'hI': '?', 'hL': '?', 'hb': '?',
+        'hd': '?', 'he': '?', 'hf': '?', 'hh': '?', 'hi': '?', 'hl': '?',
+        'i?': '?', 'iB': '?', 'iH': '?', 'iI': '?', 'iL': '?', 'ib': '?',
+        'id': '?', 'ie': '?', 'if': '?', 'ih': '?', 'ii': '?', 'il': '?',
+        'l?': '?', 'lB': '?', 'lH': '?', 'lI': '?', 'lL': '?', 'lb': '?',
+        'ld': '?', 'le': '?', 'lf': '?', 'lh': '?', 'li': '?', 'll': '?',
+    },
+    'logical_xor': {
+        '??': '?', '?B': '?', '?H': '?', '?I': '?', '?L': '?', '?b': '?',
+        '?d': '?', '?e': '?', '?f': '?', '?h': '?', '?i': '?', '?l': '?',
+        'B?': '?', 'BB': '?', 'BH': '?', 'BI': '?', 'BL': '?', 'Bb': '?',
+        'Bd': '?', 'Be': '?', 'Bf': '?', 'Bh': '?', 'Bi': '?', 'Bl': '?',
+        'H?': '?', 'HB': '?', 'HH': '?', 'HI': '?', 'HL': '?', 'Hb': '?',
+        'Hd': '?', 'He': '?', 'Hf': '?', 'Hh': '?', 'Hi': '?', 'Hl': '?',
+        'I?': '?', 'IB': '?', 'IH': '?', 'II': '?', 'IL': '?', 'Ib': '?',
+        'Id': '?', 'Ie': '?', 'If': '?', 'Ih': '?', 'Ii': '?', 'Il': '?',
+        'L?': '?', 'LB': '?', 'LH': '?', 'LI': '?', 'LL': '?', 'Lb': '?',
+        'Ld': '?', 'Le': '?', 'Lf': '?', 'Lh': '?', 'Li': '?', 'Ll': '?',
+        'b?': '?', 'bB': '?', 'bH': '?', 'bI': '?', 'bL': '?', 'bb': '?',
+        'bd': '?', 'be': '?', 'bf': '?', 'bh': '?', 'bi': '?', 'bl': '?',
+        'd?': '?', 'dB': '?', 'dH': '?', 'dI': '?', 'dL': '?', 'db': '?',
+        'dd': '?', 'de': '?', 'df': '?', 'dh': '?', 'di': '?', 'dl': '?',
+        'e?': '?', 'eB': '?', 'eH': '?', 'eI': '?', 'eL': '?', 'eb': '?',
+        'ed': '?', 'ee': '?', 'ef': '?', 'eh': '?', 'ei': '?', 'el': '?',
+        'f?': '?', 'fB': '?', 'fH': '?', 'fI': '?', 'fL': '?', 'fb': '?',
+        'fd': '?', 'fe': '?', 'ff': '?', 'fh': '?', 'fi': '?', 'fl': '?',
+        'h?': '?', 'hB': '?', 'hH': '?', 'hI': '?', 'hL': '?', 'hb': '?',
+        'hd': '?', 'he': '?', 'hf': '?', 'hh': '?', 'hi': '?', 'hl': '?',
+        'i?': '?', 'iB': '?', 'iH': '?', 'iI': '?', 'iL': '?', 'ib': '?',
+        'id': '?', 'ie': '?', 'if': '?', 'ih': '?', 'ii': '?', 'il': '?',
+        'l?': '?', 'lB': '?', 'lH': '?', 'lI': '?', 'lL': '?', 'lb': '?',
+        'ld': '?', 'le': '?', 'lf': '?', 'lh': '?', 'li': '?', 'll': '?',
+    },
+    'matmul': {
+        '??': '?', '?B': 'B', '?H': 'H', '?I': 'I', '?L': 'L', '?b': 'b',
+        '?d': 'd', '?e': 'e', '?f': 'f', '?h': 'h', '?i': 'i', '?l': 'l',
+        'B?': 'B', 'BB': 'B', 'BH': 'H', 'BI': 'I', 'BL': 'L', 'Bb': 'h',
+        'Bd': 'd', 'Be': 'e', 'Bf': 'f', 'Bh': 'h', 'Bi': 'i', 'Bl': 'l',
+        'H?': 'H', 'HB': 'H', 'HH': 'H', 'HI': 'I', 'HL': 'L', 'Hb': 'i',
+        'Hd': 'd', 'He': 'f', 'Hf': 'f', 'Hh': 'i', 'Hi': 'i', 'Hl': 'l',
+        'I?': 'I', 'IB': 'I', 'IH': 'I', 'II': 'I', 'IL': 'L', 'Ib': 'l',
+        'Id': 'd', 'Ie': 'd', 'If': 'd', 'Ih': 'l', 'Ii': 'l', 'Il': 'l',
+        'L?': 'L', 'LB': 'L', 'LH': 'L', 'LI': 'L', 'LL': 'L', 'Lb': 'd',
+        'Ld': 'd', 'Le': 'd', 'Lf': 'd', 'Lh': 'd', 'Li': 'd', 'Ll': 'd',
+        'b?': 'b', 'bB': 'h', 'bH': 'i', 'bI': 'l', 'bL': 'd', 'bb': 'b',
+        'bd': 'd', 'be': 'e', 'bf': 'f', 'bh': 'h', 'bi': 'i', 'bl': 'l',
+        'd?': 'd', 'dB': 'd', 'dH': 'd', 'dI': 'd', 'dL': 'd', 'db': 'd',
+        'dd': 'd', 'de': 'd', 'df': 'd', 'dh': 'd', 'di': 'd', 'dl': 'd',
+        'e?': 'e', 'eB': 'e', 'eH': 'f', 'eI': 'd', 'eL': 'd', 'eb': 'e',
+        'ed': 'd', 'ee': 'e', 'ef': 'f', 'eh': 'f', 'ei': 'd', 'el': 'd',
+        'f?': 'f', 'fB': 'f', 'fH': 'f', 'fI': 'd', 'fL': 'd', 'fb': 'f',
+        'fd': 'd', 'fe': 'f', 'ff': 'f', 'fh': 'f', 'fi': 'd', 'fl': 'd',
+        'h?': 'h', 'hB': 'h', 'hH': 'i', 'hI': 'l', 'hL': 'd', 'hb': 'h',
+        'hd': 'd', 'he': 'f', 'hf': 'f', 'hh': 'h', 'hi': 'i', 'hl': 'l',
+        'i?': 'i', 'iB': 'i', 'iH': 'i', 'iI': 'l', 'iL': 'd', 'ib': 'i',
+        'id': 'd', 'ie': 'd', 'if': 'd', 'ih': 'i', 'ii': 'i', 'il': 'l',
+        'l?': 'l', 'lB': 'l', 'lH': 'l', 'lI': 'l', 'lL': 'd', 'lb': 'l',
+        'ld': 'd', 'le': 'd', 'lf': 'd', 'lh': 'l', 'li': 'l', 'll': 'l',
+    },
+    'maximum': {
+        '??': '?', '?B': 'B', '?H': 'H', '?I': 'I', '?L': 'L', '?b': 'b',
+        '?d': 'd', '?e': 'e', '?f': 'f', '?h': 'h', '?i': 'i', '?l': 'l',
+        'B?': 'B', 'BB': 'B', 'BH': 'H', 'BI': 'I', 'BL': 'L', 'Bb': 'h',
+        'Bd': 'd', 'Be': 'e', 'Bf': 'f', 'Bh': 'h', 'Bi': 'i', 'Bl': 'l',
+        'H?': 'H', 'HB': 'H', 'HH': 'H', 'HI': 'I', 'HL': 'L', 'Hb': 'i',
+        'Hd': 'd', 'He': 'f', 'Hf': 'f', 'Hh': 'i', 'Hi': 'i', 'Hl': 'l',
+        'I?': 'I', 'IB': 'I', 'IH': 'I', 'II': 'I', 'IL': 'L', 'Ib': 'l',
+        'Id': 'd', 'Ie': 'd', 'If': 'd', 'Ih': 'l', 'Ii': 'l', 'Il': 'l',
+        'L?': 'L', 'LB': 'L', 'LH': 'L', 'LI': 'L', 'LL': 'L', 'Lb': 'd',
+        'Ld': 'd', 'Le': 'd', 'Lf': 'd', 'Lh': 'd', 'Li': 'd', 'Ll': 'd',
+        'b?': 'b', 'bB': 'h', 'bH': 'i', 'bI': 'l', 'bL': 'd', 'bb': 'b',
+        'bd': 'd', 'be': 'e', 'bf': 'f', 'bh': 'h', 'bi': 'i', 'bl': 'l',
+        'd?': 'd', 'dB': 'd', 'dH': 'd', 'dI': 'd', 'dL': 'd', 'db': 'd',
+        'dd': 'd', 'de': 'd', 'df': 'd', 'dh': 'd', 'di': 'd', 'dl': 'd',
+        'e?': 'e', 'eB': 'e', 'eH': 'f', 'eI': 'd', 'eL': 'd', 'eb': 'e',
+        'ed': 'd', 'ee': 'e', 'ef': 'f', 'eh': 'f', 'ei': 'd', 'el': 'd',
+        'f?': 'f', 'fB': 'f', 'fH': 'f', 'fI': 'd', 'fL': 'd', 'fb': 'f',
+        'fd': 'd', 'fe': 'f', 'ff': 'f', 'fh': 'f', 'fi': 'd', 'fl': 'd',
+        'h?': 'h', 'hB': 'h', 'hH': 'i', 'hI': 'l', 'hL': 'd', 'hb': 'h',
+        'hd': 'd', 'he': 'f', 'hf': 'f', 'hh': 'h', 'hi': 'i', 'hl': 'l',
+        'i?': 'i', 'iB': 'i', 'iH': 'i', 'iI': 'l', 'iL': 'd', 'ib': 'i',
+        'id': 'd', 'ie': 'd', 'if': 'd', 'ih': 'i', 'ii': 'i', 'il': 'l',
+        'l?': 'l', 'lB': 'l', 'lH': 'l', 'lI': 'l', 'lL': 'd', 'lb': 'l',
+        'ld': 'd', 'le': 'd', 'lf': 'd', 'lh': 'l', 'li': 'l', 'll': 'l',
+    },
+    'minimum': {
+        '??': '?', '?B': 'B', '?H': 'H', '?I': 'I', '?L': 'L', '?b': 'b',
+        '?d': 'd', '?e': 'e', '?f': 'f', '?h': 'h', '?i': 'i', '?l': 'l',
+        'B?': 'B', 'BB': 'B', 'BH': 'H', 'BI': 'I', 'BL': 'L', 'Bb': 'h',
+        'Bd': 'd', 'Be': 'e', 'Bf': 'f', 'Bh': 'h', 'Bi': 'i', 'Bl': 'l',
+        'H?': 'H', 'HB': 'H', 'HH': 'H', 'HI': 'I', 'HL': 'L', 'Hb': 'i',
+        'Hd': 'd', 'He': 'f', 'Hf': 'f', 'Hh': 'i', 'Hi': 'i', 'Hl': 'l',
+        'I?': 'I', 'IB': 'I', 'IH': 'I', 'II': 'I', 'IL': 'L', 'Ib': 'l',
+        'Id': 'd', 'Ie': 'd', 'If': 'd', 'Ih': 'l', 'Ii': 'l', 'Il': 'l',
+        'L?': 'L', 'LB': 'L', 'LH': 'L', 'LI': 'L', 'LL': 'L', 'Lb': 'd',
+        'Ld': 'd', 'Le': 'd', 'Lf': 'd', 'Lh': 'd', 'Li': 'd', 'Ll': 'd',
+        'b?': 'b', 'bB': 'h', 'bH': 'i', 'bI': 'l', 'bL': 'd', 'bb': 'b',
+        'bd': 'd', 'be': 'e', 'bf': 'f', 'bh': 'h', 'bi': 'i', 'bl': 'l',
+        'd?': 'd', 'dB': 'd', 'dH': 'd', 'dI': 'd', 'dL': 'd', 'db': 'd',
+        'dd': 'd', 'de': 'd', 'df': 'd', 'dh': 'd', 'di': 'd', 'dl': 'd',
+        'e?': 'e', 'eB': 'e', 'eH': 'f', 'eI': 'd', 'eL': 'd', 'eb': 'e',
+        'ed': 'd', 'ee': 'e', 'ef': 'f', 'eh': 'f', 'ei': 'd', 'el': 'd',
+        'f?': 'f', 'fB': 'f', 'fH': 'f', 'fI': 'd', 'fL': 'd', 'fb': 'f',
+        'fd': 'd', 'fe': 'f', 'ff': 'f', 'fh': 'f', 'fi': 'd', 'fl': 'd',
+        'h?': 'h', 'hB': 'h', 'hH': 'i', 'hI': 'l', 'hL': 'd', 'hb': 'h',
+        'hd': 'd', 'he': 'f', 'hf': 'f', 'hh': 'h', 'hi': 'i', 'hl': 'l',
+        'i?': 'i', 'iB': 'i', 'iH': 'i', 'iI': 'l', 'iL': 'd', 'ib': 'i',
+        'id': 'd', 'ie': 'd', 'if': 'd', 'ih': 'i', 'ii': 'i', 'il': 'l',
+        'l?': 'l', 'lB': 'l', 'lH': 'l', 'lI': 'l', 'lL': 'd', 'lb': 'l',
+        'ld': 'd', 'le': 'd', 'lf': 'd', 'lh': 'l', 'li': 'l', 'll': 'l',
+    },
+    'modf': {
+        '?': 'ee', 'B': 'ee', 'H': 'ff', 'I': 'dd', 'L': 'dd', 'b': 'ee',
+        'd': 'dd', 'e': 'ee', 'f': 'ff', 'h': 'ff', 'i': 'dd', 'l': 'dd',
+    },
+    'multiply': {
+        '??': '?', '?B': 'B', '?H': 'H', '?I': 'I', '?L': 'L', '?b': 'b',
+        '?d': 'd', '?e': 'e', '?f': 'f', '?h': 'h', '?i': 'i', '?l': 'l',
+        'B?': 'B', 'BB': 'B', 'BH': 'H', 'BI': 'I', 'BL': 'L', 'Bb': 'h',
+        'Bd': 'd', 'Be': 'e', 'Bf': 'f', 'Bh': 'h', 'Bi': 'i', 'Bl': 'l',
+        'H?': 'H', 'HB': 'H', 'HH': 'H', 'HI': 'I', 'HL': 'L', 'Hb': 'i',
+        'Hd': 'd', 'He': 'f', 'Hf': 'f', 'Hh': 'i', 'Hi': 'i', 'Hl': 'l',
+        'I?': 'I', 'IB': 'I', 'IH': 'I', 'II': 'I', 'IL': 'L', 'Ib': 'l',
+        'Id': 'd', 'Ie': 'd', 'If': 'd', 'Ih': 'l', 'Ii': 'l', 'Il': 'l',
+        'L?': 'L', 'LB': 'L', 'LH': 'L', 'LI': 'L', 'LL': 'L', 'Lb': 'd',
+        'Ld': 'd', 'Le': 'd', 'Lf': 'd', 'Lh': 'd', 'Li': 'd', 'Ll': 'd',
+        'b?': 'b', 'bB': 'h', 'bH': 'i', 'bI': 'l', 'bL': 'd', 'bb': 'b',
+        'bd': 'd', 'be': 'e', 'bf': 'f', 'bh': 'h', 'bi': 'i', 'bl': 'l',
+        'd?': 'd', 'dB': 'd', 'dH': 'd', 'dI': 'd', 'dL': 'd', 'db': 'd',
+        'dd': 'd', 'de': 'd', 'df': 'd', 'dh': 'd', 'di': 'd', 'dl': 'd',
+        'e?': 'e', 'eB': 'e', 'eH': 'f', 'eI': 'd', 'eL': 'd', 'eb': 'e',
+        'ed': 'd', 'ee': 'e', 'ef': 'f', 'eh': 'f', 'ei': 'd', 'el': 'd',
+        'f?': 'f', 'fB': 'f', 'fH': 'f', 'fI': 'd', 'fL': 'd', 'fb': 'f',
+        'fd': 'd', 'fe': 'f', 'ff': 'f', 'fh': 'f', 'fi': 'd', 'fl': 'd',
+        'h?': 'h', 'hB': 'h', 'hH': 'i', 'hI': 'l', 'hL': 'd', 'hb': 'h',
+        'hd': 'd', 'he': 'f', 'hf': 'f', 'hh': 'h', 'hi': 'i', 'hl': 'l',
+        'i?': 'i', 'iB': 'i', 'iH': 'i', 'iI': 'l', 'iL': 'd', 'ib': 'i',
+        'id': 'd', 'ie': 'd', 'if': 'd', 'ih': 'i', 'ii': 'i', 'il': 'l',
+        'l?': 'l', 'lB': 'l', 'lH': 'l', 'lI': 'l', 'lL': 'd', 'lb': 'l',
+        'ld': 'd', 'le': 'd', 'lf': 'd', 'lh': 'l', 'li': 'l', 'll': 'l',
+    },
+    'negative': {
+        'B': 'B', 'H': 'H', 'I': 'I', 'L': 'L', 'b': 'b', 'd': 'd', 'e': 'e',
+        'f': 'f', 'h': 'h', 'i': 'i', 'l': 'l',
+    },
+    'nextafter': {
+        '??': 'e', '?B': 'e', '?H': 'f', '?I': 'd', '?L': 'd', '?b': 'e',
+        '?d': 'd', '?e': 'e', '?f': 'f', '?h': 'f', '?i': 'd', '?l': 'd',
+        'B?': 'e', 'BB': 'e', 'BH': 'f', 'BI': 'd', 'BL': 'd', 'Bb': 'e',
+        'Bd': 'd', 'Be': 'e', 'Bf': 'f', 'Bh': 'f', 'Bi': 'd', 'Bl': 'd',
+        'H?': 'f', 'HB': 'f', 'HH': 'f', 'HI': 'd', 'HL': 'd', 'Hb': 'f',
+        'Hd': 'd', 'He': 'f', 'Hf': 'f', 'Hh': 'f', 'Hi': 'd', 'Hl': 'd',
+        'I?': 'd', 'IB': 'd', 'IH': 'd', 'II': 'd', 'IL': 'd', 'Ib': 'd',
+        'Id': 'd', 'Ie': 'd', 'If': 'd', 'Ih': 'd', 'Ii': 'd', 'Il': 'd',
+        'L?': 'd', 'LB': 'd', 'LH': 'd', 'LI': 'd', 'LL': 'd', 'Lb': 'd',
+        'Ld': 'd', 'Le': 'd', 'Lf': 'd', 'Lh': 'd', 'Li': 'd', 'Ll': 'd',
+        'b?': 'e', 'bB': 'e', 'bH': 'f', 'bI': 'd', 'bL': 'd', 'bb': 'e',
+        'bd': 'd', 'be': 'e', 'bf': 'f', 'bh': 'f', 'bi': 'd', 'bl': 'd',
+        'd?': 'd', 'dB': 'd', 'dH': 'd', 'dI': 'd', 'dL': 'd', 'db': 'd',
+        'dd': 'd', 'de': 'd', 'df': 'd', 'dh': 'd', 'di': 'd', 'dl': 'd',
+        'e?': 'e', 'eB': 'e', 'eH': 'f', 'eI': 'd', 'eL': 'd', 'eb': 'e',
+        'ed': 'd', 'ee': 'e', 'ef': 'f', 'eh': 'f', 'ei': 'd', 'el': 'd',
+        'f?': 'f', 'fB': 'f', 'fH': 'f', 'fI': 'd', 'fL': 'd', 'fb': 'f',
+        'fd': 'd', 'fe': 'f', 'ff': 'f', 'fh': 'f', 'fi': 'd', 'fl': 'd',
+        'h?': 'f', 'hB': 'f', 'hH': 'f', 'hI': 'd', 'hL': 'd', 'hb': 'f',
+        'hd': 'd', 'he': 'f', 'hf': 'f', 'hh': 'f', 'hi': 'd', 'hl': 'd',
+        'i?': 'd', 'iB': 'd', 'iH': 'd', 'iI': 'd', 'iL': 'd', 'ib': 'd',
+        'id': 'd', 'ie': 'd', 'if': 'd', 'ih': 'd', 'ii': 'd', 'il': 'd',
+        'l?': 'd', 'lB': 'd', 'lH': 'd', 'lI': 'd', 'lL': 'd', 'lb': 'd',
+        'ld': 'd', 'le': 'd', 'lf': 'd', 'lh': 'd', 'li': 'd', 'll': 'd',
+    },
+    'not_equal': {
+        '??': '?', '?B': '?', '?H': '?', '?I': '?', '?L': '?', '?b': '?',
+        '?d': '?', '?e': '?', '?f': '?', '?h': '?', '?i': '?', '?l': '?',
+        'B?': '?', 'BB': '?', 'BH': '?', 'BI': '?', 'BL': '?', 'Bb': '?',
+        'Bd': '?', 'Be': '?', 'Bf': '?', 'Bh': '?', 'Bi': '?', 'Bl': '?',
+        'H?': '?', 'HB': '?', 'HH': '?', 'HI': '?', 'HL': '?', 'Hb': '?',
+        'Hd': '?', 'He': '?', 'Hf': '?', 'Hh': '?', 'Hi': '?', 'Hl': '?',
+        'I?': '?', 'IB': '?', 'IH': '?', 'II': '?', 'IL': '?', 'Ib': '?',
+        'Id': '?', 'Ie': '?', 'If': '?', 'Ih': '?', 'Ii': '?', 'Il': '?',
+        'L?': '?', 'LB': '?', 'LH': '?', 'LI': '?', 'LL': '?', 'Lb': '?',
+        'Ld': '?', 'Le': '?', 'Lf': '?', 'Lh': '?', 'Li': '?', 'Ll': '?',
+        'b?': '?', 'bB': '?', 'bH': '?', 'bI': '?', 'bL': '?', 'bb': '?',
+        'bd': '?', 'be': '?', 'bf': '?', 'bh': '?', 'bi': '?', 'bl': '?',
+        'd?': '?', 'dB': '?', 'dH': '?', 'dI': '?', 'dL': '?', 'db': '?',
+        'dd': '?', 'de': '?', 'df': '?', 'dh': '?', 'di': '?', 'dl': '?',
+        'e?': '?', 'eB': '?', 'eH': '?', 'eI': '?', 'eL': '?', 'eb': '?',
+        'ed': '?', 'ee': '?', 'ef': '?', 'eh': '?', 'ei': '?', 'el': '?',
+        'f?': '?', 'fB': '?', 'fH': '?', 'fI': '?', 'fL': '?', 'fb': '?',
+        'fd': '?', 'fe': '?', 'ff': '?', 'fh': '?', 'fi': '?', 'fl': '?',
+        'h?': '?', 'hB': '?', 'hH': '?', 'hI': '?', 'hL': '?', 'hb': '?',
+        'hd': '?', 'he': '?', 'hf': '?', 'hh': '?', 'hi': '?', 'hl': '?',
+        'i?': '?', 'iB': '?', 'iH': '?', 'iI': '?', 'iL': '?', 'ib': '?',
+        'id': '?', 'ie': '?', 'if': '?', 'ih': '?', 'ii': '?', 'il': '?',
+        'l?': '?', 'lB': '?', 'lH': '?', 'lI': '?', 'lL': '?', 'lb': '?',
+        'ld': '?', 'le': '?', 'lf': '?', 'lh': '?', 'li': '?', 'll': '?',
+    },
+    'positive': {
+        'B': 'B', 'H': 'H', 'I': 'I', 'L': 'L', 'b': 'b', 'd': 'd', 'e': 'e',
+        'f': 'f', 'h': 'h', 'i': 'i', 'l': 'l',
+    },
+    'power': {
+        '??': 'b', '?B': 'B', '?H': 'H', '?I': 'I', '?L': 'L', '?b': 'b',
+        '?d': 'd', '?e': 'e', '?f': 'f', '?h': 'h', '?i': 'i', '?l': 'l',
+        'B?': 'B', 'BB': 'B', 'BH': 'H', 'BI': 'I', 'BL': 'L', 'Bb': 'h',
+        'Bd': 'd', 'Be': 'e', 'Bf': 'f', 'Bh': 'h', 'Bi': 'i', 'Bl': 'l',
+        'H?': 'H', 'HB': 'H', 'HH': 'H', 'HI': 'I', 'HL': 'L', 'Hb': 'i',
+        'Hd': 'd', 'He': 'f', 'Hf': 'f', 'Hh': 'i', 'Hi': 'i', 'Hl': 'l',
+        'I?': 'I', 'IB': 'I', 'IH': 'I', 'II': 'I', 'IL': 'L', 'Ib': 'l',
+        'Id': 'd', 'Ie': 'd', 'If': 'd', 'Ih': 'l', 'Ii': 'l', 'Il': 'l',
+        'L?': 'L', 'LB': 'L', 'LH': 'L', 'LI': 'L', 'LL': 'L', 'Lb': 'd',
+        'Ld': 'd', 'Le': 'd', 'Lf': 'd', 'Lh': 'd', 'Li': 'd', 'Ll': 'd',
+        'b?': 'b', 'bB': 'h', 'bH': 'i', 'bI': 'l', 'bL': 'd', 'bb': 'b',
+        'bd': 'd', 'be': 'e', 'bf': 'f', 'bh': 'h', 'bi': 'i', 'bl': 'l',
+        'd?': 'd', 'dB': 'd', 'dH': 'd', 'dI': 'd', 'dL': 'd', 'db': 'd',
+        'dd': 'd', 'de': 'd', 'df': 'd', 'dh': 'd', 'di': 'd', 'dl': 'd',
+        'e?': 'e', 'eB': 'e', 'eH': 'f', 'eI': 'd', 'eL': 'd', 'eb': 'e',
+        'ed': 'd', 'ee': 'e', 'ef': 'f', 'eh': 'f', 'ei': 'd', 'el': 'd',
+        'f?': 'f', 'fB': 'f', 'fH': 'f', 'fI': 'd', 'fL': 'd', 'fb': 'f',
+        'fd': 'd', 'fe': 'f', 'ff': 'f', 'fh': 'f', 'fi': 'd', 'fl': 'd',
+        'h?': 'h', 'hB': 'h', 'hH': 'i', 'hI': 'l', 'hL': 'd', 'hb': 'h',
+        'hd': 'd', 'he': 'f', 'hf': 'f', 'hh': 'h', 'hi': 'i', 'hl': 'l',
+        'i?': 'i', 'iB': 'i', 'iH': 'i', 'iI': 'l', 'iL': 'd', 'ib': 'i',
+        'id': 'd', 'ie': 'd', 'if': 'd', 'ih': 'i', 'ii': 'i', 'il': 'l',
+        'l?': 'l', 'lB': 'l', 'lH': 'l', 'lI': 'l', 'lL': 'd', 'lb': 'l',
+        'ld': 'd', 'le': 'd', 'lf': 'd', 'lh': 'l', 'li': 'l', 'll': 'l',
+    },
+    'rad2deg': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'radians': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'reciprocal': {
+        '?': 'b', 'B': 'B', 'H': 'H', 'I': 'I', 'L': 'L', 'b': 'b', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'h', 'i': 'i', 'l': 'l',
+    },
+    'remainder': {
+        '??': 'b', '?B': 'B', '?H': 'H', '?I': 'I', '?L': 'L', '?b': 'b',
+        '?d': 'd', '?e': 'e', '?f': 'f', '?h': 'h', '?i': 'i', '?l': 'l',
+        'B?': 'B', 'BB': 'B', 'BH': 'H', 'BI': 'I', 'BL': 'L', 'Bb': 'h',
+        'Bd': 'd', 'Be': 'e', 'Bf': 'f', 'Bh': 'h', 'Bi': 'i', 'Bl': 'l',
+        'H?': 'H', 'HB': 'H', 'HH': 'H', 'HI': 'I', 'HL': 'L', 'Hb': 'i',
+        'Hd': 'd', 'He': 'f', 'Hf': 'f', 'Hh': 'i', 'Hi': 'i', 'Hl': 'l',
+        'I?': 'I', 'IB': 'I', 'IH': 'I', 'II': 'I', 'IL': 'L', 'Ib': 'l',
+        'Id': 'd', 'Ie': 'd', 'If': 'd', 'Ih': 'l', 'Ii': 'l', 'Il': 'l',
+        'L?': 'L', 'LB': 'L', 'LH': 'L', 'LI': 'L', 'LL': 'L', 'Lb': 'd',
+        'Ld': 'd', 'Le': 'd', 'Lf': 'd', 'Lh': 'd', 'Li': 'd', 'Ll': 'd',
+        'b?': 'b', 'bB': 'h', 'bH': 'i', 'bI': 'l', 'bL': 'd', 'bb': 'b',
+        'bd': 'd', 'be': 'e', 'bf': 'f', 'bh': 'h', 'bi': 'i', 'bl': 'l',
+        'd?': 'd', 'dB': 'd', 'dH': 'd', 'dI': 'd', 'dL': 'd', 'db': 'd',
+        'dd': 'd', 'de': 'd', 'df': 'd', 'dh': 'd', 'di': 'd', 'dl': 'd',
+        'e?': 'e', 'eB': 'e', 'eH': 'f', 'eI': 'd', 'eL': 'd', 'eb': 'e',
+        'ed': 'd', 'ee': 'e', 'ef': 'f', 'eh': 'f', 'ei': 'd', 'el': 'd',
+        'f?': 'f', 'fB': 'f', 'fH': 'f', 'fI': 'd', 'fL': 'd', 'fb': 'f',
+        'fd': 'd', 'fe': 'f', 'ff': 'f', 'fh': 'f', 'fi': 'd', 'fl': 'd',
+        'h?': 'h', 'hB': 'h', 'hH': 'i', 'hI': 'l', 'hL': 'd', 'hb': 'h',
+        'hd': 'd', 'he': 'f', 'hf': 'f', 'hh': 'h', 'hi': 'i', 'hl': 'l',
+        'i?': 'i', 'iB': 'i', 'iH': 'i', 'iI': 'l', 'iL': 'd', 'ib': 'i',
+        'id': 'd', 'ie': 'd', 'if': 'd', 'ih': 'i', 'ii': 'i', 'il': 'l',
+        'l?': 'l', 'lB': 'l', 'lH': 'l', 'lI': 'l', 'lL': 'd', 'lb': 'l',
+        'ld': 'd', 'le': 'd', 'lf': 'd', 'lh': 'l', 'li': 'l', 'll': 'l',
+    },
+    'right_shift': {
+        '??': 'b', '?B': 'B', '?H': 'H', '?I': 'I', '?L': 'L', '?b': 'b',
+        '?h': 'h', '?i': 'i', '?l': 'l', 'B?': 'B', 'BB': 'B', 'BH': 'H',
+        'BI': 'I', 'BL': 'L', 'Bb': 'h', 'Bh': 'h', 'Bi': 'i', 'Bl': 'l',
+        'H?': 'H', 'HB': 'H', 'HH': 'H', 'HI': 'I', 'HL': 'L', 'Hb': 'i',
+        'Hh': 'i', 'Hi': 'i', 'Hl': 'l', 'I?': 'I', 'IB': 'I', 'IH': 'I',
+        'II': 'I', 'IL': 'L', 'Ib': 'l', 'Ih': 'l', 'Ii': 'l', 'Il': 'l',
+        'L?': 'L', 'LB': 'L', 'LH': 'L', 'LI': 'L', 'LL': 'L', 'b?': 'b',
+        'bB': 'h', 'bH': 'i', 'bI': 'l', 'bb': 'b', 'bh': 'h', 'bi': 'i',
+        'bl': 'l', 'h?': 'h', 'hB': 'h', 'hH': 'i', 'hI': 'l', 'hb': 'h',
+        'hh': 'h', 'hi': 'i', 'hl': 'l', 'i?': 'i', 'iB': 'i', 'iH': 'i',
+        'iI': 'l', 'ib': 'i', 'ih': 'i', 'ii': 'i', 'il': 'l', 'l?': 'l',
+        'lB': 'l', 'lH': 'l', 'lI': 'l', 'lb': 'l', 'lh': 'l', 'li': 'l',
+        'll': 'l',
+    },
+    'rint': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'sign': {
+        'B': 'B', 'H': 'H', 'I': 'I', 'L': 'L', 'b': 'b', 'd': 'd', 'e': 'e',
+        'f': 'f', 'h': 'h', 'i': 'i', 'l': 'l',
+    },
+    'signbit': {
+        '?': '?', 'B': '?', 'H': '?', 'I': '?', 'L': '?', 'b': '?', 'd': '?',
+        'e': '?', 'f': '?', 'h': '?', 'i': '?', 'l': '?',
+    },
+    'sin': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'sinh': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'spacing': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'sqrt': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'square': {
+        '?': 'b', 'B': 'B', 'H': 'H', 'I': 'I', 'L': 'L', 'b': 'b', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'h', 'i': 'i', 'l': 'l',
+    },
+    'subtract': {
+        '?B': 'B', '?H': 'H', '?I': 'I', '?L': 'L', '?b': 'b', '?d': 'd',
+        '?e': 'e', '?f': 'f', '?h': 'h', '?i': 'i', '?l': 'l', 'B?': 'B',
+        'BB': 'B', 'BH': 'H', 'BI': 'I', 'BL': 'L', 'Bb': 'h', 'Bd': 'd',
+        'Be': 'e', 'Bf': 'f', 'Bh': 'h', 'Bi': 'i', 'Bl': 'l', 'H?': 'H',
+        'HB': 'H', 'HH': 'H', 'HI': 'I', 'HL': 'L', 'Hb': 'i', 'Hd': 'd',
+        'He': 'f', 'Hf': 'f', 'Hh': 'i', 'Hi': 'i', 'Hl': 'l', 'I?': 'I',
+        'IB': 'I', 'IH': 'I', 'II': 'I', 'IL': 'L', 'Ib': 'l', 'Id': 'd',
+        'Ie': 'd', 'If': 'd', 'Ih': 'l', 'Ii': 'l', 'Il': 'l', 'L?': 'L',
+        'LB': 'L', 'LH': 'L', 'LI': 'L', 'LL': 'L', 'Lb': 'd', 'Ld': 'd',
+        'Le': 'd', 'Lf': 'd', 'Lh': 'd', 'Li': 'd', 'Ll': 'd', 'b?': 'b',
+        'bB': 'h', 'bH': 'i', 'bI': 'l', 'bL': 'd', 'bb': 'b', 'bd': 'd',
+        'be': 'e', 'bf': 'f', 'bh': 'h', 'bi': 'i', 'bl': 'l', 'd?': 'd',
+        'dB': 'd', 'dH': 'd', 'dI': 'd', 'dL': 'd', 'db': 'd', 'dd': 'd',
+        'de': 'd', 'df': 'd', 'dh': 'd', 'di': 'd', 'dl': 'd', 'e?': 'e',
+        'eB': 'e', 'eH': 'f', 'eI': 'd', 'eL': 'd', 'eb': 'e', 'ed': 'd',
+        'ee': 'e', 'ef': 'f', 'eh': 'f', 'ei': 'd', 'el': 'd', 'f?': 'f',
+        'fB': 'f', 'fH': 'f', 'fI': 'd', 'fL': 'd', 'fb': 'f', 'fd': 'd',
+        'fe': 'f', 'ff': 'f', 'fh': 'f', 'fi': 'd', 'fl': 'd', 'h?': 'h',
+        'hB': 'h', 'hH': 'i', 'hI': 'l', 'hL': 'd', 'hb': 'h', 'hd': 'd',
+        'he': 'f', 'hf': 'f', 'hh': 'h', 'hi': 'i', 'hl': 'l', 'i?': 'i',
+        'iB': 'i', 'iH': 'i', 'iI': 'l', 'iL': 'd', 'ib': 'i', 'id': 'd',
+        'ie': 'd', 'if': 'd', 'ih': 'i', 'ii': 'i', 'il': 'l', 'l?': 'l',
+        'lB': 'l', 'lH': 'l', 'lI': 'l', 'lL': 'd', 'lb': 'l', 'ld': 'd',
+        'le': 'd', 'lf': 'd', 'lh': 'l', 'li': 'l', 'll': 'l',
+    },
+    'tan': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'tanh': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+    'true_divide': {
+        '??': 'd', '?B': 'd', '?H': 'd', '?I': 'd', '?L': 'd', '?b': 'd',
+        '?d': 'd', '?e': 'e', '?f': 'f', '?h': 'd', '?i': 'd', '?l': 'd',
+        'B?': 'd', 'BB': 'd', 'BH': 'd', 'BI': 'd', 'BL': 'd', 'Bb': 'd',
+        'Bd': 'd', 'Be': 'e', 'Bf': 'f', 'Bh': 'd', 'Bi': 'd', 'Bl': 'd',
+        'H?': 'd', 'HB': 'd', 'HH': 'd', 'HI': 'd', 'HL': 'd', 'Hb': 'd',
+        'Hd': 'd', 'He': 'f', 'Hf': 'f', 'Hh': 'd', 'Hi': 'd', 'Hl': 'd',
+        'I?': 'd', 'IB': 'd', 'IH': 'd', 'II': 'd', 'IL': 'd', 'Ib': 'd',
+        'Id': 'd', 'Ie': 'd', 'If': 'd', 'Ih': 'd', 'Ii': 'd', 'Il': 'd',
+        'L?': 'd', 'LB': 'd', 'LH': 'd', 'LI': 'd', 'LL': 'd', 'Lb': 'd',
+        'Ld': 'd', 'Le': 'd', 'Lf': 'd', 'Lh': 'd', 'Li': 'd', 'Ll': 'd',
+        'b?': 'd', 'bB': 'd', 'bH': 'd', 'bI': 'd', 'bL': 'd', 'bb': 'd',
+        'bd': 'd', 'be': 'e', 'bf': 'f', 'bh': 'd', 'bi': 'd', 'bl': 'd',
+        'd?': 'd', 'dB': 'd', 'dH': 'd', 'dI': 'd', 'dL': 'd', 'db': 'd',
+        'dd': 'd', 'de': 'd', 'df': 'd', 'dh': 'd', 'di': 'd', 'dl': 'd',
+        'e?': 'e', 'eB': 'e', 'eH': 'f', 'eI': 'd', 'eL': 'd', 'eb': 'e',
+        'ed': 'd', 'ee': 'e', 'ef': 'f', 'eh': 'f', 'ei': 'd', 'el': 'd',
+        'f?': 'f', 'fB': 'f', 'fH': 'f', 'fI': 'd', 'fL': 'd', 'fb': 'f',
+        'fd': 'd', 'fe': 'f', 'ff': 'f', 'fh': 'f', 'fi': 'd', 'fl': 'd',
+        'h?': 'd', 'hB': 'd', 'hH': 'd', 'hI': 'd', 'hL': 'd', 'hb': 'd',
+        'hd': 'd', 'he': 'f', 'hf': 'f', 'hh': 'd', 'hi': 'd', 'hl': 'd',
+        'i?': 'd', 'iB': 'd', 'iH': 'd', 'iI': 'd', 'iL': 'd', 'ib': 'd',
+        'id': 'd', 'ie': 'd', 'if': 'd', 'ih': 'd', 'ii': 'd', 'il': 'd',
+        'l?': 'd', 'lB': 'd', 'lH': 'd', 'lI': 'd', 'lL': 'd', 'lb': 'd',
+        'ld': 'd', 'le': 'd', 'lf': 'd', 'lh': 'd', 'li': 'd', 'll': 'd',
+    },
+    'trunc': {
+        '?': 'e', 'B': 'e', 'H': 'f', 'I': 'd', 'L': 'd', 'b': 'e', 'd': 'd',
+        'e': 'e', 'f': 'f', 'h': 'f', 'i': 'd', 'l': 'd',
+    },
+}
@@ -13,5 +13,6 @@ def register(name: str):
 from . import dtype
 from . import ndims
 from . import ufuncs
+from . import einsum
 
 __all__ = ['registry']
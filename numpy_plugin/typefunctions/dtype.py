@@ -1,18 +1,17 @@
-import numpy as np
 import logging
-from typing import Dict
-from mypy.types import Type
+from mypy.types import Type, AnyType, TypeOfAny
 from mypy.nodes import NameExpr, StrExpr, MemberExpr
 
 from . import register
-from ..shortcuts import is_dtypetype, int_type, bool_type, float_type
-from ..bind_arguments import BoundArgument
+from ..shortcuts import is_dtypetype, char_to_type, element_char
+from ..tables import DTYPE_ALIASES, KINDS
+from ..bind_arguments import BoundArguments
 
 log = logging.getLogger(__name__)
 
 
 @register('numpy._InferDtypeWithDefault')
-def InferDtypeWithDefault(typ: Type, funcname: str, bound_args: Dict[str, BoundArgument]):
+def InferDtypeWithDefault(typ: Type, funcname: str, bound_args: BoundArguments):
     matches = [f for f in bound_args.values() if f is not None and is_dtypetype(f.formal_typ)]
     if len(matches) == 0:
         return typ.args[0]
@@ -23,7 +22,7 @@ def InferDtypeWithDefault(typ: Type, funcname: str, bound_args: Dict[str, BoundA
 
 
 @register('numpy._InferDtype')
-def InferDtype(typ: Type, funcname: str, bound_args: Dict[str, BoundArgument]):
+def InferDtype(typ: Type, funcname: str, bound_args: BoundArguments):
 
     matches = [f for f in bound_args.values() if f is not None and is_dtypetype(f.formal_typ)]
     assert len(matches) == 1
@@ -33,9 +32,28 @@ def InferDtype(typ: Type, funcname: str, bound_args: Dict[str, BoundArgument]):
 
 
 
+@register('numpy._AccumulateDtype')
+def AccumulateDtype(typ: Type, funcname: str, bound_args: BoundArguments):
+    # sum and prod, like add.reduce, widen bool and integers to the
+    # platform's long, unsigned ones to unsigned long; floats keep their width
+    char = element_char(typ.args[0])
+    if char is None or KINDS[char] == 'f':
+        return typ.args[0]
+    return char_to_type('L' if KINDS[char] == 'u' else 'l')
+
+
+@register('numpy._MeanDtype')
+def MeanDtype(typ: Type, funcname: str, bound_args: BoundArguments):
+    # bool and integers are averaged in float64; floats keep their width
+    char = element_char(typ.args[0])
+    if char is None or KINDS[char] == 'f':
+        return typ.args[0]
+    return char_to_type('d')
+
+
 ###############################################################################
 
-def infer_dtype(formal_arg) -> str:
+def infer_dtype(formal_arg) -> Type:
     arg_type = formal_arg.arg_typ
     arg = formal_arg.arg
     if isinstance(arg, NameExpr):
@@ -52,11 +70,8 @@ def infer_dtype(formal_arg) -> str:
         raise ValueError()
 
         return 'Any'
-    np_kind = np.dtype(dtype_str).kind
-    builtin_kind_str = {
-        'i': int_type(),
-        'b': bool_type(),
-        'f': float_type(),
-    }[np_kind]
-    return builtin_kind_str
+    if dtype_str not in DTYPE_ALIASES:
+        log.error('unsupported dtype %s', dtype_str)
+        return AnyType(TypeOfAny.unannotated)
+    return char_to_type(DTYPE_ALIASES[dtype_str])
 
@@ -0,0 +1,50 @@
+from typing import List, Optional
+from mypy.types import Type, AnyType, TypeOfAny
+from mypy.nodes import NameExpr, StrExpr
+
+from . import register
+from .dtype import infer_dtype
+from .ndims import dim_or_any
+from .ufuncs import type_to_char
+from ..einsum import parse_subscripts
+from ..shortcuts import char_to_type, dimtype_to_int, is_ndarray
+from ..tables import UFUNC_OUTPUTS
+from ..bind_arguments import BoundArguments
+
+
+@register('numpy._EinsumDtype')
+def EinsumDtype(typ: Type, funcname: str, bound_args: BoundArguments):
+    dtype = bound_args['dtype']
+    if dtype is not None and not (isinstance(dtype.arg, NameExpr) and dtype.arg.name == 'None'):
+        return infer_dtype(dtype)
+    operands = bound_args['operands']
+    if operands is None:
+        return AnyType(TypeOfAny.unannotated)
+    # the operands are multiplied together, promoting their types
+    try:
+        chars = [type_to_char(t) for t in operands.arg_types]
+    except ValueError:
+        return AnyType(TypeOfAny.unannotated)
+    char = chars[0]
+    for other in chars[1:]:
+        char = UFUNC_OUTPUTS['multiply'][char + other]
+    return char_to_type(char)
+
+
+@register('numpy._EinsumNdim')
+def EinsumNdim(typ: Type, funcname: str, bound_args: BoundArguments):
+    subscripts = bound_args['subscripts']
+    if subscripts is None or not isinstance(subscripts.arg, StrExpr):
+        return dim_or_any('Any')
+    terms = parse_subscripts(subscripts.arg.value, operand_ndims(bound_args))
+    if terms is None:
+        return dim_or_any('Any')
+    return dim_or_any(len(terms[1]))
+
+
+def operand_ndims(bound_args: BoundArguments) -> List[Optional[int]]:
+    operands = bound_args['operands']
+    if operands is None:
+        return []
+    ndims = [dimtype_to_int(t.args[1]) if is_ndarray(t) else None for t in operands.arg_types]
+    return [ndim if isinstance(ndim, int) else None for ndim in ndims]
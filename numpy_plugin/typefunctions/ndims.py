@@ -1,11 +1,10 @@
-from typing import Dict
 import logging
 from mypy.types import Type, AnyType, Instance, NoneTyp
 from mypy.nodes import IntExpr, UnaryExpr, TupleExpr, ListExpr, NameExpr
 
 from . import register
-from ..shortcuts import is_shapetype, is_axestype, is_int, is_tuple, dim_as_type, dimtype_to_int, DIMTYPE_TO_INT
-from ..bind_arguments import BoundArgument
+from ..shortcuts import is_shapetype, is_axestype, is_int, is_tuple, dim_as_type, dimtype_to_int, DIMTYPE_TO_INT, MAXDIMS
+from ..bind_arguments import BoundArguments
 
 log = logging.getLogger(__name__)
 
@@ -13,29 +12,32 @@ log = logging.getLogger(__name__)
 @register('numpy._InferNdimsFromShape')
 def InferNdimsFromShape(typ: Type,
                         funcname: str,
-                        bound_args: Dict[str, BoundArgument]):
+                        bound_args: BoundArguments):
     matches = [
         f for f in bound_args.values()
         if f is not None and is_shapetype(f.formal_typ)
     ]
+    if len(matches) == 0:
+        # an optional shape that was left out, like numpy.random's size
+        return dim_as_type(0)
     assert len(matches) == 1
     return infer_ndim(matches[0])
 
 
 @register('numpy._RaiseDim')
-def RaiseDim(typ: Type, funcname: str, bound_args: Dict[str, BoundArgument]):
+def RaiseDim(typ: Type, funcname: str, bound_args: BoundArguments):
     arg = typ.args[0]
     ndim = dimtype_to_int(arg)
     if isinstance(ndim, int):
         ndim += 1
 
-    return dim_as_type(ndim)
+    return dim_or_any(ndim)
 
 
 @register('numpy._InferNdimsReduction')
 def InferNdimsReduction(typ: Type,
                         funcname: str,
-                        bound_args: Dict[str, BoundArgument]):
+                        bound_args: BoundArguments):
     matches = [
         f for f in bound_args.values()
         if f is not None and is_axestype(f.formal_typ)
@@ -86,7 +88,7 @@ def InferNdimsReduction(typ: Type,
 @register('numpy._InferNdimsIfAxisSpecified')
 def InferNdimsIfAxisSpecified(typ: Type,
                               funcname: str,
-                              bound_args: Dict[str, BoundArgument]):
+                              bound_args: BoundArguments):
     # if axis is None, the default, we return the first type argument
     # if axis is an int we return the second type argument
     assert 'axis' in bound_args
@@ -104,29 +106,29 @@ def InferNdimsIfAxisSpecified(typ: Type,
 
 
 @register('numpy._LowerDim')
-def LowerDim(typ: Type, funcname: str, bound_args: Dict[str, BoundArgument]):
+def LowerDim(typ: Type, funcname: str, bound_args: BoundArguments):
     arg = typ.args[0]
     ndim = dimtype_to_int(arg)
     if isinstance(ndim, int):
         ndim -= 1
 
-    return dim_as_type(ndim)
+    return dim_or_any(ndim)
 
 
 @register('numpy._LowerDim2')
-def LowerDim2(typ: Type, funcname: str, bound_args: Dict[str, BoundArgument]):
+def LowerDim2(typ: Type, funcname: str, bound_args: BoundArguments):
     arg = typ.args[0]
     ndim = dimtype_to_int(arg)
     if isinstance(ndim, int):
         ndim -= 2
 
-    return dim_as_type(ndim)
+    return dim_or_any(ndim)
 
 
 @register('numpy._ToggleDims_12_21')
 def ToggleDims_12_21(typ: Type,
                      funcname: str,
-                     bound_args: Dict[str, BoundArgument]):
+                     bound_args: BoundArguments):
     arg = typ.args[0]
     input_ndim = dimtype_to_int(arg)
     if isinstance(input_ndim, int):
@@ -143,7 +145,7 @@ def ToggleDims_12_21(typ: Type,
 
 
 @register('numpy._LargestDim')
-def LargestDim(typ: Type, funcname: str, bound_args: Dict[str, BoundArgument]):
+def LargestDim(typ: Type, funcname: str, bound_args: BoundArguments):
     arg0 = typ.args[0]
     arg1 = typ.args[1]
 
@@ -160,6 +162,13 @@ def LargestDim(typ: Type, funcname: str, bound_args: Dict[str, BoundArgument]):
 ###############################################################################
 
 
+def dim_or_any(ndim) -> Type:
+    # ranks outside [0, MAXDIMS] are errors at runtime; don't guess here
+    if isinstance(ndim, int) and not 0 <= ndim <= MAXDIMS:
+        return dim_as_type('Any')
+    return dim_as_type(ndim)
+
+
 def infer_ndim(formal_arg) -> Type:
     arg_type = formal_arg.arg_typ
     arg = formal_arg.arg
@@ -1,27 +1,29 @@
-import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, List
 import logging
 from functools import lru_cache
 from mypy.types import Type
 
 from . import register
-from ..shortcuts import (is_int, is_bool, is_float, bool_type, int_type,
-                         float_type, is_ndarray_of_bools, is_ndarray_of_floats,
-                         is_ndarray_of_ints)
+from ..cache import build_cache
+from ..shortcuts import (is_int, is_bool, is_float, char_to_type, element_char,
+                         is_ndarray, is_ndarray_of_bools, is_ndarray_of_floats,
+                         is_ndarray_of_ints, KIND_ORDER)
+from ..tables import KINDS, UFUNC_ALIASES, UFUNC_OUTPUTS
 
-from ..bind_arguments import BoundArgument
+from ..bind_arguments import BoundArguments
 
 log = logging.getLogger(__name__)
 
 
 @register('numpy._UfuncCast')
-def UfuncCast(typ: Type, funcname: str, bound_args: Dict[str, BoundArgument]):
+def UfuncCast(typ: Type, funcname: str, bound_args: BoundArguments):
     keys = (k for k in bound_args.keys() if k not in ('out', 'out1', 'out2'))
-    input_chars = tuple((type_to_char(bound_args[xx].arg_typ) for xx in keys))
-    typecodes = ufunc_to_typecodes(funcname)
-    output_char = ufunc_type_resolver(input_chars, typecodes)
+    arg_types = [bound_args[xx].arg_typ for xx in keys]
+    input_chars = ''.join(value_based_chars(
+        [type_to_char(t) for t in arg_types], [is_ndarray(t) for t in arg_types]))
+    output_chars = ufunc_type_resolver(input_chars, ufunc_outputs(funcname))
 
-    dtype = char_to_type(output_char[0])
+    dtype = char_to_type(output_chars[0])
     return dtype
 
 
@@ -29,43 +31,50 @@ def UfuncCast(typ: Type, funcname: str, bound_args: Dict[str, BoundArgument]):
 
 
 @lru_cache()
-def ufunc_to_typecodes(funcname: str) -> List[Tuple[str, str]]:
+def ufunc_outputs(funcname: str) -> Dict[str, str]:
     funcname_split = funcname.split('.')
     assert len(funcname_split) == 2 and funcname_split[0] == 'numpy'
     ufunc_name = funcname_split[1]
 
-    types = getattr(np, ufunc_name).types
-    return [l.split('->') for l in types]
+    return UFUNC_OUTPUTS[UFUNC_ALIASES.get(ufunc_name, ufunc_name)]
 
 
-def ufunc_type_resolver(ichars: str, typecodes: List[Tuple[str, str]]):
-    for inp, out in typecodes:
-        if all(np.can_cast(ii, tt) for ii, tt in zip(ichars, inp)):
-            return out
-    raise ValueError()
+def ufunc_type_resolver(ichars: str, outputs: Dict[str, str]) -> str:
+    try:
+        return outputs[ichars]
+    except KeyError:
+        raise ValueError(ichars)
 
 
-@lru_cache()
+def value_based_chars(chars: List[str], arrays: List[bool]) -> List[str]:
+    """Type characters as numpy 1.19 casts ufunc inputs.
+
+    A Python scalar whose kind is no higher than the arrays' doesn't widen
+    them: ``float32_array * 2.0`` is float32, ``int8_array + 1`` int8. It
+    takes the type of the first array of the highest kind. (Numpy looks at
+    the scalar's value too; the value is assumed to fit.)
+    """
+    if all(arrays) or not any(arrays):
+        return chars
+    top = max((c for c, a in zip(chars, arrays) if a), key=lambda c: KIND_ORDER[KINDS[c]])
+    return [c if a or KIND_ORDER[KINDS[c]] > KIND_ORDER[KINDS[top]] else top
+            for c, a in zip(chars, arrays)]
+
+
+@build_cache
 def type_to_char(type: Type) -> str:
     # Example: 'builtins.bool' -> '?''
     #          'builtins.float' -> 'd'
-    #          'builtins.int' -> 'l'
+    #          'numpy.float32' -> 'f'
+    #          'numpy.ndarray[numpy.int8, numpy.OneD]' -> 'b'
+    char = element_char(type.args[0] if is_ndarray(type) else type)
+    if char is not None:
+        return char
     if is_bool(type) or is_ndarray_of_bools(type):
-        return np.dtype('bool').char
+        return '?'
     if is_float(type) or is_ndarray_of_floats(type):
-        return np.dtype('float').char
+        return 'd'
     if is_int(type) or is_ndarray_of_ints(type):
-        return np.dtype('int').char
+        return 'l'
 
     raise ValueError(type)
-
-
-@lru_cache()
-def char_to_type(char: str) -> Type:
-    if char in ('b', '?'):
-        return bool_type()
-    elif char in ('e', 'f', 'd', 'g'):
-        return float_type()
-    elif char in ('i', 'l'):
-        return int_type()
-    raise ValueError(char)
@@ -0,0 +1,191 @@
+"""Check ``# Revealed type is`` expectations against mypy, in-process and batched.
+
+    $ python -m numpy_plugin.verify [--processes N] [--config-file mypy.ini] FILE...
+
+Every line carrying a ``# Revealed type is '...'`` comment expects mypy to
+report exactly that. Snippets are written out as separate modules and checked
+by a single in-process ``mypy.api`` build, so the interpreter, mypy and the
+stubs are loaded once for the whole batch instead of once per snippet; with
+``processes`` the batch is sharded over a process pool. The same engine
+checks golden files in place.
+"""
+import argparse
+import multiprocessing
+import os
+import re
+import shutil
+import sys
+import tempfile
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from mypy import api
+
+BASE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+EXPECTATION = '# Revealed type is'
+
+DEFAULT_CONFIG = '''\
+[mypy]
+mypy_path = {0}/numpy_plugin/stubs
+disallow_untyped_defs = True
+ignore_missing_imports = True
+show_traceback = True
+incremental = True
+cache_dir = {1}
+plugins = {0}/numpy_plugin_entry.py
+'''
+
+_MESSAGE = re.compile(r'^(?P<path>.+?):(?P<line>\d+): (?P<severity>error|note): (?P<message>.*)$')
+
+# (line, message)
+Message = Tuple[int, str]
+
+
+class Result:
+    __slots__ = ('name', 'expected', 'received')
+
+    def __init__(self, name: str, expected: List[Message], received: List[Message]) -> None:
+        self.name = name
+        self.expected = expected
+        self.received = received
+
+    @property
+    def ok(self) -> bool:
+        return [m for _, m in self.expected] == [m for _, m in self.received]
+
+    def diff(self) -> str:
+        lines = ['%s:' % self.name]
+        lines += ['  expected %d: %s' % e for e in self.expected]
+        lines += ['  received %d: %s' % r for r in self.received]
+        return '\n'.join(lines)
+
+
+def parse_expectations(source: str) -> List[Message]:
+    expected = []
+    for i, line in enumerate(source.splitlines(), 1):
+        if EXPECTATION in line:
+            expected.append((i, line[line.find(EXPECTATION):][2:]))
+    return expected
+
+
+def check_paths(paths: Sequence[str], config_file: str) -> Dict[str, List[Message]]:
+    """Type check the files in one build; return the errors reported per file.
+
+    A crash in one file ends mypy's build for all of them, so the file that
+    crashed keeps what was reported up to the crash and the rest are checked
+    again without it.
+    """
+    remaining = [os.path.abspath(p) for p in paths]
+    received = {p: [] for p in remaining}  # type: Dict[str, List[Message]]
+    while remaining:
+        stdout, stderr, status = api.run(['--config-file', config_file] + remaining)
+        crashed = None
+        for line in stdout.splitlines():
+            match = _MESSAGE.match(line)
+            if match is None:
+                continue
+            path = os.path.abspath(match.group('path'))
+            if path not in received or match.group('severity') != 'error':
+                continue
+            message = match.group('message')
+            if message.startswith('INTERNAL ERROR'):
+                crashed = path
+                continue
+            received[path].append((int(match.group('line')), message))
+        if crashed is None:
+            break
+        remaining.remove(crashed)
+        for path in remaining:
+            received[path] = []
+    return received
+
+
+def check_snippets(snippets: 'OrderedDict[str, str]',
+                   config_file: Optional[str]=None) -> Dict[str, List[Message]]:
+    """Check each snippet as its own module in a single build."""
+    workdir = tempfile.mkdtemp()
+    try:
+        if config_file is None:
+            config_file = write_default_config(workdir, os.path.join(workdir, '.mypy_cache'))
+        paths = OrderedDict()  # type: OrderedDict[str, str]
+        for i, (name, source) in enumerate(snippets.items()):
+            path = os.path.join(workdir, 'snippet_%d.py' % i)
+            with open(path, 'w') as f:
+                f.write(source)
+            paths[name] = path
+        received = check_paths(list(paths.values()), config_file)
+        return {name: received[path] for name, path in paths.items()}
+    finally:
+        shutil.rmtree(workdir)
+
+
+def verify_snippets(snippets: 'OrderedDict[str, str]', processes: int=1,
+                    config_file: Optional[str]=None) -> List[Result]:
+    names = list(snippets)
+    shards = [OrderedDict((n, snippets[n]) for n in names[i::processes])
+              for i in range(max(processes, 1))]
+    if processes > 1:
+        with multiprocessing.Pool(processes) as pool:
+            outputs = pool.starmap(check_snippets, [(s, config_file) for s in shards if s])
+    else:
+        outputs = [check_snippets(shards[0], config_file)]
+
+    received = {}
+    for output in outputs:
+        received.update(output)
+    return [Result(n, parse_expectations(snippets[n]), received[n]) for n in names]
+
+
+def verify_files(paths: Sequence[str], processes: int=1,
+                 config_file: Optional[str]=None) -> List[Result]:
+    """Check golden files in place, against the comments they carry."""
+    workdir = None
+    if config_file is None:
+        workdir = tempfile.mkdtemp()
+        config_file = write_default_config(workdir, os.path.join(workdir, '.mypy_cache'))
+    try:
+        shards = [paths[i::processes] for i in range(max(processes, 1))]
+        if processes > 1:
+            with multiprocessing.Pool(processes) as pool:
+                outputs = pool.starmap(check_paths, [(s, config_file) for s in shards if s])
+        else:
+            outputs = [check_paths(paths, config_file)]
+    finally:
+        if workdir is not None:
+            shutil.rmtree(workdir)
+
+    received = {}
+    for output in outputs:
+        received.update(output)
+    results = []
+    for path in paths:
+        with open(path) as f:
+            expected = parse_expectations(f.read())
+        results.append(Result(path, expected, received[os.path.abspath(path)]))
+    return results
+
+
+def write_default_config(directory: str, cache_dir: str) -> str:
+    path = os.path.join(directory, 'mypy.ini')
+    with open(path, 'w') as f:
+        f.write(DEFAULT_CONFIG.format(BASE_DIR, cache_dir))
+    return path
+
+
+def main(argv: Optional[Sequence[str]]=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('files', nargs='+')
+    parser.add_argument('--processes', type=int, default=1)
+    parser.add_argument('--config-file', help='defaults to the bundled stubs and plugin')
+    args = parser.parse_args(argv)
+
+    results = verify_files(args.files, args.processes, args.config_file)
+    failed = [r for r in results if not r.ok]
+    for r in failed:
+        print(r.diff())
+    print('%d of %d files match their expectations' % (len(results) - len(failed), len(results)))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,4 +1,4 @@
-from mypy.types import Instance, TypeVisitor, TupleType
+from mypy.types import Instance, TypeVisitor, TupleType, AnyType, TypeOfAny, UnionType
 
 
 class TypeTransformer(TypeVisitor):
@@ -64,3 +64,19 @@ class SimpleTransformer(TypeTransformer):
 
     def visit_instance(self, typ: Instance):
         return self.instance_function(typ)
+
+
+class TypefunctionEraser(TypeTransformer):
+    """Replace unevaluated typefunctions with Any, as plain mypy would see them."""
+    def __init__(self, registry):
+        self.registry = registry
+
+    def visit_instance(self, typ: Instance):
+        if typ.type.fullname() in self.registry:
+            return AnyType(TypeOfAny.special_form)
+        if not typ.args:
+            return typ
+        return Instance(typ.type, [arg.accept(self) for arg in typ.args])
+
+    def visit_union_type(self, typ):
+        return UnionType([i.accept(self) for i in typ.items], typ.line, typ.column)
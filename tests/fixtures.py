@@ -1,51 +1,45 @@
 import os
+import atexit
 import pytest
 import tempfile
-import subprocess
 import shutil
-from distutils.spawn import find_executable
+from collections import OrderedDict
+from typing import Dict, List, Tuple
 
-BASE_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from mypy import api
 
+from numpy_plugin import verify
 
-@pytest.fixture
-def mypytest():
-    return _mypytest_inner
+BASE_DIR = verify.BASE_DIR
 
+# One incremental cache for the session, so that builtins and the numpy stub
+# are analysed by the first test only.
+_CACHE_DIR = tempfile.mkdtemp()
+_CONFIG_FILE = verify.write_default_config(_CACHE_DIR, os.path.join(_CACHE_DIR, '.mypy_cache'))
+atexit.register(shutil.rmtree, _CACHE_DIR, True)
 
-def _mypytest_inner(s: str):
-    input_lines = [e.lstrip() for e in s.splitlines()]
-    expected_output = []
-    for i, line in enumerate(input_lines):
-        if '# Revealed type is' in line:
-            expected_output.append(line[line.find('# Revealed type is'):][2:])
-
-    td = tempfile.mkdtemp()
-    with open(os.path.join(td, 'input.py'), 'w') as f:
-        f.write('\n'.join(input_lines))
-    with open(os.path.join(td, 'mypy.ini'), 'w') as f:
-        f.write('''
+DIAGNOSTICS_CONFIG = '''
 [mypy]
-
 mypy_path = {0}/numpy_plugin/stubs
-disallow_untyped_defs = True
-ignore_missing_imports = True
-show_traceback = True
-plugins = {0}/numpy_plugin_entry.py'''.format(BASE_DIR))
+cache_dir = {1}
+plugins = {0}/numpy_plugin_entry.py
 
+[numpy-plugin]
+{2}
+'''
 
-    curdir = os.path.abspath(os.curdir)
-    try:
-        os.chdir(td)
-        cmd = ['mypy', '--config-file', 'mypy.ini', 'input.py']
-        p = subprocess.run(' '.join(cmd), stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, shell=True)
-        received_output = []
-        for l in p.stdout.splitlines():
-            received_output.append(l.split('error: ')[1])
 
-    finally:
-        os.chdir(curdir)
-        shutil.rmtree(td)
+@pytest.fixture
+def mypytest():
+    return _mypytest_inner
+
+
+def _mypytest_inner(s: str):
+    input_lines = [e.lstrip() for e in s.splitlines()]
+    [result] = verify.verify_snippets(OrderedDict(input='\n'.join(input_lines)),
+                                      config_file=_CONFIG_FILE)
+    expected_output = [m for _, m in result.expected]
+    received_output = [m for _, m in result.received]
 
     print('\n'.join(received_output))
     assert len(expected_output) == len(received_output), (len(expected_output), len(received_output))
@@ -53,3 +47,31 @@ plugins = {0}/numpy_plugin_entry.py'''.format(BASE_DIR))
         assert e == r, ('"%s" != "%s"' % (e, r))
 
 
+@pytest.fixture
+def diagnostics(tmpdir):
+    """Check modules with a ``[numpy-plugin]`` section, returning the
+    ``(line, message)`` of each diagnostic by module."""
+    def run(section: str, sources: Dict[str, str]) -> Dict[str, List[Tuple[int, str]]]:
+        config = tmpdir.join('mypy.ini')
+        config.write(DIAGNOSTICS_CONFIG.format(BASE_DIR, tmpdir.join('cache'), section))
+        paths = []
+        for module, source in sources.items():
+            path = tmpdir.join(module + '.py')
+            path.write(source)
+            paths.append(str(path))
+        stdout, _, _ = api.run(['--config-file', str(config)] + paths)
+        found = {}  # type: Dict[str, List[Tuple[int, str]]]
+        for line in stdout.splitlines():
+            path, lineno, _, message = line.split(':', 3)
+            module = os.path.basename(path)[:-3]
+            found.setdefault(module, []).append((int(lineno), message.strip()))
+        return found
+
+    return run
+
+
+def codes(found: List[Tuple[int, str]]) -> List[Tuple[int, str]]:
+    """The ``(line, code)`` of diagnostics, for those ending in ``[code]``;
+    the others keep their message."""
+    return [(line, message[message.rindex('[') + 1:-1] if message.endswith(']') else message)
+            for line, message in found]
@@ -0,0 +1,41 @@
+import os
+
+from mypy import api
+
+from numpy_plugin.activation import ModuleFilter, parse_patterns
+from .fixtures import BASE_DIR
+
+SOURCE = '''import numpy as np
+reveal_type(np.zeros((2, 3)))
+reveal_type(np.add(np.ones(3), 1))
+'''
+
+
+def test_patterns():
+    f = ModuleFilter(parse_patterns('ourpkg.science.*, tools.np_*'))
+    assert f.matches('ourpkg.science')
+    assert f.matches('ourpkg.science.fft')
+    assert not f.matches('ourpkg.sciencey')
+    assert not f.matches('ourpkg')
+    assert f.matches('tools.np_helpers')
+    assert not f.matches('tools.other')
+
+
+def test_inactive_modules_get_plain_types(tmpdir, monkeypatch):
+    monkeypatch.setenv('NUMPY_PLUGIN_MODULES', 'science.*')
+    tmpdir.join('mypy.ini').write('''
+[mypy]
+mypy_path = {0}/numpy_plugin/stubs
+cache_dir = {1}
+plugins = {0}/numpy_plugin_entry.py'''.format(BASE_DIR, os.devnull))
+    tmpdir.mkdir('science').join('__init__.py').write(SOURCE)
+    tmpdir.join('other.py').write(SOURCE)
+    monkeypatch.chdir(tmpdir)
+
+    out, _, _ = api.run(['--config-file', 'mypy.ini', 'science/__init__.py', 'other.py'])
+    assert sorted(out.splitlines()) == [
+        "other.py:2: error: Revealed type is 'numpy.ndarray[Any, Any]'",
+        "other.py:3: error: Revealed type is 'numpy.ndarray[Any, Any]'",
+        "science/__init__.py:2: error: Revealed type is 'numpy.ndarray[builtins.float, numpy.TwoD]'",
+        "science/__init__.py:3: error: Revealed type is 'numpy.ndarray[builtins.float, numpy.OneD]'",
+    ]
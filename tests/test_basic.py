@@ -29,7 +29,19 @@ b = np.zeros(1, dtype='int')
 c = np.zeros(1, dtype='i')
 reveal_type(a)  # Revealed type is 'numpy.ndarray[builtins.int, numpy.OneD]'
 reveal_type(b)  # Revealed type is 'numpy.ndarray[builtins.int, numpy.OneD]'
-reveal_type(c)  # Revealed type is 'numpy.ndarray[builtins.int, numpy.OneD]'
+reveal_type(c)  # Revealed type is 'numpy.ndarray[numpy.int32, numpy.OneD]'
 ''')
 
 
+def test_high_rank(mypytest):
+    mypytest('''
+import numpy as np
+a = np.zeros((2, 3, 4, 5, 6))
+b = np.ones((2, 3, 4, 5, 6, 7), dtype=int)
+reveal_type(a)  # Revealed type is 'numpy.ndarray[builtins.float, numpy.FiveD]'
+reveal_type(b)  # Revealed type is 'numpy.ndarray[builtins.int, numpy.SixD]'
+reveal_type(b[0])  # Revealed type is 'numpy.ndarray[builtins.int*, numpy.FiveD]'
+reveal_type(b[None])  # Revealed type is 'numpy.ndarray[builtins.int*, numpy.SevenD]'
+reveal_type(np.sum(b, axis=0))  # Revealed type is 'numpy.ndarray[builtins.int, numpy.FiveD]'
+reveal_type(np.add(a, b))  # Revealed type is 'numpy.ndarray[builtins.float, numpy.SixD]'
+''')
@@ -0,0 +1,28 @@
+from types import SimpleNamespace
+
+from numpy_plugin.bind_arguments import bind_arguments
+
+
+def test_star_args_keep_every_actual():
+    # def einsum(subscripts, *operands, out=None)
+    callee = SimpleNamespace(arg_names=['subscripts', 'operands', 'out'],
+                             arg_types=['str', 'ndarray', 'ndarray'])
+    ctx = SimpleNamespace(arg_types=[['str'], ['a', 'b', 'c'], []],
+                          args=[['s'], ['x', 'y', 'z'], []])
+    bound = bind_arguments(callee, ctx)
+    assert list(bound) == ['subscripts', 'operands', 'out']
+    assert bound['operands'].arg_types == ['a', 'b', 'c']
+    assert bound['operands'].arg == 'x'
+    assert bound['out'] is None
+    assert 'out' in bound and 'dtype' not in bound
+    assert [b.name for b in bound.values() if b is not None] == ['subscripts', 'operands']
+
+
+def test_methods_skip_self_and_layouts_are_reused():
+    callee = SimpleNamespace(arg_names=['self', 'axis'], arg_types=['ndarray', 'int'])
+    ctx = SimpleNamespace(arg_types=[['int']], args=[['0']])
+    first = bind_arguments(callee, ctx, calltype='method')
+    second = bind_arguments(callee, ctx, calltype='method')
+    assert dict(first.items()) == {'axis': first['axis']}
+    assert first['axis'].formal_typ == 'int'
+    assert first.layout is second.layout
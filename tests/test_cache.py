@@ -0,0 +1,48 @@
+from numpy_plugin.cache import TypeCache, build_cache, type_key
+
+
+def test_type_cache_evicts_least_recently_used():
+    cache = TypeCache('test', maxsize=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert 'b' not in cache.data
+    assert cache.stats() == {'hits': 1, 'misses': 0, 'evictions': 1, 'size': 2, 'maxsize': 2}
+
+
+def test_build_cache_counts_hits_and_misses():
+    calls = []
+
+    @build_cache
+    def double(x):
+        calls.append(x)
+        return 2 * x
+
+    assert double(2) == double(2) == 4
+    assert double(x=3) == 6
+    assert calls == [2, 3]
+    assert (double.cache.hits, double.cache.misses) == (1, 2)
+
+
+def test_build_cache_bypasses_unkeyable_keywords():
+    from mypy.types import ErasedType
+    calls = []
+
+    @build_cache
+    def same(typ):
+        calls.append(typ)
+        return typ
+
+    # two types with no type_key are told apart by position and by keyword
+    a, b = ErasedType(), ErasedType()
+    assert same(a) is a and same(b) is b
+    assert same(typ=a) is a and same(typ=b) is b
+    assert len(calls) == 4
+    assert (same.cache.hits, same.cache.misses) == (0, 0)
+
+
+def test_type_key_is_structural():
+    from mypy.types import AnyType, NoneTyp, TypeOfAny
+    assert type_key(NoneTyp()) == type_key(NoneTyp())
+    assert type_key(AnyType(TypeOfAny.unannotated)) == ('Any', TypeOfAny.unannotated)
@@ -27,6 +27,17 @@ reveal_type(np.asarray(np.zeros((3,3))))  # Revealed type is 'numpy.ndarray[buil
 ''')
 
 
+def test_array_constructor_nested(mypytest):
+    mypytest('''
+import numpy as np
+reveal_type(np.array([[[[1.0]]]]))  # Revealed type is 'numpy.ndarray[builtins.float, numpy.FourD]'
+reveal_type(np.array([[[[[True]]]]]))  # Revealed type is 'numpy.ndarray[builtins.bool, numpy.FiveD]'
+reveal_type(np.asarray([[1, 2], [3, 4]]))  # Revealed type is 'numpy.ndarray[builtins.int, numpy.TwoD]'
+reveal_type(np.ascontiguousarray([(1, 2.0), (3, 4)]))  # Revealed type is 'numpy.ndarray[builtins.float, numpy.TwoD]'
+reveal_type(np.array((1, 2, 3)))  # Revealed type is 'numpy.ndarray[builtins.int, numpy.OneD]'
+''')
+
+
 def test_reshape(mypytest):
     mypytest('''
 import numpy as np
@@ -0,0 +1,82 @@
+import os
+import threading
+
+from mypy import build
+from mypy.main import process_options
+
+from numpy_plugin import context
+from numpy_plugin.shortcuts import API
+from .fixtures import BASE_DIR
+
+SOURCES = {
+    'ints': '''
+import numpy as np
+a = np.zeros((2, 2), dtype=int)
+reveal_type(np.sum(a, axis=1))
+''',
+    'floats': '''
+import numpy as np
+b = np.ones((2, 3, 4))
+reveal_type(b[0])
+''',
+}
+
+
+def test_api_follows_the_current_context():
+    first, second = context.PluginContext(), context.PluginContext()
+    first.api, second.api = 'first', 'second'
+    seen = {}
+
+    def run(ctx, name):
+        previous = context.swap(ctx)
+        try:
+            barrier.wait()
+            seen[name] = API.upper()
+        finally:
+            context.swap(previous)
+
+    barrier = threading.Barrier(2)
+    threads = [threading.Thread(target=run, args=(first, 'a')),
+               threading.Thread(target=run, args=(second, 'b'))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert seen == {'a': 'FIRST', 'b': 'SECOND'}
+    assert context.current() is context.DEFAULT
+
+
+def _check(tmpdir, name):
+    path = str(tmpdir.join(name + '.py'))
+    config = tmpdir.join('mypy.ini')
+    config.write('''
+[mypy]
+mypy_path = {0}/numpy_plugin/stubs
+cache_dir = {1}
+plugins = {0}/numpy_plugin_entry.py'''.format(BASE_DIR, os.devnull))
+    sources, options = process_options(['--config-file', str(config), path])
+    try:
+        return build.build(sources, options).errors
+    except build.CompileError as e:
+        return e.messages
+
+
+def test_builds_in_threads_match_sequential_builds(tmpdir):
+    for name, source in SOURCES.items():
+        tmpdir.join(name + '.py').write(source)
+    sequential = {name: _check(tmpdir, name) for name in SOURCES}
+
+    concurrent = {}
+
+    def run(name):
+        concurrent[name] = _check(tmpdir, name)
+
+    threads = [threading.Thread(target=run, args=(name,)) for name in SOURCES]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert concurrent == sequential
+    assert any("numpy.ndarray[builtins.int, numpy.OneD]" in m for m in sequential['ints'])
+    assert any("numpy.ndarray[builtins.float*, numpy.TwoD]" in m for m in sequential['floats'])
@@ -0,0 +1,81 @@
+import pytest
+
+from numpy_plugin.copies import parse_copy_checks, CODES
+from .fixtures import diagnostics, codes
+
+SECTION = '''
+copy_checks =
+    hot
+    io: redundant-asarray
+'''
+
+SOURCE = '''
+import numpy as np
+
+def only_read(x: np.ndarray) -> float:
+    y = np.array(x)
+    return float(np.sum(y) + y[0] * x.shape[0])
+
+def written(x: np.ndarray) -> np.ndarray:
+    y = np.array(x)
+    y[0] = 1
+    return y
+
+def source_written(x: np.ndarray) -> None:
+    y = np.array(x)
+    x.fill(0)
+    print(np.sum(y))
+
+def conversions(n: int) -> None:
+    a = np.zeros((3, 3), dtype=np.float32)
+    b = a.astype(np.float32)
+    c = a.astype('float64')
+    d = a.astype(np.float32, copy=False)
+    e = np.ones(n).astype(float)
+    f = a.copy().astype(int)
+    g = np.array(a.copy())
+    h = a.copy().copy()
+    i = np.asarray(np.array([1, 2]))
+    j = np.asarray(np.array([1, 2]), dtype=float)
+    print(b, c, d, e, f, g, h, i, j)
+
+def chained(mask: np.ndarray[bool, np.OneD], idx: np.ndarray[int, np.OneD]) -> None:
+    a = np.ones(10)
+    print(a[mask][idx], a[mask][2:5], a[idx][mask], a[2:5][idx])
+
+def written_through_views(x: np.ndarray, o: np.ndarray[float, np.OneD]) -> None:
+    b = np.array(x)
+    c = np.reshape(b, -1)
+    c[0] = 1
+    d = np.array(x)
+    np.asarray(d)[0] = 1
+    e = np.array(x)
+    np.add(o, o, e)
+    f = np.array(x)
+    print(np.reshape(f, -1))
+'''
+
+
+def test_copy_checks(diagnostics):
+    found = diagnostics(SECTION, dict.fromkeys(('hot', 'io', 'cold'), SOURCE))
+    assert codes(found['hot']) == [
+        (5, 'redundant-array-copy'),
+        (20, 'redundant-astype'),
+        (23, 'redundant-astype'),
+        (24, 'redundant-copy-chain'),
+        (25, 'redundant-copy-chain'),
+        (26, 'redundant-copy-chain'),
+        (27, 'redundant-asarray'),
+        (33, 'chained-advanced-index'),
+        (43, 'redundant-array-copy'),
+    ]
+    assert codes(found['io']) == [(27, 'redundant-asarray')]
+    assert 'cold' not in found
+
+
+def test_parse_copy_checks():
+    assert parse_copy_checks('a.*; b: redundant-astype') == [
+        ('a.*', frozenset(CODES)), ('b', frozenset(['redundant-astype']))]
+    assert parse_copy_checks(None) == []
+    with pytest.raises(ValueError):
+        parse_copy_checks('a: redundant-everything')
@@ -0,0 +1,61 @@
+import json
+
+from numpy_plugin import costs
+from .fixtures import diagnostics
+
+SOURCE = '''
+import numpy as np
+import numpy.linalg
+
+N = 2000
+
+def build() -> None:
+    a = np.zeros((1000, 1000))
+    b = np.eye(N)
+    c = np.sum(a, axis=0)
+    d = np.einsum('ij,jk->ik', a, a)
+    e = np.linalg.cholesky(b)
+
+def unknown(n: int) -> None:
+    x = np.ones((n, 3))
+
+def defaulted(n: int = None) -> None:
+    if n is None:
+        n = 10000
+    x = np.ones((n, 1000))
+'''
+
+
+def test_cost_report(tmpdir, monkeypatch, diagnostics):
+    monkeypatch.setattr(costs, '_model', None)
+    monkeypatch.setenv('NUMPY_PLUGIN_COST_REPORT', str(tmpdir.join('costs.json')))
+    monkeypatch.setenv('NUMPY_PLUGIN_MEMORY_BUDGET', '16M')
+    found = diagnostics('', {'module': SOURCE})
+
+    # only the 2000x2000 eye and the cholesky factor are over the budget
+    warnings = [message for _, message in found['module'] if 'memory budget' in message]
+    assert len(warnings) == 2, found
+    assert warnings[0].startswith('numpy.eye allocates 30.5 MiB')
+
+    # a recheck of the edited module, as by the daemon, parses it anew; its
+    # calls are counted once
+    diagnostics('', {'module': SOURCE + '# edited\n'})
+    costs._model.write()
+    report = json.loads(tmpdir.join('costs.json').read())
+    rows = {row['function']: row for row in report['functions']}
+    build = rows['module.build']
+    assert build['bytes_allocated'] == 8 * (10 ** 6 + 4 * 10 ** 6 + 1000 + 10 ** 6 + 4 * 10 ** 6)
+    # sum: 10^6 additions; einsum: 2 * 1000^3; cholesky: 2000^3 / 3
+    assert build['flops'] == 10 ** 6 + 2 * 10 ** 9 + 2000 ** 3 // 3
+    assert build['largest_allocation_site'].endswith(':9 numpy.eye')
+    assert build['unknown_calls'] == 0
+    assert rows['module.unknown']['unknown_calls'] == 1
+    # n is 10000 only when the caller leaves it out
+    assert rows['module.defaulted']['unknown_calls'] == 1
+
+
+def test_parse_size():
+    assert costs.parse_size('512M') == 512 * 2 ** 20
+    assert costs.parse_size('2GiB') == 2 * 2 ** 30
+    assert costs.parse_size('1000') == 1000
+    assert costs.parse_size(None) is None
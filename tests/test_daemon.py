@@ -0,0 +1,47 @@
+import os
+import time
+
+from .fixtures import BASE_DIR
+
+SOURCE = '''
+import numpy as np
+a = np.zeros((2, 2), dtype=int)
+reveal_type(a)
+reveal_type(np.sum(a, axis=1))
+reveal_type(np.add(a, 1.0)[0])
+'''
+
+
+def test_dmypy_rechecks_are_stable(tmpdir, monkeypatch):
+    from mypy.dmypy import Server
+
+    monkeypatch.chdir(tmpdir)
+    tmpdir.join('mypy.ini').write('''
+[mypy]
+mypy_path = {0}/numpy_plugin/stubs
+plugins = {0}/numpy_plugin_entry.py'''.format(BASE_DIR))
+    tmpdir.join('input.py').write(SOURCE)
+
+    server = Server(['--config-file', 'mypy.ini'])
+    outputs, timings = [], []
+    for i in range(4):
+        start = time.perf_counter()
+        response = server.cmd_check(['input.py'])
+        timings.append(time.perf_counter() - start)
+        outputs.append(response['out'])
+
+    assert outputs[0].splitlines() == [
+        "input.py:4: error: Revealed type is 'numpy.ndarray[builtins.int, numpy.TwoD]'",
+        "input.py:5: error: Revealed type is 'numpy.ndarray[builtins.int, numpy.OneD]'",
+        "input.py:6: error: Revealed type is 'numpy.ndarray[builtins.float*, numpy.OneD]'",
+    ]
+    assert all(out == outputs[0] for out in outputs)
+    # the first check analyzes everything; rechecks must not get slower
+    assert max(timings[1:]) < 1.5 * timings[0]
+
+    # an edit is seen by the next recheck
+    tmpdir.join('input.py').write(SOURCE + 'reveal_type(np.ones(3))\n')
+    tmpdir.join('input.py').setmtime(time.time() + 2)
+    out = server.cmd_check(['input.py'])['out'].splitlines()
+    assert out[-1] == "input.py:7: error: Revealed type is 'numpy.ndarray[builtins.float, numpy.OneD]'"
+    assert os.path.basename(server.options.cache_dir).startswith('numpy-plugin-')
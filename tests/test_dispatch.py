@@ -0,0 +1,29 @@
+from mypy.options import Options
+
+from numpy_plugin.dispatch import build_dispatch_index
+from numpy_plugin.plugin import NumpyPlugin
+from numpy_plugin.typefunctions import registry
+
+
+def test_dispatch_index():
+    index = build_dispatch_index(registry.keys())
+    assert index['numpy.zeros'] == 'function'
+    assert index['numpy.add'] == 'function'
+    assert index['numpy.ndarray.reshape'] == 'method'
+    # submodules of the stub package
+    assert index['numpy.linalg.eigh'] == 'function'
+    assert index['numpy.random.normal'] == 'function'
+    assert index['numpy.lib.stride_tricks.broadcast_to'] == 'function'
+    # no typefunction in the signature
+    assert 'numpy.bincount' not in index
+    # overloaded
+    assert 'numpy.where' not in index
+
+
+def test_non_numpy_callees_are_not_hooked():
+    plugin = NumpyPlugin(Options())
+    assert plugin.get_function_hook('builtins.len') is None
+    assert plugin.get_method_hook('builtins.list.append') is None
+    assert plugin.get_function_hook('numpy.zeros') is not None
+    assert plugin.get_function_hook('numpy.array') is not None
+    assert plugin.get_method_hook('numpy.ndarray.__getitem__') is not None
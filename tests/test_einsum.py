@@ -0,0 +1,45 @@
+from numpy_plugin.einsum import parse_subscripts, naive_flops, optimal_path
+from .fixtures import *
+
+
+def test_einsum_output(mypytest):
+    mypytest('''
+import numpy as np
+a = np.zeros((3, 4))
+f = np.zeros((4, 5), np.float32)
+i = np.zeros(4, int)
+reveal_type(np.einsum('ij,jk->ik', a, f))  # Revealed type is 'numpy.ndarray[builtins.float, numpy.TwoD]'
+reveal_type(np.einsum('ij,jk', f, f.T))  # Revealed type is 'numpy.ndarray[numpy.float32, numpy.TwoD]'
+reveal_type(np.einsum('i,i', i, i))  # Revealed type is 'builtins.int'
+reveal_type(np.einsum('ii', a))  # Revealed type is 'builtins.float'
+reveal_type(np.einsum('...j,j->...', np.zeros((2, 3, 4)), i))  # Revealed type is 'numpy.ndarray[builtins.float, numpy.TwoD]'
+reveal_type(np.einsum('ij,jk->ik', a, a.T, dtype='f'))  # Revealed type is 'numpy.ndarray[numpy.float32, numpy.TwoD]'
+reveal_type(np.einsum('ij,jk->iz', a, f))  # Revealed type is 'numpy.ndarray[builtins.float, Any]'
+''')
+
+
+def test_parse_subscripts():
+    assert parse_subscripts('ij,jk', [2, 2]) == (['ij', 'jk'], 'ik')
+    assert parse_subscripts('ij, jk -> ki', [2, None]) == (['ij', 'jk'], 'ki')
+    assert parse_subscripts('...ij,...jk->...ik', [4, 2]) == (['01ij', 'jk'], '01ik')
+    assert parse_subscripts('i...', [3]) == (['i01'], '01i')
+    assert parse_subscripts('ij,jk', [2, 3]) is None
+    assert parse_subscripts('ij,jk->il', [2, 2]) is None
+    assert parse_subscripts('i1,jk', [2, 2]) is None
+
+
+def test_contraction_path():
+    terms = parse_subscripts('ij,jk,kl->il', [2, 2, 2])
+    extents = dict.fromkeys('ijkl', 100)
+    # 100^4 index combinations, two multiplications and an addition each
+    assert naive_flops(terms, extents) == 3 * 100 ** 4
+    # two matrix products
+    assert optimal_path(terms, extents) == (2 * 2 * 100 ** 3, [(0, 1), (0, 1)])
+    # a small matrix first: (ij,jk) is cheap, (jk,kl) isn't
+    extents['i'] = 2
+    assert optimal_path(terms, extents) == (2 * (2 * 100 * 100 + 2 * 100 * 100),
+                                            [(0, 1), (0, 1)])
+    terms = parse_subscripts('ab,bc,cd->ad', [2, 2, 2])
+    extents = {'a': 100, 'b': 100, 'c': 100, 'd': 2}
+    assert optimal_path(terms, extents)[1] == [(1, 2), (0, 1)]
+    assert optimal_path(parse_subscripts('ij', [2]), extents) is None
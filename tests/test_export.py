@@ -0,0 +1,47 @@
+import os
+
+from mypy import api
+
+from numpy_plugin import export
+from .fixtures import BASE_DIR
+
+SOURCE = '''import numpy as np
+a = np.zeros((2, 3), dtype=int)
+b = np.sum(a, axis=0)
+c = np.sum(a)
+d = np.ones(len([1]))
+'''
+
+
+def test_export_call_sites(tmpdir, monkeypatch):
+    database = str(tmpdir.join('types.sqlite'))
+    monkeypatch.setenv('NUMPY_PLUGIN_EXPORT', database)
+    tmpdir.join('mypy.ini').write('''
+[mypy]
+mypy_path = {0}/numpy_plugin/stubs
+cache_dir = {1}
+plugins = {0}/numpy_plugin_entry.py'''.format(BASE_DIR, os.devnull))
+    module = tmpdir.join('module.py')
+    module.write(SOURCE)
+
+    api.run(['--config-file', str(tmpdir.join('mypy.ini')), str(module)])
+    export.flush_all()
+
+    [zeros] = export.lookup(database, str(module), 2)
+    assert (zeros['callee'], zeros['dtype'], zeros['ndim'], zeros['is_any']) == \
+        ('numpy.zeros', 'builtins.int', 2, 0)
+    assert zeros['column'] == 4
+    [reduced] = export.lookup(database, str(module), 3, 4)
+    assert (reduced['dtype'], reduced['ndim']) == ('builtins.int', 1)
+    [scalar] = export.lookup(database, str(module), 4)
+    assert (scalar['dtype'], scalar['ndim']) == ('builtins.int', 0)
+    [unknown] = export.lookup(database, str(module), 5)
+    assert (unknown['ndim'], unknown['is_any']) == (None, 1)
+
+    # a second build replaces the rows of the files it checks
+    module.write(SOURCE.replace('dtype=int', 'dtype=float'))
+    api.run(['--config-file', str(tmpdir.join('mypy.ini')), str(module)])
+    export.flush_all()
+    [zeros] = export.lookup(database, str(module), 2)
+    assert zeros['dtype'] == 'builtins.float'
+    assert export.main([database, '%s:2' % module]) == 0
@@ -43,3 +43,16 @@ reveal_type(b[None])  # Revealed type is 'numpy.ndarray[builtins.float*, numpy.T
 reveal_type(b[np.newaxis])  # Revealed type is 'numpy.ndarray[builtins.float*, numpy.ThreeD]'
 reveal_type(b[np.zeros(10, dtype='int')])  # Revealed type is 'numpy.ndarray[builtins.float*, numpy.TwoD]'
 ''')
+
+
+def test_indexing_mixed_slices_and_arrays(mypytest):
+    mypytest('''
+import numpy as np
+i1 = np.zeros(10, dtype='int')
+i2 = np.zeros((2, 5), dtype='int')
+a = np.zeros((3, 3, 3))
+reveal_type(a[i1, :])        # Revealed type is 'numpy.ndarray[builtins.float*, numpy.ThreeD]'
+reveal_type(a[:, i1])        # Revealed type is 'numpy.ndarray[builtins.float*, numpy.ThreeD]'
+reveal_type(a[..., i2])      # Revealed type is 'numpy.ndarray[builtins.float*, numpy.FourD]'
+reveal_type(a[0, :, i1])     # Revealed type is 'numpy.ndarray[builtins.float*, numpy.TwoD]'
+''')
@@ -0,0 +1,69 @@
+from .fixtures import diagnostics, codes
+
+SECTION = '''
+layout_checks =
+    hot
+    kernels: layout-contiguous-copy
+'''
+
+SOURCE = '''
+import numpy as np
+
+def transposed(x: np.ndarray) -> None:
+    a = np.zeros((3, 4))
+    b = a.T
+    b.reshape(12)
+    b.ravel()
+    a.reshape(12)
+    b.T.ravel()
+    np.ascontiguousarray(a.T)
+    np.ascontiguousarray(a)
+    x.reshape(3)
+
+def ordered() -> None:
+    c = np.zeros((3, 4), order='F')
+    c.reshape(12, order='F')
+    np.reshape(c, 12)
+    np.reshape(c.copy(), 12)
+    np.reshape(c.copy(order='K'), 12)
+    np.swapaxes(c, 0, 1).ravel()
+
+def sliced() -> None:
+    a = np.ones((2, 3, 4))
+    a[1:2].ravel()
+    a[0, 1:3].ravel()
+    a[:, 1:3].ravel()
+    a[::2].ravel()
+    a.transpose(0, 2, 1).ravel()
+    a.transpose(0, 1, 2).ravel()
+    a.transpose((0, 2, 1)).ravel()
+    a.transpose((0, 1, 2)).ravel()
+
+def literals() -> None:
+    rows = [[1.0, 2.0], [3.0, 4.0]]
+    f = np.array(rows, order='F')
+    np.ascontiguousarray(f.T)
+    np.ascontiguousarray(f)
+    np.asarray(rows, order='F').ravel()
+    np.array(rows).ravel()
+'''
+
+
+def test_layout_checks(diagnostics):
+    found = diagnostics(SECTION, dict.fromkeys(('hot', 'kernels', 'cold'), SOURCE))
+    assert codes(found['hot']) == [
+        (7, 'layout-reshape-copy'),
+        (8, 'layout-reshape-copy'),
+        (11, 'layout-contiguous-copy'),
+        (18, 'layout-reshape-copy'),
+        (20, 'layout-reshape-copy'),
+        (27, 'layout-reshape-copy'),
+        (28, 'layout-reshape-copy'),
+        (29, 'layout-reshape-copy'),
+        (31, 'layout-reshape-copy'),
+        (38, 'layout-contiguous-copy'),
+        (39, 'layout-reshape-copy'),
+    ]
+    assert codes(found['kernels']) == [(11, 'layout-contiguous-copy'),
+                                       (38, 'layout-contiguous-copy')]
+    assert 'cold' not in found
@@ -0,0 +1,62 @@
+import json
+
+from numpy_plugin import loops
+from .fixtures import diagnostics, codes
+
+SECTION = '''
+loop_checks = hot: loop-element-access
+loop_report = {0}
+'''
+
+SOURCE = '''
+import numpy as np
+
+def slow() -> float:
+    b = np.zeros((3, 3))
+    c = np.zeros(3)
+    total = 0.0
+    for i in range(3):
+        for j in range(3):
+            total += b[i, j]
+        row = b[i]
+    for x in c:
+        total += x
+    ys = [y * 2 for y in c.flat]
+    k = 0
+    while k < 3:
+        total += c[k]
+        k += 1
+    return total + sum(b[i, i] for i in range(3)) + c[0]
+
+def fast() -> None:
+    c = np.zeros(3)
+    for row in np.zeros((3, 3)):
+        pass
+    def inner(i: int) -> float:
+        return c[i]
+    print(inner(0), [i for i in range(3)])
+'''
+
+
+def test_loop_checks(tmpdir, monkeypatch, diagnostics):
+    monkeypatch.setattr(loops, '_checker', None)
+    report = tmpdir.join('loops.json')
+    found = diagnostics(SECTION.format(report), dict.fromkeys(('hot', 'cold'), SOURCE))
+
+    # only accesses are enabled in hot, and nothing in cold
+    assert codes(found['hot']) == [(10, 'loop-element-access'), (17, 'loop-element-access'),
+                                   (19, 'loop-element-access')]
+    assert 'cold' not in found
+
+    # a recheck of the edited modules, as by the daemon, parses them anew;
+    # their accesses are counted once
+    diagnostics(SECTION.format(report), dict.fromkeys(('hot', 'cold'), SOURCE + '# edited\n'))
+    loops._checker.write()
+    rows = [r for r in json.loads(report.read())['loops'] if r['file'].endswith('hot.py')]
+    # b[i] in the outer loop is a row; the 2-D iteration in fast is its own
+    # loop, ranked after slow's
+    assert [(r['function'], r['loop_line']) for r in rows] == [
+        ('hot.slow', 9), ('hot.slow', 12), ('hot.slow', 14), ('hot.slow', 16),
+        ('hot.slow', 19), ('hot.fast', 23)]
+    assert [r['function_total'] for r in rows] == [5] * 5 + [1]
+    assert [r['element_iterations'] for r in rows] == [0, 1, 1, 0, 0, 1]
@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+
+from mypy.nodes import NameExpr
+from mypy.types import AnyType, TypeOfAny
+
+from numpy_plugin.bind_arguments import BoundArguments, Layout
+from numpy_plugin.outputs import passes_out
+from .fixtures import *
+
+
+def test_out_is_returned(mypytest):
+    mypytest('''
+import numpy as np
+a = np.zeros((3, 4))
+f = np.zeros((3, 4), np.float32)
+reveal_type(np.add(f, 1.0, out=f))  # Revealed type is 'numpy.ndarray[numpy.float32, numpy.TwoD]'
+reveal_type(np.add(f, f, out=a))  # Revealed type is 'numpy.ndarray[builtins.float, numpy.TwoD]'
+reveal_type(np.add(np.zeros(4), 1.0, out=a))  # Revealed type is 'numpy.ndarray[builtins.float, numpy.TwoD]'
+reveal_type(np.sum(a, axis=0, out=np.zeros(4)))  # Revealed type is 'numpy.ndarray[builtins.float, numpy.OneD]'
+reveal_type(np.sum(np.zeros((3, 4), np.int8), axis=0, out=np.zeros(4, np.int8)))  # Revealed type is 'numpy.ndarray[numpy.int8, numpy.OneD]'
+reveal_type(np.around(a, out=a))  # Revealed type is 'numpy.ndarray[builtins.float, numpy.TwoD]'
+reveal_type(np.frexp(a, out1=a))  # Revealed type is 'Tuple[numpy.ndarray[builtins.float, numpy.TwoD], numpy.ndarray[numpy.int32, numpy.TwoD]]'
+''')
+
+
+def test_out_mismatches(diagnostics):
+    source = '''
+import numpy as np
+a = np.zeros((3, 4))
+np.add(a, a, out=np.zeros((3, 4), int))
+np.add(a, a, out=np.zeros((3, 4), np.float32))
+np.add(a, a, out=np.zeros(4))
+np.sum(a, axis=0, out=a)
+np.cumsum(a, axis=0, out=np.zeros(4))
+np.clip(a, 0, 1, out=np.zeros((3, 4), int))
+np.greater(a, 0.0, out=np.zeros((3, 4), bool))
+np.add(a, a, out=np.zeros((3, 4), int))
+'''
+    assert diagnostics('', {'outputs': source})['outputs'] == [
+        (4, 'Argument "out" to "add" has dtype int64, which the float64 result can\'t be cast to'),
+        (5, 'Argument "out" to "add" has dtype float32; the float64 result is cast to it silently'),
+        (6, 'Argument "out" to "add" has 1 dimensions, but the result has 2'),
+        (7, 'Argument "out" to "sum" has 2 dimensions, but the result has 1'),
+        (8, 'Argument "out" to "cumsum" has 1 dimensions, but the result has 2'),
+        (9, 'Argument "out" to "clip" has dtype int64; the float64 result is cast to it silently'),
+        # not memoized away
+        (11, 'Argument "out" to "add" has dtype int64, which the float64 result can\'t be cast to'),
+    ]
+
+
+def test_passes_out_to_methods():
+    # a method's actuals are bound without self; out is the second formal
+    method = SimpleNamespace(arg_names=['self', 'axis', 'out'], arg_types=[None] * 3)
+    buffer = ([AnyType(TypeOfAny.explicit)], [NameExpr('b')])
+    assert passes_out(BoundArguments(Layout(method, 1), [[], buffer[0]], [[], buffer[1]]))
+    assert not passes_out(BoundArguments(Layout(method, 1), [buffer[0], []], [buffer[1], []]))
@@ -0,0 +1,66 @@
+from mypy.nodes import TypeInfo, SymbolTable, ClassDef, Block, NameExpr, StrExpr, TupleExpr
+from mypy.types import Instance, TypeVarType, TypeVarDef
+
+from numpy_plugin.cache import expr_key
+from numpy_plugin.plan import compile_plan, Call, Rebuild, SUBSTITUTED, PlanMismatch
+from .fixtures import *
+
+
+def make_info(fullname):
+    name = fullname.rsplit('.', 1)[-1]
+    info = TypeInfo(SymbolTable(), ClassDef(name, Block([])), fullname.rsplit('.', 1)[0])
+    info._fullname = fullname
+    return info
+
+
+def test_compile_plan_nested_typefunctions():
+    ndarray, float_, lower = (make_info(n) for n in
+                              ('numpy.ndarray', 'builtins.float', 'numpy._LowerDim'))
+    calls = []
+
+    def lower_dim(typ, funcname, bound_args):
+        calls.append(typ.args[0])
+        return Instance(float_, [])
+
+    d = TypeVarType(TypeVarDef('_D', 'numpy._D', -1, [], Instance(float_, [])))
+    plan = compile_plan(Instance(ndarray, [Instance(float_, []), Instance(lower, [d])]),
+                        {'numpy._LowerDim': lower_dim})
+    assert isinstance(plan, Rebuild)
+    assert plan.children[0] is None
+    assert isinstance(plan.children[1], Call)
+    assert plan.children[1].children == [SUBSTITUTED]
+
+    # the value of _D is marked erased by the substitution, and unmarked
+    # before the typefunction sees it
+    value = Instance(float_, [], erased=True)
+    result = plan.evaluate(Instance(ndarray, [Instance(float_, []), Instance(lower, [value])]),
+                           'numpy.f', None)
+    assert calls[0].type is float_ and not calls[0].erased
+    assert result.type is ndarray and result.args[1].type is float_
+
+    with pytest.raises(PlanMismatch):
+        plan.evaluate(Instance(float_, []), 'numpy.f', None)
+
+    assert compile_plan(Instance(float_, []), {}) is None
+
+
+def test_expr_key_keeps_what_typefunctions_read():
+    assert expr_key(StrExpr('f')) != expr_key(StrExpr('i'))
+    assert expr_key(NameExpr('n')) != expr_key(NameExpr('int'))
+    assert expr_key(TupleExpr([NameExpr('n'), NameExpr('m')])) == \
+        expr_key(TupleExpr([NameExpr('a'), NameExpr('b')]))
+
+
+def test_memoized_calls(mypytest):
+    mypytest('''
+import numpy as np
+n = 3
+reveal_type(np.zeros((n, n)))  # Revealed type is 'numpy.ndarray[builtins.float, numpy.TwoD]'
+reveal_type(np.zeros((n, n)))  # Revealed type is 'numpy.ndarray[builtins.float, numpy.TwoD]'
+reveal_type(np.zeros((n, n), int))  # Revealed type is 'numpy.ndarray[builtins.int, numpy.TwoD]'
+reveal_type(np.zeros((n, n), 'f'))  # Revealed type is 'numpy.ndarray[numpy.float32, numpy.TwoD]'
+reveal_type(np.zeros((n, n, n), 'i'))  # Revealed type is 'numpy.ndarray[numpy.int32, numpy.ThreeD]'
+reveal_type(np.sum(np.zeros((n, n)), axis=0, keepdims=True))  # Revealed type is 'numpy.ndarray[builtins.float, numpy.TwoD]'
+reveal_type(np.sum(np.zeros((n, n)), axis=0, keepdims=False))  # Revealed type is 'numpy.ndarray[builtins.float, numpy.OneD]'
+reveal_type(np.average(np.zeros((n, n)), axis=1))  # Revealed type is 'numpy.ndarray[builtins.float, numpy.OneD]'
+''')
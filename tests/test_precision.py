@@ -0,0 +1,67 @@
+from .fixtures import *
+
+
+def test_constructors_keep_width(mypytest):
+    mypytest('''
+import numpy as np
+reveal_type(np.zeros((3, 3), dtype=np.float32))  # Revealed type is 'numpy.ndarray[numpy.float32, numpy.TwoD]'
+reveal_type(np.ones(3, 'u1'))  # Revealed type is 'numpy.ndarray[numpy.uint8, numpy.OneD]'
+reveal_type(np.eye(3, dtype='float16'))  # Revealed type is 'numpy.ndarray[numpy.float16, numpy.TwoD]'
+reveal_type(np.array([1, 2], dtype=np.int16))  # Revealed type is 'numpy.ndarray[numpy.int16, numpy.OneD]'
+reveal_type(np.asarray(np.zeros(3), dtype='f4'))  # Revealed type is 'numpy.ndarray[numpy.float32, numpy.OneD]'
+reveal_type(np.zeros_like(np.zeros(3, np.int8)))  # Revealed type is 'numpy.ndarray[numpy.int8, numpy.OneD]'
+reveal_type(np.zeros(3).astype(np.float32))  # Revealed type is 'numpy.ndarray[numpy.float32, numpy.OneD]'
+reveal_type(np.zeros((3, 3), np.float64))  # Revealed type is 'numpy.ndarray[builtins.float, numpy.TwoD]'
+''')
+
+
+def test_ufunc_promotion(mypytest):
+    mypytest('''
+import numpy as np
+a = np.zeros((3, 3), dtype=np.float32)
+reveal_type(np.multiply(a, 2.0))  # Revealed type is 'numpy.ndarray[numpy.float32, numpy.TwoD]'
+reveal_type(np.add(a, 1))  # Revealed type is 'numpy.ndarray[numpy.float32, numpy.TwoD]'
+reveal_type(np.add(a, np.ones((3, 3))))  # Revealed type is 'numpy.ndarray[builtins.float, numpy.TwoD]'
+reveal_type(np.add(np.zeros(3, 'u1'), np.zeros(3, 'i1')))  # Revealed type is 'numpy.ndarray[numpy.int16, numpy.OneD]'
+reveal_type(np.add(np.zeros(3, 'i1'), 1))  # Revealed type is 'numpy.ndarray[numpy.int8, numpy.OneD]'
+reveal_type(np.add(np.zeros(3, 'i4'), 1.5))  # Revealed type is 'numpy.ndarray[builtins.float, numpy.OneD]'
+reveal_type(np.add(np.zeros(3, bool), 1))  # Revealed type is 'numpy.ndarray[builtins.int, numpy.OneD]'
+reveal_type(np.true_divide(np.zeros(3, 'i1'), np.zeros(3, 'i1')))  # Revealed type is 'numpy.ndarray[builtins.float, numpy.OneD]'
+reveal_type(np.divide(np.zeros(3, 'i1'), 2))  # Revealed type is 'numpy.ndarray[builtins.float, numpy.OneD]'
+reveal_type(np.true_divide(np.zeros(3, 'e'), np.zeros(3, 'e')))  # Revealed type is 'numpy.ndarray[numpy.float16, numpy.OneD]'
+''')
+
+
+def test_reductions(mypytest):
+    mypytest('''
+import numpy as np
+a = np.zeros((3, 3), dtype=np.float32)
+reveal_type(np.sum(a, axis=0))  # Revealed type is 'numpy.ndarray[numpy.float32, numpy.OneD]'
+reveal_type(np.sum(np.zeros(3, 'i1')))  # Revealed type is 'builtins.int'
+reveal_type(np.cumsum(np.zeros(3, 'u2')))  # Revealed type is 'numpy.ndarray[numpy.uint64, numpy.OneD]'
+reveal_type(np.cumproduct(np.zeros(3, 'i1')))  # Revealed type is 'numpy.ndarray[builtins.int, numpy.OneD]'
+reveal_type(np.trace(np.zeros((3, 3), 'u1')))  # Revealed type is 'numpy.uint64'
+reveal_type(np.sum(a, dtype='f8'))  # Revealed type is 'builtins.float'
+reveal_type(np.mean(np.zeros(3, int)))  # Revealed type is 'builtins.float'
+reveal_type(np.mean(a, axis=1))  # Revealed type is 'numpy.ndarray[numpy.float32, numpy.OneD]'
+reveal_type(np.std(a, axis=1))  # Revealed type is 'numpy.ndarray[numpy.float32, numpy.OneD]'
+reveal_type(np.average(np.zeros((2, 2), bool), axis=0))  # Revealed type is 'numpy.ndarray[builtins.float, numpy.OneD]'
+reveal_type(np.amax(a, axis=0))  # Revealed type is 'numpy.ndarray[numpy.float32, numpy.OneD]'
+''')
+
+
+def test_upcasts_are_rejected():
+    from numpy_plugin import verify
+    from collections import OrderedDict
+    source = '''
+import numpy as np
+def keep(x: np.ndarray[np.float32, np.TwoD]) -> np.ndarray[np.float32, np.TwoD]:
+    return np.multiply(x, 0.5)
+def upcast(x: np.ndarray[np.float32, np.TwoD]) -> np.ndarray[np.float32, np.TwoD]:
+    return np.multiply(x, np.ones((3, 3)))
+def widen(x: np.ndarray[np.float32, np.TwoD]) -> np.ndarray[float, np.TwoD]:
+    return x
+'''
+    [received] = verify.check_snippets(OrderedDict(upcasts=source)).values()
+    assert [line for line, _ in received] == [6]
+    assert 'expected "ndarray[float32, TwoD]"' in received[0][1]
@@ -0,0 +1,29 @@
+import csv
+import json
+from types import SimpleNamespace
+
+from numpy_plugin.profiling import Profiler
+
+
+def test_profiler_report(tmpdir):
+    profiler = Profiler(str(tmpdir.join('profile.json')))
+    typefunction = profiler.wrap('typefunction', 'numpy._UfuncCast', lambda x: x)
+    hook = profiler.wrap_hook(lambda fullname, calltype, ctx: typefunction(1))
+
+    for line in (1, 2, 3):
+        ctx = SimpleNamespace(api=SimpleNamespace(path='m.py'),
+                              context=SimpleNamespace(line=line))
+        assert hook('numpy.add', 'function', ctx) == 1
+
+    profiler.write()
+    report = json.loads(tmpdir.join('profile.json').read())
+    by_name = {h['name']: h for h in report['hooks']}
+    assert by_name['numpy.add']['count'] == 3
+    assert by_name['numpy._UfuncCast']['slowest_site'].startswith('m.py:')
+    assert by_name['numpy.add']['p50_ms'] <= by_name['numpy.add']['p99_ms']
+    assert len(report['slowest_calls']) == 6
+
+    profiler.output = str(tmpdir.join('profile.csv'))
+    profiler.write()
+    rows = list(csv.DictReader(tmpdir.join('profile.csv').open()))
+    assert {r['name'] for r in rows} == {'numpy.add', 'numpy._UfuncCast'}
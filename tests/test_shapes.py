@@ -0,0 +1,103 @@
+from numpy_plugin.shapes import broadcast, is_outer, reshaped, multiply, divide
+from .fixtures import diagnostics, codes
+
+SECTION = '''
+shape_checks =
+    hot
+    kernels: shape-mismatch
+'''
+
+SOURCE = '''
+import numpy as np
+
+def broadcasts(n: int, m: int, x: np.ndarray[float, np.TwoD]) -> None:
+    a = np.zeros((n, m))
+    a + np.zeros(m)
+    c = np.zeros((3, 4))
+    c + np.zeros(5)
+    np.add(c, np.zeros(5))
+    np.zeros((n, 1)) * np.zeros((1, m))
+    np.zeros((n, 1)) * a
+    rows, cols = x.shape
+    x - np.zeros(cols)
+    x - np.zeros(rows)
+    x.T - np.zeros(len(x))
+
+def propagated(n: int) -> None:
+    c = np.zeros((3, 4))
+    c.reshape((-1, 6)) + np.zeros((2, 6))
+    c.reshape((-1, 5))
+    c.reshape((2, 2))
+    np.sum(c, axis=0) + np.zeros(4)
+    np.sum(c, axis=1) + np.zeros(4)
+    np.mean(c, axis=1, keepdims=True) * c
+    c[1:3] + np.zeros((2, 4))
+    c[1:3] + np.zeros((3, 4))
+    c[:, None, 0] * c[None, :, 0]
+    b = np.ones((n, 3))
+    b.ravel()[:, None] * b.ravel()
+
+def stacked() -> None:
+    c = np.zeros((3, 4))
+    np.concatenate([c, np.zeros((2, 4))])
+    np.concatenate([c, np.zeros((2, 5))])
+    np.stack([c, np.zeros((3, 4))]) + np.zeros((2, 3, 4))
+    np.concatenate([c, c], axis=1) + np.zeros(4)
+
+def contracted(n: int) -> None:
+    x = np.zeros((n, n))
+    np.einsum('ij,jk,kl->il', x, x, x)
+    np.einsum('ij,jk,kl->il', x, x, x, optimize=True)
+    np.einsum('ij,jk,kl->il', np.eye(3), np.eye(3), np.eye(3))
+    np.einsum('ij,jk->ik', np.zeros((n, 3)), np.zeros((3, 4))) + np.zeros(5)
+
+def drawn() -> None:
+    np.random.randint(0, 10, 100) + np.zeros(100)
+    np.random.normal(5, 1, 10) + np.zeros(10)
+    np.random.choice(np.arange(5), 3) + np.zeros(3)
+    np.random.uniform(0, 1, (2, 3)) + np.zeros(4)
+
+def defaulted(n: int = None) -> None:
+    if n is None:
+        n = 10
+    np.zeros(n) + np.ones(3)
+'''
+
+
+def test_shape_checks(diagnostics):
+    found = diagnostics(SECTION, dict.fromkeys(('hot', 'kernels', 'cold'), SOURCE))
+    assert codes(found['hot']) == [
+        (8, 'shape-mismatch'),
+        (9, 'shape-mismatch'),
+        (10, 'broadcast-outer'),
+        (20, 'shape-mismatch'),
+        (21, 'shape-mismatch'),
+        (23, 'shape-mismatch'),
+        (26, 'shape-mismatch'),
+        (27, 'broadcast-outer'),
+        (29, 'broadcast-outer'),
+        (34, 'shape-mismatch'),
+        (36, 'shape-mismatch'),
+        (40, 'einsum-unoptimized'),
+        (43, 'shape-mismatch'),
+        (49, 'shape-mismatch'),
+    ]
+    assert codes(found['kernels']) == [line for line in codes(found['hot'])
+                                       if line[1] == 'shape-mismatch']
+    assert 'cold' not in found
+
+
+def test_symbolic_extents():
+    assert broadcast([('n', 1), (1, 'm')]) == (('n', 'm'), False)
+    assert broadcast([('n', 'm'), (3,)]) == (('n', 3), False)
+    assert broadcast([(3, 4), (5,)]) == ((3, 4), True)
+    # either name may be 1
+    assert broadcast([('n',), ('m',)]) == ((None,), False)
+    assert is_outer([('n', 1), (1, 'm')], ('n', 'm'))
+    assert not is_outer([('n', 1), ('n', 'm')], ('n', 'm'))
+    assert not is_outer([(None, 1), (1, None)], (None, None))
+    assert multiply(['n', 2, 'm', 3]) == '6*m*n'
+    assert divide('6*m*n', multiply([3, 'n'])) == '2*m'
+    assert reshaped((3, 'n'), (-1,)) == (('3*n',), False)
+    assert reshaped((3, 'n'), ('n', -1)) == (('n', 3), False)
+    assert reshaped((3, 4), (5, 2)) == ((5, 2), True)
@@ -0,0 +1,71 @@
+import os
+
+from mypy import api
+
+from numpy_plugin import stubcache
+from .fixtures import BASE_DIR
+
+CONFIG = '''
+[mypy]
+mypy_path = {0}/numpy_plugin/stubs
+cache_dir = {1}
+plugins = {0}/numpy_plugin_entry.py
+
+[numpy-plugin]
+incremental = {2}
+'''
+
+
+def run(tmpdir, cache_dir, incremental=True):
+    config = tmpdir.join('mypy-%s.ini' % os.path.basename(cache_dir))
+    config.write(CONFIG.format(BASE_DIR, cache_dir, incremental))
+    module = tmpdir.join('module.py')
+    module.write('import numpy as np\nreveal_type(np.zeros((2, 3)))\n')
+    stdout, _, _ = api.run(['--config-file', str(config), str(module)])
+    return stdout
+
+
+def numpy_metas(cache_dir):
+    return [os.path.join(root, name) for root, _, files in os.walk(cache_dir)
+            for name in files if name == '__init__.meta.json' and root.endswith('numpy')]
+
+
+def test_seed_from_harvested_fragment(tmpdir, monkeypatch):
+    store = str(tmpdir.join('store'))
+    monkeypatch.setenv('NUMPY_PLUGIN_STUB_CACHE', store)
+    monkeypatch.setattr(stubcache, '_pending', {})
+
+    first = run(tmpdir, str(tmpdir.join('first')))
+    assert not os.path.exists(store)
+    stubcache.harvest_all()
+    [fragment] = os.listdir(store)
+    files = stubcache.fragment_files(os.path.join(store, fragment))
+    assert any(f.endswith(os.path.join('numpy', '__init__.meta.json')) for f in files)
+    assert any(f.endswith('builtins.meta.json') for f in files)
+
+    # a build with an empty cache starts from the fragment, and mypy
+    # accepts it: the seeded files are not rewritten
+    second = str(tmpdir.join('second'))
+    stdout = run(tmpdir, second)
+    assert stdout == first
+    [meta] = numpy_metas(second)
+    [stored] = numpy_metas(os.path.join(store, fragment))
+    assert os.path.getmtime(meta) == os.path.getmtime(stored)
+    assert not stubcache._pending
+
+
+def test_stub_cache_off(tmpdir, monkeypatch):
+    monkeypatch.setenv('NUMPY_PLUGIN_STUB_CACHE', 'off')
+    monkeypatch.setattr(stubcache, '_pending', {})
+    run(tmpdir, str(tmpdir.join('cache')))
+    assert not stubcache._pending
+    assert stubcache.store_from_config(None) is None
+
+
+def test_no_stub_cache_by_default(tmpdir, monkeypatch):
+    monkeypatch.delenv('NUMPY_PLUGIN_STUB_CACHE', raising=False)
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmpdir.join('xdg')))
+    monkeypatch.setattr(stubcache, '_pending', {})
+    run(tmpdir, str(tmpdir.join('cache')), incremental=False)
+    assert not stubcache._pending
+    assert not os.path.exists(str(tmpdir.join('xdg')))
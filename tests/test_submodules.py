@@ -0,0 +1,40 @@
+from .fixtures import *
+
+
+def test_linalg(mypytest):
+    mypytest('''
+    import numpy as np
+    a = np.zeros((3, 3))
+    w, v = np.linalg.eigh(a)
+    reveal_type(w)  # Revealed type is 'numpy.ndarray[builtins.float, numpy.OneD]'
+    reveal_type(np.linalg.cholesky(a))  # Revealed type is 'numpy.ndarray[builtins.float, numpy.TwoD]'
+    ''')
+
+
+def test_random(mypytest):
+    mypytest('''
+    import numpy as np
+    reveal_type(np.random.normal(size=(2, 3)))  # Revealed type is 'numpy.ndarray[builtins.float, numpy.TwoD]'
+    reveal_type(np.random.randint(0, 10, size=5))  # Revealed type is 'numpy.ndarray[builtins.int, numpy.OneD]'
+    reveal_type(np.random.random())  # Revealed type is 'builtins.float'
+    ''')
+
+
+def test_stride_tricks(mypytest):
+    mypytest('''
+    import numpy as np
+    from numpy.lib.stride_tricks import broadcast_to
+    from numpy.testing import assert_allclose
+    a = np.zeros(3)
+    b = broadcast_to(a, (4, 3))
+    reveal_type(b)  # Revealed type is 'numpy.ndarray[builtins.float, numpy.TwoD]'
+    assert_allclose(b, b)
+    ''')
+
+
+def test_testing(mypytest):
+    mypytest('''
+    import numpy as np
+    a = np.zeros(3)
+    np.testing.assert_allclose(a, a)
+    ''')
@@ -0,0 +1,53 @@
+import itertools
+import subprocess
+import sys
+
+import pytest
+
+from numpy_plugin import tables
+from .fixtures import BASE_DIR
+
+
+def test_plugin_does_not_import_numpy():
+    code = ('import sys, numpy_plugin.plugin; '
+            'sys.exit("numpy" in sys.modules)')
+    assert subprocess.call([sys.executable, '-c', code], cwd=BASE_DIR) == 0
+
+
+def test_tables_match_installed_numpy():
+    np = pytest.importorskip('numpy')
+    if np.__version__ != tables.NUMPY_VERSION:
+        pytest.skip('tables generated from NumPy %s' % tables.NUMPY_VERSION)
+
+    for name, char in tables.DTYPE_ALIASES.items():
+        assert np.dtype(name) == np.dtype(char)
+    for a, targets in tables.CAN_CAST_SAFE.items():
+        for b in tables.TYPECHARS:
+            assert np.can_cast(a, b) == (b in targets)
+    for a, targets in tables.CAN_CAST_SAME_KIND.items():
+        for b in tables.TYPECHARS:
+            assert np.can_cast(a, b, 'same_kind') == (b in targets)
+
+    # every loop, and every combination of inputs without one, against the
+    # types of an actual call on arrays
+    for name, table in tables.UFUNC_OUTPUTS.items():
+        ufunc = getattr(np, name)
+        for inputs in itertools.product(tables.TYPECHARS, repeat=ufunc.nin):
+            arrays = [np.ones(1, dtype=c) for c in inputs]
+            try:
+                with np.errstate(all='ignore'):
+                    results = ufunc(*arrays)
+            except TypeError:
+                assert ''.join(inputs) not in table, (name, inputs)
+                continue
+            results = results if isinstance(results, tuple) else (results,)
+            expected = [r.dtype for r in results]
+            outputs = table.get(''.join(inputs))
+            assert outputs is not None and [np.dtype(c) for c in outputs] == expected, \
+                (name, inputs, outputs, expected)
+    # bool and integers are divided in float64, as np.result_type(a, b, 1.0)
+    for inputs, output in (('??', 'd'), ('bb', 'd'), ('ll', 'd'), ('ee', 'e'), ('ff', 'f')):
+        assert tables.UFUNC_OUTPUTS['true_divide'][inputs] == output
+    for name, target in tables.UFUNC_ALIASES.items():
+        assert getattr(np, name) is getattr(np, target)
+
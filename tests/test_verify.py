@@ -0,0 +1,29 @@
+import os
+import tempfile
+import shutil
+from collections import OrderedDict
+
+from numpy_plugin import verify
+
+
+def test_batch_maps_messages_to_snippets():
+    results = verify.verify_snippets(OrderedDict([
+        ('int', 'reveal_type(1)  # Revealed type is \'builtins.int\''),
+        ('str', 'x = 1\nreveal_type("")  # Revealed type is \'builtins.str\''),
+        ('wrong', 'reveal_type(1.0)  # Revealed type is \'builtins.int\''),
+    ]))
+    assert [r.name for r in results] == ['int', 'str', 'wrong']
+    assert [r.ok for r in results] == [True, True, False]
+    assert results[1].received == [(2, "Revealed type is 'builtins.str'")]
+
+
+def test_golden_files():
+    td = tempfile.mkdtemp()
+    try:
+        path = os.path.join(td, 'golden.py')
+        with open(path, 'w') as f:
+            f.write('import numpy as np\n'
+                    'reveal_type(np.zeros((2, 3)))  # Revealed type is \'numpy.ndarray[builtins.float, numpy.TwoD]\'\n')
+        assert verify.main([path]) == 0
+    finally:
+        shutil.rmtree(td)
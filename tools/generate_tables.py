@@ -0,0 +1,177 @@
+"""Regenerate ``numpy_plugin/tables.py`` from an installed NumPy.
+
+    $ python tools/generate_tables.py [--numpy-version 1.19.5] [--output PATH]
+
+The plugin never imports NumPy at type-check time; everything it needs to
+know about dtypes, casting and ufunc loop resolution is captured here, once,
+from whichever NumPy this script runs against. Pass ``--numpy-version`` to
+refuse to run against any other version.
+"""
+import argparse
+import itertools
+import os
+import sys
+import warnings
+
+import numpy as np
+
+OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                      'numpy_plugin', 'tables.py')
+
+# Bumped whenever the layout of the generated module changes.
+TABLES_VERSION = 1
+
+# The type characters the plugin can represent: bool, the signed and unsigned
+# integers and the floats, narrowest first.
+TYPECHARS = '?bhilBHILefd'
+
+HEADER = '''\
+"""Dtype, casting and ufunc resolution tables.
+
+Generated by tools/generate_tables.py from NumPy {numpy_version}; do not edit.
+"""
+'''
+
+
+def canonical_char(dtype):
+    """The character in TYPECHARS naming the same dtype, or None."""
+    for c in TYPECHARS:
+        if np.dtype(c) == dtype:
+            return c
+    return None
+
+
+def dtype_aliases():
+    names = set(k for k in np.sctypeDict if isinstance(k, str))
+    names |= {'bool', 'int', 'float'}
+    aliases = {}
+    for name in sorted(names):
+        with warnings.catch_warnings():
+            # skip deprecated spellings such as 'Float64'
+            warnings.simplefilter('error', DeprecationWarning)
+            try:
+                dtype = np.dtype(name)
+            except (TypeError, DeprecationWarning):
+                continue
+        char = canonical_char(dtype)
+        if char is not None:
+            aliases[name] = char
+    for c in TYPECHARS:
+        aliases[c] = c
+    return aliases
+
+
+def casting_table(casting):
+    return {a: ''.join(b for b in TYPECHARS if np.can_cast(a, b, casting))
+            for a in TYPECHARS}
+
+
+def resolve_loop(ufunc, inputs):
+    # The output types of a call on one-element arrays of the input types.
+    # Taking the first loop every input casts to safely, as NumPy's default
+    # type resolver does, isn't enough: true_divide sends bool and integer
+    # inputs to its 'dd' loop, and subtract, negative and others refuse
+    # bools, so the ufunc's own resolver is asked.
+    arrays = [np.ones(1, dtype=c) for c in inputs]
+    try:
+        with np.errstate(all='ignore'):
+            results = ufunc(*arrays)
+    except TypeError:
+        return None
+    if not isinstance(results, tuple):
+        results = (results,)
+    return ''.join(canonical_char(r.dtype) or '' for r in results)
+
+
+def ufunc_tables():
+    outputs = {}
+    aliases = {}
+    canonical = {}
+    for name in sorted(dir(np)):
+        ufunc = getattr(np, name)
+        if not isinstance(ufunc, np.ufunc):
+            continue
+        if ufunc.__name__ != name and ufunc.__name__ in canonical.values():
+            aliases[name] = ufunc.__name__
+            continue
+        canonical[name] = ufunc.__name__
+        table = {}
+        for inputs in itertools.product(TYPECHARS, repeat=ufunc.nin):
+            out = resolve_loop(ufunc, inputs)
+            if out and len(out) == ufunc.nout:
+                table[''.join(inputs)] = out
+        outputs[ufunc.__name__] = table
+    for name, target in canonical.items():
+        if name != target:
+            aliases[name] = target
+    return outputs, aliases
+
+
+def render(numpy_version):
+    outputs, aliases = ufunc_tables()
+    sections = [
+        HEADER.format(numpy_version=numpy_version),
+        'NUMPY_VERSION = %r' % numpy_version,
+        'TABLES_VERSION = %r' % TABLES_VERSION,
+        '',
+        '# Type characters covered by the tables, narrowest first.',
+        'TYPECHARS = %r' % TYPECHARS,
+        '',
+        '# dtype name or character -> canonical type character',
+        'DTYPE_ALIASES = %s' % _compact_dict(dtype_aliases(), indent=4),
+        '',
+        '# type character -> dtype kind',
+        'KINDS = %s' % _compact_dict(
+            {c: np.dtype(c).kind for c in TYPECHARS}, indent=4),
+        '',
+        '# type character -> itemsize in bytes',
+        'ITEMSIZES = %s' % _compact_dict(
+            {c: np.dtype(c).itemsize for c in TYPECHARS}, indent=4),
+        '',
+        '# type character -> the characters it casts to under each casting rule',
+        'CAN_CAST_SAFE = %s' % _compact_dict(casting_table('safe'), indent=4),
+        'CAN_CAST_SAME_KIND = %s' % _compact_dict(casting_table('same_kind'), indent=4),
+        '',
+        '# ufunc alias -> the name it is listed under in UFUNC_OUTPUTS',
+        'UFUNC_ALIASES = %s' % _compact_dict(aliases, indent=4),
+        '',
+        '# ufunc name -> {input characters: output characters}',
+        'UFUNC_OUTPUTS = {',
+    ]
+    for name in sorted(outputs):
+        sections.append('    %r: %s,' % (name, _compact_dict(outputs[name], indent=8)))
+    sections.append('}')
+    return '\n'.join(sections) + '\n'
+
+
+def _compact_dict(d, indent):
+    if not d:
+        return '{}'
+    items = ['%r: %r' % kv for kv in sorted(d.items())]
+    lines, line = [], ''
+    for item in items:
+        if line and len(line) + len(item) + indent + 2 > 79:
+            lines.append(line)
+            line = ''
+        line += (' ' if line else '') + item + ','
+    lines.append(line)
+    body = '\n'.join(' ' * indent + l for l in lines)
+    return '{\n' + body + '\n' + ' ' * (indent - 4) + '}'
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--numpy-version', help='required NumPy version')
+    parser.add_argument('--output', default=OUTPUT)
+    args = parser.parse_args()
+
+    if args.numpy_version is not None and np.__version__ != args.numpy_version:
+        sys.exit('NumPy %s is installed, but %s was requested' % (
+            np.__version__, args.numpy_version))
+
+    with open(args.output, 'w') as f:
+        f.write(render(np.__version__))
+
+
+if __name__ == '__main__':
+    main()